@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Measures get_key throughput of in-memory auth key manager with 1M stored
+keys and 10k concurrent connections. Each connection gets its auth key
+for every message. Also prints memory used by stored keys.
+
+Run from repository root::
+
+    python -m benchmarks.bench_auth_key_manager
+"""
+import asyncio
+import resource
+import time
+from random import getrandbits, sample
+
+from mtpylon.crypto import AuthKey, AuthKeyManager
+
+KEYS = 1000000
+CONNECTIONS = 10000
+MESSAGES = 50
+
+
+async def connection(manager: AuthKeyManager, auth_key_id: int):
+    for _ in range(MESSAGES):
+        await manager.get_key(auth_key_id)
+        await asyncio.sleep(0)
+
+
+async def measure():
+    manager = AuthKeyManager()
+    memory_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    started = time.perf_counter()
+    auth_key_ids = []
+    for _ in range(KEYS):
+        auth_key = AuthKey(getrandbits(2048) | 1 << 2047)
+        await manager.set_key(auth_key)
+        auth_key_ids.append(auth_key.id)
+    fill_time = time.perf_counter() - started
+
+    memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - memory_before
+
+    connection_ids = sample(auth_key_ids, CONNECTIONS)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        connection(manager, auth_key_id)
+        for auth_key_id in connection_ids
+    ])
+    spent = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for auth_key_id in connection_ids * MESSAGES:
+        await manager.get_key(auth_key_id)
+    get_time = time.perf_counter() - started
+
+    print(f'{KEYS} keys stored in {fill_time:.1f} s, {memory / 1024:.0f} MB')
+    print(
+        f'{CONNECTIONS} connections: '
+        f'{CONNECTIONS * MESSAGES / spent:>10.0f} messages/s'
+    )
+    print(f'get_key: {CONNECTIONS * MESSAGES / get_time:>10.0f} calls/s')
+
+
+def main():
+    asyncio.run(measure())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Measures auth key lookups with auth key manager of separate service with
+and without read-through cache. Remote manager is simulated with network
+round trip on every call. Lookups are done in concurrent bursts, part of
+them requests unknown auth key ids.
+
+Run from repository root::
+
+    python -m benchmarks.bench_cached_auth_key_manager
+"""
+import asyncio
+import time
+from random import choice, getrandbits, random
+from typing import List, Union
+
+from mtpylon.crypto import (
+    AuthKey,
+    AuthKeyManager,
+    AuthKeyDoesNotExist,
+    CachedAuthKeyManager,
+)
+from mtpylon.crypto.auth_key_manager import AuthKeyManagerProtocol
+
+KEYS = 1000
+LOOKUPS = 20000
+BURST = 500
+UNKNOWN_SHARE = 0.1
+UNKNOWN_KEYS = 100
+ROUND_TRIP = 0.001
+
+
+class RemoteAuthKeyManager(AuthKeyManager):
+
+    def __init__(self):
+        super().__init__()
+        self.requests = 0
+
+    async def get_key(self, value: Union[AuthKey, int]) -> AuthKey:
+        self.requests += 1
+        await asyncio.sleep(ROUND_TRIP)
+        return await super().get_key(value)
+
+
+async def lookup(manager: AuthKeyManagerProtocol, auth_key_id: int):
+    try:
+        await manager.get_key(auth_key_id)
+    except AuthKeyDoesNotExist:
+        pass
+
+
+async def measure(name: str, cached: bool, auth_keys: List[AuthKey]):
+    backend = RemoteAuthKeyManager()
+    for auth_key in auth_keys:
+        await backend.set_key(auth_key)
+
+    manager: AuthKeyManagerProtocol = backend
+    if cached:
+        manager = CachedAuthKeyManager(backend)
+
+    known_ids = [auth_key.id for auth_key in auth_keys]
+    unknown_ids = [getrandbits(63) for _ in range(UNKNOWN_KEYS)]
+    lookup_ids = [
+        choice(unknown_ids) if random() < UNKNOWN_SHARE else choice(known_ids)
+        for _ in range(LOOKUPS)
+    ]
+
+    started = time.perf_counter()
+    for i in range(0, LOOKUPS, BURST):
+        await asyncio.gather(*[
+            lookup(manager, auth_key_id)
+            for auth_key_id in lookup_ids[i:i + BURST]
+        ])
+    spent = time.perf_counter() - started
+
+    line = (
+        f'{name:<8} {LOOKUPS / spent:>10.0f} lookups/s, '
+        f'{backend.requests:>6} backend requests'
+    )
+    if isinstance(manager, CachedAuthKeyManager):
+        line += f', hit rate {manager.metrics.hit_rate:.3f}'
+
+    print(line)
+
+
+async def run():
+    auth_keys = [AuthKey(getrandbits(2048) | 1 << 2047) for _ in range(KEYS)]
+
+    await measure('direct', False, auth_keys)
+    await measure('cached', True, auth_keys)
+
+
+def main():
+    asyncio.run(run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Measures unpack time of small and large unencrypted messages when codecs
+are always offloaded to thread pool and when small messages are decoded
+inline.
+
+Run from repository root::
+
+    python -m benchmarks.bench_codec_executor
+"""
+import asyncio
+from time import perf_counter
+
+from mtpylon import long
+from mtpylon.messages import CodecExecutor, UnencryptedMessage
+from mtpylon.messages.unencrypted_message import pack, unpack_message
+from mtpylon.service_schema.constructors import MsgsAck
+
+ROUNDS = 5000
+
+
+async def run(name, codec_executor, message_bytes):
+    start = perf_counter()
+
+    for _ in range(ROUNDS):
+        await unpack_message(message_bytes, codec_executor)
+
+    spent = perf_counter() - start
+    print(
+        f'{name:<36} {spent / ROUNDS * 1000000:>8.1f} us per message   '
+        f'inline: {codec_executor.metrics.inline:>5} '
+        f'offloaded: {codec_executor.metrics.offloaded:>5}'
+    )
+    codec_executor.shutdown()
+
+
+async def main():
+    small_message = pack(
+        UnencryptedMessage(
+            message_id=long(0x51e57ac42770964a),
+            message_data=MsgsAck(msg_ids=[long(1)]),
+        )
+    )
+    large_message = pack(
+        UnencryptedMessage(
+            message_id=long(0x51e57ac42770964a),
+            message_data=MsgsAck(msg_ids=[long(i) for i in range(8192)]),
+        )
+    )
+
+    for name, message_bytes in [
+        (f'msgs_ack {len(small_message)} B', small_message),
+        (f'msgs_ack {len(large_message) // 1024} KB', large_message),
+    ]:
+        await run(
+            f'{name} offloaded',
+            CodecExecutor(inline_threshold=0),
+            message_bytes
+        )
+        await run(f'{name} adaptive', CodecExecutor(), message_bytes)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
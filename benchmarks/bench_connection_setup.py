@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Measures setup time of connection message sender and handler versus size
+of customer schema.
+
+Run from repository root::
+
+    python -m benchmarks.bench_connection_setup
+"""
+from dataclasses import make_dataclass
+from timeit import timeit
+
+from mtpylon import Schema
+from mtpylon.message_sender import MessageSender
+from mtpylon.message_handler import MessageHandler
+from mtpylon.service_schema import prepare_common_schema
+
+ROUNDS = 100
+SCHEMA_SIZES = [10, 100, 1000]
+
+
+def build_schema(size: int) -> Schema:
+    constructors = [
+        make_dataclass(
+            f'Item{i}',
+            [('value', int)],
+            namespace={
+                'Meta': type(
+                    'Meta',
+                    (),
+                    {'name': f'item{i}', 'order': ('value', )}
+                )
+            },
+        )
+        for i in range(size)
+    ]
+    return Schema(constructors=constructors, functions=[])
+
+
+def setup_connection(schema: Schema):
+    """
+    Creates sender and handler as websocket handler does on first message.
+    Transport objects are not used on setup so they are omitted
+    """
+    message_sender = MessageSender(
+        schema=schema,
+        obfuscator=None,
+        transport_wrapper=None,
+        ws=None,
+    )
+    MessageHandler(
+        schema=schema,
+        obfuscator=None,
+        transport_wrapper=None,
+        message_sender=message_sender,
+    )
+
+
+def main():
+    for size in SCHEMA_SIZES:
+        schema = build_schema(size)
+
+        prepare_time = timeit(lambda: prepare_common_schema(schema), number=1)
+        setup_time = timeit(lambda: setup_connection(schema), number=ROUNDS)
+
+        print(
+            f'{size:>5} constructors   '
+            f'prepare: {prepare_time * 1000:>8.2f} ms   '
+            f'connection: {setup_time / ROUNDS * 1000:>8.3f} ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
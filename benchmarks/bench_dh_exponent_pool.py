@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Measures time of getting (a, g_a) pair on req_DH_params critical path:
+exponentiation on every handshake versus pop from precomputed pool.
+
+Run from repository root::
+
+    python -m benchmarks.bench_dh_exponent_pool
+"""
+import asyncio
+import time
+from random import getrandbits
+from timeit import timeit
+
+from mtpylon.crypto import DhExponentPool
+from mtpylon.dh_prime_generators.single_prime import DH_PRIME
+
+G = 3
+ROUNDS = 200
+
+
+async def measure_pool():
+    pool = DhExponentPool(low_watermark=ROUNDS, high_watermark=ROUNDS)
+    await pool.fill(G, DH_PRIME)
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await pool.pop(G, DH_PRIME)
+    spent = time.perf_counter() - started
+
+    pool.shutdown()
+
+    return spent
+
+
+def main():
+    inline_time = timeit(
+        lambda: pow(G, getrandbits(2048), DH_PRIME),
+        number=ROUNDS
+    )
+    pool_time = asyncio.run(measure_pool())
+
+    print(f'exponentiation {inline_time / ROUNDS * 1e6:>10.2f} us')
+    print(f'pool pop       {pool_time / ROUNDS * 1e6:>10.2f} us')
+
+
+if __name__ == '__main__':
+    main()
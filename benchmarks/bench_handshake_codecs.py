@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Measures calls/sec of handshake inner data codecs used by `req_DH_params`
+and `set_client_DH_params`.
+
+Run from repository root::
+
+    python -m benchmarks.bench_handshake_codecs
+"""
+from timeit import timeit
+
+from mtpylon import long, int128, int256
+from mtpylon.serialization import dump
+from mtpylon.service_schema import service_schema
+from mtpylon.service_schema.constructors import (
+    PQInnerData,
+    Server_DH_inner_data,
+    Client_DH_Inner_Data,
+)
+from mtpylon.service_schema.functions.req_DH_params_func import (
+    load_pq_inner_data,
+    dump_dh_inner_data,
+)
+from mtpylon.service_schema.functions.set_client_DH_params_func import (
+    load_client_dh_inner_data,
+)
+
+ROUNDS = 10000
+
+NONCE = int128(0x3E0549828CCA27E966B301A48FECE2FC)
+SERVER_NONCE = int128(0xA5CF4D33F4A11EA877BA4AA573907330)
+NEW_NONCE = int256(
+    0x311C85DB234AA2640AFC4A76A735CF5B1F0FD68BD17FA181E1229AD867CC024D
+)
+
+
+def run(name, func):
+    call_time = timeit(func, number=ROUNDS)
+    print(f'{name:<28} {ROUNDS / call_time:>10.0f} calls/s')
+
+
+def main():
+    pq_inner_data = dump(
+        PQInnerData(
+            pq=b'\x17\xed\x48\x94\x1a\x08\xf9\x81',
+            p=b'\x49\x4c\x55\x3b',
+            q=b'\x53\x91\x10\x73',
+            nonce=NONCE,
+            server_nonce=SERVER_NONCE,
+            new_nonce=NEW_NONCE,
+        ),
+        schema=service_schema
+    )
+    dh_inner_data = Server_DH_inner_data(
+        nonce=NONCE,
+        server_nonce=SERVER_NONCE,
+        g=3,
+        dh_prime=bytes(256),
+        g_a=bytes(256),
+        server_time=1600000000,
+    )
+    client_dh_inner_data = dump(
+        Client_DH_Inner_Data(
+            nonce=NONCE,
+            server_nonce=SERVER_NONCE,
+            retry_id=long(0),
+            g_b=bytes(256),
+        ),
+        schema=service_schema
+    )
+
+    run('load_pq_inner_data', lambda: load_pq_inner_data(pq_inner_data))
+    run('dump_dh_inner_data', lambda: dump_dh_inner_data(dh_inner_data))
+    run(
+        'load_client_dh_inner_data',
+        lambda: load_client_dh_inner_data(client_dh_inner_data)
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Measures latency of rpc calls on established sessions while hundreds of
+auth key exchanges arrive every 50 ms. Each exchange decrypts rsa inner
+data and computes g_a and auth key with handshake executor. Rpc call is
+simulated by task that should wake up every millisecond, its latency is
+delay of wake up.
+
+Run from repository root::
+
+    python -m benchmarks.bench_handshake_executor
+"""
+import asyncio
+import time
+from random import getrandbits, randrange
+
+import rsa  # type: ignore
+
+from mtpylon.crypto import HandshakeExecutor, ProcessHandshakeExecutor
+from mtpylon.crypto.rsa import decrypt
+
+HANDSHAKES = 200
+HANDSHAKE_INTERVAL = 0.05  # seconds between arrivals of handshakes
+RPC_INTERVAL = 0.001  # seconds
+
+
+async def handshake(i, executor, private, encrypted_data, g_b, dh_prime):
+    await asyncio.sleep(i * HANDSHAKE_INTERVAL)
+    await executor.run(decrypt, encrypted_data, private)
+    a = getrandbits(2048)
+    await executor.run(pow, 3, a, dh_prime)
+    # set_client_DH_params is handled as separate message
+    await asyncio.sleep(0)
+    await executor.run(pow, g_b, a, dh_prime)
+
+
+async def rpc_calls(latencies, stop):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(RPC_INTERVAL)
+        latencies.append(time.perf_counter() - started - RPC_INTERVAL)
+
+
+async def measure(name, executor, private, encrypted_data, g_b, dh_prime):
+    executor.start()
+    # warm up workers of pool
+    await asyncio.gather(*[executor.run(pow, 3, 5, 7) for _ in range(8)])
+
+    latencies = []
+    stop = asyncio.Event()
+    rpc_task = asyncio.create_task(rpc_calls(latencies, stop))
+
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        handshake(i, executor, private, encrypted_data, g_b, dh_prime)
+        for i in range(HANDSHAKES)
+    ])
+    spent = time.perf_counter() - started
+
+    stop.set()
+    await rpc_task
+    executor.shutdown()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    worst = latencies[-1] * 1000
+
+    print(
+        f'{name:<8} {HANDSHAKES} handshakes {spent:>6.2f} s   rpc latency '
+        f'p50: {p50:>7.2f} ms   p99: {p99:>7.2f} ms   max: {worst:>7.2f} ms'
+    )
+
+
+def main():
+    _, private = rsa.newkeys(2048)
+    encrypted_data = randrange(private.n).to_bytes(256, 'big')
+    dh_prime = getrandbits(2048) | 1 << 2047 | 1
+    g_b = randrange(dh_prime)
+
+    for name, executor in [
+        ('inline', HandshakeExecutor()),
+        ('process', ProcessHandshakeExecutor()),
+    ]:
+        asyncio.run(
+            measure(name, executor, private, encrypted_data, g_b, dh_prime)
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Measures per message crypto work that depends on auth key: msg key, aes key
+and iv generation and lookups of salt, session, acknowledgement and
+subscriber stores keyed by auth key.
+
+Run from repository root::
+
+    python -m benchmarks.bench_message_crypto
+"""
+from random import getrandbits
+from timeit import timeit
+
+from mtpylon.crypto import AuthKey
+from mtpylon.crypto.generate_key_iv import generate_key_iv
+from mtpylon.crypto.get_msg_key import get_msg_key
+
+ROUNDS = 100000
+STORES = 4  # salts, sessions, acknowledgements, session subject
+
+
+def main():
+    auth_key = AuthKey(getrandbits(2048) | 1 << 2047)
+    stores = [{AuthKey(auth_key.value): i} for i in range(STORES)]
+    data = bytes(256)
+
+    def handle_message():
+        msg_key = get_msg_key(auth_key, data)
+        generate_key_iv(auth_key, msg_key, 'client')
+        generate_key_iv(auth_key, msg_key, 'server')
+
+        for store in stores:
+            store[auth_key]
+
+    lookup_time = timeit(
+        lambda: [store[auth_key] for store in stores],
+        number=ROUNDS
+    )
+    message_time = timeit(handle_message, number=ROUNDS)
+
+    lookup_us = lookup_time / ROUNDS * 1e6
+    message_us = message_time / ROUNDS * 1e6
+
+    print(f'{STORES} lookups by auth key {lookup_us:>8.2f} us')
+    print(f'message crypto         {message_us:>8.2f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Measures throughput of AES-256-CTR backends that are used by transport
+obfuscator to decrypt incoming and encrypt outgoing frames.
+
+Run from repository root::
+
+    python -m benchmarks.bench_obfuscation
+"""
+import os
+from timeit import timeit
+
+from mtpylon.transports.ctr_backends import ctr_backends
+
+FRAME_SIZES = [1024, 64 * 1024]
+TOTAL_SIZE = 8 * 1024 * 1024
+
+
+def main():
+    key = os.urandom(32)
+    iv = os.urandom(16)
+
+    for name, backend in ctr_backends.items():
+        if backend is None:
+            print(f'{name:<14} not installed')
+            continue
+
+        for frame_size in FRAME_SIZES:
+            frame = os.urandom(frame_size)
+            cipher = backend(key, iv)
+            # pure python backend is too slow to process all data
+            total = TOTAL_SIZE if name != 'pyaes' else TOTAL_SIZE // 64
+            rounds = total // frame_size
+
+            spent = timeit(lambda: cipher.process(frame), number=rounds)
+            mb_per_sec = rounds * frame_size / spent / 1024 / 1024
+
+            print(
+                f'{name:<14} frame {frame_size // 1024:>3} KB '
+                f'{mb_per_sec:>10.2f} MB/s'
+            )
+
+
+if __name__ == '__main__':
+    main()
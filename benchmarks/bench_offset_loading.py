@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Measures load time of large messages: 1 MB `vector<bytes>` payload and
+`MessageContainer` with 1000 messages.
+
+Run from repository root::
+
+    python -m benchmarks.bench_offset_loading
+"""
+from dataclasses import dataclass
+from typing import List
+from timeit import timeit
+
+from mtpylon import Schema, long
+from mtpylon.serialization import dump, load
+from mtpylon.service_schema import (
+    service_schema,
+    load as load_service,
+    dump as dump_service,
+)
+from mtpylon.service_schema.constructors import (
+    MessageContainer,
+    Message,
+    MsgsAck,
+)
+
+ROUNDS = 10
+
+
+@dataclass
+class Chunks:
+    parts: List[bytes]
+
+    class Meta:
+        name = 'chunks'
+        order = ('parts', )
+
+
+def run(name, load_func):
+    load_time = timeit(load_func, number=ROUNDS)
+    print(f'{name:<32} {load_time / ROUNDS * 1000:>10.2f} ms per message')
+
+
+def main():
+    schema = Schema(constructors=[Chunks], functions=[])
+    chunks = Chunks(parts=[bytes(256) for _ in range(4096)])
+    dumped_chunks = dump(chunks, schema=schema)
+
+    run(
+        f'vector<bytes> {len(dumped_chunks) // 1024} KB',
+        lambda: load(dumped_chunks, schema=schema)
+    )
+
+    container = MessageContainer(
+        messages=[
+            Message(
+                msg_id=long(i * 4),
+                seqno=i,
+                body=MsgsAck(msg_ids=[long(i)])
+            )
+            for i in range(1000)
+        ]
+    )
+    dumped_container = dump_service(container, schema=service_schema)
+
+    run(
+        'msg_container 1000 messages',
+        lambda: load_service(dumped_container, schema=service_schema)
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Measures persistent auth key manager: writes with fsync per change and
+with batched fsync, start with mapped index and with index rebuilt from
+log, and lookups of keys after restart.
+
+Run from repository root::
+
+    python -m benchmarks.bench_persistent_auth_key_manager
+"""
+import asyncio
+import os
+import tempfile
+import time
+from random import getrandbits, sample
+
+from mtpylon.crypto.persistent_auth_key_manager import (
+    PersistentAuthKeyManager,
+    INDEX_FILE,
+)
+
+KEYS = 200000
+BURST = 1000
+SINGLE_WRITES = 500
+LOOKUPS = 100000
+
+
+def random_auth_key() -> int:
+    return getrandbits(2048) | 1 << 2047
+
+
+async def measure(path: str):
+    manager = PersistentAuthKeyManager(path, sync_delay=0, sync_batch=1)
+    started = time.perf_counter()
+    for _ in range(SINGLE_WRITES):
+        await manager.set_key(random_auth_key())
+    single_rate = SINGLE_WRITES / (time.perf_counter() - started)
+    await manager.close()
+
+    manager = PersistentAuthKeyManager(path)
+    started = time.perf_counter()
+    for _ in range(KEYS // BURST):
+        auth_keys = [random_auth_key() for _ in range(BURST)]
+        await asyncio.gather(*[
+            manager.set_key(auth_key)
+            for auth_key in auth_keys
+        ])
+    batched_rate = KEYS / (time.perf_counter() - started)
+    await manager.close()
+
+    started = time.perf_counter()
+    manager = PersistentAuthKeyManager(path)
+    mapped_time = time.perf_counter() - started
+    count = len(manager)
+    await manager.close()
+
+    os.remove(os.path.join(path, INDEX_FILE))
+    started = time.perf_counter()
+    manager = PersistentAuthKeyManager(path)
+    rebuild_time = time.perf_counter() - started
+    await manager.close()
+
+    manager = PersistentAuthKeyManager(path)
+    auth_key_ids = sample(
+        [auth_key_id for auth_key_id, _ in manager._index.items()],
+        LOOKUPS
+    )
+    started = time.perf_counter()
+    for auth_key_id in auth_key_ids:
+        await manager.get_key(auth_key_id)
+    lookup_rate = LOOKUPS / (time.perf_counter() - started)
+    await manager.close()
+
+    print(f'fsync per change   {single_rate:>10.0f} set_key/s')
+    print(f'batched fsync      {batched_rate:>10.0f} set_key/s')
+    print(f'start, mapped index  {mapped_time * 1000:>8.2f} ms, {count} keys')
+    print(f'start, rebuilt index {rebuild_time * 1000:>8.2f} ms')
+    print(f'get_key after restart {lookup_rate:>9.0f} calls/s')
+
+
+def main():
+    with tempfile.TemporaryDirectory() as path:
+        asyncio.run(measure(path))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Measures auth key lookup of incoming encrypted messages with remote auth key
+manager. Remote manager is simulated with network round trip on every
+get_key call. Each connection resolves its auth key for every message.
+
+Run from repository root::
+
+    python -m benchmarks.bench_pinned_auth_key
+"""
+import asyncio
+import time
+from random import getrandbits
+from typing import Union
+
+from mtpylon.crypto import AuthKey, AuthKeyManager
+from mtpylon.messages.encrypted_message import get_auth_key
+
+CONNECTIONS = 100
+MESSAGES = 200
+ROUND_TRIP = 0.0005
+
+
+class RemoteAuthKeyManager(AuthKeyManager):
+
+    def __init__(self):
+        super().__init__()
+        self.requests = 0
+
+    async def get_key(self, value: Union[AuthKey, int]) -> AuthKey:
+        self.requests += 1
+        await asyncio.sleep(ROUND_TRIP)
+        return await super().get_key(value)
+
+
+async def connection(manager: AuthKeyManager, auth_key: AuthKey):
+    message = auth_key.id.to_bytes(8, 'big') + bytes(56)
+
+    for _ in range(MESSAGES):
+        await get_auth_key(manager, message)
+
+
+async def measure():
+    manager = RemoteAuthKeyManager()
+    auth_keys = []
+
+    for _ in range(CONNECTIONS):
+        auth_key = AuthKey(getrandbits(2048) | 1 << 2047)
+        await manager.set_key(auth_key)
+        auth_keys.append(auth_key)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        connection(manager, auth_key)
+        for auth_key in auth_keys
+    ])
+    spent = time.perf_counter() - started
+
+    messages = CONNECTIONS * MESSAGES
+    print(
+        f'{CONNECTIONS} connections, {ROUND_TRIP * 1000:.1f} ms round trip: '
+        f'{messages / spent:>10.0f} messages/s, '
+        f'{manager.requests} manager requests'
+    )
+
+
+def main():
+    asyncio.run(measure())
+
+
+if __name__ == '__main__':
+    main()
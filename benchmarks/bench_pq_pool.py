@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Measures time of getting p, q pair in req_pq handler: generation of pair
+on every handshake versus pop from pregenerated pool.
+
+Run from repository root::
+
+    python -m benchmarks.bench_pq_pool
+"""
+import asyncio
+import time
+from timeit import timeit
+
+from mtpylon.service_schema import PqPool
+from mtpylon.service_schema.utils import generates_pq
+
+ROUNDS = 2000
+
+
+async def measure_pool():
+    pool = PqPool(low_watermark=0, high_watermark=ROUNDS)
+    await pool.fill()
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        pool.pop()
+    spent = time.perf_counter() - started
+
+    pool.shutdown()
+
+    return spent
+
+
+def main():
+    generate_time = timeit(generates_pq, number=ROUNDS)
+    pool_time = asyncio.run(measure_pool())
+
+    print(f'generation {generate_time / ROUNDS * 1e6:>10.2f} us')
+    print(f'pool pop   {pool_time / ROUNDS * 1e6:>10.2f} us')
+
+
+if __name__ == '__main__':
+    main()
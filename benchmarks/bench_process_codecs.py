@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Measures latency of small messages of other connections while large
+payloads are decoded in thread pool and in process pool.
+
+Run from repository root::
+
+    python -m benchmarks.bench_process_codecs
+"""
+import asyncio
+from statistics import quantiles
+from time import perf_counter
+
+from mtpylon import Schema, long
+from mtpylon.messages import (
+    CodecExecutor,
+    ProcessCodecExecutor,
+    EncryptedMessage,
+)
+from mtpylon.messages.encrypted_message import load_message, write_message
+from mtpylon.service_schema import get_common_schema
+
+from tests.echoschema import schema as echo_schema, Reply
+
+from .bench_offset_loading import Chunks
+
+DURATION = 3  # seconds
+CONNECTIONS = 10
+LARGE_UPLOADERS = 2
+RECEIVE_INTERVAL = 0.001  # seconds
+
+schema = echo_schema | Schema(constructors=[Chunks], functions=[])
+common_schema = get_common_schema(schema)
+
+
+def build_message(data) -> bytes:
+    return bytes(
+        write_message(
+            common_schema,
+            EncryptedMessage(
+                salt=long(1),
+                session_id=long(2),
+                message_id=long(3),
+                seq_no=0,
+                message_data=data,
+            )
+        )
+    )
+
+
+async def small_connection(codec_executor, message, deadline, latencies):
+    """
+    Latency includes waiting of event loop after message should have been
+    received, so stalls of event loop are measured too
+    """
+    while perf_counter() < deadline:
+        received = perf_counter() + RECEIVE_INTERVAL
+        await asyncio.sleep(RECEIVE_INTERVAL)
+        await load_message(common_schema, message, codec_executor)
+        latencies.append(perf_counter() - received)
+
+
+async def large_uploader(codec_executor, message, deadline):
+    while perf_counter() < deadline:
+        await load_message(common_schema, message, codec_executor)
+
+
+async def run(name, codec_executor, large_message):
+    small_message = build_message(Reply(content='hello world', rand_id=12))
+    latencies = []
+    deadline = perf_counter() + DURATION
+
+    tasks = [
+        small_connection(codec_executor, small_message, deadline, latencies)
+        for _ in range(CONNECTIONS)
+    ]
+
+    if large_message is not None:
+        tasks += [
+            large_uploader(codec_executor, large_message, deadline)
+            for _ in range(LARGE_UPLOADERS)
+        ]
+
+    await asyncio.gather(*tasks)
+    codec_executor.shutdown()
+
+    percentiles = quantiles(latencies, n=100)
+    print(
+        f'{name:<24} p50: {percentiles[49] * 1000:>8.2f} ms   '
+        f'p99: {percentiles[98] * 1000:>8.2f} ms   '
+        f'processed: {codec_executor.metrics.processed}'
+    )
+
+
+async def main():
+    large_message = build_message(
+        Chunks(parts=[bytes(256) for _ in range(16384)])
+    )
+
+    await run('no large payloads', CodecExecutor(), None)
+    await run('thread pool', CodecExecutor(), large_message)
+
+    process_codec_executor = ProcessCodecExecutor(
+        process_workers=LARGE_UPLOADERS
+    )
+    process_codec_executor.start(common_schema)
+    await run('process pool', process_codec_executor, large_message)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
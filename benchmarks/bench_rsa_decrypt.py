@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Measures rsa decryption of req_DH_params encrypted data with 2048 bit key:
+exponentiation by private exponent versus chinese remainder theorem.
+
+Run from repository root::
+
+    python -m benchmarks.bench_rsa_decrypt
+"""
+from random import randrange
+from timeit import timeit
+
+import rsa  # type: ignore
+
+from mtpylon.crypto.rsa import decrypt
+
+ROUNDS = 200
+
+
+def main():
+    _, private = rsa.newkeys(2048)
+    value = randrange(private.n)
+    encrypted_data = value.to_bytes(256, 'big')
+
+    full_time = timeit(
+        lambda: pow(value, private.d, private.n),
+        number=ROUNDS
+    )
+    crt_time = timeit(lambda: decrypt(encrypted_data, private), number=ROUNDS)
+
+    print(f'full exponent {full_time / ROUNDS * 1000:>8.3f} ms')
+    print(f'decrypt       {crt_time / ROUNDS * 1000:>8.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Measures safe prime dh generator: build of 2048 bit safe prime in worker
+processes on cold start, warm restart from cache file and latency of
+concurrent handshakes served from prefetch buffer.
+
+Run from repository root::
+
+    python -m benchmarks.bench_safe_prime
+"""
+import asyncio
+import os
+import tempfile
+import time
+
+from mtpylon.dh_prime_generators.safe_prime import generate
+
+HANDSHAKES = 1000
+
+
+async def measure(path: str, title: str):
+    generator = generate(cache_path=path, pool_size=1)
+
+    started = time.perf_counter()
+    await generator.asend(None)
+    first_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        generator.asend(None)
+        for _ in range(HANDSHAKES)
+    ])
+    handshakes_time = time.perf_counter() - started
+
+    await generator.aclose()
+
+    print(
+        f'{title:<12} first prime: {first_time:>8.2f} s   '
+        f'{HANDSHAKES} concurrent handshakes: '
+        f'{handshakes_time * 1000:>6.2f} ms'
+    )
+
+
+def main():
+    print(f'workers: {os.cpu_count()}')
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        path = os.path.join(cache_dir, 'primes.txt')
+
+        asyncio.run(measure(path, 'cold start'))
+        asyncio.run(measure(path, 'warm restart'))
+
+
+if __name__ == '__main__':
+    main()
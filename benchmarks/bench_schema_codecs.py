@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Measures messages/sec of `mtpylon.serialization` dump/load on the echo and
+simple test schemas.
+
+Run from repository root::
+
+    python -m benchmarks.bench_schema_codecs
+"""
+from timeit import timeit
+
+from mtpylon.serialization import dump, load, CallableFunc
+
+from tests import echoschema, simpleschema
+
+ROUNDS = 20000
+
+
+def run(name, schema, value):
+    dumped = dump(value, schema=schema)
+
+    dump_time = timeit(lambda: dump(value, schema=schema), number=ROUNDS)
+    load_time = timeit(lambda: load(dumped, schema=schema), number=ROUNDS)
+
+    print(
+        f'{name:<24} dump: {ROUNDS / dump_time:>10.0f} msg/s   '
+        f'load: {ROUNDS / load_time:>10.0f} msg/s'
+    )
+
+
+def main():
+    run(
+        'echo(content)',
+        echoschema.schema,
+        CallableFunc(echoschema.echo, {'content': 'hello world'}),
+    )
+    run(
+        'reply',
+        echoschema.schema,
+        echoschema.Reply(rand_id=12, content='hello world'),
+    )
+    run(
+        'task with tags',
+        simpleschema.schema,
+        simpleschema.Task(
+            id=12,
+            content='dump by schema',
+            completed=simpleschema.BoolTrue(),
+            tags=['schema', 'dump'],
+        ),
+    )
+    run(
+        'task list(10)',
+        simpleschema.schema,
+        simpleschema.TaskList(tasks=[
+            simpleschema.Task(
+                id=i,
+                content=f'task {i}',
+                completed=simpleschema.BoolFalse(),
+                tags=None,
+            )
+            for i in range(10)
+        ]),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Measures startup time of large synthetic schema: validation and description
+of schema with compilation of its codecs versus import of generated codecs
+from cache. Cached time is startup of schema built with `load_schema`,
+schema created with `Schema` is validated on every start. Also compares
+throughput of compiled and generated codecs.
+
+Run from repository root::
+
+    python -m benchmarks.bench_schema_startup
+"""
+import tempfile
+from dataclasses import make_dataclass, field
+from timeit import timeit
+from typing import List, Optional
+
+from mtpylon import Schema, long
+from mtpylon.serialization.codegen import load_schema
+from mtpylon.serialization.schema import get_loader, get_dumper
+
+SCHEMA_SIZES = [100, 1000, 2000]
+ROUNDS = 20000
+
+
+def build_constructors(size: int) -> list:
+    return [
+        make_dataclass(
+            f'Item{i}',
+            [
+                ('id', int),
+                ('ref', long),
+                ('name', str),
+                ('tags', Optional[List[str]], field(metadata={'flag': 0})),
+            ],
+            namespace={
+                'Meta': type(
+                    'Meta',
+                    (),
+                    {
+                        'name': f'item{i}',
+                        'order': ('id', 'ref', 'name', 'tags'),
+                    }
+                )
+            },
+        )
+        for i in range(size)
+    ]
+
+
+def compile_codecs(schema: Schema):
+    get_loader(schema).compile_plans()
+    get_dumper(schema).compile_plans()
+
+
+def measure_startup(size: int):
+    constructors = build_constructors(size)
+
+    def cold():
+        compile_codecs(Schema(constructors=constructors, functions=[]))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        def cached():
+            compile_codecs(load_schema(constructors, [], cache_dir))
+
+        cold_time = timeit(cold, number=1)
+        miss_time = timeit(cached, number=1)
+        hit_time = timeit(cached, number=1)
+
+    print(
+        f'{size:>5} constructors   '
+        f'validated: {cold_time * 1000:>8.1f} ms   '
+        f'generated: {miss_time * 1000:>8.1f} ms   '
+        f'cached: {hit_time * 1000:>8.1f} ms'
+    )
+
+
+def measure_codecs():
+    constructors = build_constructors(1)
+    value = constructors[0](
+        id=1,
+        ref=long(2),
+        name='item',
+        tags=['a', 'b'],
+    )
+
+    schema = Schema(constructors=constructors, functions=[])
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        generated_schema = load_schema(constructors, [], cache_dir)
+
+    for name, current_schema in [
+        ('compiled', schema),
+        ('generated', generated_schema),
+    ]:
+        loader = get_loader(current_schema)
+        dumper = get_dumper(current_schema)
+        dumped = dumper.dump(value)
+
+        dump_time = timeit(lambda: dumper.dump(value), number=ROUNDS)
+        load_time = timeit(lambda: loader.load(dumped), number=ROUNDS)
+
+        print(
+            f'{name:<24} dump: {ROUNDS / dump_time:>10.0f} msg/s   '
+            f'load: {ROUNDS / load_time:>10.0f} msg/s'
+        )
+
+
+def main():
+    for size in SCHEMA_SIZES:
+        measure_startup(size)
+
+    measure_codecs()
+
+
+if __name__ == '__main__':
+    main()
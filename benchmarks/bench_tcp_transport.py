@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Compares raw tcp server with websocket handler. Server runs in separate
+process with both transports. Clients send `req_pq` and wait for `resPQ`
+answer in turn, p, q pairs are pregenerated to measure transport only.
+Memory per connection is measured as growth of server RSS after opening
+idle connections that have sent one request.
+
+Run from repository root::
+
+    python -m benchmarks.bench_tcp_transport
+"""
+import asyncio
+import multiprocessing
+import os
+import time
+from typing import Tuple
+
+import aiohttp
+import rsa  # type: ignore
+from aiohttp import web
+
+from mtpylon import Schema
+from mtpylon.configuration import configure_app
+from mtpylon.constants import PQ_POOL_RESOURCE_NAME, TCP_SERVER_RESOURCE_NAME
+from mtpylon.crypto import KeyPair
+from mtpylon.transports import Obfuscator
+from mtpylon.transports.intermediate import PROTOCOL_TAG, wrap
+
+CONNECTIONS = 50
+REQUESTS = 100
+IDLE_CONNECTIONS = 1000
+PQ_PAIRS = 2 * (CONNECTIONS * REQUESTS + IDLE_CONNECTIONS) + 1000
+
+# unencrypted req_pq message
+REQ_PQ = bytes.fromhex(
+    '0000000000000000040000005e595260140000007897466054b3ae2f'
+    '3172ad489eef5aa8271f730e'
+)
+
+
+def run_server(conn):
+    async def serve():
+        public_key, private_key = rsa.newkeys(1024)
+        app = web.Application()
+        configure_app(
+            app,
+            Schema(constructors=[], functions=[]),
+            {
+                'rsa_manager': {
+                    'params': {
+                        'rsa_keys': [
+                            KeyPair(public=public_key, private=private_key)
+                        ]
+                    }
+                },
+                'dh_prime_generator': {
+                    'generator': (
+                        'mtpylon.dh_prime_generators.single_prime.generate'
+                    ),
+                },
+                'pq_pool': {
+                    'params': {
+                        'low_watermark': 0,
+                        'high_watermark': PQ_PAIRS,
+                    }
+                },
+                'tcp_server': {
+                    'host': '127.0.0.1',
+                },
+            }
+        )
+
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        await app[PQ_POOL_RESOURCE_NAME].fill()
+
+        ws_port = runner.addresses[0][1]
+        tcp_port = app[TCP_SERVER_RESOURCE_NAME].sockets[0].getsockname()[1]
+        conn.send((ws_port, tcp_port))
+
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+def get_rss(pid: int) -> int:
+    with open(f'/proc/{pid}/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def create_header() -> Tuple[bytes, Obfuscator]:
+    """
+    Returns obfuscation header of intermediate transport and obfuscator of
+    client side
+    """
+    header = bytearray(os.urandom(64))
+    header[56:60] = PROTOCOL_TAG.to_bytes(4, 'big')
+    reversed_header = header[::-1]
+
+    obfuscator = Obfuscator(
+        client_key=bytes(reversed_header[8:40]),
+        client_iv=bytes(reversed_header[40:56]),
+        server_key=bytes(header[8:40]),
+        server_iv=bytes(header[40:56]),
+    )
+    encrypted_header = obfuscator.encrypt(bytes(header))
+
+    return bytes(header[:56]) + encrypted_header[56:], obfuscator
+
+
+class TcpClient:
+
+    async def connect(self, port: int):
+        self.reader, self.writer = await asyncio.open_connection(
+            '127.0.0.1',
+            port
+        )
+        header, self.obfuscator = create_header()
+        self.writer.write(header)
+
+    async def request(self):
+        self.writer.write(self.obfuscator.encrypt(wrap(REQ_PQ)))
+        size = int.from_bytes(
+            self.obfuscator.decrypt(await self.reader.readexactly(4)),
+            'little'
+        )
+        self.obfuscator.decrypt(await self.reader.readexactly(size))
+
+    async def close(self):
+        self.writer.close()
+
+
+class WsClient:
+
+    def __init__(self, session: aiohttp.ClientSession):
+        self.session = session
+
+    async def connect(self, port: int):
+        self.ws = await self.session.ws_connect(f'http://127.0.0.1:{port}/ws')
+        header, self.obfuscator = create_header()
+        await self.ws.send_bytes(header)
+
+    async def request(self):
+        await self.ws.send_bytes(self.obfuscator.encrypt(wrap(REQ_PQ)))
+        self.obfuscator.decrypt(await self.ws.receive_bytes())
+
+    async def close(self):
+        await self.ws.close()
+
+
+async def measure(name: str, create_client, port: int, pid: int):
+    async def run_client(client):
+        for _ in range(REQUESTS):
+            await client.request()
+
+    clients = [create_client() for _ in range(CONNECTIONS)]
+    await asyncio.gather(*[client.connect(port) for client in clients])
+
+    started = time.perf_counter()
+    await asyncio.gather(*[run_client(client) for client in clients])
+    spent = time.perf_counter() - started
+
+    await asyncio.gather(*[client.close() for client in clients])
+    await asyncio.sleep(0.5)
+
+    rss_before = get_rss(pid)
+    clients = [create_client() for _ in range(IDLE_CONNECTIONS)]
+    for client in clients:
+        await client.connect(port)
+        await client.request()
+    await asyncio.sleep(0.5)
+    rss = get_rss(pid) - rss_before
+
+    await asyncio.gather(*[client.close() for client in clients])
+
+    print(
+        f'{name:<10} {CONNECTIONS * REQUESTS / spent:>8.0f} requests/s  '
+        f'{rss / IDLE_CONNECTIONS / 1024:>6.1f} KB per connection'
+    )
+
+
+async def run(ws_port: int, tcp_port: int, pid: int):
+    connector = aiohttp.TCPConnector(limit=0)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await measure('websocket', lambda: WsClient(session), ws_port, pid)
+    await measure('tcp', TcpClient, tcp_port, pid)
+
+
+def main():
+    parent_conn, child_conn = multiprocessing.Pipe()
+    server = multiprocessing.Process(target=run_server, args=(child_conn, ))
+    server.start()
+
+    try:
+        ws_port, tcp_port = parent_conn.recv()
+        asyncio.run(run(ws_port, tcp_port, server.pid))
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Measures dh prime generator wrapped with validation: verification of new
+prime versus cached verdict of already verified prime. Longest stall of
+event loop is measured while new prime is verified.
+
+Run from repository root::
+
+    python -m benchmarks.bench_validated_dh_prime
+"""
+import asyncio
+import time
+
+from mtpylon.dh_prime_generators.single_prime import generate
+from mtpylon.dh_prime_generators.validated import ValidatedDhPrimeGenerator
+
+ROUNDS = 10000
+TICK = 0.001  # seconds
+
+
+async def measure_stall(done: asyncio.Event) -> float:
+    longest = 0.0
+
+    while not done.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK)
+        longest = max(longest, time.perf_counter() - started - TICK)
+
+    return longest
+
+
+async def measure():
+    generator = ValidatedDhPrimeGenerator(generate())
+
+    done = asyncio.Event()
+    stall = asyncio.create_task(measure_stall(done))
+
+    started = time.perf_counter()
+    await generator.asend(None)
+    first_time = time.perf_counter() - started
+
+    done.set()
+    stall_time = await stall
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await generator.asend(None)
+    cached_time = (time.perf_counter() - started) / ROUNDS
+
+    print(f'new prime    {first_time * 1e6:>12.2f} us')
+    print(f'cached prime {cached_time * 1e6:>12.2f} us')
+    print(f'loop stall   {stall_time * 1e6:>12.2f} us')
+
+    await generator.aclose()
+
+
+def main():
+    asyncio.run(measure())
+
+
+if __name__ == '__main__':
+    main()
@@ -2,9 +2,11 @@
 from .websockets import create_websocket_handler
 from .schema import schema_view_factory
 from .pub_keys import pub_keys_view
+from .tcp import MtprotoTcpServer
 
 __all__ = [
     'create_websocket_handler',
     'schema_view_factory',
     'pub_keys_view',
+    'MtprotoTcpServer',
 ]
@@ -0,0 +1,422 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import logging
+from collections import deque
+from typing import Callable, Deque, NamedTuple, Optional, Set, cast
+
+from aiohttp.web import Application
+
+from mtpylon.schema import Schema
+from mtpylon.transports import (
+    parse_header,
+    get_wrapper,
+    Obfuscator,
+    TransportWrapper,
+)
+from mtpylon.transports.ctr_backends import default_ctr_backend
+from mtpylon.transports.transport_wrapper import PacketSizeFunc
+from mtpylon.middlewares import BASIC_MIDDLEWARES
+from mtpylon.service_schema import prepare_common_schema
+from mtpylon.message_sender import MessageSender
+from mtpylon.message_handler import MessageHandler
+from mtpylon.constants import CTR_BACKEND_RESOURCE_NAME
+
+from .websockets import validate_shared_resources
+
+logger = logging.getLogger(__name__)
+
+HEADER_SIZE = 64  # size of obfuscation header
+MIN_READ_SIZE = 1024
+DEFAULT_BUFFER_SIZE = 4 * 1024
+DEFAULT_MAX_PACKET_SIZE = 1024 * 1024
+DEFAULT_MAX_PENDING = 64
+
+
+class TcpRequest(NamedTuple):
+    """
+    Request of tcp connection that implements `MtprotoRequest`. There is no
+    http request over raw tcp, so handlers get only shared resources from
+    `app`, address of peer from `remote` and connection from `transport`
+    """
+    app: Application
+    remote: Optional[str]
+    transport: Optional[asyncio.BaseTransport]
+
+
+def get_remote(transport: asyncio.BaseTransport) -> Optional[str]:
+    """
+    Returns host of peer as `aiohttp.web.Request.remote` does
+    """
+    peername = transport.get_extra_info('peername')
+
+    if isinstance(peername, (list, tuple)):
+        return str(peername[0])
+
+    return None if peername is None else str(peername)
+
+
+class MtprotoTcpProtocol(asyncio.BufferedProtocol):
+    """
+    Protocol of raw tcp connection that works with MTProto protocol.
+    First 64 bytes of stream are obfuscation header that defines how to
+    decrypt obfuscated stream and what transport protocol should be used.
+
+    Stream is read into reusable receive buffer. Received bytes are
+    deobfuscated in place and split into packets by transport wrapper.
+    Packets are memoryviews of receive buffer, so region of buffer isn't
+    reused while its packets are waiting or handled. Packets are handled in
+    turn by connection task, so context vars are kept for connection as in
+    websocket handler. Reading is paused while `max_pending` packets are
+    waiting.
+
+    Protocol is passed to `MessageSender` as connection to send messages.
+
+    Args:
+        app - application with configured shared resources
+        schema - schema of customer
+        buffer_size - initial size of receive buffer
+        max_packet_size - packets over this size close connection
+        max_pending - number of received packets to pause reading
+        on_close - callback that is called with protocol when connection
+                   is closed
+    """
+
+    def __init__(
+        self,
+        app: Application,
+        schema: Schema,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        max_packet_size: int = DEFAULT_MAX_PACKET_SIZE,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        on_close: Optional[Callable[['MtprotoTcpProtocol'], None]] = None
+    ):
+        self.app = app
+        self.schema = schema
+        self.max_packet_size = max_packet_size
+        self.max_pending = max_pending
+        self._buffer_size = buffer_size
+        self._buffer = bytearray(buffer_size)
+        self._start = 0  # start of received packets that aren't split yet
+        self._end = 0  # end of received bytes
+        self._obfuscator: Optional[Obfuscator] = None
+        self._transport_wrapper: Optional[TransportWrapper] = None
+        self._message_handler: Optional[MessageHandler] = None
+        self._transport: Optional[asyncio.Transport] = None
+        self._packets: Deque[memoryview] = deque()
+        self._handling = False  # packet of receive buffer is handled
+        self._packet_received = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._reading_paused = False
+        self._closed = False
+        self._task: Optional[asyncio.Task] = None
+        self._on_close = on_close
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def close(self):
+        if self._transport is not None:
+            self._transport.close()
+
+    async def send_bytes(self, data: bytes):
+        """
+        Writes data into connection and waits while write buffer of
+        transport is full
+        """
+        if self._closed or self._transport is None:
+            return
+
+        self._transport.write(data)
+        await self._writable.wait()
+
+    def abort(self):
+        """
+        Closes connection at once and stops handling of received packets
+        """
+        if self._task is not None:
+            self._task.cancel()
+
+        if self._transport is not None:
+            self._transport.abort()
+
+    def connection_made(self, transport: asyncio.BaseTransport):
+        self._transport = cast(asyncio.Transport, transport)
+
+        try:
+            validate_shared_resources(self.app)
+        except ValueError as e:
+            logger.error(e)
+            self._transport.close()
+            return
+
+        logger.info('New tcp connection')
+        self._task = asyncio.create_task(self._handle_packets())
+
+    def connection_lost(self, exc: Optional[Exception]):
+        logger.info('Close tcp connection')
+        self._closed = True
+        self._packets.clear()
+        self._packet_received.set()
+        self._writable.set()
+
+        if self._on_close is not None:
+            self._on_close(self)
+
+    def pause_writing(self):
+        self._writable.clear()
+
+    def resume_writing(self):
+        self._writable.set()
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        pending = self._end - self._start
+        in_use = self._handling or bool(self._packets)
+
+        if not pending and not in_use:
+            if len(self._buffer) > self._buffer_size:
+                # big packet has been handled, release its buffer
+                self._buffer = bytearray(self._buffer_size)
+            self._start = self._end = 0
+        elif len(self._buffer) - self._end < MIN_READ_SIZE:
+            size = len(self._buffer)
+            if pending + MIN_READ_SIZE > size // 2:
+                size = max(size * 2, pending + MIN_READ_SIZE)
+
+            if size == len(self._buffer) and not in_use:
+                self._buffer[:pending] = self._buffer[self._start:self._end]
+            else:
+                # packets keep views of old buffer until they are handled
+                buffer = bytearray(size)
+                buffer[:pending] = self._buffer[self._start:self._end]
+                self._buffer = buffer
+
+            self._start = 0
+            self._end = pending
+
+        return memoryview(self._buffer)[self._end:]
+
+    def buffer_updated(self, nbytes: int):
+        start = self._end
+        self._end += nbytes
+
+        if self._obfuscator is None:
+            if self._end < HEADER_SIZE:
+                return
+
+            if not self._start_transport():
+                return
+
+            start = self._start = HEADER_SIZE
+
+        if start < self._end:
+            obfuscator = cast(Obfuscator, self._obfuscator)
+            with memoryview(self._buffer) as buffer:
+                obfuscator.decrypt_into(buffer[start:self._end])
+
+        self._split_packets()
+
+    def eof_received(self) -> bool:
+        return False
+
+    def _start_transport(self) -> bool:
+        transport = cast(asyncio.Transport, self._transport)
+
+        try:
+            transport_tag, obfuscator = parse_header(
+                bytes(self._buffer[:HEADER_SIZE]),
+                ctr_backend=self.app.get(
+                    CTR_BACKEND_RESOURCE_NAME,
+                    default_ctr_backend
+                )
+            )
+            transport_wrapper = get_wrapper(transport_tag)
+        except ValueError as e:
+            logger.error(str(e))
+            transport.close()
+            return False
+
+        if transport_wrapper.packet_size is None:
+            logger.error(
+                f'Transport {hex(transport_tag)} could not split tcp stream'
+            )
+            transport.close()
+            return False
+
+        message_sender = MessageSender(
+            schema=self.schema,
+            obfuscator=obfuscator,
+            transport_wrapper=transport_wrapper,
+            ws=self,
+        )
+        self._message_handler = MessageHandler(
+            schema=self.schema,
+            obfuscator=obfuscator,
+            transport_wrapper=transport_wrapper,
+            message_sender=message_sender,
+            middlewares=BASIC_MIDDLEWARES
+        )
+        self._obfuscator = obfuscator
+        self._transport_wrapper = transport_wrapper
+        logger.debug(f'Obfuscation,wrapper for {hex(transport_tag)} set')
+
+        return True
+
+    def _split_packets(self):
+        transport = cast(asyncio.Transport, self._transport)
+        transport_wrapper = cast(TransportWrapper, self._transport_wrapper)
+        get_packet_size = cast(PacketSizeFunc, transport_wrapper.packet_size)
+
+        while self._start < self._end:
+            with memoryview(self._buffer) as buffer:
+                packet_size = get_packet_size(
+                    buffer[self._start:self._end]
+                )
+
+            if packet_size is None:
+                break
+
+            if packet_size > self.max_packet_size:
+                logger.error(f'Packet of {packet_size} bytes is too big')
+                transport.close()
+                return
+
+            if self._end - self._start < packet_size:
+                break
+
+            self._packets.append(
+                memoryview(self._buffer)[
+                    self._start:self._start + packet_size
+                ]
+            )
+            self._start += packet_size
+
+        if self._packets:
+            self._packet_received.set()
+
+        if len(self._packets) >= self.max_pending:
+            self._reading_paused = True
+            transport.pause_reading()
+
+    async def _handle_packets(self):
+        transport = cast(asyncio.Transport, self._transport)
+        request = TcpRequest(
+            app=self.app,
+            remote=get_remote(transport),
+            transport=transport,
+        )
+
+        while True:
+            if not self._packets:
+                if self._closed:
+                    break
+
+                self._packet_received.clear()
+                await self._packet_received.wait()
+                continue
+
+            packet = self._packets.popleft()
+            self._handling = True
+
+            if (
+                self._reading_paused and
+                len(self._packets) <= self.max_pending // 2
+            ):
+                self._reading_paused = False
+                transport.resume_reading()
+
+            logger.info('Handle income message')
+            message_handler = cast(MessageHandler, self._message_handler)
+
+            try:
+                await message_handler.handle_transport_message(request, packet)
+            except ValueError as e:
+                logger.error(str(e))
+                transport.close()
+                break
+            except Exception:
+                logger.exception('Failed to handle tcp message')
+                transport.close()
+                break
+            finally:
+                self._handling = False
+                del packet
+
+
+class MtprotoTcpServer:
+    """
+    Raw tcp server of MTProto protocol that serves connections with shared
+    resources of aiohttp application alongside websocket handler.
+
+    Args:
+        app - application with configured shared resources
+        schema - schema of customer
+        host - host to listen on, all interfaces by default
+        port - port to listen on
+        protocol_params - params of `MtprotoTcpProtocol`
+    """
+
+    def __init__(
+        self,
+        app: Application,
+        schema: Schema,
+        host: Optional[str] = None,
+        port: int = 0,
+        **protocol_params
+    ):
+        prepare_common_schema(schema)
+
+        self.app = app
+        self.schema = schema
+        self.host = host
+        self.port = port
+        self.protocol_params = protocol_params
+        self.connections: Set[MtprotoTcpProtocol] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def sockets(self):
+        """
+        Listening sockets of started server
+        """
+        if self._server is None:
+            return ()
+
+        return self._server.sockets
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+
+        self._server = await loop.create_server(
+            self._create_protocol,
+            self.host,
+            self.port
+        )
+
+    async def close(self):
+        """
+        Stops listening and closes all connections
+        """
+        if self._server is None:
+            return
+
+        self._server.close()
+
+        for connection in list(self.connections):
+            connection.abort()
+        self.connections.clear()
+
+        await self._server.wait_closed()
+        self._server = None
+
+    def _create_protocol(self) -> MtprotoTcpProtocol:
+        protocol = MtprotoTcpProtocol(
+            self.app,
+            self.schema,
+            on_close=self.connections.discard,
+            **self.protocol_params
+        )
+        self.connections.add(protocol)
+
+        return protocol
@@ -13,7 +13,9 @@ from mtpylon.transports import (
     parse_header,
     get_wrapper,
 )
+from mtpylon.transports.ctr_backends import default_ctr_backend
 from mtpylon.middlewares import BASIC_MIDDLEWARES
+from mtpylon.service_schema import prepare_common_schema
 from mtpylon.message_sender import MessageSender
 from mtpylon.message_handler import MessageHandler
 from mtpylon.constants import (
@@ -23,6 +25,7 @@ from mtpylon.constants import (
     SERVER_SALT_MANAGER_RESOURCE_NAME,
     SESSION_SUBJECT_RESOURCE_NAME,
     ACKNOWLEDGEMENT_STORE_RESOURCE_NAME,
+    CTR_BACKEND_RESOURCE_NAME,
 )
 
 logger = logging.getLogger(__name__)
@@ -110,7 +113,13 @@ async def ws_handler(request: Request, schema: Schema) -> WebSocketResponse:
 
         if transport_tag is None:
             try:
-                transport_tag, obfuscator = parse_header(data)
+                transport_tag, obfuscator = parse_header(
+                    data,
+                    ctr_backend=request.app.get(
+                        CTR_BACKEND_RESOURCE_NAME,
+                        default_ctr_backend
+                    )
+                )
                 transport_wrapper = get_wrapper(transport_tag)
                 message_sender = MessageSender(
                     schema=schema,
@@ -148,5 +157,10 @@ async def ws_handler(request: Request, schema: Schema) -> WebSocketResponse:
 def create_websocket_handler(
         schema: Schema
 ) -> WebSocketHandler:
+    """
+    Creates websocket handler for schema. Schema joined with service schema
+    and its codecs are prepared here once and shared by all connections
+    """
+    prepare_common_schema(schema)
 
     return partial(ws_handler, schema=schema)
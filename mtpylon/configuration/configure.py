@@ -4,11 +4,16 @@ from typing import Optional
 from aiohttp.web import Application
 
 from mtpylon.schema import Schema
+from mtpylon.crypto import CachedAuthKeyManager
 from mtpylon.sessions import SessionSubject
+from mtpylon.transports.ctr_backends import get_ctr_backend
+from mtpylon.dh_prime_generators.validated import ValidatedDhPrimeGenerator
+from mtpylon.service_schema import get_common_schema, prepare_common_schema
 from mtpylon.aiohandlers import (
     create_websocket_handler,
     pub_keys_view,
     schema_view_factory,
+    MtprotoTcpServer,
 )
 from .types import (
     ConfigDict,
@@ -18,6 +23,12 @@ from .types import (
     ServerSaltManagerDict,
     SessionStorageDict,
     AcknowledgmentStoreDict,
+    CodecExecutorDict,
+    HandshakeExecutorDict,
+    DhExponentPoolDict,
+    PqPoolDict,
+    ObfuscationDict,
+    TcpServerDict,
 )
 from .import_path import import_path
 from .constants import (
@@ -27,6 +38,10 @@ from .constants import (
     DEFAULT_SERVER_SALT_MANAGER_PATH,
     DEFAULT_SESSION_STORAGE_PATH,
     DEFAULT_ACKNOWLEDGEMENT_STORAGE_PATH,
+    DEFAULT_CODEC_EXECUTOR_PATH,
+    DEFAULT_HANDSHAKE_EXECUTOR_PATH,
+    DEFAULT_DH_EXPONENT_POOL_PATH,
+    DEFAULT_PQ_POOL_PATH,
     API_VIEW,
     DEFAULT_API_PATH,
     SCHEMA_VIEW,
@@ -35,7 +50,10 @@ from .constants import (
 from ..constants import RSA_MANAGER_RESOURCE_NAME, \
     AUTH_KEY_MANAGER_RESOURCE_NAME, DH_PRIME_GENERATOR_RESOURCE_NAME, \
     SERVER_SALT_MANAGER_RESOURCE_NAME, SESSION_SUBJECT_RESOURCE_NAME, \
-    ACKNOWLEDGEMENT_STORE_RESOURCE_NAME
+    ACKNOWLEDGEMENT_STORE_RESOURCE_NAME, CODEC_EXECUTOR_RESOURCE_NAME, \
+    CTR_BACKEND_RESOURCE_NAME, HANDSHAKE_EXECUTOR_RESOURCE_NAME, \
+    DH_EXPONENT_POOL_RESOURCE_NAME, PQ_POOL_RESOURCE_NAME, \
+    TCP_SERVER_RESOURCE_NAME
 
 
 def configure_rsa_manager(app: Application, config: RsaManagerDict):
@@ -52,7 +70,9 @@ def configure_rsa_manager(app: Application, config: RsaManagerDict):
 
 def configure_auth_manager(app: Application, config: AuthKeyManagerDict):
     """
-    Configure rsa manager with dict config
+    Configure auth key manager with dict config. Manager is wrapped with
+    read-through cache if `cache` params are passed. Manager with `close`
+    coroutine is closed on application cleanup
     """
     auth_key_manager_path = config.get(
         'manager',
@@ -62,13 +82,34 @@ def configure_auth_manager(app: Application, config: AuthKeyManagerDict):
 
     params = config.get('params', {})
 
-    app[AUTH_KEY_MANAGER_RESOURCE_NAME] = auth_key_manager_class(**params)
+    auth_key_manager = auth_key_manager_class(**params)
+
+    close_auth_key_manager = getattr(auth_key_manager, 'close', None)
+    if close_auth_key_manager is not None:
+        async def close(app: Application):
+            await close_auth_key_manager()
+
+        app.on_cleanup.append(close)
+
+    if 'cache' in config:
+        auth_key_manager = CachedAuthKeyManager(
+            auth_key_manager,
+            **config['cache']
+        )
+
+    app[AUTH_KEY_MANAGER_RESOURCE_NAME] = auth_key_manager
 
 
 def configure_dh_prime_generator(
     app: Application,
     config: DhPrimeGeneratorDict
 ):
+    """
+    Configure dh prime generator. Generator is closed on application
+    cleanup. If `validate` is True generator is wrapped to verify each
+    distinct prime once. Primes are verified with handshake executor of
+    application, so it should be configured before
+    """
     dh_prime_generator_path = config.get(
         'generator',
         DEFAULT_DH_PRIME_GENERATOR_PATH
@@ -77,7 +118,20 @@ def configure_dh_prime_generator(
 
     params = config.get('params', {})
 
-    app[DH_PRIME_GENERATOR_RESOURCE_NAME] = dh_prime_generator(**params)
+    generator = dh_prime_generator(**params)
+
+    if config.get('validate', False):
+        generator = ValidatedDhPrimeGenerator(
+            generator,
+            handshake_executor=app[HANDSHAKE_EXECUTOR_RESOURCE_NAME]
+        )
+
+    app[DH_PRIME_GENERATOR_RESOURCE_NAME] = generator
+
+    async def close_dh_prime_generator(app: Application):
+        await generator.aclose()
+
+    app.on_cleanup.append(close_dh_prime_generator)
 
 
 def configure_serversalt_manager(
@@ -131,6 +185,149 @@ def configure_acknowledgement_store(
     )
 
 
+def configure_codec_executor(
+    app: Application,
+    schema: Schema,
+    config: CodecExecutorDict
+):
+    """
+    Configure executor of message codecs. Executor is started with schema
+    joined with service schema and shut down on application cleanup
+    """
+    codec_executor_path = config.get(
+        'executor',
+        DEFAULT_CODEC_EXECUTOR_PATH
+    )
+    codec_executor_class = import_path(codec_executor_path)
+
+    params = config.get('params', {})
+
+    codec_executor = codec_executor_class(**params)
+    codec_executor.start(get_common_schema(schema))
+    app[CODEC_EXECUTOR_RESOURCE_NAME] = codec_executor
+
+    async def shutdown_codec_executor(app: Application):
+        codec_executor.shutdown()
+
+    app.on_cleanup.append(shutdown_codec_executor)
+
+
+def configure_handshake_executor(
+    app: Application,
+    config: HandshakeExecutorDict
+):
+    """
+    Configure executor of auth key exchange math. Executor is started
+    on configuration and shut down on application cleanup
+    """
+    handshake_executor_path = config.get(
+        'executor',
+        DEFAULT_HANDSHAKE_EXECUTOR_PATH
+    )
+    handshake_executor_class = import_path(handshake_executor_path)
+
+    params = config.get('params', {})
+
+    handshake_executor = handshake_executor_class(**params)
+    handshake_executor.start()
+    app[HANDSHAKE_EXECUTOR_RESOURCE_NAME] = handshake_executor
+
+    async def shutdown_handshake_executor(app: Application):
+        handshake_executor.shutdown()
+
+    app.on_cleanup.append(shutdown_handshake_executor)
+
+
+def configure_dh_exponent_pool(
+    app: Application,
+    config: DhExponentPoolDict
+):
+    """
+    Configure pool of precomputed (a, g_a) pairs. Pool computes pairs with
+    handshake executor of application, so it should be configured before.
+    Pool isn't filled in background with inline handshake executor.
+    Background filling of pool is stopped on application shutdown
+    """
+    dh_exponent_pool_path = config.get('pool', DEFAULT_DH_EXPONENT_POOL_PATH)
+    dh_exponent_pool_class = import_path(dh_exponent_pool_path)
+
+    params = config.get('params', {})
+
+    dh_exponent_pool = dh_exponent_pool_class(
+        handshake_executor=app[HANDSHAKE_EXECUTOR_RESOURCE_NAME],
+        **params
+    )
+    app[DH_EXPONENT_POOL_RESOURCE_NAME] = dh_exponent_pool
+
+    async def shutdown_dh_exponent_pool(app: Application):
+        dh_exponent_pool.shutdown()
+
+    app.on_shutdown.append(shutdown_dh_exponent_pool)
+
+
+def configure_pq_pool(app: Application, config: PqPoolDict):
+    """
+    Configure pool of pregenerated p, q pairs. Pool generates pairs with
+    handshake executor of application, so it should be configured before.
+    Pool isn't filled in background with inline handshake executor.
+    Background filling of pool is stopped on application shutdown
+    """
+    pq_pool_path = config.get('pool', DEFAULT_PQ_POOL_PATH)
+    pq_pool_class = import_path(pq_pool_path)
+
+    params = config.get('params', {})
+
+    pq_pool = pq_pool_class(
+        handshake_executor=app[HANDSHAKE_EXECUTOR_RESOURCE_NAME],
+        **params
+    )
+    app[PQ_POOL_RESOURCE_NAME] = pq_pool
+
+    async def shutdown_pq_pool(app: Application):
+        pq_pool.shutdown()
+
+    app.on_shutdown.append(shutdown_pq_pool)
+
+
+def configure_obfuscation(app: Application, config: ObfuscationDict):
+    """
+    Configure AES-256-CTR backend of transport obfuscation
+
+    Raises:
+        ValueError - if backend is unknown or its library isn't installed
+    """
+    app[CTR_BACKEND_RESOURCE_NAME] = get_ctr_backend(config.get('ctr_backend'))
+
+
+def configure_tcp_server(
+    app: Application,
+    schema: Schema,
+    config: TcpServerDict
+):
+    """
+    Configure raw tcp server that serves MTProto clients with shared
+    resources of application. Server is started on application startup and
+    closed with its connections on shutdown
+    """
+    tcp_server = MtprotoTcpServer(
+        app,
+        schema,
+        host=config.get('host'),
+        port=config.get('port', 0),
+        **config.get('params', {})
+    )
+    app[TCP_SERVER_RESOURCE_NAME] = tcp_server
+
+    async def start_tcp_server(app: Application):
+        await tcp_server.start()
+
+    async def close_tcp_server(app: Application):
+        await tcp_server.close()
+
+    app.on_startup.append(start_tcp_server)
+    app.on_shutdown.append(close_tcp_server)
+
+
 def configure_views(
     app: Application,
     schema: Schema,
@@ -178,6 +375,31 @@ def configure_app(
      * `acknowledgement_storage`' - storage of messages that hasn't received
      acknowledgement
 
+     * `codec_executor` - runs message codecs inline or in dedicated
+     thread pool depending on message size
+
+     * `handshake_executor` - runs big integer math of auth key exchange
+     inline or in process pool
+
+     * `dh_exponent_pool` - if set then pool of precomputed (a, g_a) pairs
+     is used by auth key exchange. Pool pays off with dh prime generator
+     that returns the same prime and process handshake executor
+
+     * `pq_pool` - pool of pregenerated p, q pairs that are used by
+     `req_pq` and `req_pq_multi`
+
+     * `obfuscation` - selects AES-256-CTR backend of transport obfuscation
+
+     * `tcp_server` - if set then raw tcp server of MTProto protocol is
+     started alongside websocket view
+
+     * `schema_cache_dir` - directory to cache generated codecs of schema
+     joined with service schema. Joined schema is not validated and
+     described again on next start with the same schema. Customer schema
+     should be built with `mtpylon.serialization.codegen.load_schema` to
+     skip its validation too. Directory keeps python code that is executed
+     on start, so it should be writable only by user of application
+
     Customer could configure main views for this schema:
 
      * `pub_keys_view` - if set then `mtpylon.aiohandlers.pub_keys_view` will
@@ -192,6 +414,7 @@ def configure_app(
     """
     configure_rsa_manager(app, config.get('rsa_manager', {}))
     configure_auth_manager(app, config.get('auth_key_manager', {}))
+    configure_handshake_executor(app, config.get('handshake_executor', {}))
     configure_dh_prime_generator(app, config.get('dh_prime_generator', {}))
     configure_serversalt_manager(app, config.get('server_salt_manager', {}))
     configure_session_subject(app, config.get('session_storage', {}))
@@ -199,6 +422,18 @@ def configure_app(
         app,
         config.get('acknowledgement_storage', {})
     )
+    prepare_common_schema(schema, config.get('schema_cache_dir'))
+    configure_codec_executor(app, schema, config.get('codec_executor', {}))
+
+    if 'dh_exponent_pool' in config:
+        configure_dh_exponent_pool(app, config['dh_exponent_pool'])
+
+    configure_pq_pool(app, config.get('pq_pool', {}))
+    configure_obfuscation(app, config.get('obfuscation', {}))
+
+    if 'tcp_server' in config:
+        configure_tcp_server(app, schema, config['tcp_server'])
+
     configure_views(
         app,
         schema,
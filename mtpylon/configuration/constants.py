@@ -14,6 +14,14 @@ DEFAULT_SESSION_STORAGE_PATH = 'mtpylon.sessions.InMemorySessionStorage'
 DEFAULT_ACKNOWLEDGEMENT_STORAGE_PATH = \
     'mtpylon.acknowledgement_store.InmemoryAcknowledgementStore'
 
+DEFAULT_CODEC_EXECUTOR_PATH = 'mtpylon.messages.CodecExecutor'
+
+DEFAULT_HANDSHAKE_EXECUTOR_PATH = 'mtpylon.crypto.HandshakeExecutor'
+
+DEFAULT_DH_EXPONENT_POOL_PATH = 'mtpylon.crypto.DhExponentPool'
+
+DEFAULT_PQ_POOL_PATH = 'mtpylon.service_schema.PqPool'
+
 
 API_VIEW = 'mtpylon_api_view'  # name of mtpylon api view in aiohttp
 DEFAULT_API_PATH = '/ws'
@@ -27,10 +27,18 @@ class AuthKeyManagerDict(TypedDict, total=False):
     that should implement
     `mtpylon.crypto.auth_key_manager.AuthKeyManagerProtocol`. To pass
     params for creating instance of auth key manager  use `params` value
-    that should be a dict with key as string and value as any available type
+    that should be a dict with key as string and value as any available type.
+    To keep auth keys between restarts use
+    `mtpylon.crypto.persistent_auth_key_manager.PersistentAuthKeyManager`
+    with `path` param of directory to store keys in.
+    If auth keys are stored in separate service pass `cache` dict to wrap
+    manager with `mtpylon.crypto.cached_auth_key_manager.CachedAuthKeyManager`
+    read-through cache. Its keys are `max_size`, `ttl` and `negative_ttl`
+    params of cache
     """
     manager: ImportPath
     params: Dict[str, Any]
+    cache: Dict[str, Any]
 
 
 class DhPrimeGeneratorDict(TypedDict, total=False):
@@ -40,10 +48,17 @@ class DhPrimeGeneratorDict(TypedDict, total=False):
     from 2ton.com.au using `mtpylon.dh_prime_generators.two_tone.generator`
     Customer could creates it's one generator. Generator should be async
     and return `int` values. Additional params could be passed with `param`
-    attribute
+    attribute. To build safe primes locally in worker processes use
+    `mtpylon.dh_prime_generators.safe_prime.generate` with `cache_path`,
+    `pool_size` and `workers` params. Pass True as `validate` to verify
+    that each distinct prime is safe prime with suitable g once before it's
+    used. Verification is worth it for generators that reuse primes or load
+    them from outside, it runs in process pool if handshake executor
+    doesn't offload math
     """
     generator: ImportPath
     params: Dict[str, Any]
+    validate: bool
 
 
 class ServerSaltManagerDict(TypedDict, total=False):
@@ -87,6 +102,82 @@ class AcknowledgmentStoreDict(TypedDict, total=False):
     params: Dict[str, Any]
 
 
+class CodecExecutorDict(TypedDict, total=False):
+    """
+    Stores information about how to run message codecs. By default
+    `mtpylon.messages.CodecExecutor` will be used. It loads and dumps small
+    messages inline in event loop and offloads larger ones to dedicated
+    thread pool. Pass `inline_threshold` in bytes and `max_workers` of
+    thread pool in `params` dict to tune it. To decode and encode large
+    payloads in process pool use `mtpylon.messages.ProcessCodecExecutor`
+    with `process_threshold` in bytes and `process_workers` params.
+    Customer could pass path to it's own executor in `executor` key
+    """
+    executor: ImportPath
+    params: Dict[str, Any]
+
+
+class HandshakeExecutorDict(TypedDict, total=False):
+    """
+    Stores information about how to run big integer math of auth key
+    exchange. By default `mtpylon.crypto.HandshakeExecutor` will be used.
+    It runs math inline in event loop. To run it in process pool use
+    `mtpylon.crypto.ProcessHandshakeExecutor` with `max_workers` param.
+    Customer could pass path to it's own executor in `executor` key
+    """
+    executor: ImportPath
+    params: Dict[str, Any]
+
+
+class DhExponentPoolDict(TypedDict, total=False):
+    """
+    Stores information about pool of precomputed (a, g_a) pairs of auth key
+    exchange. By default `mtpylon.crypto.DhExponentPool` will be used. Pass
+    `low_watermark`, `high_watermark` and `max_pools` in `params` dict to
+    tune it. Pairs are computed with configured handshake executor, pool
+    is filled in background only with process handshake executor.
+    Pool is used only if this key is set in config.
+    Customer could pass path to it's own pool in `pool` key
+    """
+    pool: ImportPath
+    params: Dict[str, Any]
+
+
+class PqPoolDict(TypedDict, total=False):
+    """
+    Stores information about pool of pregenerated p, q pairs of `req_pq`
+    and `req_pq_multi`. By default `mtpylon.service_schema.PqPool` will be
+    used. Pass `low_watermark` and `high_watermark` in `params` dict to
+    tune it. Pairs are generated with configured handshake executor, pool
+    is filled in background only with process handshake executor.
+    Customer could pass path to it's own pool in `pool` key
+    """
+    pool: ImportPath
+    params: Dict[str, Any]
+
+
+class ObfuscationDict(TypedDict, total=False):
+    """
+    Stores information about AES-256-CTR backend of transport obfuscation.
+    Pass `tgcrypto`, `cryptography` or `pyaes` as `ctr_backend`. By default
+    the first installed backend of this list will be used
+    """
+    ctr_backend: str
+
+
+class TcpServerDict(TypedDict, total=False):
+    """
+    Stores information about raw tcp server that serves MTProto clients
+    alongside websocket view. Server listens on `host` and `port`, by
+    default on all interfaces. Params of
+    `mtpylon.aiohandlers.tcp.MtprotoTcpProtocol` like `buffer_size`,
+    `max_packet_size` and `max_pending` could be passed in `params`
+    """
+    host: str
+    port: int
+    params: Dict[str, Any]
+
+
 class ConfigDict(TypedDict, total=False):
     """
     Config for whole mtpylon application that should be passed to configure
@@ -104,6 +195,19 @@ class ConfigDict(TypedDict, total=False):
      Check `SessionStorageDict`
      * `acknowledgement_storage` - configure resource for storing
      messages that required acknowledgement. Check `AcknowledgementStoreDict`
+     * `codec_executor` - configure how messages are loaded and dumped.
+     Check `CodecExecutorDict`
+     * `handshake_executor` - configure how math of auth key exchange runs.
+     Check `HandshakeExecutorDict`
+     * `dh_exponent_pool` - use pool of precomputed DH exponents.
+     Check `DhExponentPoolDict`
+     * `pq_pool` - configure pool of pregenerated p, q pairs.
+     Check `PqPoolDict`
+     * `obfuscation` - configure cipher of transport obfuscation.
+     Check `ObfuscationDict`
+     * `tcp_server` - start raw tcp server. Check `TcpServerDict`
+     * `schema_cache_dir` - directory to cache generated codecs of schema.
+     It keeps executable python code, so protect it from other users
      * `pub_keys_path` - uri for displaying pub keys view
      * `schema_path`` - uri for displaying schema
      * `api_path` - uri for displaying api by default `/ws`
@@ -114,6 +218,13 @@ class ConfigDict(TypedDict, total=False):
     server_salt_manager: ServerSaltManagerDict
     session_storage: SessionStorageDict
     acknowledgement_storage: AcknowledgmentStoreDict
+    codec_executor: CodecExecutorDict
+    handshake_executor: HandshakeExecutorDict
+    dh_exponent_pool: DhExponentPoolDict
+    pq_pool: PqPoolDict
+    obfuscation: ObfuscationDict
+    tcp_server: TcpServerDict
+    schema_cache_dir: str
     pub_keys_path: str
     schema_path: str
     api_path: str
@@ -10,3 +10,15 @@ SERVER_SALT_MANAGER_RESOURCE_NAME = 'server_salt_manager'
 SESSION_SUBJECT_RESOURCE_NAME = 'session_subject'
 
 ACKNOWLEDGEMENT_STORE_RESOURCE_NAME = 'acknowledgement_store'
+
+CODEC_EXECUTOR_RESOURCE_NAME = 'codec_executor'
+
+HANDSHAKE_EXECUTOR_RESOURCE_NAME = 'handshake_executor'
+
+DH_EXPONENT_POOL_RESOURCE_NAME = 'dh_exponent_pool'
+
+PQ_POOL_RESOURCE_NAME = 'pq_pool'
+
+CTR_BACKEND_RESOURCE_NAME = 'ctr_backend'  # cipher of transport obfuscation
+
+TCP_SERVER_RESOURCE_NAME = 'tcp_server'  # raw tcp server of application
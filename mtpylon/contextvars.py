@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 from contextvars import ContextVar
 
 from .types import int128, int256, long
-from .crypto import AuthKey
+from .crypto import AuthKey, AuthKeyPin
 
 
 if TYPE_CHECKING:  # pragma: nocover
@@ -41,6 +41,10 @@ dh_prime_var: ContextVar[int] = ContextVar('dh_prime')
 auth_key_var: ContextVar[AuthKey] = ContextVar('auth_key')
 
 
+"""Stores auth key pinned by connection"""
+auth_key_pin_var: ContextVar[AuthKeyPin] = ContextVar('auth_key_pin')
+
+
 """Stores server salt for current context"""
 server_salt_var: ContextVar[long] = ContextVar('server_salt_var')
 
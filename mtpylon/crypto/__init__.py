@@ -1,19 +1,35 @@
 # -*- coding: utf-8 -*-
 from .auth_key import AuthKey
 from .auth_key_manager import AuthKeyManager
+from .auth_key_pin import AuthKeyPin
+from .persistent_auth_key_manager import PersistentAuthKeyManager
+from .cached_auth_key_manager import (
+    CachedAuthKeyManager,
+    CachedAuthKeyManagerMetrics,
+)
 from .exceptions import AuthKeyDoesNotExist
 from .rsa_manager import RsaManager, KeyPair
 from .key_iv_pair import KeyIvPair
 from .get_msg_key import get_msg_key
 from .generate_key_iv import generate_key_iv
+from .handshake_executor import HandshakeExecutor, ProcessHandshakeExecutor
+from .dh_exponent_pool import DhExponentPool, DhExponentPoolMetrics
 
 __all__ = [
     'RsaManager',
     'KeyPair',
     'AuthKey',
     'AuthKeyManager',
+    'AuthKeyPin',
+    'PersistentAuthKeyManager',
+    'CachedAuthKeyManager',
+    'CachedAuthKeyManagerMetrics',
     'AuthKeyDoesNotExist',
     'KeyIvPair',
     'get_msg_key',
     'generate_key_iv',
+    'HandshakeExecutor',
+    'ProcessHandshakeExecutor',
+    'DhExponentPool',
+    'DhExponentPoolMetrics',
 ]
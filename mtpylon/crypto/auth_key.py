@@ -1,11 +1,66 @@
 # -*- coding: utf-8 -*-
-from dataclasses import dataclass
 from hashlib import sha1
+from typing import Any, Tuple
+
+from ..utils import dump_integer_big_endian
 
 
-@dataclass(frozen=True)
 class AuthKey:
+    """
+    Immutable auth key shared with client. Hash, id, aux hash and parts of
+    key that are used to encrypt messages are computed once on creation,
+    so auth key could be used as dict key and to encrypt every message
+    without computing sha1 and dumping key value again.
+
+    Args:
+        value - auth key value
+    """
+    __slots__ = (
+        'value',
+        'hash',
+        'id',
+        'aux_hash',
+        'key_bytes',
+        'client_key_iv_parts',
+        'server_key_iv_parts',
+        'msg_key_part',
+    )
+
     value: int
+    hash: int
+    id: int
+    aux_hash: int
+    key_bytes: bytes
+    # parts of auth key that are hashed with msg key to generate key and iv
+    client_key_iv_parts: Tuple[bytes, bytes]
+    server_key_iv_parts: Tuple[bytes, bytes]
+    # part of auth key that is hashed with message to generate msg key
+    msg_key_part: bytes
+
+    def __init__(self, value: int):
+        key_hash = sha1(value.to_bytes(256, 'big')).digest()
+        key_bytes = dump_integer_big_endian(value)
+
+        set_attr = object.__setattr__
+        set_attr(self, 'value', value)
+        set_attr(self, 'hash', int.from_bytes(key_hash, 'big'))
+        set_attr(self, 'id', int.from_bytes(key_hash[-8:], 'big'))
+        set_attr(self, 'aux_hash', int.from_bytes(key_hash[:8], 'big'))
+        set_attr(self, 'key_bytes', key_bytes)
+        set_attr(self, 'client_key_iv_parts', _get_key_iv_parts(key_bytes, 0))
+        set_attr(self, 'server_key_iv_parts', _get_key_iv_parts(key_bytes, 8))
+        set_attr(self, 'msg_key_part', key_bytes[88:88 + 32])
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError('AuthKey is immutable')
+
+    def __delattr__(self, name: str):
+        raise AttributeError('AuthKey is immutable')
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, AuthKey):
+            return NotImplemented
+        return self.value == other.value
 
     def __hash__(self) -> int:
         """
@@ -13,23 +68,12 @@ class AuthKey:
         """
         return self.hash
 
-    @property
-    def hash(self) -> int:
-        return int.from_bytes(
-            sha1(self.value.to_bytes(256, 'big')).digest(),
-            'big'
-        )
-
-    @property
-    def id(self) -> int:
-        return int.from_bytes(
-            self.hash.to_bytes(20, 'big')[-8:],
-            'big'
-        )
-
-    @property
-    def aux_hash(self) -> int:
-        return int.from_bytes(
-            self.hash.to_bytes(20, 'big')[:8],
-            'big'
-        )
+    def __repr__(self) -> str:
+        return f'AuthKey(value={self.value})'
+
+    def __reduce__(self):
+        return AuthKey, (self.value, )
+
+
+def _get_key_iv_parts(key_bytes: bytes, x: int) -> Tuple[bytes, bytes]:
+    return key_bytes[x:36 + x], key_bytes[40 + x:76 + x]
@@ -1,10 +1,24 @@
 # -*- coding: utf-8 -*-
 import asyncio
-from typing import Protocol, Union, Dict
+from collections import OrderedDict
+from typing import (
+    Callable,
+    Protocol,
+    Union,
+    Dict,
+    List,
+    Optional,
+    runtime_checkable,
+)
+from weakref import WeakSet
 
 from .auth_key import AuthKey
 from .exceptions import AuthKeyDoesNotExist
 
+AUTH_KEY_SIZE = 256  # bytes
+DEFAULT_SHARDS = 64
+DEFAULT_HOT_KEYS = 65536
+
 
 class AuthKeyManagerProtocol(Protocol):
 
@@ -50,44 +64,168 @@ class AuthKeyManagerProtocol(Protocol):
         ...
 
 
-class AuthKeyManager(AuthKeyManagerProtocol):
+InvalidationCallback = Callable[[int], None]
+
+
+@runtime_checkable
+class InvalidatingAuthKeyManagerProtocol(AuthKeyManagerProtocol, Protocol):
+    """
+    Auth key manager that notifies connections about deleted auth keys, so
+    connections could pin resolved auth keys and don't request manager for
+    every message
+    """
+
+    def add_invalidation_callback(
+        self,
+        callback: InvalidationCallback
+    ):  # pragma: nocover
+        """
+        Registers callback that is called with id of deleted auth key.
+        Manager keeps weak reference to callback, so callback of closed
+        connection is removed with it
+        """
+        ...
+
+    def remove_invalidation_callback(
+        self,
+        callback: InvalidationCallback
+    ):  # pragma: nocover
+        """
+        Removes registered invalidation callback
+        """
+        ...
+
+    @property
+    def pin_ttl(self) -> Optional[float]:  # pragma: nocover
+        """
+        Seconds connection uses pinned auth key before it checks key with
+        manager again. None means pin is kept until auth key is deleted
+        through this manager
+        """
+        ...
+
+
+class AuthKeyInvalidationMixin:
+    """
+    Implements invalidation callbacks of
+    `InvalidatingAuthKeyManagerProtocol`. Manager calls `_invalidate` with
+    id of deleted auth key
+    """
 
     def __init__(self):
-        self._manager_lock = asyncio.Lock()
-        self._manager_map: Dict[int, AuthKey] = {}
+        self._invalidation_callbacks: WeakSet[InvalidationCallback] = \
+            WeakSet()
+
+    def add_invalidation_callback(self, callback: InvalidationCallback):
+        self._invalidation_callbacks.add(callback)
+
+    def remove_invalidation_callback(self, callback: InvalidationCallback):
+        self._invalidation_callbacks.discard(callback)
+
+    @property
+    def pin_ttl(self) -> Optional[float]:
+        return None
+
+    def _invalidate(self, auth_key_id: int):
+        for callback in list(self._invalidation_callbacks):
+            callback(auth_key_id)
+
+
+class AuthKeyManager(AuthKeyInvalidationMixin, AuthKeyManagerProtocol):
+    """
+    In-memory auth key manager. Dict reads are atomic in event loop, so
+    `has_key` and `get_key` that are called for every encrypted message
+    don't take any lock. Writes take lock of shard of key id only.
+
+    Keys are stored compactly as 256 bytes of value in shards. Recently
+    used AuthKey instances with precomputed parts are kept in hot keys
+    cache up to `hot_keys` instances, the least recently used one is
+    evicted first.
+
+    Connections pin resolved auth keys and register invalidation callbacks
+    with `add_invalidation_callback`. Callbacks are called with id of
+    deleted auth key.
+
+    Args:
+        shards - number of shards with own write lock
+        hot_keys - max number of AuthKey instances to keep
+    """
+
+    def __init__(
+        self,
+        shards: int = DEFAULT_SHARDS,
+        hot_keys: int = DEFAULT_HOT_KEYS
+    ):
+        if shards < 1:
+            raise ValueError('shards should be positive')
+
+        super().__init__()
+        self._shards: List[Dict[int, bytes]] = [{} for _ in range(shards)]
+        self._locks = [asyncio.Lock() for _ in range(shards)]
+        self._hot_keys: OrderedDict[int, AuthKey] = OrderedDict()
+        self._max_hot_keys = hot_keys
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
 
     async def set_key(self, value: Union[AuthKey, int]):
         if isinstance(value, int):
             value = AuthKey(value)
 
-        async with self._manager_lock:
-            self._manager_map[value.id] = value
+        shard_index = value.id % len(self._shards)
+
+        async with self._locks[shard_index]:
+            self._shards[shard_index][value.id] = value.value.to_bytes(
+                AUTH_KEY_SIZE,
+                'big'
+            )
+            self._set_hot_key(value)
 
     async def has_key(self, value: Union[AuthKey, int]) -> bool:
         if isinstance(value, AuthKey):
             value = value.id
 
-        async with self._manager_lock:
-            result = value in self._manager_map
-
-        return result
+        return value in self._shards[value % len(self._shards)]
 
     async def get_key(self, value: int) -> AuthKey:
-        async with self._manager_lock:
-            try:
-                result = self._manager_map[value]
-            except KeyError:
-                raise AuthKeyDoesNotExist(
-                    f'Auth key id {value} does not exist'
-                )
-        return result
+        auth_key = self._hot_keys.get(value)
+
+        if auth_key is not None:
+            self._hot_keys.move_to_end(value)
+            return auth_key
+
+        try:
+            key_bytes = self._shards[value % len(self._shards)][value]
+        except KeyError:
+            raise AuthKeyDoesNotExist(
+                f'Auth key id {value} does not exist'
+            )
+
+        auth_key = AuthKey(int.from_bytes(key_bytes, 'big'))
+        self._set_hot_key(auth_key)
+
+        return auth_key
 
     async def del_key(self, value: Union[AuthKey, int]):
         if isinstance(value, AuthKey):
             value = value.id
 
-        async with self._manager_lock:
+        shard_index = value % len(self._shards)
+
+        async with self._locks[shard_index]:
             try:
-                del self._manager_map[value]
+                del self._shards[shard_index][value]
             except KeyError:
                 raise AuthKeyDoesNotExist
+
+            self._hot_keys.pop(value, None)
+
+        self._invalidate(value)
+
+    def _set_hot_key(self, auth_key: AuthKey):
+        hot_keys = self._hot_keys
+        hot_keys[auth_key.id] = auth_key
+        hot_keys.move_to_end(auth_key.id)
+
+        if len(hot_keys) > self._max_hot_keys:
+            hot_keys.popitem(last=False)
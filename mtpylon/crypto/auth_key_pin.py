@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+from time import monotonic
+from typing import Optional
+
+from .auth_key import AuthKey
+
+
+class AuthKeyPin:
+    """
+    Auth key resolved by connection on the first message. Later messages
+    with the same auth key id use pinned key without request to auth key
+    manager. Pin is registered as invalidation callback of manager, so
+    it's cleared when auth key is deleted. If `ttl` is passed pinned key
+    expires in `ttl` seconds, so connection checks it with manager again.
+
+    Args:
+        auth_key - resolved auth key of connection
+        ttl - seconds to keep pinned auth key, it's kept until invalidation
+              by default
+    """
+
+    def __init__(self, auth_key: AuthKey, ttl: Optional[float] = None):
+        self.ttl = ttl
+        self.auth_key: Optional[AuthKey] = None
+        self.expires_at: Optional[float] = None
+        self.set(auth_key)
+
+    def set(self, auth_key: AuthKey):
+        """
+        Pins auth key that has been resolved by manager
+        """
+        self.auth_key = auth_key
+        self.expires_at = (
+            monotonic() + self.ttl
+            if self.ttl is not None
+            else None
+        )
+
+    def get(self, auth_key_id: int) -> Optional[AuthKey]:
+        """
+        Returns pinned auth key if it has got the same id and hasn't expired
+        """
+        auth_key = self.auth_key
+
+        if auth_key is None or auth_key.id != auth_key_id:
+            return None
+
+        if self.expires_at is not None and self.expires_at <= monotonic():
+            return None
+
+        return auth_key
+
+    def __call__(self, auth_key_id: int):
+        """
+        Clears pinned auth key if auth key with the same id has been deleted
+        """
+        if self.auth_key is not None and self.auth_key.id == auth_key_id:
+            self.auth_key = None
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from .auth_key import AuthKey
+from .auth_key_manager import (
+    AuthKeyInvalidationMixin,
+    AuthKeyManagerProtocol,
+)
+from .exceptions import AuthKeyDoesNotExist
+
+DEFAULT_MAX_SIZE = 65536
+DEFAULT_TTL = 300.0  # seconds
+DEFAULT_NEGATIVE_TTL = 5.0  # seconds
+
+CacheEntry = Tuple[Optional[AuthKey], float]  # auth key or None, expires at
+
+
+@dataclass
+class CachedAuthKeyManagerMetrics:
+    """
+    Counts of lookups served from cache, lookups of unknown ids served from
+    cache, requests to wrapped manager and lookups that waited for request
+    of another lookup with the same id
+    """
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Share of lookups that haven't requested wrapped manager
+        """
+        lookups = self.hits + self.negative_hits + self.misses + self.coalesced
+
+        if not lookups:
+            return 0.0
+
+        return (lookups - self.misses) / lookups
+
+
+class CachedAuthKeyManager(AuthKeyInvalidationMixin, AuthKeyManagerProtocol):
+    """
+    Read-through cache in front of auth key manager that stores keys in
+    separate service. Found AuthKey instances are kept up to `ttl` seconds
+    and ids of unknown keys up to `negative_ttl` seconds, so connections
+    with wrong auth key id don't request wrapped manager for every message.
+    Cache keeps `max_size` least recently used entries.
+
+    Concurrent lookups of the same id that isn't cached wait for single
+    request to wrapped manager.
+
+    Keys that are set or deleted through cache manager are updated in cache
+    at once. Keys changed in wrapped manager by other processes are updated
+    when entry expires.
+
+    Args:
+        manager - wrapped auth key manager
+        max_size - max number of cached entries
+        ttl - seconds to keep found auth keys
+        negative_ttl - seconds to keep ids of unknown auth keys
+    """
+
+    def __init__(
+        self,
+        manager: AuthKeyManagerProtocol,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float = DEFAULT_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL
+    ):
+        if max_size < 1:
+            raise ValueError('max_size should be positive')
+
+        super().__init__()
+        self.manager = manager
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.metrics = CachedAuthKeyManagerMetrics()
+        self._entries: OrderedDict[int, CacheEntry] = OrderedDict()
+        self._pending: Dict[int, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def pin_ttl(self) -> Optional[float]:
+        """
+        Keys could be deleted in wrapped manager by other processes, so
+        connections check pinned keys when cache entries expire
+        """
+        return self.ttl
+
+    async def set_key(self, value: Union[AuthKey, int]):
+        if isinstance(value, int):
+            value = AuthKey(value)
+
+        await self.manager.set_key(value)
+
+        self._pending.pop(value.id, None)
+        self._set_entry(value.id, value, self.ttl)
+
+    async def has_key(self, value: Union[AuthKey, int]) -> bool:
+        if isinstance(value, AuthKey):
+            value = value.id
+
+        try:
+            await self.get_key(value)
+        except AuthKeyDoesNotExist:
+            return False
+
+        return True
+
+    async def get_key(self, value: int) -> AuthKey:
+        entry = self._entries.get(value)
+
+        if entry is not None:
+            auth_key, expires_at = entry
+
+            if expires_at > monotonic():
+                self._entries.move_to_end(value)
+
+                if auth_key is None:
+                    self.metrics.negative_hits += 1
+                    raise AuthKeyDoesNotExist(
+                        f'Auth key id {value} does not exist'
+                    )
+
+                self.metrics.hits += 1
+                return auth_key
+
+            del self._entries[value]
+
+        task = self._pending.get(value)
+
+        if task is None:
+            self.metrics.misses += 1
+            task = asyncio.create_task(self._load(value))
+            self._pending[value] = task
+            task.add_done_callback(self._get_loaded_callback(value))
+        else:
+            self.metrics.coalesced += 1
+
+        # lookup could be cancelled by its connection, request is shared
+        # with other lookups, so it shouldn't be cancelled
+        return await asyncio.shield(task)
+
+    async def del_key(self, value: Union[AuthKey, int]):
+        if isinstance(value, AuthKey):
+            value = value.id
+
+        await self.manager.del_key(value)
+
+        # requests that are running could return deleted key, so their
+        # results shouldn't be cached
+        self._pending.pop(value, None)
+        self._entries.pop(value, None)
+
+        self._invalidate(value)
+
+    async def _load(self, value: int) -> AuthKey:
+        task = asyncio.current_task()
+
+        try:
+            auth_key = await self.manager.get_key(value)
+        except AuthKeyDoesNotExist:
+            # key has been set or deleted during request if task isn't
+            # pending anymore, so its result is stale
+            if self._pending.get(value) is task:
+                self._set_entry(value, None, self.negative_ttl)
+            raise
+
+        if self._pending.get(value) is task:
+            self._set_entry(value, auth_key, self.ttl)
+
+        return auth_key
+
+    def _get_loaded_callback(
+        self,
+        value: int
+    ) -> Callable[[asyncio.Task], None]:
+        def on_done(task: asyncio.Task):
+            if self._pending.get(value) is task:
+                del self._pending[value]
+
+            if not task.cancelled():
+                # all lookups could be cancelled, so exception is retrieved
+                # here to not be logged as never retrieved
+                task.exception()
+
+        return on_done
+
+    def _set_entry(
+        self,
+        value: int,
+        auth_key: Optional[AuthKey],
+        ttl: float
+    ):
+        entries = self._entries
+        entries[value] = (auth_key, monotonic() + ttl)
+        entries.move_to_end(value)
+
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import logging
+import secrets
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Tuple
+
+from .handshake_executor import HandshakeExecutor, default_handshake_executor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOW_WATERMARK = 16
+DEFAULT_HIGH_WATERMARK = 64
+DEFAULT_MAX_POOLS = 4
+# number of dh primes that have been seen once to remember
+MAX_SEEN_PRIMES = 1024
+
+ExponentPair = Tuple[int, int]  # a, g_a
+PoolKey = Tuple[int, int]  # g, dh_prime
+
+
+@dataclass
+class DhExponentPoolMetrics:
+    """
+    Counts of exponent pairs taken from pool, computed on handshake because
+    pool has been exhausted and computed in background
+    """
+    hits: int = 0
+    exhausted: int = 0
+    generated: int = 0
+
+
+def generate_exponent_pair(g: int, dh_prime: int) -> ExponentPair:
+    """
+    Generates random 2048 bit exponent `a` and computes g_a. Exponent is
+    taken from os random source, so workers forked from one process never
+    generate the same exponent
+    """
+    a = secrets.randbits(2048)
+
+    return a, pow(g, a, dh_prime)
+
+
+class DhExponentPool:
+    """
+    Pool of precomputed (a, g_a) pairs per g and dh_prime. Handshake pops
+    ready pair instead of computing 2048 bit exponentiation. Each pair is
+    removed from pool when it's popped, so pair is never reused.
+
+    Pool is filled in background up to `high_watermark` pairs when its size
+    drops below `low_watermark`. If pool is exhausted pair is computed on
+    handshake and `metrics.exhausted` is increased. Pools of least recently
+    used dh primes over `max_pools` are dropped.
+
+    Generators like `two_ton` return new prime for every handshake, pairs
+    of such prime are never used. So pool is created only for g and dh
+    prime that have been popped more than once. Pool isn't filled in
+    background if handshake executor runs math in event loop, filling
+    would stall every connection.
+
+    Args:
+        low_watermark - pool is refilled when it has got less pairs
+        high_watermark - pool is refilled up to this number of pairs
+        max_pools - max number of dh primes to keep pools for
+        handshake_executor - executor to compute pairs with
+    """
+
+    def __init__(
+        self,
+        low_watermark: int = DEFAULT_LOW_WATERMARK,
+        high_watermark: int = DEFAULT_HIGH_WATERMARK,
+        max_pools: int = DEFAULT_MAX_POOLS,
+        handshake_executor: Optional[HandshakeExecutor] = None
+    ):
+        if not 0 <= low_watermark <= high_watermark:
+            raise ValueError(
+                'Watermarks should satisfy 0 <= low_watermark <= '
+                'high_watermark'
+            )
+        if max_pools < 1:
+            raise ValueError('max_pools should be positive')
+
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.max_pools = max_pools
+        self.metrics = DhExponentPoolMetrics()
+        self._handshake_executor = (
+            handshake_executor
+            if handshake_executor is not None
+            else default_handshake_executor
+        )
+        self._pools: OrderedDict[PoolKey, Deque[ExponentPair]] = \
+            OrderedDict()
+        self._tasks: Dict[PoolKey, asyncio.Task] = {}
+        self._seen: OrderedDict[PoolKey, None] = OrderedDict()
+
+    def size(self, g: int, dh_prime: int) -> int:
+        """
+        Returns number of ready pairs for g and dh_prime
+        """
+        pairs = self._pools.get((g, dh_prime))
+
+        return len(pairs) if pairs is not None else 0
+
+    async def pop(self, g: int, dh_prime: int) -> ExponentPair:
+        """
+        Takes ready (a, g_a) pair from pool or computes it if pool has been
+        exhausted. Schedules filling of pool if it's below low watermark
+        and g, dh_prime have been popped before
+        """
+        key = (g, dh_prime)
+        pairs = self._pools.get(key)
+
+        if pairs:
+            self.metrics.hits += 1
+            self._pools.move_to_end(key)
+            pair = pairs.popleft()
+        else:
+            self.metrics.exhausted += 1
+            pair = await self._handshake_executor.run(
+                generate_exponent_pair,
+                g,
+                dh_prime
+            )
+
+        if pairs is None:
+            if not self._is_seen(key):
+                return pair
+            pairs = self._get_pairs(key)
+
+        if (
+            len(pairs) < self.low_watermark and
+            self._handshake_executor.offloaded
+        ):
+            self._schedule_fill(key)
+
+        return pair
+
+    async def fill(self, g: int, dh_prime: int):
+        """
+        Fills pool of g and dh_prime up to high watermark. Could be awaited
+        on start to prepare pool of known dh prime before first handshakes
+        """
+        key = (g, dh_prime)
+        pairs = self._get_pairs(key)
+
+        while (
+            len(pairs) < self.high_watermark and
+            self._pools.get(key) is pairs
+        ):
+            pair = await self._handshake_executor.run(
+                generate_exponent_pair,
+                g,
+                dh_prime
+            )
+            pairs.append(pair)
+            self.metrics.generated += 1
+            # inline executor computes pair in event loop, so let handshakes
+            # run between pairs
+            await asyncio.sleep(0)
+
+    def shutdown(self):
+        """
+        Cancels background filling and drops all pairs
+        """
+        for task in self._tasks.values():
+            task.cancel()
+
+        self._tasks.clear()
+        self._pools.clear()
+        self._seen.clear()
+
+    def _is_seen(self, key: PoolKey) -> bool:
+        """
+        Checks that g, dh_prime has been popped before and remembers it
+        otherwise
+        """
+        if key in self._seen:
+            del self._seen[key]
+            return True
+
+        self._seen[key] = None
+
+        while len(self._seen) > MAX_SEEN_PRIMES:
+            self._seen.popitem(last=False)
+
+        return False
+
+    def _get_pairs(self, key: PoolKey) -> Deque[ExponentPair]:
+        if key in self._pools:
+            self._pools.move_to_end(key)
+            return self._pools[key]
+
+        pairs: Deque[ExponentPair] = deque()
+        self._pools[key] = pairs
+
+        while len(self._pools) > self.max_pools:
+            old_key, _ = self._pools.popitem(last=False)
+            task = self._tasks.pop(old_key, None)
+
+            if task is not None:
+                task.cancel()
+
+        return pairs
+
+    def _schedule_fill(self, key: PoolKey):
+        if key in self._tasks:
+            return
+
+        task = asyncio.create_task(self.fill(*key))
+        self._tasks[key] = task
+
+        def on_done(task: asyncio.Task):
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+
+            if not task.cancelled() and task.exception() is not None:
+                logger.error(
+                    'Failed to fill dh exponent pool',
+                    exc_info=task.exception()
+                )
+
+        task.add_done_callback(on_done)
@@ -3,17 +3,17 @@ from hashlib import sha256
 
 from mtpylon import int128
 from mtpylon.crypto import AuthKey
-from mtpylon.utils import dump_integer_big_endian
 from mtpylon.serialization.int128 import load as load_int128
+from mtpylon.serialization.loaded import Buffer
 
 
-def get_msg_key(auth_key: AuthKey, raw_data: bytes) -> int128:
+def get_msg_key(auth_key: AuthKey, raw_data: Buffer) -> int128:
     """
     :param raw_data:
     :return:
     """
-    auth_key_bytes = dump_integer_big_endian(auth_key.value)[88:88 + 32]
-    prepared_data = auth_key_bytes + raw_data
+    msg_key_hash = sha256(auth_key.msg_key_part)
+    msg_key_hash.update(raw_data)
 
-    loaded = load_int128(sha256(prepared_data).digest()[8:24])
+    loaded = load_int128(msg_key_hash.digest(), 8)
     return loaded.value
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class HandshakeExecutor:
+    """
+    Runs big integer math of auth key exchange: rsa decryption of
+    `req_DH_params` inner data, computation of g_a and auth key.
+    Default executor runs it inline in event loop.
+    """
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Runs function of handshake math with args and returns its result
+        """
+        return func(*args)
+
+    @property
+    def offloaded(self) -> bool:
+        """
+        Whether handshake math runs outside of event loop. Inline executor
+        runs it in event loop
+        """
+        return False
+
+    def start(self):
+        """
+        Prepares executor to run handshake math. Inline executor doesn't
+        require any preparation
+        """
+
+    def shutdown(self):
+        """
+        Waits for running handshake math and releases resources of executor
+        """
+
+
+class ProcessHandshakeExecutor(HandshakeExecutor):
+    """
+    Handshake executor that runs handshake math in process pool. Modular
+    exponentiation of 2048 bit numbers takes milliseconds and holds GIL,
+    so running it in event loop or thread pool blocks every other
+    connection of worker.
+
+    Functions and args are passed to workers by reference, so they should
+    be picklable and importable in worker process.
+
+    Args:
+        max_workers - size of process pool
+        start_method - multiprocessing start method of workers
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        start_method: Optional[str] = None
+    ):
+        self._max_workers = max_workers
+        self._start_method = start_method
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Runs function in process pool. Runs it inline if executor hasn't
+        been started
+        """
+        if self._executor is None:
+            return await super().run(func, *args)
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    @property
+    def offloaded(self) -> bool:
+        return self._executor is not None
+
+    def start(self):
+        """
+        Starts process pool
+        """
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context(self._start_method),
+        )
+
+    def shutdown(self):
+        """
+        Waits for running handshake math and shuts down process pool
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+default_handshake_executor = HandshakeExecutor()
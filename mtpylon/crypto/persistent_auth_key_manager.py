@@ -0,0 +1,735 @@
+# -*- coding: utf-8 -*-
+"""
+Auth key manager that keeps auth keys between restarts. Keys are appended to
+log file and found with hash index in memory mapped file. Log of manager
+could be compacted offline::
+
+    python -m mtpylon.crypto.persistent_auth_key_manager compact <path>
+"""
+import asyncio
+import logging
+import mmap
+import os
+import struct
+import sys
+from collections import OrderedDict
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .auth_key import AuthKey
+from .auth_key_manager import (
+    AuthKeyInvalidationMixin,
+    AuthKeyManagerProtocol,
+    AUTH_KEY_SIZE,
+    DEFAULT_HOT_KEYS,
+)
+from .exceptions import AuthKeyDoesNotExist
+
+logger = logging.getLogger(__name__)
+
+LOG_FILE = 'auth_keys.log'
+INDEX_FILE = 'auth_keys.idx'
+
+RECORD = struct.Struct(f'<QB{AUTH_KEY_SIZE}s')  # auth key id, type, value
+SET_RECORD = 1
+DEL_RECORD = 2
+
+INDEX_MAGIC = b'MTPAKIX1'
+# magic, capacity, count, used slots, indexed log size, clean flag
+INDEX_HEADER = struct.Struct('<8sQQQQQ')
+INDEX_HEADER_SIZE = 64
+SLOT = struct.Struct('<QQ')  # auth key id, offset of record + 1
+EMPTY_SLOT = 0
+DELETED_SLOT = 2 ** 64 - 1
+MIN_CAPACITY = 1024
+
+DEFAULT_SYNC_DELAY = 0.005  # seconds
+DEFAULT_SYNC_BATCH = 256
+
+READ_CHUNK = RECORD.size * 4096
+
+
+def get_capacity(count: int) -> int:
+    """
+    Returns power of two capacity of index that keeps load factor of
+    `count` keys below 1/2
+    """
+    capacity = MIN_CAPACITY
+
+    while capacity < count * 2:
+        capacity *= 2
+
+    return capacity
+
+
+class AuthKeyIndex:
+    """
+    Open addressing hash table of auth key id to offset of its record in
+    log. Table is stored in memory mapped file, so it's loaded on start
+    without reading log. Auth key ids are parts of sha1 hashes, so lower
+    bits of id are used as hash.
+
+    Header keeps count of keys and size of log that has been indexed.
+    Clean flag of header is reset before the first change and set on close,
+    index without clean flag is rebuilt from log on start.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'r+b')
+
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0)
+        except (OSError, ValueError):
+            self._file.close()
+            raise
+
+        magic, capacity, count, used, log_size, clean = \
+            INDEX_HEADER.unpack_from(self._map)
+
+        if magic != INDEX_MAGIC:
+            self.close()
+            raise ValueError(f'Wrong auth key index file {path}')
+
+        if len(self._map) != INDEX_HEADER_SIZE + capacity * SLOT.size:
+            self.close()
+            raise ValueError(f'Wrong size of auth key index file {path}')
+
+        self.capacity = capacity
+        self.count = count
+        self.used = used
+        self.log_size = log_size
+        self.clean = bool(clean)
+
+    @classmethod
+    def create(
+        cls,
+        path: str,
+        entries: List[Tuple[int, int]],
+        log_size: int,
+        capacity: Optional[int] = None,
+        clean: bool = True
+    ) -> 'AuthKeyIndex':
+        """
+        Creates index file with entries of auth key id and record offset
+        atomically and opens it. Index that is created while log is
+        changed should not be clean, otherwise changes that aren't indexed
+        yet are lost if process stops
+
+        Args:
+            path - path of index file
+            entries - auth key ids and offsets of their records
+            log_size - size of indexed log
+            capacity - number of slots, power of two. Minimal capacity for
+                       entries is used by default
+            clean - clean flag of created index
+        """
+        count = len(entries)
+        if capacity is None:
+            capacity = get_capacity(count)
+        tmp_path = f'{path}.tmp'
+
+        with open(tmp_path, 'w+b') as f:
+            f.truncate(INDEX_HEADER_SIZE + capacity * SLOT.size)
+
+            with mmap.mmap(f.fileno(), 0) as index_map:
+                mask = capacity - 1
+
+                for auth_key_id, offset in entries:
+                    slot = auth_key_id & mask
+
+                    while SLOT.unpack_from(
+                        index_map,
+                        INDEX_HEADER_SIZE + slot * SLOT.size
+                    )[1] != EMPTY_SLOT:
+                        slot = (slot + 1) & mask
+
+                    SLOT.pack_into(
+                        index_map,
+                        INDEX_HEADER_SIZE + slot * SLOT.size,
+                        auth_key_id,
+                        offset + 1
+                    )
+
+                INDEX_HEADER.pack_into(
+                    index_map,
+                    0,
+                    INDEX_MAGIC,
+                    capacity,
+                    count,
+                    count,
+                    log_size,
+                    int(clean)
+                )
+                index_map.flush()
+
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, path)
+
+        return cls(path)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def is_full(self) -> bool:
+        """
+        Checks that index should be grown before new key is added
+        """
+        return (self.used + 1) * 2 > self.capacity
+
+    def get(self, auth_key_id: int) -> Optional[int]:
+        """
+        Returns offset of auth key record in log or None if key is not
+        indexed
+        """
+        index_map = self._map
+        mask = self.capacity - 1
+        slot = auth_key_id & mask
+
+        while True:
+            slot_id, offset = SLOT.unpack_from(
+                index_map,
+                INDEX_HEADER_SIZE + slot * SLOT.size
+            )
+
+            if offset == EMPTY_SLOT:
+                return None
+
+            if slot_id == auth_key_id and offset != DELETED_SLOT:
+                return offset - 1
+
+            slot = (slot + 1) & mask
+
+    def set(self, auth_key_id: int, offset: int):
+        """
+        Sets offset of auth key record in log. Index should not be full
+        """
+        index_map = self._map
+        mask = self.capacity - 1
+        slot = auth_key_id & mask
+        free_slot = None
+
+        while True:
+            slot_id, slot_offset = SLOT.unpack_from(
+                index_map,
+                INDEX_HEADER_SIZE + slot * SLOT.size
+            )
+
+            if slot_offset == EMPTY_SLOT:
+                break
+
+            if slot_offset == DELETED_SLOT:
+                if free_slot is None:
+                    free_slot = slot
+            elif slot_id == auth_key_id:
+                free_slot = slot
+                self.count -= 1
+                break
+
+            slot = (slot + 1) & mask
+
+        if free_slot is None:
+            free_slot = slot
+            self.used += 1
+
+        self.count += 1
+        SLOT.pack_into(
+            index_map,
+            INDEX_HEADER_SIZE + free_slot * SLOT.size,
+            auth_key_id,
+            offset + 1
+        )
+
+    def delete(self, auth_key_id: int) -> bool:
+        """
+        Removes auth key from index. Returns False if key is not indexed
+        """
+        index_map = self._map
+        mask = self.capacity - 1
+        slot = auth_key_id & mask
+
+        while True:
+            slot_id, offset = SLOT.unpack_from(
+                index_map,
+                INDEX_HEADER_SIZE + slot * SLOT.size
+            )
+
+            if offset == EMPTY_SLOT:
+                return False
+
+            if slot_id == auth_key_id and offset != DELETED_SLOT:
+                SLOT.pack_into(
+                    index_map,
+                    INDEX_HEADER_SIZE + slot * SLOT.size,
+                    auth_key_id,
+                    DELETED_SLOT
+                )
+                self.count -= 1
+                return True
+
+            slot = (slot + 1) & mask
+
+    def items(self) -> Iterator[Tuple[int, int]]:
+        """
+        Iterates over indexed auth key ids and offsets of their records
+        """
+        for auth_key_id, offset in SLOT.iter_unpack(
+            self._map[INDEX_HEADER_SIZE:]
+        ):
+            if offset != EMPTY_SLOT and offset != DELETED_SLOT:
+                yield auth_key_id, offset - 1
+
+    def write_header(self, clean: bool):
+        """
+        Writes counters and clean flag into header
+        """
+        self.clean = clean
+        INDEX_HEADER.pack_into(
+            self._map,
+            0,
+            INDEX_MAGIC,
+            self.capacity,
+            self.count,
+            self.used,
+            self.log_size,
+            int(clean)
+        )
+
+    def flush(self):
+        """
+        Flushes changed pages of index to file
+        """
+        self._map.flush()
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+def read_record(fd: int, offset: int) -> bytes:
+    """
+    Reads record of log at offset
+
+    Raises:
+        ValueError - if log is shorter than record
+    """
+    record = os.pread(fd, RECORD.size, offset)
+
+    if len(record) != RECORD.size:
+        raise ValueError(
+            f'Auth key log is truncated, got {len(record)} bytes of '
+            f'record at {offset}'
+        )
+
+    return record
+
+
+def read_records(fd: int, log_size: int) -> Iterator[Tuple[int, int, int]]:
+    """
+    Iterates over records of log, returns offset of record, auth key id
+    and type of record
+    """
+    offset = 0
+
+    while offset < log_size:
+        chunk = os.pread(fd, min(READ_CHUNK, log_size - offset), offset)
+
+        for auth_key_id, record_type, _ in RECORD.iter_unpack(chunk):
+            yield offset, auth_key_id, record_type
+            offset += RECORD.size
+
+
+def replay_log(fd: int, log_size: int) -> Dict[int, int]:
+    """
+    Reads log and returns offsets of records of existing auth keys by
+    their ids
+    """
+    offsets: Dict[int, int] = {}
+
+    for offset, auth_key_id, record_type in read_records(fd, log_size):
+        if record_type == SET_RECORD:
+            offsets[auth_key_id] = offset
+        else:
+            offsets.pop(auth_key_id, None)
+
+    return offsets
+
+
+def compact_log(
+    fd: int,
+    index: AuthKeyIndex,
+    log_path: str,
+    index_path: str
+) -> Tuple[str, str]:
+    """
+    Writes records of existing auth keys into new log and builds index for
+    it. Returns temporary paths of new log and index files
+    """
+    new_log_path = f'{log_path}.compact'
+    new_index_path = f'{index_path}.compact'
+    offsets: List[Tuple[int, int]] = []
+
+    with open(new_log_path, 'wb') as f:
+        for auth_key_id, offset in index.items():
+            offsets.append((auth_key_id, f.tell()))
+            f.write(read_record(fd, offset))
+
+        f.flush()
+        os.fsync(f.fileno())
+        log_size = f.tell()
+
+    AuthKeyIndex.create(new_index_path, offsets, log_size).close()
+
+    return new_log_path, new_index_path
+
+
+class PersistentAuthKeyManager(
+    AuthKeyInvalidationMixin,
+    AuthKeyManagerProtocol
+):
+    """
+    Auth key manager that stores keys in directory, so clients don't
+    repeat auth key exchange after restart. Each change is appended to log
+    file as fixed size record. Log offsets of keys are kept in hash index in
+    memory mapped file, so start maps index instead of reading log. Index
+    is rebuilt from log only if manager hasn't been closed properly.
+
+    Changes wait for fsync of log. Changes that are made within `sync_delay`
+    seconds share one fsync, fsync is started at once when `sync_batch`
+    changes are waiting.
+
+    Deleted keys stay in log until `compact` is called.
+    Recently used AuthKey instances are kept in hot keys cache, the least
+    recently used one is evicted first.
+
+    Args:
+        path - directory to store log and index files
+        sync_delay - seconds to collect changes for one fsync
+        sync_batch - max number of changes to wait for one fsync
+        hot_keys - max number of AuthKey instances to keep
+    """
+
+    def __init__(
+        self,
+        path: str,
+        sync_delay: float = DEFAULT_SYNC_DELAY,
+        sync_batch: int = DEFAULT_SYNC_BATCH,
+        hot_keys: int = DEFAULT_HOT_KEYS
+    ):
+        if sync_batch < 1:
+            raise ValueError('sync_batch should be positive')
+
+        os.makedirs(path, exist_ok=True)
+
+        super().__init__()
+        self.path = path
+        self.sync_delay = sync_delay
+        self.sync_batch = sync_batch
+        self._log_path = os.path.join(path, LOG_FILE)
+        self._index_path = os.path.join(path, INDEX_FILE)
+        self._lock: Optional[asyncio.Lock] = None
+        self._sync_waiters: List[asyncio.Future] = []
+        self._sync_handle: Optional[asyncio.TimerHandle] = None
+        self._fsync_tasks: Set[asyncio.Task] = set()
+        self._hot_keys: OrderedDict[int, AuthKey] = OrderedDict()
+        self._max_hot_keys = hot_keys
+        self._open()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def dead_records(self) -> int:
+        """
+        Number of log records of deleted and replaced keys that would be
+        removed by compaction
+        """
+        return self._log_size // RECORD.size - len(self._index)
+
+    async def set_key(self, value: Union[AuthKey, int]):
+        if isinstance(value, int):
+            value = AuthKey(value)
+
+        async with self._get_lock():
+            self._append(
+                value.id,
+                SET_RECORD,
+                value.value.to_bytes(AUTH_KEY_SIZE, 'big')
+            )
+            self._set_hot_key(value)
+
+        await self._sync()
+
+    async def has_key(self, value: Union[AuthKey, int]) -> bool:
+        if isinstance(value, AuthKey):
+            value = value.id
+
+        return self._index.get(value) is not None
+
+    async def get_key(self, value: int) -> AuthKey:
+        """
+        Returns hot auth key or reads its record from log
+
+        Raises:
+            AuthKeyDoesNotExist - if key doesn't store in manager
+            ValueError - if record of key in log is truncated or doesn't
+                         match index
+        """
+        auth_key = self._hot_keys.get(value)
+
+        if auth_key is not None:
+            self._hot_keys.move_to_end(value)
+            return auth_key
+
+        offset = self._index.get(value)
+
+        if offset is None:
+            raise AuthKeyDoesNotExist(f'Auth key id {value} does not exist')
+
+        auth_key_id, record_type, key_bytes = RECORD.unpack(
+            read_record(self._fd, offset)
+        )
+
+        if auth_key_id != value or record_type != SET_RECORD:
+            raise ValueError(
+                f'Record at {offset} is not auth key {value}, index is '
+                'corrupted'
+            )
+
+        auth_key = AuthKey(int.from_bytes(key_bytes, 'big'))
+        self._set_hot_key(auth_key)
+
+        return auth_key
+
+    async def del_key(self, value: Union[AuthKey, int]):
+        if isinstance(value, AuthKey):
+            value = value.id
+
+        async with self._get_lock():
+            if self._index.get(value) is None:
+                raise AuthKeyDoesNotExist
+
+            self._append(value, DEL_RECORD, bytes(AUTH_KEY_SIZE))
+            self._hot_keys.pop(value, None)
+
+        self._invalidate(value)
+
+        await self._sync()
+
+    async def compact(self):
+        """
+        Rewrites log without records of deleted and replaced keys. New log
+        and index are built in thread pool, keys could be read meanwhile
+        but changes wait for compaction
+        """
+        async with self._get_lock():
+            await self._wait_synced()
+            self._index.write_header(clean=False)
+            self._index.flush()
+
+            loop = asyncio.get_running_loop()
+            new_log_path, new_index_path = await loop.run_in_executor(
+                None,
+                compact_log,
+                self._fd,
+                self._index,
+                self._log_path,
+                self._index_path
+            )
+
+            dead_records = self.dead_records
+            self._close_files()
+            os.replace(new_log_path, self._log_path)
+            os.replace(new_index_path, self._index_path)
+            self._open()
+
+            logger.info(f'Auth key log compacted, {dead_records} removed')
+
+    async def close(self):
+        """
+        Syncs log and marks index clean, so it's mapped on next start
+        """
+        await self._wait_synced()
+
+        self._index.log_size = self._log_size
+        self._index.write_header(clean=True)
+        self._index.flush()
+        self._close_files()
+
+    def _open(self):
+        self._fd = os.open(self._log_path, os.O_RDWR | os.O_CREAT, 0o600)
+        log_size = os.fstat(self._fd).st_size
+        self._log_size = log_size - log_size % RECORD.size
+
+        if self._log_size != log_size:
+            logger.warning('Auth key log has been truncated')
+            os.ftruncate(self._fd, self._log_size)
+
+        index = None
+        try:
+            index = AuthKeyIndex(self._index_path)
+        except (OSError, ValueError, struct.error):
+            pass
+
+        if (
+            index is not None and
+            index.clean and
+            index.log_size == self._log_size
+        ):
+            self._index = index
+            self._changed = False
+            return
+
+        if index is not None:
+            index.close()
+
+        if index is not None or self._log_size:
+            logger.warning('Auth key index is rebuilt from log')
+
+        self._index = AuthKeyIndex.create(
+            self._index_path,
+            list(replay_log(self._fd, self._log_size).items()),
+            self._log_size
+        )
+        self._changed = False
+
+    def _close_files(self):
+        self._index.close()
+        os.close(self._fd)
+
+    def _append(self, auth_key_id: int, record_type: int, value: bytes):
+        if not self._changed:
+            # index is rebuilt if process stops before close
+            self._index.write_header(clean=False)
+            self._index.flush()
+            self._changed = True
+
+        offset = self._log_size
+        os.pwrite(
+            self._fd,
+            RECORD.pack(auth_key_id, record_type, value),
+            offset
+        )
+        self._log_size += RECORD.size
+
+        if record_type == DEL_RECORD:
+            self._index.delete(auth_key_id)
+            return
+
+        if self._index.is_full():
+            self._grow_index()
+
+        self._index.set(auth_key_id, offset)
+
+    def _grow_index(self):
+        index = self._index
+        entries = list(index.items())
+        index.close()
+
+        # key that is being appended is set after growth, so index is
+        # created not clean to be rebuilt if process stops before close
+        self._index = AuthKeyIndex.create(
+            self._index_path,
+            entries,
+            self._log_size,
+            index.capacity * 2,
+            clean=False
+        )
+
+    async def _sync(self):
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._sync_waiters.append(waiter)
+
+        if len(self._sync_waiters) >= self.sync_batch:
+            self._flush_waiters()
+        elif self._sync_handle is None:
+            self._sync_handle = loop.call_later(
+                self.sync_delay,
+                self._flush_waiters
+            )
+
+        await waiter
+
+    def _flush_waiters(self):
+        if self._sync_handle is not None:
+            self._sync_handle.cancel()
+            self._sync_handle = None
+
+        waiters = self._sync_waiters
+        self._sync_waiters = []
+
+        if waiters:
+            task = asyncio.create_task(self._fsync(waiters, self._fd))
+            self._fsync_tasks.add(task)
+            task.add_done_callback(self._fsync_tasks.discard)
+
+    async def _wait_synced(self):
+        self._flush_waiters()
+
+        if self._fsync_tasks:
+            await asyncio.gather(*self._fsync_tasks)
+
+    async def _fsync(self, waiters: List[asyncio.Future], fd: int):
+        loop = asyncio.get_running_loop()
+
+        try:
+            await loop.run_in_executor(None, os.fsync, fd)
+        except Exception as e:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(e)
+            return
+
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        return self._lock
+
+    def _set_hot_key(self, auth_key: AuthKey):
+        hot_keys = self._hot_keys
+        hot_keys[auth_key.id] = auth_key
+        hot_keys.move_to_end(auth_key.id)
+
+        if len(hot_keys) > self._max_hot_keys:
+            hot_keys.popitem(last=False)
+
+
+async def compact(path: str):
+    """
+    Compacts log of persistent auth key manager stored in directory
+    """
+    manager = PersistentAuthKeyManager(path)
+    await manager.compact()
+    await manager.close()
+
+
+def main():
+    """
+    Compacts log of auth keys
+    """
+    if len(sys.argv) != 3 or sys.argv[1] != 'compact':
+        print(
+            'Usage: python -m mtpylon.crypto.persistent_auth_key_manager '
+            'compact <path>'
+        )
+        sys.exit(1)
+
+    asyncio.run(compact(sys.argv[2]))
+
+
+if __name__ == '__main__':
+    main()
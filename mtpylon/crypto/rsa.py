@@ -17,10 +17,17 @@ def encrypt(original_data: bytes, public: rsa.PublicKey) -> bytes:
 
 def decrypt(encrypted_data: bytes, private: rsa.PrivateKey) -> bytes:
     """
-    Rough rsa dencrypt implementation only for auth key exchange
+    Rough rsa dencrypt implementation only for auth key exchange.
+    Uses chinese remainder theorem: exponentiations by halves of private
+    exponent modulo primes p and q are about 3 times faster than
+    exponentiation by private exponent modulo n
     """
     encrypted_value = int.from_bytes(encrypted_data, 'big')
 
-    original_value = pow(encrypted_value, private.d, private.n)
+    m1 = pow(encrypted_value, private.exp1, private.p)
+    m2 = pow(encrypted_value, private.exp2, private.q)
+    h = (private.coef * (m1 - m2)) % private.p
+
+    original_value = m2 + h * private.q
 
     return original_value.to_bytes(bytes_needed(original_value), 'big')
@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+"""
+Generator of dh primes that builds safe primes locally in worker processes
+and keeps pool of verified primes. Pool is stored in local file, so primes
+are not built again on restart. File could be prepared offline::
+
+    python -m mtpylon.dh_prime_generators.safe_prime primes.txt 4
+"""
+import asyncio
+import logging
+import os
+import secrets
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from mtpylon.crypto.random_prime import is_miller_rabin_passed
+
+from .typing import DhPrimeGenerator
+
+logger = logging.getLogger(__name__)
+
+DH_PRIME_BITS = 2048
+DEFAULT_POOL_SIZE = 4
+SIEVE_LIMIT = 1 << 16
+SEARCH_WINDOW = 1 << 14
+
+
+def _get_small_primes(limit: int) -> List[int]:
+    sieve = bytearray([1]) * limit
+    sieve[:2] = b'\x00\x00'
+
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit, i)))
+
+    return [i for i in range(3, limit) if sieve[i]]
+
+
+small_primes = _get_small_primes(SIEVE_LIMIT)
+
+
+def is_safe_prime(value: int, bits: int = DH_PRIME_BITS) -> bool:
+    """
+    Checks that value is `bits` long safe prime: value and (value - 1) / 2
+    are primes. 2 ^ (bits - 1) < value < 2 ^ bits
+    """
+    if value.bit_length() != bits or value % 2 == 0:
+        return False
+
+    q = (value - 1) // 2
+
+    for prime in small_primes:
+        if prime >= q:
+            break
+        if value % prime == 0 or q % prime == 0:
+            return False
+
+    return is_miller_rabin_passed(q) and is_miller_rabin_passed(value)
+
+
+def search_safe_prime(
+    bits: int = DH_PRIME_BITS,
+    window: int = SEARCH_WINDOW
+) -> Optional[int]:
+    """
+    Searches safe prime p = 2q + 1 among `window` candidates q starting from
+    random odd number. Candidates that p or q are divisible by small prime
+    are sieved out, remaining ones are checked with Fermat test.
+
+    Returns:
+        verified safe prime or None if window hasn't got safe primes
+    """
+    q0 = secrets.randbits(bits - 1) | (1 << (bits - 2)) | 1
+    # q = q0 + 2k and p = 2 * q0 + 1 + 4k
+    candidates = bytearray([1]) * window
+
+    for prime in small_primes:
+        k = (-q0 * pow(2, -1, prime)) % prime
+        candidates[k::prime] = bytes(len(range(k, window, prime)))
+
+        k = (-(2 * q0 + 1) * pow(4, -1, prime)) % prime
+        candidates[k::prime] = bytes(len(range(k, window, prime)))
+
+    for k in range(window):
+        if not candidates[k]:
+            continue
+
+        q = q0 + 2 * k
+        p = 2 * q + 1
+
+        if (
+            pow(2, q - 1, q) == 1 and
+            pow(2, p - 1, p) == 1 and
+            is_safe_prime(p, bits)
+        ):
+            return p
+
+    return None
+
+
+def load_primes(path: str) -> List[int]:
+    """
+    Loads primes stored by one in line. Wrong lines are skipped,
+    primes should be verified after loading
+    """
+    if not os.path.exists(path):
+        return []
+
+    primes = []
+
+    with open(path) as f:
+        for line in f:
+            try:
+                primes.append(int(line))
+            except ValueError:
+                logger.warning(f'Wrong dh prime line in {path}')
+
+    return primes
+
+
+def store_primes(path: str, primes: List[int]):
+    """
+    Rewrites file of primes atomically
+    """
+    tmp_path = f'{path}.tmp'
+
+    with open(tmp_path, 'w') as f:
+        f.writelines(f'{prime}\n' for prime in primes)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, path)
+
+
+class SafePrimeGenerator(DhPrimeGenerator):
+    """
+    Dh prime generator with pool of verified safe primes. It could be shared
+    by all handshakes of application: `asend` is plain coroutine, so
+    concurrent calls are served from prefetch buffer without
+    `asynchronous generator is already running` error. Primes of buffer
+    are returned in turn.
+
+    Buffer is filled in background on first call. Primes of cache file are
+    verified again and missing primes are built in process pool. Handshakes
+    wait for the first prime if buffer is empty. If filling fails before
+    the first prime, its error is raised to every handshake.
+
+    Args:
+        cache_path - path of file to store primes between restarts
+        pool_size - number of primes to keep
+        workers - size of process pool
+        bits - size of primes in bits
+    """
+
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        workers: Optional[int] = None,
+        bits: int = DH_PRIME_BITS
+    ):
+        if pool_size < 1:
+            raise ValueError('pool_size should be positive')
+
+        self.cache_path = cache_path
+        self.pool_size = pool_size
+        self.bits = bits
+        self.primes: List[int] = []
+        self._workers = workers
+        self._index = 0
+        self._ready: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    async def asend(self, value: None) -> int:
+        """
+        Returns next prime of buffer. Waits for the first prime if buffer
+        is empty
+
+        Raises:
+            Exception - error of filling if there aren't any primes
+            RuntimeError - if generator has been closed without primes
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self.fill())
+            self._task.add_done_callback(self._on_filled)
+
+        if not self.primes:
+            await self._get_ready().wait()
+
+        if not self.primes:
+            if self._error is not None:
+                raise self._error
+            raise RuntimeError('Dh prime generator has been closed')
+
+        prime = self.primes[self._index % len(self.primes)]
+        self._index += 1
+
+        return prime
+
+    async def athrow(self, typ, val=None, tb=None):
+        """
+        Raises exception passed into generator
+        """
+        if val is None:
+            val = typ()
+        raise val
+
+    async def aclose(self):
+        """
+        Stops building primes and shuts down process pool
+        """
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        self._get_ready().set()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def fill(self) -> None:
+        """
+        Verifies primes of cache file and builds missing primes up to pool
+        size. Each built prime is stored to cache file
+        """
+        loop = asyncio.get_running_loop()
+        workers = self._workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+
+        loaded: List[int] = []
+        if self.cache_path is not None:
+            loaded = load_primes(self.cache_path)
+        cached = loaded[:self.pool_size]
+
+        verify_jobs = [
+            loop.run_in_executor(
+                self._executor,
+                is_safe_prime,
+                prime,
+                self.bits
+            )
+            for prime in cached
+        ]
+        for prime, job in zip(cached, verify_jobs):
+            if await job:
+                self._add_prime(prime)
+            else:
+                logger.warning('Cached dh prime is not safe prime')
+
+        if self.primes != loaded:
+            self._store()
+
+        while len(self.primes) < self.pool_size:
+            jobs = [
+                loop.run_in_executor(
+                    self._executor,
+                    search_safe_prime,
+                    self.bits
+                )
+                for _ in range(workers)
+            ]
+
+            for built_prime in await asyncio.gather(*jobs):
+                if (
+                    built_prime is not None and
+                    len(self.primes) < self.pool_size
+                ):
+                    logger.info('Safe dh prime has been built')
+                    self._add_prime(built_prime)
+                    self._store()
+
+        self._executor.shutdown(wait=True)
+        self._executor = None
+
+    def _on_filled(self, task: asyncio.Task):
+        if task.cancelled() or task.exception() is None:
+            return
+
+        self._error = task.exception()
+        logger.error('Failed to fill dh primes', exc_info=self._error)
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+        # handshakes that wait for the first prime get error of filling
+        self._get_ready().set()
+
+    def _get_ready(self) -> asyncio.Event:
+        if self._ready is None:
+            self._ready = asyncio.Event()
+
+        return self._ready
+
+    def _add_prime(self, prime: int):
+        self.primes.append(prime)
+        self._get_ready().set()
+
+    def _store(self):
+        if self.cache_path is not None:
+            store_primes(self.cache_path, self.primes)
+
+
+def generate(
+    cache_path: Optional[str] = None,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    workers: Optional[int] = None,
+    bits: int = DH_PRIME_BITS
+) -> DhPrimeGenerator:
+    """
+    Returns dh prime generator that builds safe primes locally and stores
+    them in `cache_path` file
+    """
+    return SafePrimeGenerator(
+        cache_path=cache_path,
+        pool_size=pool_size,
+        workers=workers,
+        bits=bits,
+    )
+
+
+def main():
+    """
+    Builds safe primes and stores them into file
+    """
+    if len(sys.argv) != 3:
+        print(
+            'Usage: python -m mtpylon.dh_prime_generators.safe_prime '
+            '<path> <count>'
+        )
+        sys.exit(1)
+
+    path, count = sys.argv[1], int(sys.argv[2])
+
+    asyncio.run(generate(cache_path=path, pool_size=count).fill())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import logging
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from hashlib import sha256
+from typing import Dict, Optional
+
+from mtpylon.crypto.handshake_executor import HandshakeExecutor
+from mtpylon.utils import dump_integer_big_endian
+
+from .safe_prime import is_safe_prime, DH_PRIME_BITS
+from .typing import DhPrimeGenerator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_G = 3
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_CACHE_SIZE = 4096
+
+
+def is_valid_g(prime: int, g: int) -> bool:
+    """
+    Checks that g generates cyclic subgroup of prime order (prime - 1) / 2
+    as it's required by client
+    """
+    if g == 2:
+        return prime % 8 == 7
+    if g == 3:
+        return prime % 3 == 2
+    if g == 4:
+        return True
+    if g == 5:
+        return prime % 5 in (1, 4)
+    if g == 6:
+        return prime % 24 in (19, 23)
+    if g == 7:
+        return prime % 7 in (3, 5, 6)
+    return False
+
+
+def is_valid_dh_prime(prime: int, g: int = DEFAULT_G) -> bool:
+    """
+    Checks that prime is 2048 bit safe prime and g is suitable generator
+    for it
+    """
+    return is_valid_g(prime, g) and is_safe_prime(prime, DH_PRIME_BITS)
+
+
+def get_prime_digest(prime: int) -> bytes:
+    return sha256(dump_integer_big_endian(prime)).digest()
+
+
+class ValidatedDhPrimeGenerator(DhPrimeGenerator):
+    """
+    Wraps dh prime generator with external source of primes, so only
+    verified primes are used by `req_DH_params`. Each distinct prime is
+    verified once and verdict is cached by sha256 digest of prime.
+    Handshakes that get the same unverified prime wait for single
+    verification. Invalid primes are skipped.
+
+    Verification is big integer math that holds GIL, so it runs with
+    handshake executor if executor runs math outside of event loop and in
+    own single process pool otherwise.
+
+    Calls of wrapped generator are serialized, so it could be shared by
+    concurrent handshakes.
+
+    Args:
+        generator - wrapped dh prime generator
+        g - generator of subgroup that is used by handshakes
+        max_attempts - number of invalid primes in a row to raise error
+        cache_size - number of verdicts to keep
+        handshake_executor - executor of auth key exchange math
+    """
+
+    def __init__(
+        self,
+        generator: DhPrimeGenerator,
+        g: int = DEFAULT_G,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        handshake_executor: Optional[HandshakeExecutor] = None
+    ):
+        self.generator = generator
+        self.g = g
+        self.max_attempts = max_attempts
+        self.cache_size = cache_size
+        self._verdicts: OrderedDict[bytes, bool] = OrderedDict()
+        self._pending: Dict[bytes, asyncio.Future] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._handshake_executor = handshake_executor
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    async def asend(self, value: None) -> int:
+        """
+        Returns next verified prime of wrapped generator
+
+        Raises:
+            ValueError - if wrapped generator returns invalid primes
+                         `max_attempts` times in a row
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        for _ in range(self.max_attempts):
+            async with self._lock:
+                prime = await self.generator.asend(None)
+
+            if await self.is_valid(prime):
+                return prime
+
+            logger.warning('Dh prime generator returned invalid prime')
+
+        raise ValueError('Dh prime generator returns invalid primes')
+
+    async def athrow(self, typ, val=None, tb=None):
+        """
+        Raises exception passed into generator
+        """
+        if val is None:
+            val = typ()
+        raise val
+
+    async def aclose(self):
+        """
+        Closes wrapped generator and shuts down process pool
+        """
+        await self.generator.aclose()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def is_valid(self, prime: int) -> bool:
+        """
+        Returns cached verdict of prime or verifies it outside of event loop
+        """
+        digest = get_prime_digest(prime)
+
+        if digest in self._verdicts:
+            self._verdicts.move_to_end(digest)
+            return self._verdicts[digest]
+
+        verification = self._pending.get(digest)
+
+        if verification is None:
+            verification = asyncio.ensure_future(self._verify(prime))
+            verification.add_done_callback(partial(self._on_verified, digest))
+            self._pending[digest] = verification
+
+        # verification is shared with other handshakes, so it shouldn't be
+        # cancelled with any of them
+        return await asyncio.shield(verification)
+
+    def _on_verified(self, digest: bytes, verification: asyncio.Future):
+        del self._pending[digest]
+
+        if verification.cancelled() or verification.exception() is not None:
+            return
+
+        self._verdicts[digest] = verification.result()
+
+        while len(self._verdicts) > self.cache_size:
+            self._verdicts.popitem(last=False)
+
+    async def _verify(self, prime: int) -> bool:
+        handshake_executor = self._handshake_executor
+
+        if handshake_executor is not None and handshake_executor.offloaded:
+            return await handshake_executor.run(
+                is_valid_dh_prime,
+                prime,
+                self.g
+            )
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=1)
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            self._executor,
+            is_valid_dh_prime,
+            prime,
+            self.g
+        )
@@ -3,14 +3,17 @@ import logging
 from typing import List
 from dataclasses import dataclass, field
 
-from aiohttp import web
-
 from mtpylon.schema import Schema
-from mtpylon.constants import AUTH_KEY_MANAGER_RESOURCE_NAME
-from mtpylon.service_schema import service_schema
+from mtpylon.request import MtprotoRequest
+from mtpylon.constants import (
+    AUTH_KEY_MANAGER_RESOURCE_NAME,
+    CODEC_EXECUTOR_RESOURCE_NAME,
+)
+from mtpylon.service_schema import get_common_schema
 from mtpylon.transports import Obfuscator, TransportWrapper
 from mtpylon.message_sender import MessageSender
 from mtpylon.messages import MtprotoMessage, unpack_message
+from mtpylon.serialization.loaded import Buffer
 from mtpylon.middlewares import MiddleWareFunc
 
 from .strategies import get_handle_strategy
@@ -27,10 +30,30 @@ class MessageHandler:
     middlewares: List[MiddleWareFunc] = field(default_factory=list)
 
     def __post_init__(self):
-        self._common_schema = self.schema | service_schema
+        self._common_schema = get_common_schema(self.schema)
 
-    async def handle(self, request: web.Request, obfuscated_data: bytes):
+    async def handle(self, request: MtprotoRequest, obfuscated_data: bytes):
         message = await self.decrypt_message(request, obfuscated_data)
+        await self.handle_message(request, message)
+
+    async def handle_transport_message(
+            self,
+            request: MtprotoRequest,
+            transport_message: Buffer
+    ):
+        """
+        Handles wrapped message that has been already deobfuscated by
+        transport that reads obfuscated stream. Message could be memoryview
+        of receive buffer that is valid until handling is finished
+        """
+        message = await self.unwrap_message(request, transport_message)
+        await self.handle_message(request, message)
+
+    async def handle_message(
+            self,
+            request: MtprotoRequest,
+            message: MtprotoMessage
+    ):
         logger.info(f'Received message: {message.message_id}')
         logger.debug(message)
 
@@ -40,14 +63,23 @@ class MessageHandler:
 
     async def decrypt_message(
             self,
-            request: web.Request,
+            request: MtprotoRequest,
             obfuscated_data: bytes
     ) -> MtprotoMessage:
         transport_message = self.obfuscator.decrypt(obfuscated_data)
+
+        return await self.unwrap_message(request, transport_message)
+
+    async def unwrap_message(
+            self,
+            request: MtprotoRequest,
+            transport_message: Buffer
+    ) -> MtprotoMessage:
         message_bytes = self.transport_wrapper.unwrap(transport_message)
 
         return await unpack_message(
             request.app[AUTH_KEY_MANAGER_RESOURCE_NAME],
             self._common_schema,
-            message_bytes
+            message_bytes,
+            request.app.get(CODEC_EXECUTOR_RESOURCE_NAME)
         )
@@ -2,7 +2,7 @@
 from typing import cast, Callable, List, Any
 from asyncio import create_task
 
-from aiohttp.web import Request
+from mtpylon.request import MtprotoRequest
 
 from mtpylon.income_message import IncomeMessage
 from mtpylon.middlewares import MiddleWareFunc
@@ -15,7 +15,7 @@ from .types import HandleStrategy
 
 
 async def _message_container_handler(
-    request: Request,
+    request: MtprotoRequest,
     **kwargs: Any
 ):
     """
@@ -28,7 +28,7 @@ async def handle_message_container(
     strategy_selector: Callable[[IncomeMessage], HandleStrategy],
     middlewares: List[MiddleWareFunc],
     sender: MessageSender,
-    request: Request,
+    request: MtprotoRequest,
     message: IncomeMessage
 ):
     income_message_var.set(message)
@@ -2,7 +2,7 @@
 from typing import cast, List
 from asyncio import create_task
 
-from aiohttp.web import Request
+from mtpylon.request import MtprotoRequest
 
 from mtpylon.types import long
 from mtpylon.constants import ACKNOWLEDGEMENT_STORE_RESOURCE_NAME
@@ -18,7 +18,7 @@ from mtpylon.contextvars import (
 )
 
 
-async def delete_msgs(request: Request, msg_ids: List[long]):
+async def delete_msgs(request: MtprotoRequest, msg_ids: List[long]):
     acknowledgement_store = request.app[ACKNOWLEDGEMENT_STORE_RESOURCE_NAME]
 
     auth_key = auth_key_var.get()
@@ -37,7 +37,7 @@ async def delete_msgs(request: Request, msg_ids: List[long]):
 async def handle_msgs_ack(
     middlewares: List[MiddleWareFunc],
     sender: MessageSender,
-    request: Request,
+    request: MtprotoRequest,
     message: IncomeMessage
 ):
     message = cast(EncryptedMessage, message)
@@ -3,7 +3,7 @@ import logging
 from typing import cast, List, Any
 from asyncio import create_task
 
-from aiohttp.web import Request
+from mtpylon.request import MtprotoRequest
 
 from mtpylon.exceptions import RpcCallError
 from mtpylon.contextvars import (
@@ -29,7 +29,7 @@ def is_rpc_result(result: Any) -> bool:
 
 async def run_rpc_query_middleware(
     handler: Handler,
-    request: Request,
+    request: MtprotoRequest,
     **params: Any,
 ) -> Any:
     message = income_message_var.get()
@@ -70,7 +70,7 @@ async def run_rpc_query_middleware(
 async def run_rpc_query(
     middlewares: List[MiddleWareFunc],
     sender: MessageSender,
-    request: Request,
+    request: MtprotoRequest,
     message: IncomeMessage,
 ):
     income_message_var.set(message)
@@ -100,7 +100,7 @@ async def run_rpc_query(
 async def handle_rpc_query_message(
     middlewares: List[MiddleWareFunc],
     sender: MessageSender,
-    request: Request,
+    request: MtprotoRequest,
     message: IncomeMessage
 ):
     create_task(run_rpc_query(middlewares, sender, request, message))
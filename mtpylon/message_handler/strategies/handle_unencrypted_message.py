@@ -2,7 +2,7 @@
 import logging
 from typing import cast, List
 
-from aiohttp.web import Request
+from mtpylon.request import MtprotoRequest
 
 from mtpylon.messages import UnencryptedMessage
 from mtpylon.serialization import CallableFunc
@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 async def handle_unencrypted_message(
     middlewares: List[MiddleWareFunc],
     sender: MessageSender,
-    request: Request,
+    request: MtprotoRequest,
     message: IncomeMessage,
 ):
     """
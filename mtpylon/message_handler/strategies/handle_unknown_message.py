@@ -2,7 +2,7 @@
 import logging
 from typing import List
 
-from aiohttp.web import Request
+from mtpylon.request import MtprotoRequest
 
 from mtpylon.middlewares import MiddleWareFunc
 from mtpylon.message_sender import MessageSender
@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 async def handle_unknown_message(
     middlewares: List[MiddleWareFunc],
     sender: MessageSender,
-    request: Request,
+    request: MtprotoRequest,
     message: IncomeMessage,
 ):
     """
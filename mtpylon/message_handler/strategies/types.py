@@ -2,7 +2,7 @@
 from typing import Callable, Awaitable, List
 
 from mypy_extensions import Arg
-from aiohttp.web import Request
+from mtpylon.request import MtprotoRequest
 
 
 from mtpylon.income_message import IncomeMessage
@@ -14,7 +14,7 @@ HandleStrategy = Callable[
     [
         Arg(List[MiddleWareFunc], 'middlewares'),  # noqa: F821
         Arg(MessageSender, 'sender'),  # noqa: F821
-        Arg(Request, 'request'),  # noqa: F821
+        Arg(MtprotoRequest, 'request'),  # noqa: F821
         Arg(IncomeMessage, 'message'),  # noqa: F821
     ],
     Awaitable[None]
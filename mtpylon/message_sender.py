@@ -1,14 +1,15 @@
 # -*- coding: utf-8 -*-
-from typing import List, Any, Generator, cast
+from typing import List, Any, Generator, Protocol, cast
 from dataclasses import dataclass, field
 import logging
 
-from aiohttp.web import WebSocketResponse, Request
+from .request import MtprotoRequest
 
 from .types import long
 from .constants import (
     AUTH_KEY_MANAGER_RESOURCE_NAME,
-    ACKNOWLEDGEMENT_STORE_RESOURCE_NAME
+    ACKNOWLEDGEMENT_STORE_RESOURCE_NAME,
+    CODEC_EXECUTOR_RESOURCE_NAME,
 )
 from .acknowledgement_store import (
     AcknowledgementStoreProtocol,
@@ -23,29 +24,50 @@ from .messages import (
 )
 from .transports import Obfuscator, TransportWrapper
 from .schema import Schema
-from .service_schema import service_schema
+from .service_schema import get_common_schema
 from .service_schema.constructors import MessageContainer, Message
 from .contextvars import auth_key_var
 
 logger = logging.getLogger(__name__)
 
 
+class MessageConnection(Protocol):
+    """
+    Connection to send obfuscated messages to client. Websocket response
+    of aiohttp or raw tcp connection
+    """
+
+    @property
+    def closed(self) -> bool:  # pragma: nocover
+        ...
+
+    async def close(self) -> Any:  # pragma: nocover
+        ...
+
+    async def send_bytes(self, data: bytes) -> Any:  # pragma: nocover
+        ...
+
+
 @dataclass
 class MessageSender:
 
     schema: Schema
     obfuscator: Obfuscator
     transport_wrapper: TransportWrapper
-    ws: WebSocketResponse
+    ws: MessageConnection
 
     _msg_ids: Generator[long, bool, None] = field(init=False)
 
     def __post_init__(self):
         self._msg_ids = message_ids()
         self._msg_ids.send(None)
-        self._common_schema = self.schema | service_schema
+        self._common_schema = get_common_schema(self.schema)
 
-    async def _send_message(self, request: Request, message: MtprotoMessage):
+    async def _send_message(
+        self,
+        request: MtprotoRequest,
+        message: MtprotoMessage
+    ):
         if self.ws.closed:
             logger.warning('Ws connection has been closed before')
             return
@@ -54,7 +76,8 @@ class MessageSender:
             message_bytes = await pack_message(
                 request.app[AUTH_KEY_MANAGER_RESOURCE_NAME],
                 self._common_schema,
-                message
+                message,
+                request.app.get(CODEC_EXECUTOR_RESOURCE_NAME)
             )
         except ValueError as e:
             logger.error(f'Can`t dump message {message} close ws connection')
@@ -94,7 +117,7 @@ class MessageSender:
 
     async def send_unencrypted_message(
         self,
-        request: Request,
+        request: MtprotoRequest,
         data: Any,
         response: bool = False
     ):
@@ -107,7 +130,7 @@ class MessageSender:
 
     async def send_encrypted_message(
         self,
-        request: Request,
+        request: MtprotoRequest,
         server_salt: long,
         session_id: long,
         data: Any,
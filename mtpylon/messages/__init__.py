@@ -9,6 +9,8 @@ from .mtproto_message import (
     unpack_message,
 )
 from .types import EncryptedMessage, UnencryptedMessage, MtprotoMessage
+from .codec_executor import CodecExecutor, CodecMetrics
+from .process_codec_executor import ProcessCodecExecutor
 
 __all__ = [
     'is_unencrypted_message',
@@ -19,4 +21,7 @@ __all__ = [
     'UnencryptedMessage',
     'EncryptedMessage',
     'MtprotoMessage',
+    'CodecExecutor',
+    'CodecMetrics',
+    'ProcessCodecExecutor',
 ]
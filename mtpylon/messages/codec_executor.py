@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields, is_dataclass
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+from mtpylon.schema import Schema
+
+T = TypeVar('T')
+EncodedT = TypeVar('EncodedT', bytes, bytearray)
+
+DEFAULT_INLINE_THRESHOLD = 16 * 1024  # bytes
+
+# every tl value is dumped into 4 bytes at least
+MIN_VALUE_SIZE = 4
+SCALAR_SIZE = 8
+
+
+def estimate_size(data: Any, limit: int) -> int:
+    """
+    Estimates size of dumped data by walking its fields. Bytes, strings and
+    lazy values count their length, other values count as 8 bytes. Items
+    of tl vector have the same type, so vector is estimated by its first
+    item. Fields are walked until estimate reaches limit, so multi megabyte
+    payload is estimated as fast as small one.
+
+    Args:
+        data - combinator or value to dump
+        limit - size that is enough to know
+    """
+    if isinstance(data, (list, tuple)):
+        if not data:
+            return MIN_VALUE_SIZE
+        return MIN_VALUE_SIZE + len(data) * estimate_size(data[0], limit)
+
+    if is_dataclass(data):
+        size = MIN_VALUE_SIZE
+        for field in fields(data):
+            if size >= limit:
+                break
+            size += estimate_size(getattr(data, field.name), limit - size)
+        return size
+
+    if hasattr(data, '__len__'):
+        return len(data) + MIN_VALUE_SIZE
+
+    return SCALAR_SIZE
+
+
+@dataclass
+class CodecMetrics:
+    """
+    Counts of messages that has been encoded or decoded inline in event loop,
+    offloaded to thread pool and to process pool
+    """
+    inline: int = 0
+    offloaded: int = 0
+    processed: int = 0
+
+
+class CodecExecutor:
+    """
+    Runs message codecs inline or in dedicated thread pool.
+
+    Thread hop costs more than decoding of small messages like `ping` or
+    `msgs_ack`, so messages smaller than `inline_threshold` are decoded
+    in event loop and larger ones are offloaded to thread pool.
+
+    Size of message to dump is not known before dumping, so it's estimated
+    by walking fields of data up to threshold.
+
+    Args:
+        inline_threshold - messages smaller than threshold in bytes are
+                           handled inline
+        max_workers - size of thread pool for offloaded codecs
+    """
+
+    def __init__(
+        self,
+        inline_threshold: int = DEFAULT_INLINE_THRESHOLD,
+        max_workers: Optional[int] = None
+    ):
+        self.inline_threshold = inline_threshold
+        self.metrics = CodecMetrics()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='mtpylon-codec'
+        )
+
+    async def decode(
+        self,
+        size: int,
+        func: Callable[..., T],
+        *args: Any
+    ) -> T:
+        """
+        Runs decode function inline if size of input less than threshold
+        otherwise in thread pool
+        """
+        return await self._run(size, func, *args)
+
+    async def encode(
+        self,
+        data: Any,
+        func: Callable[..., EncodedT],
+        *args: Any
+    ) -> EncodedT:
+        """
+        Runs encode function of data inline if estimated size of data less
+        than threshold otherwise in thread pool
+        """
+        return await self._run(
+            estimate_size(data, self.size_limit),
+            func,
+            *args
+        )
+
+    @property
+    def size_limit(self) -> int:
+        """
+        Estimated size of data to encode that is enough to choose how to
+        run encode function
+        """
+        return self.inline_threshold
+
+    def start(self, schema: Schema):
+        """
+        Prepares executor to run codecs of common schema. Codecs run in
+        current process don't require any preparation
+        """
+
+    def shutdown(self):
+        """
+        Waits for offloaded codecs and shuts down thread pool
+        """
+        self._executor.shutdown(wait=True)
+
+    async def _run(
+        self,
+        size: int,
+        func: Callable[..., T],
+        *args: Any
+    ) -> T:
+        if size < self.inline_threshold:
+            self.metrics.inline += 1
+            return func(*args)
+
+        return await self._offload(func, *args)
+
+    async def _offload(self, func: Callable[..., T], *args: Any) -> T:
+        self.metrics.offloaded += 1
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+
+default_codec_executor = CodecExecutor()
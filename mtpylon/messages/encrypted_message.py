@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
-import asyncio
 import logging
-from typing import Any
+from typing import Any, Optional
 from random import randbytes
 
 from tgcrypto import ige256_decrypt, ige256_encrypt  # type: ignore
@@ -10,13 +9,18 @@ from mtpylon.schema import Schema
 from mtpylon.crypto import (
     AuthKey,
     AuthKeyManager,
+    AuthKeyPin,
     AuthKeyDoesNotExist,
     generate_key_iv,
     get_msg_key,
 )
+from mtpylon.crypto.auth_key_manager import (
+    InvalidatingAuthKeyManagerProtocol,
+)
 from mtpylon.serialization.int import (
     load as load_int,
     dump as dump_int,
+    int_struct,
 )
 from mtpylon.serialization.long import (
     load as load_long,
@@ -26,21 +30,18 @@ from mtpylon.serialization.int128 import (
     load as load_int128,
     dump as dump_int128,
 )
-from mtpylon.serialization.schema import (
-    load as load_by_schema,
-    dump as dump_by_schema
-)
+from mtpylon.serialization.loaded import Buffer
 from mtpylon.exceptions import (
     AuthKeyNotFound,
     AuthKeyChangedException,
-    DumpError
 )
-from mtpylon.contextvars import auth_key_var
+from mtpylon.contextvars import auth_key_var, auth_key_pin_var
 from mtpylon.service_schema import (
     load as load_by_service_schema,
-    dump as dump_by_service_schema
+    dump_to as dump_to_by_service_schema,
 )
 from .types import EncryptedMessage
+from .codec_executor import CodecExecutor, default_codec_executor
 
 
 logger = logging.getLogger(__name__)
@@ -49,59 +50,71 @@ logger = logging.getLogger(__name__)
 MIN_PAD = 12
 
 
-def load_data(schema: Schema, message_bytes: bytes) -> Any:
+def load_data(schema: Schema, message_bytes: Buffer, offset: int = 0) -> Any:
     """
-    Tries to load with services, clients schema.
+    Loads clients or service value. Common schema is expected here, so
+    loader is selected by constructor id in single pass: clients and
+    service combinators are found in one table, custom loaders of service
+    schema are resolved for Message type.
 
     Raises:
         ValueError - if couldn't parse message bytes
     """
-    try:
-        value = load_by_schema(
-            message_bytes,
-            schema=schema
-        ).value
-    except ValueError:
-        value = load_by_service_schema(
-            message_bytes,
-            schema=schema
-        ).value
+    return load_by_service_schema(
+        message_bytes,
+        schema=schema,
+        offset=offset
+    ).value
 
-    return value
+
+def dump_data_to(buffer: bytearray, schema: Schema, data: Any) -> None:
+    """
+    Appends dumped clients or service data to buffer. Dumper is selected
+    by type of data in single lookup
+
+    Raises:
+        DumpError - if data couldn't been dumped
+    """
+    dump_to_by_service_schema(buffer, data, schema)
 
 
 def dump_data(schema: Schema, data: Any) -> bytes:
     """
-    Tries to dumps data as clients data.
-    If it failed tries dump as server data
+    Dumps clients or service data
 
     Raises:
         DumpError - if data couldn't been dumped
     """
+    buffer = bytearray()
+    dump_data_to(buffer, schema, data)
 
-    try:
-        dumped_data = dump_by_schema(data, schema=schema, custom_dumpers=None)
-    except DumpError:
-        dumped_data = dump_by_service_schema(data, schema)
-
-    return dumped_data
+    return bytes(buffer)
 
 
 async def load_message(
     schema: Schema,
-    message_bytes: bytes
+    message_bytes: bytes,
+    codec_executor: Optional[CodecExecutor] = None
 ) -> EncryptedMessage:
     """
-    Loads message with extra header data
+    Loads message with extra header data. Message is read by offsets from
+    memoryview so decrypted bytes are not copied. Message data is loaded
+    inline or in thread pool by codec executor
     """
-    salt = load_long(message_bytes).value
-    session_id = load_long(message_bytes[8:]).value
-    message_id = load_long(message_bytes[16:]).value
-    seq_no = load_int(message_bytes[24:]).value
-    message_value = await asyncio.to_thread(
+    if codec_executor is None:
+        codec_executor = default_codec_executor
+
+    buffer = memoryview(message_bytes)
+    salt = load_long(buffer, 0).value
+    session_id = load_long(buffer, 8).value
+    message_id = load_long(buffer, 16).value
+    seq_no = load_int(buffer, 24).value
+    message_value = await codec_executor.decode(
+        len(buffer),
         load_data,
         schema,
-        message_bytes[32:]
+        buffer,
+        32
     )
 
     return EncryptedMessage(
@@ -113,19 +126,44 @@ async def load_message(
     )
 
 
-async def dump_message(schema: Schema, message: EncryptedMessage) -> bytes:
-    data_bytes = await asyncio.to_thread(
-        dump_data,
-        schema,
-        message.message_data
+def write_message(schema: Schema, message: EncryptedMessage) -> bytearray:
+    """
+    Dumps message with extra header data into single buffer. Message data
+    is dumped right after header then its length is written before it
+    """
+    buffer = bytearray()
+    buffer += dump_long(message.salt)
+    buffer += dump_long(message.session_id)
+    buffer += dump_long(message.message_id)
+    buffer += dump_int(message.seq_no)
+
+    size_position = len(buffer)
+    buffer += dump_int(0)
+
+    dump_data_to(buffer, schema, message.message_data)
+
+    int_struct.pack_into(
+        buffer,
+        size_position,
+        len(buffer) - size_position - 4
     )
-    return (
-        dump_long(message.salt) +
-        dump_long(message.session_id) +
-        dump_long(message.message_id) +
-        dump_int(message.seq_no) +
-        dump_int(len(data_bytes)) +
-        data_bytes
+
+    return buffer
+
+
+async def dump_message(
+    schema: Schema,
+    message: EncryptedMessage,
+    codec_executor: Optional[CodecExecutor] = None
+) -> bytearray:
+    if codec_executor is None:
+        codec_executor = default_codec_executor
+
+    return await codec_executor.encode(
+        message.message_data,
+        write_message,
+        schema,
+        message
     )
 
 
@@ -139,10 +177,14 @@ def pad_bytes(raw_data):
 
 async def get_auth_key(
     auth_manager: AuthKeyManager,
-    encrypted_message: bytes
+    encrypted_message: Buffer
 ) -> AuthKey:
     """
-    Returns actual auth_key value
+    Returns actual auth_key value. Auth key is pinned by connection after
+    the first lookup, so later messages don't request auth_manager. Pin is
+    cleared by auth_manager when auth key is deleted and expires in
+    `pin_ttl` seconds of auth_manager. Auth key is not pinned
+    if auth_manager doesn't implement `InvalidatingAuthKeyManagerProtocol`
 
     Raises:
         AuthKeyNotFound - if auth key not found in auth_manager
@@ -150,6 +192,12 @@ async def get_auth_key(
     """
     income_auth_key_id = int.from_bytes(encrypted_message[:8], 'big')
 
+    pin = auth_key_pin_var.get(None)
+    if pin is not None:
+        pinned_auth_key = pin.get(income_auth_key_id)
+        if pinned_auth_key is not None:
+            return pinned_auth_key
+
     try:
         auth_key = await auth_manager.get_key(income_auth_key_id)
     except AuthKeyDoesNotExist:
@@ -168,20 +216,29 @@ async def get_auth_key(
         )
         raise AuthKeyChangedException
 
+    if isinstance(auth_manager, InvalidatingAuthKeyManagerProtocol):
+        if pin is None:
+            pin = AuthKeyPin(auth_key, ttl=auth_manager.pin_ttl)
+            auth_key_pin_var.set(pin)
+            auth_manager.add_invalidation_callback(pin)
+        else:
+            pin.set(auth_key)
+
     return auth_key
 
 
 async def unpack_message(
     auth_manager: AuthKeyManager,
     schema: Schema,
-    encrypted_message: bytes
+    encrypted_message: Buffer,
+    codec_executor: Optional[CodecExecutor] = None
 ) -> EncryptedMessage:
     """
     Unpacks income message. Validates auth_key_id
     """
     auth_key = await get_auth_key(auth_manager, encrypted_message)
 
-    msg_key = load_int128(encrypted_message[8:]).value
+    msg_key = load_int128(encrypted_message, 8).value
 
     key_pair = generate_key_iv(
         auth_key,
@@ -190,20 +247,21 @@ async def unpack_message(
     )
 
     message_bytes = ige256_decrypt(
-        encrypted_message[24:],
+        memoryview(encrypted_message)[24:],
         key_pair.key,
         key_pair.iv
     )
 
-    return await load_message(schema, message_bytes)
+    return await load_message(schema, message_bytes, codec_executor)
 
 
 async def pack_message(
     schema: Schema,
     message: EncryptedMessage,
+    codec_executor: Optional[CodecExecutor] = None
 ) -> bytes:
-    dumped_message = await dump_message(schema, message)
-    padded_message = dumped_message + pad_bytes(dumped_message)
+    padded_message = await dump_message(schema, message, codec_executor)
+    padded_message += pad_bytes(padded_message)
 
     try:
         auth_key = auth_key_var.get()
@@ -221,8 +279,8 @@ async def pack_message(
         key_iv_pair.iv
     )
 
-    return (
-        auth_key.id.to_bytes(8, 'big') +
-        dump_int128(msg_key) +
-        encrypted_message
-    )
+    return b''.join([
+        auth_key.id.to_bytes(8, 'big'),
+        dump_int128(msg_key),
+        encrypted_message,
+    ])
@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
-from typing import cast
+from typing import cast, Optional
 
 from mtpylon.crypto import AuthKeyManager
 from mtpylon.schema import Schema
+from mtpylon.serialization.loaded import Buffer
 
 from .types import MtprotoMessage, UnencryptedMessage, EncryptedMessage
 from .utils import is_unencrypted_message
+from .codec_executor import CodecExecutor
 from .unencrypted_message import (
     unpack_message as unpack_unencrypted,
     pack_message as pack_unencrypted,
@@ -19,19 +21,21 @@ from .encrypted_message import (
 async def unpack_message(
     auth_manager: AuthKeyManager,
     schema: Schema,
-    value: bytes
+    value: Buffer,
+    codec_executor: Optional[CodecExecutor] = None
 ) -> MtprotoMessage:
     if is_unencrypted_message(value):
-        return await unpack_unencrypted(value)
-    return await unpack_encrypted(auth_manager, schema, value)
+        return await unpack_unencrypted(value, codec_executor)
+    return await unpack_encrypted(auth_manager, schema, value, codec_executor)
 
 
 async def pack_message(
     auth_manager: AuthKeyManager,
     schema: Schema,
-    value: MtprotoMessage
+    value: MtprotoMessage,
+    codec_executor: Optional[CodecExecutor] = None
 ) -> bytes:
     if isinstance(value, UnencryptedMessage):
-        return await pack_unencrypted(value)
+        return await pack_unencrypted(value, codec_executor)
     value = cast(EncryptedMessage, value)
-    return await pack_encrypted(schema, value)
+    return await pack_encrypted(schema, value, codec_executor)
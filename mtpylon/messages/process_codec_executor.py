@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import cast, Any, Callable, List, Optional, TypeVar
+
+from mtpylon.schema import Schema
+from mtpylon.serialization.schema import get_loader, get_dumper
+from mtpylon.serialization.codegen import load_schema
+from mtpylon.service_schema.serialization.service_schema import (
+    custom_loaders,
+    custom_dumpers,
+)
+
+from .codec_executor import CodecExecutor, DEFAULT_INLINE_THRESHOLD
+
+T = TypeVar('T')
+
+DEFAULT_PROCESS_THRESHOLD = 1024 * 1024  # bytes
+
+_worker_schema: Optional[Schema] = None
+
+
+class WorkerSchema:
+    """
+    Placeholder of common schema in arguments of codecs that run in process
+    pool. Worker replaces it with schema it has been initialized with
+    """
+
+
+def init_worker(
+    constructors: List[Any],
+    functions: List[Callable],
+    cache_dir: Optional[str] = None
+):
+    """
+    Builds common schema and compiles its codecs once per worker process.
+    Schema with generated codecs is imported from cache directory if it
+    has been passed
+    """
+    global _worker_schema
+
+    if cache_dir is not None:
+        _worker_schema = load_schema(constructors, functions, cache_dir)
+    else:
+        _worker_schema = Schema(constructors=constructors, functions=functions)
+
+    get_loader(_worker_schema, custom_loaders).compile_plans()
+    get_dumper(_worker_schema, custom_dumpers).compile_plans()
+
+
+def run_in_worker(func: Callable[..., T], *args: Any) -> T:
+    """
+    Runs codec in worker process with schema of worker
+    """
+    return func(*[
+        _worker_schema if arg is WorkerSchema else arg
+        for arg in args
+    ])
+
+
+class ProcessCodecExecutor(CodecExecutor):
+    """
+    Codec executor that runs codecs of payloads larger than
+    `process_threshold` in process pool. Pure python codecs hold GIL, so
+    large payloads decoded in thread pool still stall other connections.
+
+    Workers of pool build common schema once on start, raw bytes and
+    loaded values are exchanged with event loop. Constructors and functions
+    of schema are passed to workers by reference, so they should be
+    importable in worker process.
+
+    Args:
+        inline_threshold - messages smaller than threshold in bytes are
+                           handled inline
+        max_workers - size of thread pool for offloaded codecs
+        process_threshold - messages not smaller than threshold in bytes
+                            are handled in process pool
+        process_workers - size of process pool
+        start_method - multiprocessing start method of workers
+    """
+
+    def __init__(
+        self,
+        inline_threshold: int = DEFAULT_INLINE_THRESHOLD,
+        max_workers: Optional[int] = None,
+        process_threshold: int = DEFAULT_PROCESS_THRESHOLD,
+        process_workers: Optional[int] = None,
+        start_method: Optional[str] = None
+    ):
+        super().__init__(
+            inline_threshold=inline_threshold,
+            max_workers=max_workers
+        )
+        self.process_threshold = process_threshold
+        self._process_workers = process_workers
+        self._start_method = start_method
+        self._schema: Optional[Schema] = None
+        self._process_executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self, schema: Schema):
+        """
+        Starts process pool with workers initialized with common schema.
+        Workers import generated codecs of schema if it has got them
+        """
+        cache_dir: Optional[str] = None
+        if schema.codecs is not None:
+            cache_dir = os.path.dirname(cast(str, schema.codecs.__file__))
+
+        self._schema = schema
+        self._process_executor = ProcessPoolExecutor(
+            max_workers=self._process_workers,
+            mp_context=multiprocessing.get_context(self._start_method),
+            initializer=init_worker,
+            initargs=(schema.constructors, schema.functions, cache_dir)
+        )
+
+    @property
+    def size_limit(self) -> int:
+        return max(self.inline_threshold, self.process_threshold)
+
+    def shutdown(self):
+        """
+        Waits for offloaded codecs and shuts down thread and process pools
+        """
+        super().shutdown()
+
+        if self._process_executor is not None:
+            self._process_executor.shutdown(wait=True)
+            self._process_executor = None
+
+    async def _run(
+        self,
+        size: int,
+        func: Callable[..., T],
+        *args: Any
+    ) -> T:
+        if (
+            self._process_executor is None or
+            size < self.process_threshold or
+            any(
+                isinstance(arg, Schema) and arg is not self._schema
+                for arg in args
+            )
+        ):
+            return await super()._run(size, func, *args)
+
+        self.metrics.processed += 1
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            self._process_executor,
+            partial(run_in_worker, func, *[
+                self._prepare_arg(arg)
+                for arg in args
+            ])
+        )
+
+    def _prepare_arg(self, arg: Any) -> Any:
+        if arg is self._schema:
+            return WorkerSchema
+        if isinstance(arg, memoryview):
+            return arg.tobytes()
+        return arg
@@ -1,19 +1,29 @@
 # -*- coding: utf-8 -*-
-import asyncio
+from typing import Optional
 
 from mtpylon import long
-from mtpylon.service_schema import load as load_schema, dump as dump_schema
-from mtpylon.serialization.int import load as load_int, dump as dump_int
+from mtpylon.service_schema import (
+    load as load_schema,
+    dump_to as dump_schema_to,
+)
+from mtpylon.serialization.int import (
+    load as load_int,
+    dump as dump_int,
+    int_struct,
+)
 from mtpylon.serialization.long import load as load_long, dump as dump_long
+from mtpylon.serialization.loaded import Buffer
 
 from .types import UnencryptedMessage
+from .codec_executor import CodecExecutor, default_codec_executor
 
 
-def unpack(input: bytes) -> UnencryptedMessage:
-    loaded_msg_id = load_long(input[8:])
-    loaded_size = load_int(input[16:])
+def unpack(input: Buffer) -> UnencryptedMessage:
+    buffer = memoryview(input)
+    loaded_msg_id = load_long(buffer, 8)
+    loaded_size = load_int(buffer, 16)
     size = loaded_size.value
-    loaded_value = load_schema(input[20:20 + size])
+    loaded_value = load_schema(buffer[20:20 + size])
 
     return UnencryptedMessage(
         message_id=loaded_msg_id.value,
@@ -21,21 +31,40 @@ def unpack(input: bytes) -> UnencryptedMessage:
     )
 
 
-def pack(message: UnencryptedMessage):
-    auth_id = dump_long(long(0))
+def pack(message: UnencryptedMessage) -> bytes:
+    buffer = bytearray()
+    buffer += dump_long(long(0))
+    buffer += dump_long(message.message_id)
 
-    msg_id = dump_long(message.message_id)
+    size_position = len(buffer)
+    buffer += dump_int(0)
 
-    value = dump_schema(message.message_data)
+    dump_schema_to(buffer, message.message_data)
+
+    int_struct.pack_into(
+        buffer,
+        size_position,
+        len(buffer) - size_position - 4
+    )
+
+    return bytes(buffer)
 
-    size = dump_int(len(value))
 
-    return auth_id + msg_id + size + value
+async def unpack_message(
+    input: Buffer,
+    codec_executor: Optional[CodecExecutor] = None
+) -> UnencryptedMessage:
+    if codec_executor is None:
+        codec_executor = default_codec_executor
 
+    return await codec_executor.decode(len(input), unpack, input)
 
-async def unpack_message(input: bytes) -> UnencryptedMessage:
-    return await asyncio.to_thread(unpack, input)
 
+async def pack_message(
+    message: UnencryptedMessage,
+    codec_executor: Optional[CodecExecutor] = None
+) -> bytes:
+    if codec_executor is None:
+        codec_executor = default_codec_executor
 
-async def pack_message(message: UnencryptedMessage) -> bytes:
-    return await asyncio.to_thread(pack, message)
+    return await codec_executor.encode(message.message_data, pack, message)
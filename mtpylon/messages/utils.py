@@ -4,9 +4,10 @@ from typing import Generator, Optional
 
 from mtpylon.types import long
 from mtpylon.serialization.long import load as load_long
+from mtpylon.serialization.loaded import Buffer
 
 
-def is_unencrypted_message(buffer: bytes) -> bool:
+def is_unencrypted_message(buffer: Buffer) -> bool:
     """
     Unencrypted message starts with auth_key_id equals 0
     See: https://core.telegram.org/mtproto/description#unencrypted-message
@@ -16,7 +17,7 @@ def is_unencrypted_message(buffer: bytes) -> bool:
     return loaded_auth_key_id.value == 0
 
 
-def is_encrypted_message(buffer: bytes) -> bool:
+def is_encrypted_message(buffer: Buffer) -> bool:
     """
     Encrypted message starts with auth_key_id that not equals to zero
     See: https://core.telegram.org/mtproto/description#encrypted-message
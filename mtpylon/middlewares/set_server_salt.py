@@ -2,7 +2,7 @@
 import logging
 from typing import Any, cast
 
-from aiohttp.web import Request
+from mtpylon.request import MtprotoRequest
 
 from mtpylon.constants import SERVER_SALT_MANAGER_RESOURCE_NAME
 from mtpylon.messages import EncryptedMessage
@@ -20,7 +20,7 @@ logger = logging.getLogger(__name__)
 
 async def set_server_salt(
     handler: Handler,
-    request: Request,
+    request: MtprotoRequest,
     **params: Any,
 ) -> Any:
     message = income_message_var.get()
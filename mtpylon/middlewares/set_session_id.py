@@ -2,7 +2,7 @@
 import logging
 from typing import Any
 
-from aiohttp.web import Request
+from mtpylon.request import MtprotoRequest
 
 from mtpylon.constants import SESSION_SUBJECT_RESOURCE_NAME
 from mtpylon.contextvars import (
@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 
 async def set_session_id(
     handler: Handler,
-    request: Request,
+    request: MtprotoRequest,
     **params: Any,
 ) -> Any:
     session_subject = request.app[SESSION_SUBJECT_RESOURCE_NAME]
@@ -2,11 +2,11 @@
 from typing import Any, Callable, Coroutine
 from mypy_extensions import Arg, KwArg
 
-from aiohttp.web import Request
+from mtpylon.request import MtprotoRequest
 
 Handler = Callable[
     [
-        Arg(Request, 'request'),  # noqa: F821
+        Arg(MtprotoRequest, 'request'),  # noqa: F821
         KwArg(Any)
     ],
     Coroutine[Any, Any, Any]
@@ -15,7 +15,7 @@ Handler = Callable[
 MiddleWareFunc = Callable[
     [
         Arg(Handler, 'handler'),  # noqa: F821
-        Arg(Request, 'request'),  # noqa: F821
+        Arg(MtprotoRequest, 'request'),  # noqa: F821
         KwArg(Any)
     ],
     Coroutine[Any, Any, Any]
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from typing import Optional, Protocol
+
+from aiohttp.web import Application
+
+
+class MtprotoRequest(Protocol):
+    """
+    Request of MTProto connection that is passed into middlewares and
+    functions of schema. Websocket handler passes `aiohttp.web.Request`
+    of websocket handshake, raw tcp server passes `TcpRequest`.
+    Only attributes of this protocol are available on both transports.
+    """
+
+    @property
+    def app(self) -> Application:  # pragma: nocover
+        ...
+
+    @property
+    def remote(self) -> Optional[str]:  # pragma: nocover
+        ...
+
+    @property
+    def transport(
+        self
+    ) -> Optional[asyncio.BaseTransport]:  # pragma: nocover
+        ...
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-from typing import List, Callable, Any, Union, Type, Dict, Set
+from typing import List, Callable, Any, Union, Type, Dict, Set, Optional
+from types import ModuleType
 from dataclasses import dataclass
 from inspect import isfunction
 
@@ -73,6 +74,31 @@ class Schema:
 
         self._build_schema_data()
 
+    @classmethod
+    def from_structure(
+        cls,
+        constructors: List[Any],
+        functions: List[Callable],
+        structure: SchemaStructure
+    ) -> 'Schema':
+        """
+        Builds schema from structure described beforehand. Constructors and
+        functions are not validated and described again, so structure should
+        be built from the same constructors and functions
+
+        Args:
+            constructors - constructors of schema
+            functions - functions of schema
+            structure - description of combinators and functions of schema
+        """
+        schema = cls.__new__(cls)
+        schema.constructors = constructors
+        schema.functions = functions
+
+        schema._set_schema_data(structure.constructors, structure.methods)
+
+        return schema
+
     def __contains__(self, item: Union[Callable, Type, int]) -> bool:
         """
         Checks that function, combinator or constructor presents in schema
@@ -148,6 +174,23 @@ class Schema:
         return SchemaStructure(constructors=constructors, methods=methods)
 
     def _build_schema_data(self):
+        self._set_schema_data(self._get_combinators(), self._get_methods())
+
+    def _set_schema_data(
+        self,
+        combinators: List[CombinatorData],
+        methods: List[FunctionData]
+    ):
+        # module with generated codecs of schema, it is set by
+        # `mtpylon.serialization.codegen` and dropped on schema update
+        self.codecs: Optional[ModuleType] = None
+        # loaders and dumpers with compiled plans by custom functions, they
+        # are set by `mtpylon.serialization.schema` and dropped on update
+        self.loaders: Dict[Any, Any] = {}
+        self.dumpers: Dict[Any, Any] = {}
+        # bumped on every update, so schemas derived from this one could
+        # be rebuilt
+        self.version = 0
         self._constructors_set: Set[Type] = set([
             constructor
             for constructor in self.constructors
@@ -157,11 +200,18 @@ class Schema:
         self._combinator_map: Dict[Type, CombinatorData] = {}
         self._function_map: Dict[Callable, FunctionData] = {}
 
-        for combinator_data in self._get_combinators():
+        self._add_schema_data(combinators, methods)
+
+    def _add_schema_data(
+        self,
+        combinators: List[CombinatorData],
+        methods: List[FunctionData]
+    ):
+        for combinator_data in combinators:
             self._number_map[combinator_data.id] = combinator_data
             self._combinator_map[combinator_data.origin] = combinator_data
 
-        for func_data in self._get_methods():
+        for func_data in methods:
             self._number_map[func_data.id] = func_data
             self._function_map[func_data.origin] = func_data
 
@@ -213,18 +263,23 @@ class Schema:
     def _update(self, schema: 'Schema'):
         """
         Updates current schema with constructors, functions from another schema
+        Data of another schema has been described already, so it is just
+        added to indexes of current schema
 
         Raises:
             ValueError if some of combinator number will be duplicated
         """
-        for method in schema._get_methods():
-            if method.id in self:
+        methods = list(schema._function_map.values())
+        combinators = list(schema._combinator_map.values())
+
+        for method in methods:
+            if method.id in self._number_map:
                 raise ValueError(
                     f"Duplicate method id for {method.method} id: {method.id}"
                 )
 
-        for combinator in schema._get_combinators():
-            if combinator.id in self:
+        for combinator in combinators:
+            if combinator.id in self._number_map:
                 raise ValueError(
                     f"Duplicate combinator id for {combinator.predicate} " +
                     f"id: {combinator.id}"
@@ -233,7 +288,12 @@ class Schema:
         self.constructors += schema.constructors
         self.functions += schema.functions
 
-        self._build_schema_data()
+        self.codecs = None
+        self.loaders = {}
+        self.dumpers = {}
+        self.version += 1
+        self._constructors_set |= schema._constructors_set
+        self._add_schema_data(combinators, methods)
 
     def update(self, schema: 'Schema'):
         """
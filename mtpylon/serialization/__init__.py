@@ -1,6 +1,15 @@
 # -*- coding: utf-8 -*-
-from .schema import dump, load
+from .schema import dump, dump_to, load
 from .loaded import LoadedValue
 from .schema import CallableFunc
+from .lazy import LazyBytes, LazyString
 
-__all__ = ['dump', 'load', 'LoadedValue', 'CallableFunc']
+__all__ = [
+    'dump',
+    'dump_to',
+    'load',
+    'LoadedValue',
+    'CallableFunc',
+    'LazyBytes',
+    'LazyString',
+]
@@ -1,9 +1,20 @@
 # -*- coding: utf-8 -*-
-from .loaded import LoadedValue
+from struct import Struct
+from typing import cast, Tuple, Union, TYPE_CHECKING
+
+from .loaded import LoadedValue, Buffer
+
+if TYPE_CHECKING:
+    from .lazy import LazyBytes  # noqa: F401
 
 
 LONG_STRING_CHAR = b'\xfe'
 
+# long string char followed by 3 bytes of length in little endian order
+pack_long_header = Struct('<I').pack
+
+PADDINGS = tuple(b'\x00' * count for count in range(4))
+
 
 def get_padded_bytes_count(length: int) -> int:
     return (4 - (length % 4)) % 4
@@ -42,7 +53,53 @@ def dump(value: bytes) -> bytes:
     return prefix + size + value + tail
 
 
-def load(input: bytes) -> LoadedValue[bytes]:
+def dump_to(buffer: bytearray, value: Union[Buffer, 'LazyBytes']) -> None:
+    """
+    Appends bytes dumped as tl string to buffer. Value is copied only once
+    right into buffer. Lazy bytes forwarded from loaded message are copied
+    from their view
+    """
+    data = cast(Buffer, getattr(value, 'view', value))
+
+    length = len(data)
+    if length <= 253:
+        buffer.append(length)
+        buffer += data
+        buffer += PADDINGS[get_padded_bytes_count(length + 1)]
+    else:
+        buffer += pack_long_header(length << 8 | LONG_STRING_CHAR[0])
+        buffer += data
+        buffer += PADDINGS[get_padded_bytes_count(length)]
+
+
+def get_bounds(input: Buffer, offset: int = 0) -> Tuple[int, int, int]:
+    """
+    Reads header of tl serialized string. Returns start, end positions of
+    string value in input and offset right after serialized string with
+    padding.
+
+    Args:
+        input - tl serialized bytes
+        offset - position of serialized string in input
+    """
+    if len(input) <= offset:
+        raise ValueError('Bites string should not been empty')
+
+    if input[offset] == LONG_STRING_CHAR[0]:
+        size = int.from_bytes(input[offset + 1:offset + 4], 'little')
+        start = offset + 4
+        tail = get_padded_bytes_count(size)
+    else:
+        size = input[offset]
+        start = offset + 1
+        tail = get_padded_bytes_count(size + 1)
+
+    end = start + size
+
+    return start, min(end, len(input)), end + tail
+
+
+def load(input: Buffer, offset: int = 0) -> LoadedValue[bytes]:
     """
     Loads bytes from tl serialized string by rules:
     * If L <= 253, the serialization contains one byte with the value of L,
@@ -55,19 +112,12 @@ def load(input: bytes) -> LoadedValue[bytes]:
       followed by L bytes of the string, further followed by 0 to 3 null
       padding bytes.
 
+    Returns loaded bytes with offset right after serialized string.
+
     Args:
         input - tl serialized bytes
+        offset - position of serialized string in input
     """
-    if len(input) == 0:
-        raise ValueError('Bites string should not been empty')
-
-    if input[:1] == LONG_STRING_CHAR:
-        size = int.from_bytes(input[1:4], 'little')
-        value = input[4:size + 4]
-        offset = 4 + size + get_padded_bytes_count(size)
-    else:
-        size = int.from_bytes(input[:1], 'little')
-        value = input[1: size + 1]
-        offset = 1 + size + get_padded_bytes_count(size + 1)
+    start, end, offset = get_bounds(input, offset)
 
-    return LoadedValue(value, offset)
+    return LoadedValue(bytes(input[start:end]), offset)
@@ -0,0 +1,588 @@
+# -*- coding: utf-8 -*-
+"""
+Generates python module with straight-line load and dump functions of every
+combinator and function of schema. Generated module also keeps numbers and
+descriptions of combinators and functions, so schema built from it skips
+validation and description of constructors.
+
+Module is cached on disk by hash of schema, so process and every worker
+started with the same schema just import it. Cached module is python code
+that is executed on import, so cache directory should be writable only by
+user of application.
+"""
+import hashlib
+import os
+import py_compile
+import tempfile
+from importlib.util import (
+    cache_from_source,
+    spec_from_file_location,
+    module_from_spec,
+)
+from inspect import isfunction, signature
+from types import ModuleType
+from typing import cast, Any, Callable, Iterable, List, Tuple, Type, Union
+
+from ..schema import Schema, SchemaStructure, CombinatorData, FunctionData
+from ..utils import (
+    AttrDescription,
+    get_fields_map,
+    get_combinators,
+    is_annotated_union,
+    is_list_type,
+    is_optional_type,
+)
+from .. import long
+from .int import dump as dump_int
+
+# should be changed on every change of generated source
+CODEGEN_VERSION = 1
+
+# values that are described by repr in hash of schema
+PLAIN_TYPES = (type(None), bool, int, float, str, bytes)
+
+# basic types that are packed and unpacked inline by generated functions
+INLINE_TYPES = {
+    int: ('int', 4),
+    long: ('long', 8),
+    float: ('double', 8),
+}
+
+HEADER = '''# -*- coding: utf-8 -*-
+# Generated by mtpylon.serialization.codegen. Don`t edit it
+from struct import Struct, error as StructError
+
+from mtpylon.exceptions import DumpError
+from mtpylon.serialization.loaded import LoadedValue
+from mtpylon.serialization.schema import CallableFunc
+
+int_struct = Struct('<i')
+long_struct = Struct('<q')
+double_struct = Struct('=d')
+
+unpack_int = int_struct.unpack_from
+unpack_long = long_struct.unpack_from
+unpack_double = double_struct.unpack_from
+
+pack_int = int_struct.pack
+pack_long = long_struct.pack
+pack_double = double_struct.pack
+'''
+
+Data = Union[CombinatorData, FunctionData]
+ParamDescription = Tuple[str, str]
+
+
+def _unique(values: Iterable[Any]) -> List[Any]:
+    return list(dict.fromkeys(values))
+
+
+def _get_schema_combinators(constructors: List[Any]) -> List[Any]:
+    """
+    Returns combinators of constructors in the same order as schema
+    describes them
+    """
+    return _unique(
+        combinator
+        for constructor in constructors
+        for combinator in (
+            get_combinators(constructor)
+            if is_annotated_union(constructor)
+            else [constructor]
+        )
+    )
+
+
+def _describe_value(value: Any) -> str:
+    """
+    Describes value of field metadata or default of function parameter,
+    so description is the same in every process. Objects that are
+    represented by address in memory are described by their type
+    """
+    if isinstance(value, PLAIN_TYPES):
+        return repr(value)
+
+    if isinstance(value, dict):
+        items = sorted(
+            f'{_describe_value(key)}: {_describe_value(item)}'
+            for key, item in value.items()
+        )
+        return f'{{{", ".join(items)}}}'
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_describe_value(item) for item in value]
+        if isinstance(value, (set, frozenset)):
+            items.sort()
+        return f'{type(value).__name__}({", ".join(items)})'
+
+    if isinstance(value, type) or isfunction(value):
+        return f'{value.__module__}.{value.__qualname__}'
+
+    if type(value).__repr__ is object.__repr__:
+        return f'<{type(value).__module__}.{type(value).__qualname__}>'
+
+    return repr(value)
+
+
+def _describe_origin(origin: Any) -> str:
+    name = f'{origin.__module__}.{origin.__qualname__}'
+
+    if isfunction(origin):
+        sig = signature(origin)
+        params_description = ' '.join(
+            f'{param.name}:{param.annotation!r}='
+            f'{_describe_value(param.default)}'
+            for param in sig.parameters.values()
+        )
+        return f'{name} {params_description} -> {sig.return_annotation!r}'
+
+    fields_description = ' '.join(
+        f'{field.name}:{field.type!r}:{_describe_value(dict(field.metadata))}'
+        for field in get_fields_map(origin).values()
+    )
+    meta = origin.Meta
+
+    return (
+        f'{name} {meta.name} {getattr(meta, "order", ())!r} '
+        f'{fields_description}'
+    )
+
+
+def get_schema_hash(constructors: List[Any], functions: List[Callable]) -> str:
+    """
+    Computes hash of schema constructors and functions without validation
+    and description of them. Hash is changed on change of names, fields,
+    field types or metadata of combinators and signatures of functions
+
+    Args:
+        constructors - constructors of schema
+        functions - functions of schema
+    """
+    lines = [f'mtpylon codecs {CODEGEN_VERSION}']
+
+    for constructor in constructors:
+        lines.append(repr(constructor))
+
+    for combinator in _get_schema_combinators(constructors):
+        lines.append(_describe_origin(combinator))
+
+    for func in functions:
+        lines.append(_describe_origin(func))
+
+    return hashlib.sha256('\n'.join(lines).encode()).hexdigest()
+
+
+def _describe_params(data: Data) -> Tuple[ParamDescription, ...]:
+    return tuple((param.name, param.type) for param in data.params)
+
+
+def _get_param_type(param: AttrDescription) -> Any:
+    if is_optional_type(param.origin):
+        return param.origin.__args__[0]
+    return param.origin
+
+
+def _is_inline_type(param: AttrDescription) -> bool:
+    origin = _get_param_type(param)
+    return not is_list_type(origin) and origin in INLINE_TYPES
+
+
+def _generate_load(name: str, data: Data) -> List[str]:
+    has_flags = False
+    values: List[Tuple[str, str]] = []
+    params: List[str] = []
+    body: List[str] = ['offset += 4']
+
+    for index, param in enumerate(data.params):
+        if param.name == 'flags':
+            has_flags = True
+            body += [
+                'flags, = unpack_int(input, offset)',
+                'offset += 4',
+            ]
+            continue
+
+        value = f'p{index}'
+        values.append((param.name, value))
+
+        if _is_inline_type(param):
+            type_name, size = INLINE_TYPES[_get_param_type(param)]
+            load = [
+                f'{value}, = unpack_{type_name}(input, offset)',
+                f'offset += {size}',
+            ]
+        else:
+            params.append(f'load_{index} = load_param(data, {index})')
+            load = [
+                f'loaded = load_{index}(input, offset)',
+                f'{value} = loaded.value',
+                'offset = loaded.offset',
+            ]
+
+        if has_flags and is_optional_type(param.origin):
+            flag = param.field.metadata['flag']  # type: ignore
+            body.append(f'if flags >> {flag} & 1:')
+            body += [f'    {line}' for line in load]
+            body += ['else:', f'    {value} = None']
+        else:
+            body += load
+
+    if isfunction(data.origin):
+        items = ', '.join(f'{key!r}: {value}' for key, value in values)
+        result = f'CallableFunc(origin, {{{items}}})'
+    else:
+        items = ', '.join(f'{key}={value}' for key, value in values)
+        result = f'origin({items})'
+
+    if any('unpack_' in line for line in body):
+        error = f'Not enough bytes to load {_get_name(data)}'
+        body = [
+            'try:',
+            *[f'    {line}' for line in body],
+            'except StructError:',
+            f'    raise ValueError({error!r})',
+        ]
+
+    return [
+        '',
+        '',
+        f'def make_load_{name}(data, load_param):',
+        '    origin = data.origin',
+        *[f'    {line}' for line in params],
+        '',
+        f'    def load_{name}(input, offset):',
+        *[f'        {line}' for line in body],
+        f'        return LoadedValue({result}, offset)',
+        '',
+        f'    return load_{name}',
+    ]
+
+
+def _generate_dump(name: str, data: Data) -> List[str]:
+    reads: List[str] = []
+    flags: List[str] = []
+    params: List[str] = []
+    body: List[str] = []
+
+    for index, param in enumerate(data.params):
+        if param.name == 'flags':
+            body += ['buffer += pack_int(flags)']
+            continue
+
+        value = f'p{index}'
+
+        if isfunction(data.origin):
+            reads.append(f'{value} = value.params.get({param.name!r})')
+        else:
+            reads.append(f'{value} = value.{param.name}')
+
+        if _is_inline_type(param):
+            type_name, _ = INLINE_TYPES[_get_param_type(param)]
+            dump = f'buffer += pack_{type_name}({value})'
+        else:
+            params.append(f'dump_{index} = dump_param(data, {index})')
+            dump = f'dump_{index}(buffer, {value})'
+
+        step = [f'tl_type = {param.type!r}', dump]
+
+        if 'flag' in getattr(param.field, 'metadata', {}):
+            flag = param.field.metadata['flag']  # type: ignore
+            flags += [
+                f'if {value} is not None:',
+                f'    flags |= {1 << flag}',
+            ]
+            body.append(f'if {value} is not None:')
+            body += [f'    {line}' for line in step]
+        else:
+            body += step
+
+    start: List[str] = []
+
+    if body:
+        start = ['start = len(buffer)']
+        if flags:
+            reads += ['flags = 0', *flags]
+        body = [
+            *reads,
+            "tl_type = '#'",
+            'try:',
+            *[f'    {line}' for line in body],
+            'except Exception:',
+            '    del buffer[start:]',
+            "    raise DumpError(f'Can`t dump value {tl_type}.')",
+        ]
+
+    return [
+        '',
+        '',
+        f'def make_dump_{name}(data, dump_param):',
+        f'    constructor = {dump_int(data.id)!r}',
+        *[f'    {line}' for line in params],
+        '',
+        f'    def dump_{name}(buffer, value, bare):',
+        *[f'        {line}' for line in start],
+        '        if not bare:',
+        '            buffer += constructor',
+        *[f'        {line}' for line in body],
+        '',
+        f'    return dump_{name}',
+    ]
+
+
+def _get_name(data: Data) -> str:
+    if isinstance(data, FunctionData):
+        return data.method
+    return data.predicate
+
+
+def _generate_plans(
+    kind: str,
+    key: str,
+    structure: SchemaStructure,
+    generate: Callable[[str, Data], List[str]]
+) -> List[str]:
+    """
+    Generates factory of plan for each combinator and function and function
+    that builds plans with them. Each plan is built by its own small factory,
+    so compilation of generated module takes linear time
+    """
+    named_data: List[Tuple[str, Data]] = [
+        *[(f'c{i}', data) for i, data in enumerate(structure.constructors)],
+        *[(f'f{i}', data) for i, data in enumerate(structure.methods)],
+    ]
+    lines: List[str] = []
+
+    for name, data in named_data:
+        lines += generate(name, data)
+
+    return lines + [
+        '',
+        '',
+        f'{kind.upper()}_FACTORIES = (',
+        *[f'    make_{kind}_{name},' for name, _ in named_data],
+        ')',
+        '',
+        '',
+        f'def build_{kind}_plans(combinators, functions, {kind}_param):',
+        '    return {',
+        f'        data.{key}: make(data, {kind}_param)',
+        '        for data, make in zip(',
+        '            [*combinators, *functions],',
+        f'            {kind.upper()}_FACTORIES',
+        '        )',
+        '    }',
+    ]
+
+
+def generate_source(schema: Schema, schema_hash: str) -> str:
+    """
+    Generates source of module with numbers and descriptions of combinators
+    and functions of schema and functions to build its load and dump plans.
+
+    Params that are basic types with fixed size are packed and unpacked
+    inline, other params are compiled by passed `load_param` and
+    `dump_param` functions.
+
+    Args:
+        schema - schema to generate codecs
+        schema_hash - hash of schema computed by `get_schema_hash`
+
+    Returns:
+        source of python module
+    """
+    structure = schema.get_schema_structure()
+
+    lines = [
+        HEADER,
+        f'SCHEMA_HASH = {schema_hash!r}',
+        '',
+        '# id, predicate, type and params of combinators',
+        'COMBINATORS = (',
+        *[
+            f'    ({data.id}, {data.predicate!r}, {data.type!r}, '
+            f'{_describe_params(data)!r}),'
+            for data in structure.constructors
+        ],
+        ')',
+        '',
+        '# id, method, return type and params of functions',
+        'FUNCTIONS = (',
+        *[
+            f'    ({data.id}, {data.method!r}, {data.type!r}, '
+            f'{_describe_params(data)!r}),'
+            for data in structure.methods
+        ],
+        ')',
+    ]
+    lines += _generate_plans('load', 'id', structure, _generate_load)
+    lines += _generate_plans('dump', 'origin', structure, _generate_dump)
+
+    return '\n'.join(lines) + '\n'
+
+
+def _build_combinator_data(
+    origin: Any,
+    id: int,
+    predicate: str,
+    type: str,
+    params: Tuple[ParamDescription, ...]
+) -> CombinatorData:
+    fields_map = get_fields_map(origin)
+
+    return CombinatorData(
+        id=id,
+        predicate=predicate,
+        params=[
+            AttrDescription('flags', '#', int, None)
+            if (name, param_type) == ('flags', '#')
+            else AttrDescription(
+                name,
+                param_type,
+                cast(Type, fields_map[name].type),
+                fields_map[name]
+            )
+            for name, param_type in params
+        ],
+        type=type,
+        origin=origin,
+    )
+
+
+def _build_function_data(
+    origin: Callable,
+    id: int,
+    method: str,
+    type: str,
+    params: Tuple[ParamDescription, ...]
+) -> FunctionData:
+    parameters = signature(origin).parameters
+
+    return FunctionData(
+        id=id,
+        method=method,
+        params=[
+            AttrDescription(
+                name,
+                param_type,
+                parameters[name].annotation,
+                None
+            )
+            for name, param_type in params
+        ],
+        type=type,
+        origin=origin,
+    )
+
+
+def build_schema(
+    codecs: ModuleType,
+    constructors: List[Any],
+    functions: List[Callable]
+) -> Schema:
+    """
+    Builds schema from generated module without validation and description
+    of constructors and functions
+
+    Args:
+        codecs - generated module
+        constructors - constructors of schema
+        functions - functions of schema
+    """
+    combinators = _get_schema_combinators(constructors)
+    methods = _unique(functions)
+
+    structure = SchemaStructure(
+        constructors=[
+            _build_combinator_data(origin, *description)
+            for origin, description in zip(combinators, codecs.COMBINATORS)
+        ],
+        methods=[
+            _build_function_data(origin, *description)
+            for origin, description in zip(methods, codecs.FUNCTIONS)
+        ]
+    )
+
+    schema = Schema.from_structure(constructors, functions, structure)
+    schema.codecs = codecs
+
+    return schema
+
+
+def import_codecs(path: str) -> ModuleType:
+    """
+    Imports generated module by path. Bytecode of module is loaded from
+    `__pycache__` directory near it if it is up to date
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = spec_from_file_location(name, path)
+
+    if spec is None or spec.loader is None:
+        raise ImportError(f'Can`t import generated codecs {path}')
+
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)  # type: ignore
+
+    return module
+
+
+def write_codecs(schema: Schema, schema_hash: str, path: str):
+    """
+    Writes generated codecs of schema to path and compiles its bytecode.
+    Bytecode is written even if python doesn't write bytecode of imported
+    modules, so compilation of generated module isn't repeated on next
+    start. Source file is replaced atomically, so processes that start at
+    the same time don't see partially written module
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(generate_source(schema, schema_hash))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    py_compile.compile(path, cfile=cache_from_source(path), doraise=True)
+
+
+def get_codecs_path(cache_dir: str, schema_hash: str) -> str:
+    return os.path.join(cache_dir, f'mtpylon_codecs_{schema_hash}.py')
+
+
+def load_schema(
+    constructors: List[Any],
+    functions: List[Callable],
+    cache_dir: str
+) -> Schema:
+    """
+    Returns schema with generated codecs. Schema is built from cached module
+    if it has been generated for the same constructors and functions before,
+    otherwise schema is validated and described as usual and generated module
+    is written to cache directory.
+
+    Args:
+        constructors - constructors of schema
+        functions - functions of schema
+        cache_dir - directory of generated modules
+
+    Raises:
+        InvalidConstructor, InvalidCombinator, InvalidFunction - if schema
+        isn't valid and hasn't been cached yet
+    """
+    schema_hash = get_schema_hash(constructors, functions)
+    path = get_codecs_path(cache_dir, schema_hash)
+
+    if os.path.exists(path):
+        codecs = import_codecs(path)
+
+        if getattr(codecs, 'SCHEMA_HASH', None) == schema_hash:
+            return build_schema(codecs, constructors, functions)
+
+    schema = Schema(constructors=constructors, functions=functions)
+    write_codecs(schema, schema_hash, path)
+    schema.codecs = import_codecs(path)
+
+    return schema
@@ -1,16 +1,27 @@
 # -*- coding: utf-8 -*-
 import struct
 
-from .loaded import LoadedValue
+from .loaded import LoadedValue, Buffer
 from .. import double
 
+double_struct = struct.Struct('=d')
+pack_double = double_struct.pack
+
 
 def dump(value: double) -> bytes:
     return struct.pack('=d', value)
 
 
-def load(input: bytes) -> LoadedValue[double]:
+def dump_to(buffer: bytearray, value: double) -> None:
+    """
+    Appends dumped value to buffer. Value is packed by struct without
+    intermediate calls
+    """
+    buffer += pack_double(value)
+
+
+def load(input: Buffer, offset: int = 0) -> LoadedValue[double]:
     return LoadedValue(
-        double(struct.unpack('d', input[:8])[0]),
-        8
+        double(struct.unpack_from('d', input, offset)[0]),
+        offset + 8
     )
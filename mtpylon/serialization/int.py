@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
-from .loaded import LoadedValue
+from struct import Struct, error as StructError
+
+from .loaded import LoadedValue, Buffer
+
+int_struct = Struct('<i')
+pack_int = int_struct.pack
 
 
 def dump(value: int) -> bytes:
@@ -13,18 +18,31 @@ def dump(value: int) -> bytes:
     return value.to_bytes(4, 'little', signed=True)
 
 
-def load(input: bytes) -> LoadedValue[int]:
+def dump_to(buffer: bytearray, value: int) -> None:
+    """
+    Appends dumped value to buffer. Value is packed by struct without
+    intermediate calls
+    """
+    buffer += pack_int(value)
+
+
+def load(input: Buffer, offset: int = 0) -> LoadedValue[int]:
     """
-    Load int value and return it with offset.
+    Load int value and return it with offset right after loaded value.
     int value is a 32 bit value in little endian order
 
     Args:
         input - bytes that should be read to load int
+        offset - position of int value in input
 
     Raises:
         ValueError - if there aren't enough bytes
 
     """
-    if len(input) < 4:
-        raise ValueError(f'To load int required 4 bytes. Got {len(input)}')
-    return LoadedValue(int.from_bytes(input[:4], 'little', signed=True), 4)
+    try:
+        value, = int_struct.unpack_from(input, offset)
+    except StructError:
+        raise ValueError(
+            f'To load int required 4 bytes. Got {len(input) - offset}'
+        )
+    return LoadedValue(value, offset + 4)
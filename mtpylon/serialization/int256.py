@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from .loaded import LoadedValue
+from .loaded import LoadedValue, Buffer
 from .. import int256
 
 
@@ -14,18 +14,33 @@ def dump(value: int256) -> bytes:
     return value.to_bytes(32, 'little')
 
 
-def load(input: bytes) -> LoadedValue[int256]:
+def dump_to(buffer: bytearray, value: int256) -> None:
     """
-    Loads long value and return it with offset.
+    Appends dumped value to buffer. There isn`t struct format for 256 bit
+    value, so single `to_bytes` call is cheaper than packing of parts
+    """
+    buffer += value.to_bytes(32, 'little')
+
+
+def load(input: Buffer, offset: int = 0) -> LoadedValue[int256]:
+    """
+    Loads long value and return it with offset right after loaded value.
     int value is a 256 bit value in little endian order
 
     Args:
         input - bytes that should be read to load int
+        offset - position of value in input
 
     Raises:
         ValueError - if there aren't enough bytes
 
     """
-    if len(input) < 32:
-        raise ValueError(f'To load long required 32 bytes. Got {len(input)}')
-    return LoadedValue(int256(int.from_bytes(input[:32], 'little')), 32)
+    end = offset + 32
+    if len(input) < end:
+        raise ValueError(
+            f'To load long required 32 bytes. Got {len(input) - offset}'
+        )
+    return LoadedValue(
+        int256(int.from_bytes(input[offset:end], 'little')),
+        end
+    )
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+from typing import Any, Optional
+
+from .loaded import LoadedValue, Buffer
+from .bytes import get_bounds
+
+
+class LazyBytes:
+    """
+    View over bytes value of serialized message. Value is copied from
+    message buffer only on first access, so value that is just forwarded
+    could be dumped without copying it.
+
+    Args:
+        view - memoryview of value in message buffer
+    """
+    __slots__ = ('view', '_value')
+
+    def __init__(self, view: memoryview):
+        self.view = view
+        self._value: Optional[bytes] = None
+
+    @property
+    def value(self) -> bytes:
+        """
+        Bytes copied from message buffer
+        """
+        if self._value is None:
+            self._value = bytes(self.view)
+        return self._value
+
+    def __bytes__(self) -> bytes:
+        return self.value
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyBytes):
+            return self.view == other.view
+        return self.view == other
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __reduce__(self):
+        return bytes, (self.value, )
+
+    def __repr__(self) -> str:
+        return f'LazyBytes({len(self)} bytes)'
+
+
+class LazyString:
+    """
+    View over utf-8 string value of serialized message. Value is decoded
+    only on first access, so string that is just forwarded could be dumped
+    without decoding and encoding it.
+
+    Args:
+        view - memoryview of encoded value in message buffer
+    """
+    __slots__ = ('view', '_value')
+
+    def __init__(self, view: memoryview):
+        self.view = view
+        self._value: Optional[str] = None
+
+    @property
+    def value(self) -> str:
+        """
+        Decoded string
+        """
+        if self._value is None:
+            self._value = str(self.view, 'utf-8')
+        return self._value
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyString):
+            return self.view == other.view
+        return self.value == other
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __reduce__(self):
+        return str, (self.value, )
+
+    def __repr__(self) -> str:
+        return f'LazyString({len(self.view)} bytes)'
+
+
+def _get_view(input: Buffer, start: int, end: int) -> memoryview:
+    if isinstance(input, memoryview):
+        return input[start:end]
+    return memoryview(input)[start:end]
+
+
+def load_bytes(input: Buffer, offset: int = 0) -> LoadedValue[LazyBytes]:
+    """
+    Loads tl serialized string as view over input without copying it
+
+    Args:
+        input - tl serialized bytes
+        offset - position of serialized string in input
+    """
+    start, end, offset = get_bounds(input, offset)
+
+    return LoadedValue(LazyBytes(_get_view(input, start, end)), offset)
+
+
+def load_string(input: Buffer, offset: int = 0) -> LoadedValue[LazyString]:
+    """
+    Loads utf-8 string as view over input without decoding it
+
+    Args:
+        input - tl serialized bytes
+        offset - position of serialized string in input
+    """
+    start, end, offset = get_bounds(input, offset)
+
+    return LoadedValue(LazyString(_get_view(input, start, end)), offset)
@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
-from typing import TypeVar, Generic, Final
+from typing import TypeVar, Generic, Final, Union
 
 Value = TypeVar('Value')
 
+# Input of loaders. Loaders read value from buffer by offset, so memoryview
+# could be passed to avoid copying of tail bytes
+Buffer = Union[bytes, bytearray, memoryview]
+
 
 class LoadedValue(Generic[Value]):
 
@@ -1,7 +1,12 @@
 # -*- coding: utf-8 -*-
-from .loaded import LoadedValue
+from struct import Struct, error as StructError
+
+from .loaded import LoadedValue, Buffer
 from .. import long
 
+long_struct = Struct('<q')
+pack_long = long_struct.pack
+
 
 def dump(value: long) -> bytes:
     """
@@ -14,21 +19,31 @@ def dump(value: long) -> bytes:
     return value.to_bytes(8, 'little', signed=True)
 
 
-def load(input: bytes) -> LoadedValue[long]:
+def dump_to(buffer: bytearray, value: long) -> None:
+    """
+    Appends dumped value to buffer. Value is packed by struct without
+    intermediate calls
+    """
+    buffer += pack_long(value)
+
+
+def load(input: Buffer, offset: int = 0) -> LoadedValue[long]:
     """
-    Loads long value and return it with offset.
+    Loads long value and return it with offset right after loaded value.
     int value is a 64 bit value in little endian order
 
     Args:
         input - bytes that should be read to load int
+        offset - position of long value in input
 
     Raises:
         ValueError - if there aren't enough bytes
 
     """
-    if len(input) < 8:
-        raise ValueError(f'To load long required 8 bytes. Got {len(input)}')
-    return LoadedValue(
-        long(int.from_bytes(input[:8], 'little', signed=True)),
-        8
-    )
+    try:
+        value, = long_struct.unpack_from(input, offset)
+    except StructError:
+        raise ValueError(
+            f'To load long required 8 bytes. Got {len(input) - offset}'
+        )
+    return LoadedValue(long(value), offset + 8)
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from .loaded import LoadedValue
+from .loaded import LoadedValue, Buffer
 
 
 def dump(value: bytes) -> bytes:
@@ -10,9 +10,9 @@ def dump(value: bytes) -> bytes:
     return value
 
 
-def load(input: bytes) -> LoadedValue[bytes]:
+def load(input: Buffer, offset: int = 0) -> LoadedValue[bytes]:
     """
     Assume that object input will be loaded by other schema so just wrap
     it with with offset. Offset is length of input bytes
     """
-    return LoadedValue(value=input, offset=len(input))
+    return LoadedValue(value=bytes(input[offset:]), offset=len(input))
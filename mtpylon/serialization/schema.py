@@ -8,27 +8,68 @@ from typing import (
     Dict,
     Optional,
     List,
+    Tuple,
     Type,
     NamedTuple,
 )
 from functools import partial
 from inspect import isfunction, signature
+from types import ModuleType
 from mypy_extensions import Arg, NamedArg
 
-from .bytes import dump as dump_bytes, load as load_bytes
-from .int import dump as dump_int, load as load_int
-from .long import dump as dump_long, load as load_long
-from .int128 import dump as dump_int128, load as load_int128
-from .int256 import dump as dump_int256, load as load_int256
-from .double import dump as dump_double, load as load_double
-from .string import dump as dump_string, load as load_string
-from .vector import dump as dump_vector, load as load_vector
-from .loaded import LoadedValue
+from .bytes import (
+    dump as dump_bytes,
+    dump_to as dump_bytes_to,
+    load as load_bytes,
+)
+from .int import (
+    dump as dump_int,
+    dump_to as dump_int_to,
+    load as load_int,
+    int_struct,
+)
+from .long import (
+    dump as dump_long,
+    dump_to as dump_long_to,
+    load as load_long,
+)
+from .int128 import (
+    dump as dump_int128,
+    dump_to as dump_int128_to,
+    load as load_int128,
+)
+from .int256 import (
+    dump as dump_int256,
+    dump_to as dump_int256_to,
+    load as load_int256,
+)
+from .double import (
+    dump as dump_double,
+    dump_to as dump_double_to,
+    load as load_double,
+)
+from .string import (
+    dump as dump_string,
+    dump_to as dump_string_to,
+    load as load_string,
+)
+from .vector import (
+    dump_to as dump_vector_to,
+    dump_packed_to as dump_packed_vector_to,
+    dump_wide_to as dump_wide_vector_to,
+    load as load_vector,
+    load_packed as load_packed_vector,
+    load_wide as load_wide_vector,
+)
+from .lazy import (
+    load_bytes as load_lazy_bytes,
+    load_string as load_lazy_string,
+)
+from .loaded import LoadedValue, Buffer
 from ..utils import (
     is_list_type,
     is_optional_type,
     get_fields_map,
-    AttrDescription,
 )
 from .. import long, int128, int256
 from ..schema import Schema, FunctionData, CombinatorData
@@ -36,6 +77,7 @@ from ..exceptions import DumpError
 
 
 DumpBasicTypeFunction = Callable[[Any], bytes]
+DumpToBasicTypeFunction = Callable[[bytearray, Any], None]
 DumpFunction = Callable[
     [
         Any,
@@ -52,10 +94,20 @@ DumpFunctionWithDumpObject = Callable[
     Any
 ]
 
-LoadBasicTypeFunction = Callable[[bytes], LoadedValue[Any]]
+LoadBasicTypeFunction = Callable[[Buffer, int], LoadedValue[Any]]
 LoadFunction = Callable[
     [
-        bytes,
+        Buffer,
+        NamedArg(bool, 'bare')  # noqa: F821
+    ],
+    LoadedValue[Any]
+]
+# Custom loader with `offset` param reads value from input by offset and
+# returns offset right after loaded value
+LoadByOffsetFunction = Callable[
+    [
+        Buffer,
+        NamedArg(int, 'offset'),  # noqa: F821
         NamedArg(bool, 'bare')  # noqa: F821
     ],
     LoadedValue[Any]
@@ -69,12 +121,55 @@ LoadFunctionWithLoadObject = Callable[
     LoadedValue[Any]
 ]
 
-CustomDumpFunction = Union[DumpFunction, DumpFunctionWithDumpObject]
+# Custom dumper with `buffer` param appends dumped value to buffer.
+# It takes dump_object function that appends objects to buffer too
+DumpToFunction = Callable[
+    [
+        bytearray,
+        Any,
+        NamedArg(bool, 'bare')  # noqa: F821
+    ],
+    None
+]
+DumpToFunctionWithDumpObject = Callable[
+    [
+        bytearray,
+        Any,
+        NamedArg(bool, 'bare'),  # noqa: F821
+        NamedArg(DumpToFunction, 'dump_object')  # noqa: F821
+    ],
+    None
+]
+
+CustomDumpFunction = Union[
+    DumpFunction,
+    DumpFunctionWithDumpObject,
+    DumpToFunction,
+    DumpToFunctionWithDumpObject,
+]
 CustomLoadFunction = Union[LoadFunction, LoadFunctionWithLoadObject]
 
 BasicTypeDumpers = Dict[Any, DumpBasicTypeFunction]
+BasicTypeWriters = Dict[Any, DumpToBasicTypeFunction]
 BasicTypeLoaders = Dict[Any, LoadBasicTypeFunction]
 
+LoadVectorFunction = Callable[
+    [
+        Buffer,
+        NamedArg(bool, 'bare'),  # noqa: F821
+        NamedArg(int, 'offset'),  # noqa: F821
+    ],
+    LoadedValue[List[Any]]
+]
+DumpVectorToFunction = Callable[
+    [
+        bytearray,
+        NamedArg(List[Any], 'vector'),  # noqa: F821
+        NamedArg(bool, 'bare'),  # noqa: F821
+    ],
+    None
+]
+
 DumpersMap = Dict[Any, DumpFunction]
 LoadersMap = Dict[Any, LoadFunction]
 
@@ -88,9 +183,24 @@ class CallableFunc:
     params: Dict[str, Any]
 
 
-class Value2Dump(NamedTuple):
-    value: Any
-    param: AttrDescription
+class LoadStep(NamedTuple):
+    """
+    Compiled step to load single param of combinator or function
+    """
+    name: str  # name of param
+    load: LoadBasicTypeFunction  # loads param value from bytes
+    flag: Optional[int]  # flag index for optional param
+    is_flags: bool  # is this step loads flags value
+
+
+class DumpStep(NamedTuple):
+    """
+    Compiled step to dump single param of combinator or function
+    """
+    name: str  # name of param
+    type: str  # tl type name, used in error message
+    dump: DumpToBasicTypeFunction  # appends dumped param value to buffer
+    flag: Optional[int]  # flag index for optional param
 
 
 def get_flag_ids(origin: Type, param_name: str) -> int:
@@ -106,20 +216,6 @@ def get_flag_ids(origin: Type, param_name: str) -> int:
     return field.metadata['flag']
 
 
-def get_flag_value(flag_number: int, param_name: str, origin: Type) -> int:
-    """
-    Get flag value by param name
-    """
-    return (flag_number >> get_flag_ids(origin, param_name)) & 1
-
-
-def set_flag_value(flag_number: int, param_name: str, origin: Type) -> int:
-    """
-    Updates flag value and returns it
-    """
-    return flag_number | (1 << get_flag_ids(origin, param_name))
-
-
 def is_bare_field(field: Optional[Field]):
     """
     Checks should we dump param as bare type or not
@@ -137,6 +233,16 @@ def is_bare_item_field(field: Optional[Field]):
     return 'bare' in field.metadata.get('item_meta', {})
 
 
+def is_lazy_field(field: Optional[Field]):
+    """
+    Checks should we load bytes or string param as lazy view over message
+    """
+    if field is None:
+        return False
+
+    return field.metadata.get('lazy', False)
+
+
 def build_custom_dumper_func(
     func: CustomDumpFunction,
     dump_object: DumpFunction
@@ -180,8 +286,19 @@ basic_type_dumpers: BasicTypeDumpers = {
 }
 
 
-def load_empty(x: bytes) -> LoadedValue[None]:
-    return LoadedValue(None, 0)
+basic_type_writers: BasicTypeWriters = {
+    int: dump_int_to,
+    long: dump_long_to,
+    int128: dump_int128_to,
+    int256: dump_int256_to,
+    float: dump_double_to,
+    bytes: dump_bytes_to,
+    str: dump_string_to,
+}
+
+
+def load_empty(x: Buffer, offset: int = 0) -> LoadedValue[None]:
+    return LoadedValue(None, offset)
 
 
 basic_type_loaders: BasicTypeLoaders = {
@@ -195,154 +312,654 @@ basic_type_loaders: BasicTypeLoaders = {
     type(None): load_empty,
 }
 
+# bytes and strings of lazy fields are loaded as views over message.
+# Basic writers dump lazy values, so they could be forwarded into any field
+lazy_type_loaders: BasicTypeLoaders = {
+    bytes: load_lazy_bytes,
+    str: load_lazy_string,
+}
 
-def dump_param(
-    param: Value2Dump,
-    dumpers: CustomDumpersMap,
-    dump_object: DumpFunction
-) -> bytes:
-    origin = param.param.origin
-    field = param.param.field
-
-    if is_optional_type(origin):
-        origin = origin.__args__[0]
-
-    if is_list_type(origin):
-        item_origin = origin.__args__[0]
-
-        if item_origin in basic_type_dumpers:
-            dump_item = basic_type_dumpers[item_origin]
-        elif item_origin in dumpers:
-            func = dumpers[item_origin]
-            dump_item = partial(
-                build_custom_dumper_func(func, dump_object=dump_object),
-                bare=is_bare_item_field(field)
-            )
-        else:
-            dump_item = partial(dump_object, bare=is_bare_item_field(field))
+# vectors of fixed width items are loaded and dumped in one batch
+basic_vector_loaders: Dict[Any, LoadVectorFunction] = {
+    int: partial(load_packed_vector, 'i'),
+    long: partial(load_packed_vector, 'q'),
+    float: partial(load_packed_vector, 'd'),
+    int128: partial(load_wide_vector, 16),
+    int256: partial(load_wide_vector, 32),
+}
+
+basic_vector_writers: Dict[Any, DumpVectorToFunction] = {
+    int: partial(dump_packed_vector_to, item_format='i'),
+    long: partial(dump_packed_vector_to, item_format='q'),
+    float: partial(dump_packed_vector_to, item_format='d'),
+    int128: partial(dump_wide_vector_to, item_size=16),
+    int256: partial(dump_wide_vector_to, item_size=32),
+}
 
-        return dump_vector(
-            dump_item,
-            param.value,
-            is_bare_field(field)
-        )
 
-    if origin in basic_type_dumpers:
-        return basic_type_dumpers[origin](param.value)
+class SchemaLoader:
+    """
+    Loads objects and function calls of schema. Load plan of each combinator
+    and function is compiled once on first use: param loaders, flag indexes
+    and bare options are resolved from schema description and reused for
+    every further message.
+
+    Values are read from input by offset, input is never sliced, so
+    memoryview could be passed to load values without copying.
+    """
 
-    if origin in dumpers:
-        func = build_custom_dumper_func(
-            dumpers[origin],
-            dump_object=dump_object
+    def __init__(self, schema: Schema, custom_loaders: CustomLoadersMap):
+        self.schema = schema
+        self._custom_loaders: Dict[Any, LoadByOffsetFunction] = {
+            tp: self._build_custom_loader(func)
+            for tp, func in custom_loaders.items()
+        }
+        self._boxed_plans: Dict[int, LoadBasicTypeFunction] = {}
+        self._bare_plans: Dict[Any, LoadBasicTypeFunction] = {}
+
+        if schema.codecs is not None:
+            self._set_generated_plans(schema.codecs)
+
+    def load(
+        self,
+        input: Buffer,
+        bare: bool = False,
+        tp: Optional[Any] = None,
+        offset: int = 0
+    ) -> LoadedValue[Union[CallableFunc, Any]]:
+        """
+        Loads object or function with params from bytes input
+
+        Args:
+            input - serialized value
+            bare - checks is loaded bytes are bare type or not
+            tp - select how type should be loaded
+            offset - position of serialized value in input
+
+        Returns:
+            loaded value with offset right after it
+
+        Raises:
+            ValueError - when can't load data
+        """
+        if tp in basic_type_loaders:
+            return basic_type_loaders[tp](input, offset)
+
+        if tp in self._custom_loaders:
+            return self._custom_loaders[tp](input, offset=offset, bare=bare)
+
+        if not bare:
+            return self._load_boxed(input, offset)
+
+        if tp is None:
+            raise ValueError('We should load not bare type or pass combinator')
+
+        return self._load_bare(input, offset, tp)
+
+    def compile_plans(self):
+        """
+        Compiles load plans of all combinators and functions of schema
+        beforehand, so first messages are not slowed down by compilation
+        """
+        structure = self.schema.get_schema_structure()
+
+        for data in [*structure.constructors, *structure.methods]:
+            if data.id not in self._boxed_plans:
+                self._compile_boxed_plan(data.id)
+
+    def _set_generated_plans(self, codecs: ModuleType):
+        """
+        Uses generated load functions of combinators and functions as boxed
+        plans. See `mtpylon.serialization.codegen`
+        """
+        structure = self.schema.get_schema_structure()
+        plans = codecs.build_load_plans(
+            structure.constructors,
+            structure.methods,
+            self._compile_generated_param
         )
-    else:
-        func = dump_object
 
-    return func(param.value, bare=is_bare_field(field))
+        items: List[Union[CombinatorData, FunctionData]] = [
+            *structure.constructors,
+            *structure.methods
+        ]
 
+        for data in items:
+            if data.origin not in self._custom_loaders:
+                self._boxed_plans[data.id] = plans[data.id]
 
-def _dump(
-    value: Any,
-    schema: Schema,
-    bare: bool = False,
-    custom_dumpers: Optional[CustomDumpersMap] = None
-):
-    """
-    Dumps basic or boxed types by schema
-    """
-    if custom_dumpers is None:
-        custom_dumpers = {}
+    def _compile_generated_param(
+        self,
+        data: Union[CombinatorData, FunctionData],
+        index: int
+    ) -> LoadBasicTypeFunction:
+        param = data.params[index]
+        origin = param.origin
 
-    data: Optional[Union[CombinatorData, FunctionData]] = None
-    values_2_dump: List[Value2Dump] = []
+        if is_optional_type(origin):
+            origin = origin.__args__[0]
 
-    dumped_values: List[bytes] = []
-    flags_value: Optional[int] = None
+        return self._compile_param(origin, param.field)
 
-    if type(value) in custom_dumpers:
-        origin = type(value)
-        func = build_custom_dumper_func(
-            custom_dumpers[origin],
-            dump_object=partial(
-                _dump,
-                schema=schema,
-                custom_dumpers=custom_dumpers
-            )
-        )
-        return func(value, bare=bare)
+    def _build_custom_loader(
+        self,
+        func: CustomLoadFunction
+    ) -> LoadByOffsetFunction:
+        load_func = build_custom_loader_func(func, load_object=self.load)
+
+        if 'offset' in signature(func).parameters:
+            return cast(LoadByOffsetFunction, load_func)
+
+        def load_by_offset(
+            input: Buffer,
+            offset: int,
+            bare: bool
+        ) -> LoadedValue[Any]:
+            loaded = load_func(input[offset:], bare=bare)
+            return LoadedValue(loaded.value, offset + loaded.offset)
+
+        return cast(LoadByOffsetFunction, load_by_offset)
+
+    def _load_boxed(self, input: Buffer, offset: int) -> LoadedValue[Any]:
+        combinator = load_int(input, offset).value
 
-    if isinstance(value, CallableFunc):
         try:
-            data = schema[value.func]
+            plan = self._boxed_plans[combinator]
         except KeyError:
-            raise DumpError('Can`t dump function that not in schema')
-        values_2_dump = [
-            Value2Dump(value.params.get(param.name), param)
-            for param in data.params
-        ]
-    else:
+            plan = self._compile_boxed_plan(combinator)
+
+        return plan(input, offset)
+
+    def _load_bare(
+        self,
+        input: Buffer,
+        offset: int,
+        tp: Any
+    ) -> LoadedValue[Any]:
         try:
-            data = schema[type(value)]
+            plan = self._bare_plans[tp]
         except KeyError:
-            raise DumpError('Can`t dump combinator that not in schema')
+            plan = self._compile_bare_plan(tp)
 
-        values_2_dump = [
-            Value2Dump(getattr(value, param.name, None), param)
-            for param in data.params
-        ]
+        return plan(input, offset)
+
+    def _compile_boxed_plan(self, combinator: int) -> LoadBasicTypeFunction:
+        if combinator not in self.schema:
+            raise ValueError(f'Can`t find combinator {combinator} in schema')
 
-    for item in values_2_dump:
-        attr_value = item.value
-        param = item.param
+        data = self.schema[combinator]
 
-        if param.name == 'flags':
-            flags_value = 0
-            continue
+        if data.origin in self._custom_loaders:
+            plan = partial(
+                _load_custom_param,
+                self._custom_loaders[data.origin],
+                False
+            )
+        else:
+            plan = partial(
+                self._load_params,
+                self._compile_params(data),
+                data.origin,
+                4
+            )
+
+        self._boxed_plans[combinator] = plan
+        return plan
+
+    def _compile_bare_plan(self, tp: Any) -> LoadBasicTypeFunction:
+        if tp not in self.schema:
+            raise ValueError(f'Can`t find info about {tp}')
+
+        data = self.schema[tp]
+        plan = partial(
+            self._load_params,
+            self._compile_params(data),
+            data.origin,
+            0
+        )
+
+        self._bare_plans[tp] = plan
+        return plan
 
-        if 'flag' in getattr(param.field, 'metadata', {}):
-            if attr_value is None:
+    def _compile_params(
+        self,
+        data: Union[CombinatorData, FunctionData]
+    ) -> Tuple[LoadStep, ...]:
+        steps: List[LoadStep] = []
+        has_flags = False
+
+        for param in data.params:
+            if param.name == 'flags':
+                has_flags = True
+                steps.append(LoadStep(param.name, load_int, None, True))
                 continue
 
-            type_name = param.type
-            flags_value = cast(int, flags_value)
-            param_origin = cast(Type, data.origin)
-            param_name = param.name
+            origin = param.origin
+            flag: Optional[int] = None
+
+            if is_optional_type(origin) and has_flags:
+                flag = get_flag_ids(cast(Type, data.origin), param.name)
+                origin = origin.__args__[0]
+
+            steps.append(
+                LoadStep(
+                    param.name,
+                    self._compile_param(origin, param.field),
+                    flag,
+                    False
+                )
+            )
 
-            flags_value = set_flag_value(
-                flags_value,
-                param_name,
-                param_origin
+        return tuple(steps)
+
+    def _compile_param(
+        self,
+        origin: Any,
+        field: Optional[Field]
+    ) -> LoadBasicTypeFunction:
+        if is_lazy_field(field) and origin in lazy_type_loaders:
+            return lazy_type_loaders[origin]
+
+        if is_list_type(origin) and origin.__args__[0] in basic_vector_loaders:
+            return partial(
+                _load_basic_vector_param,
+                basic_vector_loaders[origin.__args__[0]],
+                is_bare_field(field)
             )
+
+        if is_list_type(origin):
+            load_item = self._compile_type(
+                origin.__args__[0],
+                bare=is_bare_item_field(field)
+            )
+            return partial(
+                _load_vector_param,
+                load_item,
+                is_bare_field(field)
+            )
+
+        return self._compile_type(origin, bare=is_bare_field(field))
+
+    def _compile_type(self, tp: Any, bare: bool) -> LoadBasicTypeFunction:
+        if tp in basic_type_loaders:
+            return basic_type_loaders[tp]
+
+        if tp in self._custom_loaders:
+            return partial(_load_custom_param, self._custom_loaders[tp], bare)
+
+        if not bare:
+            return self._load_boxed
+
+        return partial(self._load_bare, tp=tp)
+
+    @staticmethod
+    def _load_params(
+        steps: Tuple[LoadStep, ...],
+        origin: Any,
+        skip: int,
+        input: Buffer,
+        offset: int
+    ) -> LoadedValue[Any]:
+        flag_number = 0
+        params: Dict[str, Any] = {}
+        offset += skip
+
+        for step in steps:
+            if step.flag is not None and not (flag_number >> step.flag) & 1:
+                params[step.name] = None
+                continue
+
+            loaded = step.load(input, offset)
+            offset = loaded.offset
+
+            if step.is_flags:
+                flag_number = loaded.value
+            else:
+                params[step.name] = loaded.value
+
+        if isfunction(origin):
+            value = CallableFunc(origin, params)
         else:
-            type_name = param.type
+            value = origin(**params)
+
+        return LoadedValue(value=value, offset=offset)
+
+
+def _load_custom_param(
+    load_func: LoadByOffsetFunction,
+    bare: bool,
+    input: Buffer,
+    offset: int
+) -> LoadedValue[Any]:
+    return load_func(input, offset=offset, bare=bare)
+
+
+def _load_basic_vector_param(
+    load_vector_func: LoadVectorFunction,
+    bare: bool,
+    input: Buffer,
+    offset: int
+) -> LoadedValue[List[Any]]:
+    return load_vector_func(input, bare=bare, offset=offset)
+
+
+def _load_vector_param(
+    load_item: LoadBasicTypeFunction,
+    bare: bool,
+    input: Buffer,
+    offset: int
+) -> LoadedValue[List[Any]]:
+    return load_vector(load_item, input, bare=bare, offset=offset)
+
+
+class SchemaDumper:
+    """
+    Dumps objects and function calls of schema. Dump plan of each combinator
+    and function is compiled once on first use and reused for every further
+    message.
+
+    All values are appended to one buffer, so message is built without
+    intermediate bytes objects for nested values.
+
+    Custom dumpers and compiled plans share one table keyed by type, so
+    dumper of value is selected with a single lookup.
+    """
+
+    def __init__(self, schema: Schema, custom_dumpers: CustomDumpersMap):
+        self.schema = schema
+        self._custom_dumpers: Dict[Any, DumpToFunction] = {
+            tp: self._build_custom_dumper(func)
+            for tp, func in custom_dumpers.items()
+        }
+        self._plans: Dict[Any, DumpToFunction] = dict(self._custom_dumpers)
+
+        if schema.codecs is not None:
+            self._set_generated_plans(schema.codecs)
+
+    def dump(self, value: Any, bare: bool = False) -> bytes:
+        """
+        Dumps basic or boxed types by schema
+
+        Raises:
+            DumpError - when value couldn't been dumped
+        """
+        buffer = bytearray()
+        self.dump_to(buffer, value, bare=bare)
+        return bytes(buffer)
+
+    def dump_to(
+        self,
+        buffer: bytearray,
+        value: Any,
+        bare: bool = False
+    ) -> None:
+        """
+        Appends basic or boxed types dumped by schema to buffer
+
+        Raises:
+            DumpError - when value couldn't been dumped
+        """
+        origin: Any = type(value)
+
+        if origin is CallableFunc and origin not in self._plans:
+            origin = value.func
 
         try:
-            dumped_values.append(
-                dump_param(
-                    item,
-                    dumpers=custom_dumpers,
-                    dump_object=partial(
-                        _dump,
-                        schema=schema,
-                        custom_dumpers=custom_dumpers
-                    )
+            plan = self._plans[origin]
+        except KeyError:
+            plan = self._compile_plan(origin)
+
+        plan(buffer, value, bare=bare)
+
+    def compile_plans(self):
+        """
+        Compiles dump plans of all combinators and functions of schema
+        beforehand, so first messages are not slowed down by compilation
+        """
+        structure = self.schema.get_schema_structure()
+
+        for data in [*structure.constructors, *structure.methods]:
+            if data.origin not in self._plans:
+                self._compile_plan(data.origin)
+
+    def _set_generated_plans(self, codecs: ModuleType):
+        """
+        Uses generated dump functions of combinators and functions as plans.
+        See `mtpylon.serialization.codegen`
+        """
+        structure = self.schema.get_schema_structure()
+        plans = codecs.build_dump_plans(
+            structure.constructors,
+            structure.methods,
+            self._compile_generated_param
+        )
+
+        for origin, plan in plans.items():
+            self._plans.setdefault(origin, plan)
+
+    def _compile_generated_param(
+        self,
+        data: Union[CombinatorData, FunctionData],
+        index: int
+    ) -> DumpToBasicTypeFunction:
+        param = data.params[index]
+        return self._compile_param(param.origin, param.field)
+
+    def _build_custom_dumper(self, func: CustomDumpFunction) -> DumpToFunction:
+        sig = signature(func)
+
+        if 'buffer' in sig.parameters:
+            if 'dump_object' in sig.parameters:
+                func = cast(DumpToFunctionWithDumpObject, func)
+                return partial(func, dump_object=self.dump_to)
+            return cast(DumpToFunction, func)
+
+        dump_func = build_custom_dumper_func(
+            cast(Union[DumpFunction, DumpFunctionWithDumpObject], func),
+            dump_object=self.dump
+        )
+
+        def dump_to(buffer: bytearray, value: Any, bare: bool) -> None:
+            buffer += dump_func(value, bare=bare)
+
+        return cast(DumpToFunction, dump_to)
+
+    def _compile_plan(self, origin: Any) -> DumpToFunction:
+        try:
+            data = self.schema[origin]
+        except KeyError:
+            if isfunction(origin):
+                raise DumpError('Can`t dump function that not in schema')
+            raise DumpError('Can`t dump combinator that not in schema')
+
+        steps: List[DumpStep] = []
+        has_flags = False
+
+        for param in data.params:
+            if param.name == 'flags':
+                has_flags = True
+                continue
+
+            flag: Optional[int] = None
+            if 'flag' in getattr(param.field, 'metadata', {}):
+                flag = get_flag_ids(cast(Type, data.origin), param.name)
+
+            steps.append(
+                DumpStep(
+                    param.name,
+                    param.type,
+                    self._compile_param(param.origin, param.field),
+                    flag
                 )
             )
-        except Exception:
-            raise DumpError(f'Can`t dump value {type_name}.')
 
-    dumped_flag = dump_int(flags_value) if flags_value is not None else b''
+        plan = partial(
+            self._dump_params,
+            tuple(steps),
+            dump_int(data.id),
+            has_flags,
+            isfunction(data.origin)
+        )
+        self._plans[origin] = cast(DumpToFunction, plan)
+        return cast(DumpToFunction, plan)
+
+    def _compile_param(
+        self,
+        origin: Any,
+        field: Optional[Field]
+    ) -> DumpToBasicTypeFunction:
+        if is_optional_type(origin):
+            origin = origin.__args__[0]
+
+        if is_list_type(origin) and origin.__args__[0] in basic_vector_writers:
+            return partial(
+                _dump_basic_vector_param,
+                basic_vector_writers[origin.__args__[0]],
+                is_bare_field(field)
+            )
+
+        if is_list_type(origin):
+            dump_item = self._compile_type(
+                origin.__args__[0],
+                bare=is_bare_item_field(field)
+            )
+            return partial(
+                _dump_vector_param,
+                dump_item,
+                is_bare_field(field)
+            )
 
-    constructor = dump_int(data.id) if not bare else b''
+        return self._compile_type(origin, bare=is_bare_field(field))
 
-    dumped = b''.join(
-        [
-            constructor,
-            dumped_flag
-        ] +
-        dumped_values
-    )
-    return dumped
+    def _compile_type(self, tp: Any, bare: bool) -> DumpToBasicTypeFunction:
+        if tp in basic_type_writers:
+            return basic_type_writers[tp]
+
+        if tp in self._custom_dumpers:
+            return partial(self._custom_dumpers[tp], bare=bare)
+
+        return partial(self.dump_to, bare=bare)
+
+    @staticmethod
+    def _dump_params(
+        steps: Tuple[DumpStep, ...],
+        constructor: bytes,
+        has_flags: bool,
+        is_function: bool,
+        buffer: bytearray,
+        value: Any,
+        bare: bool
+    ) -> None:
+        start = len(buffer)
+
+        if not bare:
+            buffer += constructor
+
+        flags_position = len(buffer)
+        flags_value = 0
+
+        if has_flags:
+            buffer += EMPTY_FLAGS
+
+        for step in steps:
+            if is_function:
+                attr_value = value.params.get(step.name)
+            else:
+                attr_value = getattr(value, step.name, None)
+
+            if step.flag is not None:
+                if attr_value is None:
+                    continue
+                flags_value |= 1 << step.flag
+
+            try:
+                step.dump(buffer, attr_value)
+            except Exception:
+                del buffer[start:]
+                raise DumpError(f'Can`t dump value {step.type}.')
+
+        if has_flags:
+            int_struct.pack_into(buffer, flags_position, flags_value)
+
+
+EMPTY_FLAGS = bytes(4)
+
+
+def _dump_basic_vector_param(
+    dump_vector_func: DumpVectorToFunction,
+    bare: bool,
+    buffer: bytearray,
+    value: List[Any]
+) -> None:
+    dump_vector_func(buffer, vector=value, bare=bare)
+
+
+def _dump_vector_param(
+    dump_item: DumpToBasicTypeFunction,
+    bare: bool,
+    buffer: bytearray,
+    value: List[Any]
+) -> None:
+    dump_vector_to(buffer, dump_item, value, bare)
+
+
+CustomFuncsKey = Tuple[Tuple[Any, Any], ...]
+
+
+def get_loader(
+    schema: Schema,
+    custom_loaders: Optional[CustomLoadersMap] = None
+) -> SchemaLoader:
+    """
+    Returns loader with compiled plans for schema and custom loaders.
+    Loader is created once per schema and set of custom loaders and kept
+    by schema
+    """
+    if custom_loaders is None:
+        custom_loaders = {}
+
+    key: CustomFuncsKey = tuple(custom_loaders.items())
+
+    try:
+        return schema.loaders[key]
+    except KeyError:
+        loader = SchemaLoader(schema, custom_loaders)
+        schema.loaders[key] = loader
+        return loader
+
+
+def get_dumper(
+    schema: Schema,
+    custom_dumpers: Optional[CustomDumpersMap] = None
+) -> SchemaDumper:
+    """
+    Returns dumper with compiled plans for schema and custom dumpers.
+    Dumper is created once per schema and set of custom dumpers and kept
+    by schema
+    """
+    if custom_dumpers is None:
+        custom_dumpers = {}
+
+    key: CustomFuncsKey = tuple(custom_dumpers.items())
+
+    try:
+        return schema.dumpers[key]
+    except KeyError:
+        dumper = SchemaDumper(schema, custom_dumpers)
+        schema.dumpers[key] = dumper
+        return dumper
+
+
+def _dump(
+    value: Any,
+    schema: Schema,
+    bare: bool = False,
+    custom_dumpers: Optional[CustomDumpersMap] = None
+):
+    """
+    Dumps basic or boxed types by schema
+    """
+    return get_dumper(schema, custom_dumpers).dump(value, bare=bare)
 
 
 def dump(
@@ -353,12 +970,25 @@ def dump(
     return _dump(value, schema=schema, custom_dumpers=custom_dumpers)
 
 
+def dump_to(
+    buffer: bytearray,
+    value: Any,
+    schema: Schema,
+    custom_dumpers: Optional[CustomDumpersMap] = None
+) -> None:
+    """
+    Appends value dumped by schema to buffer
+    """
+    get_dumper(schema, custom_dumpers).dump_to(buffer, value)
+
+
 def _load(
-        input: bytes,
+        input: Buffer,
         schema: Schema,
         bare: bool = False,
         tp: Optional[Any] = None,
-        custom_loaders: Optional[CustomLoadersMap] = None
+        custom_loaders: Optional[CustomLoadersMap] = None,
+        offset: int = 0
 ) -> LoadedValue[Union[CallableFunc, Any]]:
     """
     Loads object or function with params from bytes input
@@ -369,116 +999,31 @@ def _load(
         bare - checks is loaded bytes are bare type or not
         tp - select how type should be loaded
         custom_loaders - custom loaders to load value
+        offset - position of serialized value in input
+
+    Returns:
+        loaded value with offset right after it
 
     Raises:
         ValueError - when can't load data
     """
-    if custom_loaders is None:
-        custom_loaders = {}
-
-    if tp in basic_type_loaders:
-        basic_loader = basic_type_loaders[tp]
-        return basic_loader(input)
-
-    if tp in custom_loaders:
-        custom_loader = build_custom_loader_func(
-            custom_loaders[tp],
-            load_object=partial(
-                _load,
-                schema=schema,
-                custom_loaders=custom_loaders
-            )
-        )
-        return custom_loader(input, bare=bare)
-
-    if tp is None and bare:
-        raise ValueError('We should load not bare type or pass combinator')
-
-    offset = 0
-    if not bare:
-        loaded_combinator = load_int(input)
-        offset += loaded_combinator.offset
-        combinator = loaded_combinator.value
-
-        if combinator not in schema:
-            raise ValueError(f'Can`t find combinator {combinator} in schema')
-
-        data = schema[combinator]
-        if data.origin in custom_loaders:
-            custom_loader = build_custom_loader_func(
-                custom_loaders[data.origin],
-                load_object=partial(
-                    _load,
-                    schema=schema,
-                    custom_loaders=custom_loaders
-                )
-            )
-            return custom_loader(input, bare=False)
-    else:
-        tp = cast(Type, tp)
-        if tp not in schema:
-            raise ValueError(f'Can`t find info about {tp}')
-        data = schema[tp]
-
-    flag_number: Optional[int] = None
-    params: Dict[str, Any] = {}
-
-    for param in data.params:
-        if param.name == 'flags':
-            loaded = load_int(input[offset:])
-            flag_number = loaded.value
-            offset += loaded.offset
-            continue
-
-        origin = param.origin
-        if is_optional_type(origin) and flag_number is not None:
-            if get_flag_value(
-                    flag_number,
-                    param.name,
-                    cast(Type, data.origin),
-            ):
-                origin = origin.__args__[0]
-            else:
-                origin = type(None)
-
-        if is_list_type(origin):
-            item_origin = origin.__args__[0]
-            load_item = partial(
-                _load,
-                bare=is_bare_item_field(param.field),
-                schema=schema,
-                tp=item_origin,
-                custom_loaders=custom_loaders,
-            )
-            load_func: Callable[[bytes], LoadedValue[Any]] = partial(
-                load_vector,
-                load_item,
-                bare=is_bare_field(param.field)
-            )
-        else:
-            load_func = partial(
-                _load,
-                bare=is_bare_field(param.field),
-                tp=origin,
-                schema=schema,
-                custom_loaders=custom_loaders,
-            )
-
-        loaded = load_func(input[offset:])
-        params[param.name] = loaded.value
-        offset += loaded.offset
-
-    if isfunction(data.origin):
-        value = CallableFunc(data.origin, params)
-    else:
-        value = data.origin(**params)
-
-    return LoadedValue(value=value, offset=offset)
+    return get_loader(schema, custom_loaders).load(
+        input,
+        bare=bare,
+        tp=tp,
+        offset=offset
+    )
 
 
 def load(
-    input: bytes,
+    input: Buffer,
     schema: Schema,
-    custom_loaders: Optional[CustomLoadersMap] = None
+    custom_loaders: Optional[CustomLoadersMap] = None,
+    offset: int = 0
 ) -> LoadedValue[Any]:
-    return _load(input, schema=schema, custom_loaders=custom_loaders)
+    return _load(
+        input,
+        schema=schema,
+        custom_loaders=custom_loaders,
+        offset=offset
+    )
@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
-from .loaded import LoadedValue
-from .bytes import load as bytes_load, dump as bytes_dump
+from typing import Union, TYPE_CHECKING
+
+from .loaded import LoadedValue, Buffer
+from .bytes import get_bounds, dump as bytes_dump, dump_to as bytes_dump_to
+
+if TYPE_CHECKING:
+    from .lazy import LazyString  # noqa: F401
 
 
 def dump(value: str) -> bytes:
@@ -10,13 +15,24 @@ def dump(value: str) -> bytes:
     return bytes_dump(value.encode())
 
 
-def load(input: bytes):
+def dump_to(buffer: bytearray, value: Union[str, 'LazyString']) -> None:
+    """
+    Appends utf-8 string dumped by tl rules to buffer. Lazy string forwarded
+    from loaded message is dumped without decoding
+    """
+    if isinstance(value, str):
+        bytes_dump_to(buffer, value.encode())
+    else:
+        bytes_dump_to(buffer, value.view)
+
+
+def load(input: Buffer, offset: int = 0) -> LoadedValue[str]:
     """
     Loads utf-8 string
     """
-    loaded = bytes_load(input)
+    start, end, offset = get_bounds(input, offset)
 
     return LoadedValue(
-        loaded.value.decode('utf-8'),
-        loaded.offset
+        str(input[start:end], 'utf-8'),
+        offset
     )
@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
+from struct import Struct, error as StructError
 from typing import List, Callable, TypeVar
 
-from .int import dump as dump_int, load as load_int
-from .loaded import LoadedValue
+from .int import dump as dump_int, load as load_int, int_struct
+from .loaded import LoadedValue, Buffer
 
 
 VECTOR_ID = 0x1cb5c415
+VECTOR_ID_BYTES = dump_int(VECTOR_ID)
 
 
 T = TypeVar('T')
@@ -32,35 +34,186 @@ def dump(
     return dumped_constructor + dumped_size + dumped_items
 
 
-def load(
-        load_item: Callable[[bytes], LoadedValue[T]],
-        input: bytes,
+def dump_to(
+        buffer: bytearray,
+        dump_item: Callable[[bytearray, T], None],
+        vector: List[T],
         bare: bool = False
+) -> None:
+    """
+    Appends dumped telegram vector to buffer. Each item is appended to the
+    same buffer with dump_item function
+
+    Args:
+        buffer - buffer to append dumped vector
+        dump_item - function to append vectors item to buffer
+        vector - list of items that should be dumped
+        bare - is vector bare or not
+    """
+    if not bare:
+        buffer += VECTOR_ID_BYTES
+    buffer += int_struct.pack(len(vector))
+
+    for item in vector:
+        dump_item(buffer, item)
+
+
+def load(
+        load_item: Callable[[Buffer, int], LoadedValue[T]],
+        input: Buffer,
+        bare: bool = False,
+        offset: int = 0
 ) -> LoadedValue[List[T]]:
     """
     Loads telegram vector. with load_item function.
     checks that current value is vector and starts with 0x1cb5c415
     then read size of vector(next int value). then read all items one by one
 
+    Returns loaded items with offset right after vector.
+
     Args:
-        load_item - function to load item from bytes
+        load_item - function to load item from bytes by offset
         input - bytes to load them
+        bare - is vector bare or not
+        offset - position of vector in input
     """
-    bare_offset = 0 if bare else 4
-    if not bare and load_int(input[:4]).value != VECTOR_ID:
-        raise ValueError('Wrong vector constructor')
-
-    offset = bare_offset + 4
+    if not bare:
+        if load_int(input, offset).value != VECTOR_ID:
+            raise ValueError('Wrong vector constructor')
+        offset += 4
 
-    loaded_size = load_int(input[bare_offset:offset])
-
-    size = loaded_size.value
+    loaded_size = load_int(input, offset)
+    offset = loaded_size.offset
 
     results = []
 
-    for _ in range(size):
-        loaded_item = load_item(input[offset:])
+    for _ in range(loaded_size.value):
+        loaded_item = load_item(input, offset)
         results.append(loaded_item.value)
-        offset += loaded_item.offset
+        offset = loaded_item.offset
 
     return LoadedValue(results, offset)
+
+
+def _load_size(input: Buffer, bare: bool, offset: int) -> LoadedValue[int]:
+    if not bare:
+        if load_int(input, offset).value != VECTOR_ID:
+            raise ValueError('Wrong vector constructor')
+        offset += 4
+
+    return load_int(input, offset)
+
+
+def load_packed(
+        item_format: str,
+        input: Buffer,
+        bare: bool = False,
+        offset: int = 0
+) -> LoadedValue[List[T]]:
+    """
+    Loads telegram vector of fixed width items(int, long, double) with
+    one struct unpack call for all items.
+
+    Args:
+        item_format - struct format character of item
+        input - bytes to load them
+        bare - is vector bare or not
+        offset - position of vector in input
+
+    Raises:
+        ValueError - if there aren't enough bytes
+    """
+    loaded_size = _load_size(input, bare, offset)
+
+    try:
+        items_struct = Struct(f'<{loaded_size.value}{item_format}')
+        items = items_struct.unpack_from(input, loaded_size.offset)
+    except StructError:
+        raise ValueError(
+            f'Not enough bytes to load vector of {loaded_size.value} items'
+        )
+
+    return LoadedValue(list(items), loaded_size.offset + items_struct.size)
+
+
+def load_wide(
+        item_size: int,
+        input: Buffer,
+        bare: bool = False,
+        offset: int = 0
+) -> LoadedValue[List[int]]:
+    """
+    Loads telegram vector of int128 or int256 items. Items are read
+    from one slice of input without loading each item by offset.
+
+    Args:
+        item_size - size of item in bytes
+        input - bytes to load them
+        bare - is vector bare or not
+        offset - position of vector in input
+
+    Raises:
+        ValueError - if there aren't enough bytes
+    """
+    loaded_size = _load_size(input, bare, offset)
+    start = loaded_size.offset
+    end = start + loaded_size.value * item_size
+
+    if len(input) < end:
+        raise ValueError(
+            f'Not enough bytes to load vector of {loaded_size.value} items'
+        )
+
+    data = bytes(input[start:end])
+    from_bytes = int.from_bytes
+
+    return LoadedValue(
+        [
+            from_bytes(data[position:position + item_size], 'little')
+            for position in range(0, len(data), item_size)
+        ],
+        end
+    )
+
+
+def dump_packed_to(
+        buffer: bytearray,
+        item_format: str,
+        vector: List[T],
+        bare: bool = False
+) -> None:
+    """
+    Appends telegram vector of fixed width items(int, long, double) to
+    buffer with one struct pack call for all items.
+
+    Args:
+        buffer - buffer to append dumped vector
+        item_format - struct format character of item
+        vector - list of items that should be dumped
+        bare - is vector bare or not
+    """
+    if not bare:
+        buffer += VECTOR_ID_BYTES
+    buffer += int_struct.pack(len(vector))
+    buffer += Struct(f'<{len(vector)}{item_format}').pack(*vector)
+
+
+def dump_wide_to(
+        buffer: bytearray,
+        item_size: int,
+        vector: List[int],
+        bare: bool = False
+) -> None:
+    """
+    Appends telegram vector of int128 or int256 items to buffer.
+
+    Args:
+        buffer - buffer to append dumped vector
+        item_size - size of item in bytes
+        vector - list of items that should be dumped
+        bare - is vector bare or not
+    """
+    if not bare:
+        buffer += VECTOR_ID_BYTES
+    buffer += int_struct.pack(len(vector))
+    buffer += b''.join([item.to_bytes(item_size, 'little') for item in vector])
@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
 from .service_schema import service_schema
-from .serialization import load, dump
+from .serialization import load, dump, dump_to
+from .common_schema import get_common_schema, prepare_common_schema
+from .pq_pool import PqPool, PqPoolMetrics
 
 __all__ = [
     'service_schema',
     'load',
     'dump',
+    'dump_to',
+    'get_common_schema',
+    'prepare_common_schema',
+    'PqPool',
+    'PqPoolMetrics',
 ]
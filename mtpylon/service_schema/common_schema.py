@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+from typing import Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from mtpylon.schema import Schema
+from mtpylon.serialization.schema import get_loader, get_dumper
+from mtpylon.serialization.codegen import load_schema
+
+from .service_schema import service_schema
+from .serialization.service_schema import custom_loaders, custom_dumpers
+
+# customer schema -> version of customer schema, joined schema
+_common_schemas: 'WeakKeyDictionary[Schema, Tuple[int, Schema]]' = \
+    WeakKeyDictionary()
+
+
+def get_common_schema(schema: Schema) -> Schema:
+    """
+    Returns schema joined with service schema. Joined schema is built once
+    per customer schema and shared by all connections. It's built again
+    when customer schema is updated.
+
+    Args:
+        schema - customer schema
+    """
+    cached = _common_schemas.get(schema)
+
+    if cached is not None and cached[0] == schema.version:
+        return cached[1]
+
+    common_schema = schema | service_schema
+    _common_schemas[schema] = (schema.version, common_schema)
+
+    return common_schema
+
+
+def prepare_common_schema(
+    schema: Schema,
+    cache_dir: Optional[str] = None
+) -> Schema:
+    """
+    Builds common schema and compiles its loader and dumper with custom
+    service loaders and dumpers. Should be called once on application
+    configuration to avoid this work on first connections.
+
+    If cache directory is passed common schema is built with generated
+    codecs cached in it. See `mtpylon.serialization.codegen`
+
+    Args:
+        schema - customer schema
+        cache_dir - directory of generated codecs
+
+    Returns:
+        schema joined with service schema
+    """
+    cached = _common_schemas.get(schema)
+
+    if cache_dir is not None and (
+        cached is None or cached[0] != schema.version
+    ):
+        _common_schemas[schema] = (
+            schema.version,
+            load_schema(
+                constructors=schema.constructors +
+                service_schema.constructors,
+                functions=schema.functions + service_schema.functions,
+                cache_dir=cache_dir
+            )
+        )
+
+    common_schema = get_common_schema(schema)
+
+    get_loader(common_schema, custom_loaders).compile_plans()
+    get_dumper(common_schema, custom_dumpers).compile_plans()
+
+    return common_schema
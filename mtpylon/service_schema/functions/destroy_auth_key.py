@@ -1,8 +1,31 @@
 # -*- coding: utf-8 -*-
-from aiohttp import web
+from mtpylon.constants import AUTH_KEY_MANAGER_RESOURCE_NAME
+from mtpylon.request import MtprotoRequest
+from mtpylon.contextvars import auth_key_var
+from mtpylon.crypto import AuthKeyDoesNotExist
 
-from ..constructors import DestroyAuthKeyOk, DestroyAuthKeyRes
+from ..constructors import (
+    DestroyAuthKeyOk,
+    DestroyAuthKeyNone,
+    DestroyAuthKeyRes,
+)
 
 
-async def destroy_auth_key(request: web.Request) -> DestroyAuthKeyRes:
+async def destroy_auth_key(request: MtprotoRequest) -> DestroyAuthKeyRes:
+    """
+    Deletes auth key of connection. Auth key manager invalidates auth keys
+    pinned by connections
+    """
+    auth_key = auth_key_var.get(None)
+
+    if auth_key is None:
+        return DestroyAuthKeyNone()
+
+    auth_key_manager = request.app[AUTH_KEY_MANAGER_RESOURCE_NAME]
+
+    try:
+        await auth_key_manager.del_key(auth_key)
+    except AuthKeyDoesNotExist:
+        return DestroyAuthKeyNone()
+
     return DestroyAuthKeyOk()
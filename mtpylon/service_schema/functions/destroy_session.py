@@ -1,12 +1,11 @@
 # -*- coding: utf-8 -*-
-from aiohttp import web
-
 from ... import long
+from ...request import MtprotoRequest
 from ..constructors import DestroySessionRes, DestroySessionOk
 
 
 async def destroy_session(
-    request: web.Request,
+    request: MtprotoRequest,
     session_id: long
 ) -> DestroySessionRes:
     return DestroySessionOk(session_id=session_id)
@@ -1,12 +1,11 @@
 # -*- coding: utf-8 -*-
-from aiohttp import web
-
 from ... import long
+from ...request import MtprotoRequest
 from ..constructors import FutureSalts
 
 
 async def get_future_salts(
-    request: web.Request,
+    request: MtprotoRequest,
     num: int
 ) -> FutureSalts:
     return FutureSalts(
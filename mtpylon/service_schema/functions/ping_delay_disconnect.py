@@ -1,12 +1,11 @@
 # -*- coding: utf-8 -*-
-from aiohttp import web
-
 from ... import long
+from ...request import MtprotoRequest
 from ..constructors import Pong
 
 
 async def ping_delay_disconnect(
-        request: web.Request,
+        request: MtprotoRequest,
         ping_id: long,
         disconnect_delay: int
 ) -> Pong:
@@ -5,11 +5,17 @@ from hashlib import sha1
 from datetime import datetime
 from random import getrandbits
 
-from aiohttp import web
+from rsa import PrivateKey  # type: ignore
 from tgcrypto import ige256_encrypt  # type: ignore
 
 from mtpylon import Schema, long, int128, int256
+from mtpylon.request import MtprotoRequest
 from mtpylon.crypto.rsa_manager import RsaManagerProtocol
+from mtpylon.crypto.dh_exponent_pool import DhExponentPool
+from mtpylon.crypto.handshake_executor import (
+    HandshakeExecutor,
+    default_handshake_executor,
+)
 from mtpylon.contextvars import (
     server_nonce_var,
     new_nonce_var,
@@ -25,7 +31,9 @@ from mtpylon.serialization.schema import load, dump
 from mtpylon.crypto.rsa import decrypt as rsa_decrypt
 from mtpylon.constants import (
     RSA_MANAGER_RESOURCE_NAME,
-    DH_PRIME_GENERATOR_RESOURCE_NAME
+    DH_PRIME_GENERATOR_RESOURCE_NAME,
+    HANDSHAKE_EXECUTOR_RESOURCE_NAME,
+    DH_EXPONENT_POOL_RESOURCE_NAME,
 )
 
 from ..constructors import (
@@ -42,14 +50,19 @@ from ..utils import generate_a, generate_g, generate_dh_prime, \
 
 logger = logging.getLogger('mtpylon.authorization')
 
+pq_inner_data_schema = Schema(constructors=[P_Q_inner_data], functions=[])
+dh_inner_data_schema = Schema(
+    constructors=[Server_DH_inner_data],
+    functions=[]
+)
+
 
 def get_servertime():
     return int(datetime.now().timestamp())
 
 
 def load_pq_inner_data(raw_data: bytes) -> LoadedValue[P_Q_inner_data]:
-    tmp_schema = Schema(constructors=[P_Q_inner_data], functions=[])
-    loaded_data = load(raw_data, schema=tmp_schema)
+    loaded_data = load(raw_data, schema=pq_inner_data_schema)
     value = loaded_data.value
 
     value = cast(P_Q_inner_data, value)
@@ -57,25 +70,35 @@ def load_pq_inner_data(raw_data: bytes) -> LoadedValue[P_Q_inner_data]:
 
 
 def dump_dh_inner_data(data: Server_DH_inner_data):
-    tmp_schema = Schema(constructors=[Server_DH_inner_data], functions=[])
-    return dump(data, schema=tmp_schema, custom_dumpers=None)
+    return dump(data, schema=dh_inner_data_schema, custom_dumpers=None)
 
 
-def decrypt_inner_data(
-        rsa_manager: RsaManagerProtocol,
-        encrypted_data: bytes,
-        fingerprint: long
-) -> P_Q_inner_data:
+def get_private_key(
+    rsa_manager: RsaManagerProtocol,
+    fingerprint: long
+) -> PrivateKey:
     if fingerprint not in rsa_manager:
         raise ValueError(f'Fingerprint {fingerprint} not found in manager')
 
-    key_pair = rsa_manager[fingerprint]
+    return rsa_manager[fingerprint].private
+
 
+def decrypt_data(
+    encrypted_data: bytes,
+    private: PrivateKey,
+    fingerprint: long
+) -> bytes:
+    """
+    Decrypts inner data with rsa private key. Could be run in handshake
+    executor
+    """
     try:
-        unencrypted_data = rsa_decrypt(encrypted_data, key_pair.private)
+        return rsa_decrypt(encrypted_data, private)
     except OverflowError:
         raise ValueError(f'Can`t decrypt data with fingerprint {fingerprint}')
 
+
+def check_inner_data(unencrypted_data: bytes) -> P_Q_inner_data:
     loaded_value = load_pq_inner_data(unencrypted_data[20:])
     loaded_hash = sha1(unencrypted_data[20:20 + loaded_value.offset]).digest()
 
@@ -85,6 +108,18 @@ def decrypt_inner_data(
     return loaded_value.value
 
 
+def decrypt_inner_data(
+        rsa_manager: RsaManagerProtocol,
+        encrypted_data: bytes,
+        fingerprint: long
+) -> P_Q_inner_data:
+    private = get_private_key(rsa_manager, fingerprint)
+
+    return check_inner_data(
+        decrypt_data(encrypted_data, private, fingerprint)
+    )
+
+
 def build_new_nonce_hash(new_nonce: int256) -> int128:
     new_nonce_hash_bytes = sha1(
         new_nonce.to_bytes(64, 'big')
@@ -114,7 +149,7 @@ def prepare_for_encrypt(data: bytes) -> bytes:
 
 
 async def req_DH_params(
-        request: web.Request,
+        request: MtprotoRequest,
         nonce: int128,
         server_nonce: int128,
         p: bytes,
@@ -137,11 +172,24 @@ async def req_DH_params(
     """
     logger.info('Handle req DH params')
 
-    inner_data = decrypt_inner_data(
+    handshake_executor = request.app.get(
+        HANDSHAKE_EXECUTOR_RESOURCE_NAME,
+        default_handshake_executor
+    )
+    handshake_executor = cast(HandshakeExecutor, handshake_executor)
+
+    private = get_private_key(
         request.app[RSA_MANAGER_RESOURCE_NAME],
-        encrypted_data,
         public_key_fingerprint
     )
+    inner_data = check_inner_data(
+        await handshake_executor.run(
+            decrypt_data,
+            encrypted_data,
+            private,
+            public_key_fingerprint
+        )
+    )
     new_nonce_var.set(inner_data.new_nonce)
     logger.debug(f'New nonce: {inner_data.new_nonce}')
     new_nonce_hash = build_new_nonce_hash(inner_data.new_nonce)
@@ -172,10 +220,16 @@ async def req_DH_params(
     g = await generate_g()
     g_var.set(g)
 
-    a = await generate_a()
-    a_var.set(a)
+    dh_exponent_pool = request.app.get(DH_EXPONENT_POOL_RESOURCE_NAME)
+
+    if dh_exponent_pool is not None:
+        dh_exponent_pool = cast(DhExponentPool, dh_exponent_pool)
+        a, g_a = await dh_exponent_pool.pop(g, dh_prime)
+    else:
+        a = await generate_a()
+        g_a = await handshake_executor.run(pow, g, a, dh_prime)
 
-    g_a = pow(g, a, dh_prime)
+    a_var.set(a)
 
     logger.debug(f'DH prime: {dh_prime}')
     logger.debug(f'g: {g}')
@@ -1,22 +1,26 @@
 # -*- coding: utf-8 -*-
 import logging
+from typing import cast
 from random import randint, getrandbits, choices
 
-from aiohttp import web
-
 from mtpylon.utils import bytes_needed
 from mtpylon.types import int128
+from mtpylon.request import MtprotoRequest
 from mtpylon.contextvars import server_nonce_var
-from mtpylon.constants import RSA_MANAGER_RESOURCE_NAME
+from mtpylon.constants import (
+    RSA_MANAGER_RESOURCE_NAME,
+    PQ_POOL_RESOURCE_NAME,
+)
 
 from ..constructors import ResPQ
 from ..utils import generates_pq, set_pq_context
+from ..pq_pool import PqPool
 
 
 logger = logging.getLogger('mtpylon.authorization')
 
 
-async def req_pq_multi(request: web.Request, nonce: int128) -> ResPQ:
+async def req_pq_multi(request: MtprotoRequest, nonce: int128) -> ResPQ:
     """
     Handles DH exchange initiation.
     Generates server_nonce and store them in context var for further validation
@@ -31,7 +35,12 @@ async def req_pq_multi(request: web.Request, nonce: int128) -> ResPQ:
 
     server_nonce_var.set(server_nonce_value)
 
-    p, q = generates_pq()
+    if PQ_POOL_RESOURCE_NAME in request.app:
+        pq_pool = cast(PqPool, request.app[PQ_POOL_RESOURCE_NAME])
+        p, q = pq_pool.pop()
+    else:
+        p, q = generates_pq()
+
     set_pq_context(p, q)
 
     pq = p * q
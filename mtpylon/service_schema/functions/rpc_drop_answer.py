@@ -1,12 +1,11 @@
 # -*- coding: utf-8 -*-
-from aiohttp import web
-
 from mtpylon.types import long
+from mtpylon.request import MtprotoRequest
 from ..constructors import RpcDropAnswer, RpcAnswerUnknown
 
 
 async def rpc_drop_answer(
-    request: web.Request,
+    request: MtprotoRequest,
     req_msg_id: long
 ) -> RpcDropAnswer:
     return RpcAnswerUnknown()
@@ -4,16 +4,21 @@ from typing import cast, Literal, Optional
 from hashlib import sha1
 from contextvars import ContextVar
 
-from aiohttp import web
 from tgcrypto import ige256_decrypt  # type: ignore
 
 from mtpylon import Schema, long, int128, int256
+from mtpylon.request import MtprotoRequest
 from mtpylon.constants import (
     AUTH_KEY_MANAGER_RESOURCE_NAME,
-    SERVER_SALT_MANAGER_RESOURCE_NAME
+    SERVER_SALT_MANAGER_RESOURCE_NAME,
+    HANDSHAKE_EXECUTOR_RESOURCE_NAME,
 )
 from mtpylon.crypto import AuthKey, KeyIvPair
 from mtpylon.crypto.auth_key_manager import AuthKeyManagerProtocol
+from mtpylon.crypto.handshake_executor import (
+    HandshakeExecutor,
+    default_handshake_executor,
+)
 from mtpylon.salts import ServerSaltManagerProtocol
 from mtpylon.contextvars import (
     new_nonce_var,
@@ -44,6 +49,11 @@ from ..constructors import (
 
 logger = logging.getLogger('mtpylon.authorization')
 
+client_dh_inner_data_schema = Schema(
+    constructors=[Client_DH_Inner_Data],
+    functions=[]
+)
+
 
 HASH_MODE = Literal[1, 2, 3]
 
@@ -94,11 +104,7 @@ def build_salt(server_nonce: int128, new_nonce: int256) -> Salt:
 def load_client_dh_inner_data(
     raw_data: bytes
 ) -> LoadedValue[Client_DH_Inner_Data]:
-    tmp_schema = Schema(
-        constructors=[Client_DH_Inner_Data],
-        functions=[]
-    )
-    loaded_value = load(raw_data, schema=tmp_schema)
+    loaded_value = load(raw_data, schema=client_dh_inner_data_schema)
     value = loaded_value.value
 
     value = cast(Client_DH_Inner_Data, loaded_value.value)
@@ -134,7 +140,7 @@ def decrypt_inner_data(
 
 
 async def set_client_DH_params(
-    request: web.Request,
+    request: MtprotoRequest,
     nonce: int128,
     server_nonce: int128,
     encrypted_data: bytes
@@ -172,7 +178,13 @@ async def set_client_DH_params(
     g_b = int.from_bytes(inner_data.g_b, 'big')
     a_value = a_var.get()
     dh_prime = dh_prime_var.get()
-    gab_value = pow(g_b, a_value, dh_prime)
+
+    handshake_executor = request.app.get(
+        HANDSHAKE_EXECUTOR_RESOURCE_NAME,
+        default_handshake_executor
+    )
+    handshake_executor = cast(HandshakeExecutor, handshake_executor)
+    gab_value = await handshake_executor.run(pow, g_b, a_value, dh_prime)
 
     auth_key = AuthKey(gab_value)
 
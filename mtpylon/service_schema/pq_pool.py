@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional, Tuple
+
+from mtpylon.crypto.handshake_executor import (
+    HandshakeExecutor,
+    default_handshake_executor,
+)
+
+from .utils import generates_pq
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOW_WATERMARK = 32
+DEFAULT_HIGH_WATERMARK = 128
+
+PqPair = Tuple[int, int]  # p, q
+
+
+@dataclass
+class PqPoolMetrics:
+    """
+    Counts of p, q pairs taken from pool, generated on handshake because
+    pool has been empty and generated in background
+    """
+    hits: int = 0
+    misses: int = 0
+    generated: int = 0
+
+
+class PqPool:
+    """
+    Pool of pregenerated p, q pairs for `req_pq` and `req_pq_multi`.
+    Generation of pair runs Miller-Rabin tests of random numbers until
+    two primes are found, so handshakes take ready pair from pool and
+    pair is generated on handshake only if pool is empty. Each pair is
+    removed from pool when it's taken, so pair is never reused.
+
+    Pool is filled in background up to `high_watermark` pairs when its size
+    drops below `low_watermark`. Pool is filled in background only if
+    handshake executor runs math outside of event loop, inline executor
+    would stall every connection while pool is filled.
+
+    Args:
+        low_watermark - pool is refilled when it has got less pairs
+        high_watermark - pool is refilled up to this number of pairs
+        handshake_executor - executor to generate pairs with
+    """
+
+    def __init__(
+        self,
+        low_watermark: int = DEFAULT_LOW_WATERMARK,
+        high_watermark: int = DEFAULT_HIGH_WATERMARK,
+        handshake_executor: Optional[HandshakeExecutor] = None
+    ):
+        if not 0 <= low_watermark <= high_watermark:
+            raise ValueError(
+                'Watermarks should satisfy 0 <= low_watermark <= '
+                'high_watermark'
+            )
+
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.metrics = PqPoolMetrics()
+        self._handshake_executor = (
+            handshake_executor
+            if handshake_executor is not None
+            else default_handshake_executor
+        )
+        self._pairs: Deque[PqPair] = deque()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def pop(self) -> PqPair:
+        """
+        Takes ready p, q pair from pool or generates it if pool is empty.
+        Schedules filling of pool if it's below low watermark and handshake
+        executor is offloaded
+        """
+        if self._pairs:
+            self.metrics.hits += 1
+            pair = self._pairs.popleft()
+        else:
+            self.metrics.misses += 1
+            pair = generates_pq()
+
+        if (
+            len(self._pairs) < self.low_watermark and
+            self._handshake_executor.offloaded
+        ):
+            self._schedule_fill()
+
+        return pair
+
+    async def fill(self):
+        """
+        Fills pool up to high watermark. Could be awaited on start to
+        prepare pool before first handshakes
+        """
+        while len(self._pairs) < self.high_watermark:
+            pair = await self._handshake_executor.run(generates_pq)
+            self._pairs.append(pair)
+            self.metrics.generated += 1
+            # fill could be awaited with inline executor that generates pair
+            # in event loop, so let handshakes run between pairs
+            await asyncio.sleep(0)
+
+    def shutdown(self):
+        """
+        Cancels background filling and drops all pairs
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        self._pairs.clear()
+
+    def _schedule_fill(self):
+        if self._task is not None:
+            return
+
+        task = asyncio.create_task(self.fill())
+        self._task = task
+
+        def on_done(task: asyncio.Task):
+            if self._task is task:
+                self._task = None
+
+            if not task.cancelled() and task.exception() is not None:
+                logger.error(
+                    'Failed to fill pq pool',
+                    exc_info=task.exception()
+                )
+
+        task.add_done_callback(on_done)
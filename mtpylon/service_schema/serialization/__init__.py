@@ -1,4 +1,4 @@
 # -*- coding: utf-8 -*-
-from .service_schema import load, dump
+from .service_schema import load, dump, dump_to
 
-__all__ = ['load', 'dump']
+__all__ = ['load', 'dump', 'dump_to']
@@ -1,43 +1,92 @@
 # -*- coding: utf-8 -*-
-from mtpylon.serialization.schema import LoadFunction, DumpFunction
-from mtpylon.serialization.loaded import LoadedValue
-from mtpylon.serialization.int import dump as dump_int, load as load_int
+from typing import Any, cast
+
+from mtpylon.serialization.schema import (
+    LoadFunction,
+    DumpFunction,
+    DumpToFunction,
+)
+from mtpylon.serialization.loaded import LoadedValue, Buffer
+from mtpylon.serialization.int import (
+    dump as dump_int,
+    load as load_int,
+    int_struct,
+)
 from mtpylon.serialization.long import dump as dump_long, load as load_long
 
 from ..service_schema import service_schema
 from ..constructors.message import Message
 
 
+MESSAGE_ID = dump_int(service_schema[Message].id)
+
+
+def dump_to(
+    buffer: bytearray,
+    value: Message,
+    dump_object: DumpToFunction,
+    bare: bool = False
+) -> None:
+    """
+    Appends dumped message to buffer. Body is dumped right into buffer
+    then its length is written before it
+    """
+    if not bare:
+        buffer += MESSAGE_ID
+
+    buffer += dump_long(value.msg_id)
+    buffer += dump_int(value.seqno)
+
+    size_position = len(buffer)
+    buffer += dump_int(0)
+
+    dump_object(buffer, value.body, bare=False)
+
+    int_struct.pack_into(
+        buffer,
+        size_position,
+        len(buffer) - size_position - 4
+    )
+
+
 def dump(
     value: Message,
     dump_object: DumpFunction,
     bare: bool = False
 ) -> bytes:
-    data = service_schema[Message]
-    dumped_body = dump_object(value.body, bare=False)
+    def dump_body_to(buffer: bytearray, body: Any, bare: bool) -> None:
+        buffer += dump_object(body, bare=bare)
 
-    constructor = dump_int(data.id) if not bare else b''
-
-    return (
-        constructor +
-        dump_long(value.msg_id) +
-        dump_int(value.seqno) +
-        dump_int(len(dumped_body)) +
-        dumped_body
+    buffer = bytearray()
+    dump_to(
+        buffer,
+        value,
+        dump_object=cast(DumpToFunction, dump_body_to),
+        bare=bare
     )
 
+    return bytes(buffer)
+
 
 def load(
-    input: bytes,
+    input: Buffer,
     load_object: LoadFunction,
-    bare: bool = False
+    bare: bool = False,
+    offset: int = 0
 ) -> LoadedValue[Message]:
-    offset = 4 if not bare else 0
-    msg_id = load_long(input[offset:]).value
-    seqno = load_int(input[offset + 8:]).value
-    bytes_count = load_int(input[offset + 12:]).value
+    """
+    Loads message by offset. Body of message is passed to load_object
+    as slice of input, pass memoryview to avoid copying of body bytes.
+    Returns message with offset right after it
+    """
+    if not bare:
+        offset += 4
+    msg_id = load_long(input, offset).value
+    seqno = load_int(input, offset + 8).value
+    bytes_count = load_int(input, offset + 12).value
+    body_end = offset + 16 + bytes_count
     body = load_object(
-        input[offset + 16:offset + 16 + bytes_count],
+        input[offset + 16:body_end],
         bare=False
     ).value
 
@@ -48,5 +97,5 @@ def load(
             bytes=bytes_count,
             body=body
         ),
-        offset=offset + 16 + bytes_count
+        offset=body_end
     )
@@ -6,11 +6,25 @@ from mtpylon.serialization import (
     dump as dump_schema,
     LoadedValue,
 )
+from mtpylon.serialization.loaded import Buffer
+from mtpylon.serialization.schema import (
+    CustomDumpersMap,
+    CustomLoadersMap,
+    dump_to as dump_schema_to,
+)
 from mtpylon.schema import Schema
 
 from ..service_schema import service_schema
 from ..constructors import Message
-from .message import dump as dump_message, load as load_message
+from .message import dump_to as dump_message_to, load as load_message
+
+custom_dumpers: CustomDumpersMap = {
+    Message: dump_message_to,
+}
+
+custom_loaders: CustomLoadersMap = {
+    Message: load_message,
+}
 
 
 def dump(value: Any, schema: Optional[Schema] = None) -> bytes:
@@ -28,13 +42,40 @@ def dump(value: Any, schema: Optional[Schema] = None) -> bytes:
     return dump_schema(
         value,
         schema=schema,
-        custom_dumpers={
-            Message: dump_message,
-        }
+        custom_dumpers=custom_dumpers
+    )
+
+
+def dump_to(
+    buffer: bytearray,
+    value: Any,
+    schema: Optional[Schema] = None
+) -> None:
+    """
+    Appends dumped service schema value, rpc call to buffer. Uses custom
+    dumper for Message type
+
+    Args:
+        buffer: - buffer to append dumped value
+        value: - object that should be dumped
+        schema: common schema(where joined customer and service schema). If
+                schema not passed use only service_schema
+    """
+    if schema is None:
+        schema = service_schema
+    dump_schema_to(
+        buffer,
+        value,
+        schema=schema,
+        custom_dumpers=custom_dumpers
     )
 
 
-def load(input: bytes, schema: Optional[Schema] = None) -> LoadedValue[Any]:
+def load(
+    input: Buffer,
+    schema: Optional[Schema] = None,
+    offset: int = 0
+) -> LoadedValue[Any]:
     """
     Loads service schema value, rpc call from data. uses custom loader for
     Message type
@@ -43,13 +84,13 @@ def load(input: bytes, schema: Optional[Schema] = None) -> LoadedValue[Any]:
         input - input bytes that should be loaded
         schema - common schema(where joined customer and service schema).
                  If schema not passed use only service_schema
+        offset - position of serialized value in input
     """
     if schema is None:
         schema = service_schema
     return load_schema(
         input,
         schema=schema,
-        custom_loaders={
-            Message: load_message,
-        }
+        custom_loaders=custom_loaders,
+        offset=offset
     )
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+AES-256-CTR ciphers that could be used by transport obfuscator. CTR mode
+encrypts and decrypts data in the same way, so cipher provides single
+`process` method and `process_into` method that processes buffer in place.
+Cipher keeps position in key stream between calls.
+
+Custom backends written before `process_into` has been added to protocol
+are still supported: use `process_into` function of this module to call it
+with fallback to `process`.
+"""
+from typing import Callable, Dict, Optional, Type, Protocol
+
+import pyaes  # type: ignore
+
+try:
+    from tgcrypto import ctr256_encrypt  # type: ignore
+except ImportError:  # pragma: nocover
+    ctr256_encrypt = None
+
+try:
+    from cryptography.hazmat.primitives.ciphers import (  # type: ignore
+        Cipher,
+        algorithms,
+        modes,
+    )
+except ImportError:  # pragma: nocover
+    Cipher = None
+
+
+class CtrCipher(Protocol):
+    """
+    AES-256-CTR cipher. Backend classes are created with 32 bytes aes key
+    and 16 bytes initial counter block
+    """
+
+    def process(self, data: bytes) -> bytes:  # pragma: nocover
+        """
+        Encrypts or decrypts data
+        """
+        ...
+
+    def process_into(self, data: memoryview) -> None:  # pragma: nocover
+        """
+        Encrypts or decrypts writable buffer in place
+        """
+        ...
+
+
+class TgcryptoCtrCipher(CtrCipher):
+    """
+    Cipher implemented by `tgcrypto.ctr256_encrypt`. Counter block and
+    position in it are updated by tgcrypto in place and carried to the next
+    call
+    """
+
+    def __init__(self, key: bytes, iv: bytes):
+        self.key = key
+        self._counter = bytearray(iv)
+        self._state = bytearray(1)
+
+    def process(self, data: bytes) -> bytes:
+        if not data:
+            return b''
+        return ctr256_encrypt(data, self.key, self._counter, self._state)
+
+    def process_into(self, data: memoryview) -> None:
+        if data:
+            # tgcrypto reads buffer without copying it into bytes
+            data[:] = ctr256_encrypt(
+                data,
+                self.key,
+                self._counter,
+                self._state
+            )
+
+
+class CryptographyCtrCipher(CtrCipher):
+    """
+    Cipher implemented by `cryptography` package with OpenSSL backend
+    """
+
+    def __init__(self, key: bytes, iv: bytes):
+        self._context = Cipher(algorithms.AES(key), modes.CTR(iv)).encryptor()
+
+    def process(self, data: bytes) -> bytes:
+        return self._context.update(data)
+
+    def process_into(self, data: memoryview) -> None:
+        try:
+            self._context.update_into(data, data)
+        except ValueError:
+            # old versions of cryptography require output buffer to be
+            # larger than data. Key stream isn't moved when it's rejected
+            data[:] = self._context.update(data)
+
+
+class PyaesCtrCipher(CtrCipher):
+    """
+    Pure python cipher implemented by `pyaes`
+    """
+
+    def __init__(self, key: bytes, iv: bytes):
+        self._aes = pyaes.AESModeOfOperationCTR(
+            key,
+            counter=pyaes.Counter(int.from_bytes(iv, 'big'))
+        )
+
+    def process(self, data: bytes) -> bytes:
+        return self._aes.encrypt(data)
+
+    def process_into(self, data: memoryview) -> None:
+        data[:] = self._aes.encrypt(bytes(data))
+
+
+def process_into(cipher: CtrCipher, data: memoryview) -> None:
+    """
+    Encrypts or decrypts writable buffer in place by cipher. Ciphers of
+    custom backends without `process_into` method process copy of buffer
+
+    Args:
+        cipher - cipher of ctr backend
+        data - writable buffer
+    """
+    try:
+        method = cipher.process_into
+    except AttributeError:
+        data[:] = cipher.process(bytes(data))
+    else:
+        method(data)
+
+
+CtrBackend = Callable[[bytes, bytes], CtrCipher]
+
+ctr_backends: Dict[str, Optional[Type[CtrCipher]]] = {
+    'tgcrypto': TgcryptoCtrCipher if ctr256_encrypt is not None else None,
+    'cryptography': CryptographyCtrCipher if Cipher is not None else None,
+    'pyaes': PyaesCtrCipher,
+}
+
+
+def get_ctr_backend(name: Optional[str] = None) -> Type[CtrCipher]:
+    """
+    Returns cipher class of backend by name. If name hasn't been passed
+    returns the first available backend: tgcrypto, cryptography and pyaes
+
+    Args:
+        name - name of backend: `tgcrypto`, `cryptography` or `pyaes`
+
+    Raises:
+        ValueError - if backend is unknown or its library isn't installed
+    """
+    if name is None:
+        for backend in ctr_backends.values():
+            if backend is not None:
+                return backend
+
+    if name not in ctr_backends:
+        raise ValueError(f'Unknown ctr backend {name}')
+
+    backend = ctr_backends[name]
+
+    if backend is None:
+        raise ValueError(f'Library of ctr backend {name} is not installed')
+
+    return backend
+
+
+default_ctr_backend = get_ctr_backend()
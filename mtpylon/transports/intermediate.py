@@ -1,4 +1,8 @@
 # -*- coding: utf-8 -*-
+from typing import Optional
+
+from mtpylon.serialization.loaded import Buffer
+
 from .transport_wrapper import TransportWrapper
 """
     Intermediate payload structure is:
@@ -19,13 +23,21 @@ def wrap(buffer: bytes) -> bytes:
     return len(buffer).to_bytes(4, 'little') + buffer
 
 
-def unwrap(buffer: bytes) -> bytes:
+def unwrap(buffer: Buffer) -> Buffer:
     tlen = int.from_bytes(buffer[:4], 'little')
     return buffer[4:tlen + 4]
 
 
+def packet_size(buffer: memoryview) -> Optional[int]:
+    if len(buffer) < 4:
+        return None
+
+    return int.from_bytes(buffer[:4], 'little') + 4
+
+
 wrapper = TransportWrapper(
     PROTOCOL_TAG,
     wrap,
-    unwrap
+    unwrap,
+    packet_size
 )
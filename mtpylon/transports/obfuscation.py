@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 from typing import Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-import pyaes  # type: ignore
+from .ctr_backends import CtrBackend, default_ctr_backend, process_into
 
 
 @dataclass
@@ -10,8 +10,10 @@ class Obfuscator:
     """
     Obfuscator for mtproto transport protocol.
     Stores aes key/iv for client and server.
-    Provides `decrypt` method to decrypt client messages
+    Provides `decrypt` method to decrypt client messages and `decrypt_into`
+    method to decrypt received buffer in place
     Provides `encrypt` method to encrypt server messages
+    Messages are encrypted with AES-256-CTR cipher of `ctr_backend`
     """
     client_key: bytes
     client_iv: bytes
@@ -19,29 +21,38 @@ class Obfuscator:
     server_key: bytes
     server_iv: bytes
 
-    def __post_init__(self):
-        self._decipher = pyaes.AESModeOfOperationCTR(
-            self.client_key,
-            counter=pyaes.Counter(int.from_bytes(self.client_iv, 'big'))
-        )
+    ctr_backend: CtrBackend = field(
+        default=default_ctr_backend,
+        repr=False,
+        compare=False
+    )
 
-        self._cipher = pyaes.AESModeOfOperationCTR(
-            self.server_key,
-            counter=pyaes.Counter(int.from_bytes(self.server_iv, 'big'))
-        )
+    def __post_init__(self):
+        self._decipher = self.ctr_backend(self.client_key, self.client_iv)
+        self._cipher = self.ctr_backend(self.server_key, self.server_iv)
 
     def decrypt(self, encrypted_message: bytes) -> bytes:
-        return self._decipher.decrypt(encrypted_message)
+        return self._decipher.process(encrypted_message)
+
+    def decrypt_into(self, encrypted_buffer: memoryview) -> None:
+        process_into(self._decipher, encrypted_buffer)
 
     def encrypt(self, original_message: bytes) -> bytes:
-        return self._cipher.encrypt(original_message)
+        return self._cipher.process(original_message)
 
 
-def parse_header(header: bytes) -> Tuple[int, Obfuscator]:
+def parse_header(
+    header: bytes,
+    ctr_backend: CtrBackend = default_ctr_backend
+) -> Tuple[int, Obfuscator]:
     """
     Parse incoming header to retrieve client/server aes key iv and
     transport protocol version that should be used.
     Returns transport protocol tag and obfuscator
+
+    Args:
+        header - first 64 bytes sent by client
+        ctr_backend - AES-256-CTR cipher of obfuscator
     """
     client_key = header[8:40]
     client_iv = header[40:56]
@@ -50,7 +61,13 @@ def parse_header(header: bytes) -> Tuple[int, Obfuscator]:
     server_key = reversed_header[8:40]
     server_iv = reversed_header[40:56]
 
-    obfuscator = Obfuscator(client_key, client_iv, server_key, server_iv)
+    obfuscator = Obfuscator(
+        client_key,
+        client_iv,
+        server_key,
+        server_iv,
+        ctr_backend=ctr_backend
+    )
 
     encrypted_key = obfuscator.decrypt(header)
 
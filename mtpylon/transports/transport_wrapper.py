@@ -1,11 +1,18 @@
 # -*- coding: utf-8 -*-
-from typing import Callable, NamedTuple
+from typing import Callable, NamedTuple, Optional
+
+from mtpylon.serialization.loaded import Buffer
 
 WrapFunc = Callable[[bytes], bytes]
-UnwrapFunc = Callable[[bytes], bytes]
+UnwrapFunc = Callable[[Buffer], Buffer]
+PacketSizeFunc = Callable[[memoryview], Optional[int]]
 
 
 class TransportWrapper(NamedTuple):
     protocol_tag: int
     wrap: WrapFunc
     unwrap: UnwrapFunc
+    # returns size of wrapped packet that starts stream buffer or None if
+    # buffer is too short to get it. Stream of tcp server could be split
+    # only by wrappers that set it
+    packet_size: Optional[PacketSizeFunc] = None
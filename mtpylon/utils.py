@@ -26,6 +26,7 @@ from .exceptions import (
     InvalidFunction,
 )
 from .types import BASIC_TYPES
+from .request import MtprotoRequest
 
 PossibleConstructors = Optional[List[Any]]
 
@@ -467,9 +468,10 @@ def is_valid_function(
 ) -> None:
     """
     Checks is passed func valid and could be used in schema.
-    Valid function is async function that takes asyncio request object as first
-    argument. Other arguments could be only basic types and
-    constructor as parameters and return values
+    Valid function is async function that takes request object as first
+    argument annotated with `aiohttp.web.Request` or `MtprotoRequest`.
+    Other arguments could be only basic types and constructor as parameters
+    and return values
 
     Args:
         func: function that should be schecked
@@ -495,7 +497,7 @@ def is_valid_function(
         check_type = parameter.annotation
 
         if i == 0:
-            if check_type != web.Request:
+            if check_type not in (web.Request, MtprotoRequest):
                 raise InvalidFunction(
                     "First argument of mtpylon function should be request obj"
                 )
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import os
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from aiohttp import web
+
+from mtpylon.aiohandlers.tcp import (
+    MtprotoTcpProtocol,
+    MtprotoTcpServer,
+    MIN_READ_SIZE,
+    get_remote,
+)
+from mtpylon.crypto import AuthKeyManager
+from mtpylon.dh_prime_generators.single_prime import generate
+from mtpylon.salts import ServerSaltManager
+from mtpylon.sessions import SessionSubject, InMemorySessionStorage
+from mtpylon.acknowledgement_store import InmemoryAcknowledgementStore
+from mtpylon.messages import (
+    UnencryptedMessage,
+    MtprotoMessage,
+    unpack_message,
+)
+from mtpylon.service_schema import get_common_schema
+from mtpylon.service_schema.constructors import ResPQ
+from mtpylon.transports import Obfuscator, TransportWrapper, parse_header
+from mtpylon.transports.intermediate import (
+    packet_size,
+    wrapper as intermediate_wrapper,
+)
+from mtpylon.constants import (
+    RSA_MANAGER_RESOURCE_NAME,
+    AUTH_KEY_MANAGER_RESOURCE_NAME,
+    DH_PRIME_GENERATOR_RESOURCE_NAME,
+    SERVER_SALT_MANAGER_RESOURCE_NAME,
+    SESSION_SUBJECT_RESOURCE_NAME,
+    ACKNOWLEDGEMENT_STORE_RESOURCE_NAME,
+)
+
+from tests.simple_manager import manager
+from tests.simpleschema import schema
+from tests.test_aiohandlers.test_websockets import (
+    good_header,
+    wrong_header,
+    clients_message,
+)
+
+nonce = 19206937976419795195189839594871763796
+
+
+def create_app() -> web.Application:
+    app = web.Application()
+    app[RSA_MANAGER_RESOURCE_NAME] = manager
+    app[AUTH_KEY_MANAGER_RESOURCE_NAME] = AuthKeyManager()
+    app[DH_PRIME_GENERATOR_RESOURCE_NAME] = generate()
+    app[SERVER_SALT_MANAGER_RESOURCE_NAME] = ServerSaltManager()
+    app[SESSION_SUBJECT_RESOURCE_NAME] = SessionSubject(
+        lambda: InMemorySessionStorage()
+    )
+    app[
+        ACKNOWLEDGEMENT_STORE_RESOURCE_NAME
+    ] = InmemoryAcknowledgementStore()
+
+    return app
+
+
+def create_client_obfuscator(header: bytes) -> Obfuscator:
+    """
+    Creates obfuscator of client side: it encrypts with client key and
+    decrypts server messages with server key
+    """
+    reversed_header = header[::-1]
+    obfuscator = Obfuscator(
+        client_key=reversed_header[8:40],
+        client_iv=reversed_header[40:56],
+        server_key=header[8:40],
+        server_iv=header[40:56],
+    )
+    obfuscator.encrypt(header)
+
+    return obfuscator
+
+
+def get_request_packet() -> bytes:
+    _, obfuscator = parse_header(good_header)
+
+    return obfuscator.decrypt(clients_message)
+
+
+async def start_server(app: web.Application, **params) -> MtprotoTcpServer:
+    server = MtprotoTcpServer(app, schema, host='127.0.0.1', **params)
+    await server.start()
+
+    return server
+
+
+async def read_responses(
+    reader: asyncio.StreamReader,
+    obfuscator: Obfuscator,
+    count: int
+):
+    buffer = b''
+    messages: List[MtprotoMessage] = []
+
+    while len(messages) < count:
+        data = await asyncio.wait_for(reader.read(4096), 5)
+        assert data, 'connection has been closed'
+        buffer += obfuscator.decrypt(data)
+
+        while True:
+            size = packet_size(memoryview(buffer))
+            if size is None or len(buffer) < size:
+                break
+
+            messages.append(
+                await unpack_message(
+                    AuthKeyManager(),
+                    get_common_schema(schema),
+                    buffer[4:size]
+                )
+            )
+            buffer = buffer[size:]
+
+    return messages
+
+
+@pytest.mark.asyncio
+async def test_req_pq():
+    server = await start_server(create_app())
+    host, port = server.sockets[0].getsockname()[:2]
+
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(good_header + clients_message)
+
+    [message] = await read_responses(
+        reader,
+        create_client_obfuscator(good_header),
+        1
+    )
+
+    assert isinstance(message, UnencryptedMessage)
+    assert isinstance(message.message_data, ResPQ)
+    assert message.message_data.nonce == nonce
+
+    writer.close()
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_split_stream():
+    server = await start_server(create_app(), buffer_size=MIN_READ_SIZE)
+    host, port = server.sockets[0].getsockname()[:2]
+
+    client_obfuscator = create_client_obfuscator(good_header)
+    stream = good_header + client_obfuscator.encrypt(
+        get_request_packet() * 3
+    )
+
+    reader, writer = await asyncio.open_connection(host, port)
+
+    for i in range(0, len(stream), 7):
+        writer.write(stream[i:i + 7])
+        await writer.drain()
+        await asyncio.sleep(0)
+
+    messages = await read_responses(reader, client_obfuscator, 3)
+
+    assert [message.message_data.nonce for message in messages] == \
+        [nonce] * 3
+
+    writer.close()
+    await server.close()
+    assert not server.connections
+
+
+@pytest.mark.asyncio
+async def test_wrong_header():
+    logger = MagicMock()
+    server = await start_server(create_app())
+    host, port = server.sockets[0].getsockname()[:2]
+
+    with patch('mtpylon.aiohandlers.tcp.logger', logger):
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(wrong_header)
+
+        assert await asyncio.wait_for(reader.read(), 5) == b''
+
+    assert logger.error.called
+
+    writer.close()
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_no_shared_resources():
+    logger = MagicMock()
+    app = create_app()
+    del app[ACKNOWLEDGEMENT_STORE_RESOURCE_NAME]
+    server = await start_server(app)
+    host, port = server.sockets[0].getsockname()[:2]
+
+    with patch('mtpylon.aiohandlers.tcp.logger', logger):
+        reader, writer = await asyncio.open_connection(host, port)
+
+        assert await asyncio.wait_for(reader.read(), 5) == b''
+
+    logger.error.assert_called()
+
+    writer.close()
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_too_big_packet():
+    logger = MagicMock()
+    server = await start_server(create_app(), max_packet_size=1024)
+    host, port = server.sockets[0].getsockname()[:2]
+
+    client_obfuscator = create_client_obfuscator(good_header)
+    packet = (2048).to_bytes(4, 'little') + bytes(2048)
+
+    with patch('mtpylon.aiohandlers.tcp.logger', logger):
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(good_header + client_obfuscator.encrypt(packet))
+
+        assert await asyncio.wait_for(reader.read(), 5) == b''
+
+    assert logger.error.called
+
+    writer.close()
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_wrapper_without_packet_size():
+    logger = MagicMock()
+    server = await start_server(create_app())
+    host, port = server.sockets[0].getsockname()[:2]
+    transport_wrapper = TransportWrapper(
+        intermediate_wrapper.protocol_tag,
+        intermediate_wrapper.wrap,
+        intermediate_wrapper.unwrap,
+    )
+
+    with patch('mtpylon.aiohandlers.tcp.logger', logger), patch.dict(
+        'mtpylon.transports.utils.tranport_map',
+        {transport_wrapper.protocol_tag: transport_wrapper}
+    ):
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(good_header + clients_message)
+
+        assert await asyncio.wait_for(reader.read(), 5) == b''
+
+    assert logger.error.called
+
+    writer.close()
+    await server.close()
+
+
+def test_receive_buffer():
+    protocol = MtprotoTcpProtocol(
+        create_app(),
+        schema,
+        buffer_size=MIN_READ_SIZE * 2
+    )
+    protocol._transport = MagicMock()
+
+    client_obfuscator = create_client_obfuscator(good_header)
+    big_packet = (8000).to_bytes(4, 'little') + bytes(8000)
+    stream = good_header + client_obfuscator.encrypt(
+        big_packet + get_request_packet()
+    )
+
+    while stream:
+        buffer = protocol.get_buffer(-1)
+        size = min(len(buffer), len(stream), 700)
+        buffer[:size] = stream[:size]
+        stream = stream[size:]
+        protocol.buffer_updated(size)
+
+    assert list(protocol._packets) == [big_packet, get_request_packet()]
+
+    protocol._packets.clear()
+    assert len(protocol.get_buffer(-1)) == MIN_READ_SIZE * 2
+
+
+def test_keep_queued_packets():
+    protocol = MtprotoTcpProtocol(
+        create_app(),
+        schema,
+        buffer_size=MIN_READ_SIZE * 4
+    )
+    protocol._transport = MagicMock()
+
+    client_obfuscator = create_client_obfuscator(good_header)
+    packets = [
+        (196).to_bytes(4, 'little') + os.urandom(196)
+        for _ in range(30)
+    ]
+    stream = good_header + client_obfuscator.encrypt(b''.join(packets))
+
+    while stream:
+        buffer = protocol.get_buffer(-1)
+        size = min(len(buffer), len(stream), 700)
+        buffer[:size] = stream[:size]
+        stream = stream[size:]
+        protocol.buffer_updated(size)
+
+    queued = list(protocol._packets)
+    assert all(isinstance(packet, memoryview) for packet in queued)
+    assert queued == packets
+
+    protocol._packets.clear()
+    del queued
+    buffer = protocol.get_buffer(-1)
+
+    assert (protocol._start, protocol._end) == (0, 0)
+    assert len(buffer) == MIN_READ_SIZE * 4
+
+
+def test_pause_reading():
+    protocol = MtprotoTcpProtocol(create_app(), schema, max_pending=2)
+    transport = MagicMock()
+    protocol._transport = transport
+
+    client_obfuscator = create_client_obfuscator(good_header)
+    stream = good_header + client_obfuscator.encrypt(
+        get_request_packet() * 2
+    )
+
+    buffer = protocol.get_buffer(-1)
+    buffer[:len(stream)] = stream
+    protocol.buffer_updated(len(stream))
+
+    transport.pause_reading.assert_called_once()
+
+
+@pytest.mark.parametrize('peername, remote', [
+    (('127.0.0.1', 4000), '127.0.0.1'),
+    (('::1', 4000, 0, 0), '::1'),
+    ('/tmp/mtpylon.sock', '/tmp/mtpylon.sock'),
+    (None, None),
+])
+def test_get_remote(peername, remote):
+    transport = MagicMock()
+    transport.get_extra_info.return_value = peername
+
+    assert get_remote(transport) == remote
+    transport.get_extra_info.assert_called_once_with('peername')
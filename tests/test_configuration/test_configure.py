@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
+import asyncio
+
 import pytest
 import rsa  # type: ignore
 from aiohttp.web import Application
 
+from mtpylon import Schema
 from mtpylon.configuration.configure import configure_app
 from mtpylon.configuration.constants import (
     API_VIEW,
@@ -12,8 +15,25 @@ from mtpylon.configuration.constants import (
 from mtpylon.constants import RSA_MANAGER_RESOURCE_NAME, \
     AUTH_KEY_MANAGER_RESOURCE_NAME, DH_PRIME_GENERATOR_RESOURCE_NAME, \
     SERVER_SALT_MANAGER_RESOURCE_NAME, SESSION_SUBJECT_RESOURCE_NAME, \
-    ACKNOWLEDGEMENT_STORE_RESOURCE_NAME
-from mtpylon.crypto import KeyPair
+    ACKNOWLEDGEMENT_STORE_RESOURCE_NAME, CODEC_EXECUTOR_RESOURCE_NAME, \
+    CTR_BACKEND_RESOURCE_NAME, HANDSHAKE_EXECUTOR_RESOURCE_NAME, \
+    DH_EXPONENT_POOL_RESOURCE_NAME, PQ_POOL_RESOURCE_NAME, \
+    TCP_SERVER_RESOURCE_NAME
+from mtpylon.aiohandlers import MtprotoTcpServer
+from mtpylon.crypto import (
+    KeyPair,
+    ProcessHandshakeExecutor,
+    AuthKeyManager,
+    CachedAuthKeyManager,
+    PersistentAuthKeyManager,
+)
+from mtpylon.dh_prime_generators.single_prime import DH_PRIME
+from mtpylon.dh_prime_generators.validated import ValidatedDhPrimeGenerator
+from mtpylon.service_schema import get_common_schema
+from mtpylon.transports.ctr_backends import (
+    default_ctr_backend,
+    PyaesCtrCipher,
+)
 from tests.simpleschema import schema
 
 
@@ -44,11 +64,334 @@ async def test_configure_app():
 
     assert RSA_MANAGER_RESOURCE_NAME in app
     assert AUTH_KEY_MANAGER_RESOURCE_NAME in app
-    assert DH_PRIME_GENERATOR_RESOURCE_NAME in app
+    assert not isinstance(
+        app[DH_PRIME_GENERATOR_RESOURCE_NAME],
+        ValidatedDhPrimeGenerator
+    )
     assert SERVER_SALT_MANAGER_RESOURCE_NAME in app
     assert SESSION_SUBJECT_RESOURCE_NAME in app
     assert ACKNOWLEDGEMENT_STORE_RESOURCE_NAME in app
+    assert CODEC_EXECUTOR_RESOURCE_NAME in app
+    assert HANDSHAKE_EXECUTOR_RESOURCE_NAME in app
+    assert DH_EXPONENT_POOL_RESOURCE_NAME not in app
+    assert PQ_POOL_RESOURCE_NAME in app
 
     assert API_VIEW in app.router
     assert SCHEMA_VIEW in app.router
     assert PUB_KEYS_VIEW in app.router
+
+
+@pytest.mark.asyncio
+async def test_configure_codec_executor():
+    app = Application()
+
+    configure_app(
+        app,
+        schema,
+        {
+            'rsa_manager': {
+                'params': {
+                    'rsa_keys': []
+                }
+            },
+            'codec_executor': {
+                'params': {
+                    'inline_threshold': 1024,
+                    'max_workers': 2,
+                }
+            },
+        }
+    )
+
+    assert app[CODEC_EXECUTOR_RESOURCE_NAME].inline_threshold == 1024
+
+
+@pytest.mark.asyncio
+async def test_configure_handshake_executor():
+    app = Application()
+
+    configure_app(
+        app,
+        schema,
+        {
+            'rsa_manager': {
+                'params': {
+                    'rsa_keys': []
+                }
+            },
+            'handshake_executor': {
+                'executor': 'mtpylon.crypto.ProcessHandshakeExecutor',
+                'params': {
+                    'max_workers': 1,
+                }
+            },
+        }
+    )
+
+    handshake_executor = app[HANDSHAKE_EXECUTOR_RESOURCE_NAME]
+    assert isinstance(handshake_executor, ProcessHandshakeExecutor)
+    assert await handshake_executor.run(pow, 3, 5, 7) == pow(3, 5, 7)
+
+    await app.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_configure_dh_exponent_pool():
+    app = Application()
+
+    configure_app(
+        app,
+        schema,
+        {
+            'rsa_manager': {
+                'params': {
+                    'rsa_keys': []
+                }
+            },
+            'dh_exponent_pool': {
+                'params': {
+                    'low_watermark': 2,
+                    'high_watermark': 8,
+                }
+            },
+        }
+    )
+
+    dh_exponent_pool = app[DH_EXPONENT_POOL_RESOURCE_NAME]
+    assert dh_exponent_pool.low_watermark == 2
+    assert dh_exponent_pool.high_watermark == 8
+
+    await dh_exponent_pool.pop(3, 23)
+    app.freeze()
+    await app.shutdown()
+
+    assert dh_exponent_pool.size(3, 23) == 0
+
+
+@pytest.mark.asyncio
+async def test_configure_safe_prime_generator(tmp_path):
+    path = tmp_path / 'primes.txt'
+    path.write_text(f'{DH_PRIME}\n')
+    app = Application()
+
+    configure_app(
+        app,
+        schema,
+        {
+            'rsa_manager': {
+                'params': {
+                    'rsa_keys': []
+                }
+            },
+            'dh_prime_generator': {
+                'generator': 'mtpylon.dh_prime_generators.safe_prime.generate',
+                'params': {
+                    'cache_path': str(path),
+                    'pool_size': 1,
+                    'workers': 1,
+                },
+                'validate': True,
+            },
+        }
+    )
+
+    generator = app[DH_PRIME_GENERATOR_RESOURCE_NAME]
+    assert await generator.asend(None) == DH_PRIME
+
+    app.freeze()
+    await app.cleanup()
+
+    assert generator.generator._executor is None
+
+
+@pytest.mark.asyncio
+async def test_configure_validated_dh_prime_generator():
+    app = Application()
+
+    configure_app(
+        app,
+        schema,
+        {
+            'rsa_manager': {
+                'params': {
+                    'rsa_keys': []
+                }
+            },
+            'dh_prime_generator': {
+                'generator': (
+                    'mtpylon.dh_prime_generators.single_prime.generate'
+                ),
+                'validate': True,
+            },
+        }
+    )
+
+    assert isinstance(
+        app[DH_PRIME_GENERATOR_RESOURCE_NAME],
+        ValidatedDhPrimeGenerator
+    )
+
+
+@pytest.mark.asyncio
+async def test_configure_cached_auth_key_manager():
+    app = Application()
+
+    configure_app(
+        app,
+        schema,
+        {
+            'rsa_manager': {
+                'params': {
+                    'rsa_keys': []
+                }
+            },
+            'auth_key_manager': {
+                'params': {
+                    'shards': 4,
+                },
+                'cache': {
+                    'max_size': 16,
+                    'ttl': 60,
+                },
+            },
+        }
+    )
+
+    auth_key_manager = app[AUTH_KEY_MANAGER_RESOURCE_NAME]
+
+    assert isinstance(auth_key_manager, CachedAuthKeyManager)
+    assert isinstance(auth_key_manager.manager, AuthKeyManager)
+    assert auth_key_manager.max_size == 16
+    assert auth_key_manager.ttl == 60
+
+
+@pytest.mark.asyncio
+async def test_configure_persistent_auth_key_manager(tmp_path):
+    app = Application()
+
+    configure_app(
+        app,
+        schema,
+        {
+            'rsa_manager': {
+                'params': {
+                    'rsa_keys': []
+                }
+            },
+            'auth_key_manager': {
+                'manager': (
+                    'mtpylon.crypto.persistent_auth_key_manager.'
+                    'PersistentAuthKeyManager'
+                ),
+                'params': {
+                    'path': str(tmp_path),
+                },
+                'cache': {},
+            },
+        }
+    )
+
+    auth_key_manager = app[AUTH_KEY_MANAGER_RESOURCE_NAME]
+    assert isinstance(auth_key_manager.manager, PersistentAuthKeyManager)
+
+    await auth_key_manager.set_key(123)
+    await app.cleanup()
+
+    manager = PersistentAuthKeyManager(str(tmp_path))
+    assert len(manager) == 1
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_configure_tcp_server():
+    app = Application()
+
+    configure_app(
+        app,
+        schema,
+        {
+            'rsa_manager': {
+                'params': {
+                    'rsa_keys': []
+                }
+            },
+            'tcp_server': {
+                'host': '127.0.0.1',
+                'params': {
+                    'max_pending': 8,
+                }
+            },
+        }
+    )
+
+    tcp_server = app[TCP_SERVER_RESOURCE_NAME]
+    assert isinstance(tcp_server, MtprotoTcpServer)
+    assert tcp_server.protocol_params == {'max_pending': 8}
+
+    app.freeze()
+    await app.startup()
+
+    host, port = tcp_server.sockets[0].getsockname()[:2]
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.close()
+
+    await app.shutdown()
+    await app.cleanup()
+
+    assert not tcp_server.sockets
+
+
+@pytest.mark.asyncio
+async def test_configure_schema_cache_dir(tmp_path):
+    app = Application()
+    customer_schema = Schema(
+        constructors=schema.constructors,
+        functions=schema.functions
+    )
+
+    configure_app(
+        app,
+        customer_schema,
+        {
+            'rsa_manager': {
+                'params': {
+                    'rsa_keys': []
+                }
+            },
+            'schema_cache_dir': str(tmp_path),
+        }
+    )
+
+    assert get_common_schema(customer_schema).codecs is not None
+    assert len(list(tmp_path.glob('mtpylon_codecs_*.py'))) == 1
+
+
+@pytest.mark.asyncio
+async def test_configure_obfuscation():
+    app = Application()
+
+    configure_app(
+        app,
+        schema,
+        {
+            'rsa_manager': {
+                'params': {
+                    'rsa_keys': []
+                }
+            },
+            'obfuscation': {
+                'ctr_backend': 'pyaes',
+            },
+        }
+    )
+
+    assert app[CTR_BACKEND_RESOURCE_NAME] is PyaesCtrCipher
+
+
+@pytest.mark.asyncio
+async def test_configure_default_obfuscation():
+    app = Application()
+
+    configure_app(app, schema, {'rsa_manager': {'params': {'rsa_keys': []}}})
+
+    assert app[CTR_BACKEND_RESOURCE_NAME] is default_ctr_backend
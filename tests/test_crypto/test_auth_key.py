@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import pickle
+
 import pytest
 
 from mtpylon.crypto import AuthKey
@@ -35,3 +37,38 @@ def test_auth_key(key_value, auth_key_hash, auth_key_id, auth_key_aux_hash):
     assert auth_key.hash == auth_key_hash
     assert auth_key.id == auth_key_id
     assert auth_key.aux_hash == auth_key_aux_hash
+
+
+def test_auth_key_equal():
+    key_value = auth_key_tests[0].values[0]
+
+    assert AuthKey(key_value) == AuthKey(key_value)
+    assert hash(AuthKey(key_value)) == hash(AuthKey(key_value))
+    assert AuthKey(key_value) != AuthKey(auth_key_tests[1].values[0])
+    assert {AuthKey(key_value): 1}[AuthKey(key_value)] == 1
+
+
+def test_auth_key_immutable():
+    auth_key = AuthKey(auth_key_tests[0].values[0])
+
+    with pytest.raises(AttributeError):
+        auth_key.value = 12
+
+
+def test_auth_key_pickle():
+    auth_key = AuthKey(auth_key_tests[0].values[0])
+    loaded = pickle.loads(pickle.dumps(auth_key))
+
+    assert loaded == auth_key
+    assert loaded.id == auth_key.id
+    assert loaded.key_bytes == auth_key.key_bytes
+
+
+def test_auth_key_parts():
+    auth_key = AuthKey(auth_key_tests[0].values[0])
+    key_bytes = auth_key.value.to_bytes(256, 'big')
+
+    assert auth_key.key_bytes == key_bytes
+    assert auth_key.client_key_iv_parts == (key_bytes[:36], key_bytes[40:76])
+    assert auth_key.server_key_iv_parts == (key_bytes[8:44], key_bytes[48:84])
+    assert auth_key.msg_key_part == key_bytes[88:120]
@@ -3,6 +3,9 @@ import pytest
 
 
 from mtpylon.crypto import AuthKey, AuthKeyManager, AuthKeyDoesNotExist
+from mtpylon.crypto.auth_key_manager import (
+    InvalidatingAuthKeyManagerProtocol,
+)
 
 auth_key_tests = [
     (
@@ -133,3 +136,99 @@ async def test_auth_key_del_by_auth_data(auth_key, auth_key_id):
     await manager.del_key(auth_key_data)
 
     assert not await manager.has_key(auth_key_data)
+
+
+def test_wrong_shards():
+    with pytest.raises(ValueError):
+        AuthKeyManager(shards=0)
+
+
+@pytest.mark.asyncio
+async def test_get_evicted_hot_key():
+    manager = AuthKeyManager(shards=2, hot_keys=1)
+
+    for auth_key, *_ in auth_key_tests:
+        await manager.set_key(auth_key)
+
+    assert len(manager) == len(auth_key_tests)
+
+    for auth_key, auth_hash, auth_key_id, auth_aux_hash in auth_key_tests:
+        auth_key_data = await manager.get_key(auth_key_id)
+
+        assert auth_key_data == AuthKey(auth_key)
+        assert auth_key_data.hash == auth_hash
+        assert auth_key_data.aux_hash == auth_aux_hash
+
+
+@pytest.mark.asyncio
+async def test_keep_recently_used_hot_key():
+    manager = AuthKeyManager(hot_keys=2)
+    hot_key = AuthKey(auth_key_tests[0][0])
+    await manager.set_key(hot_key)
+
+    for auth_key, *_ in auth_key_tests[1:]:
+        assert await manager.get_key(hot_key.id) is hot_key
+        await manager.set_key(auth_key)
+
+    assert await manager.get_key(hot_key.id) is hot_key
+
+
+@pytest.mark.asyncio
+async def test_get_deleted_hot_key():
+    manager = AuthKeyManager()
+    auth_key, _, auth_key_id, _ = auth_key_tests[0]
+
+    await manager.set_key(auth_key)
+    await manager.get_key(auth_key_id)
+    await manager.del_key(auth_key_id)
+
+    with pytest.raises(AuthKeyDoesNotExist):
+        await manager.get_key(auth_key_id)
+
+
+class Callback:
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, auth_key_id: int):
+        self.calls.append(auth_key_id)
+
+
+@pytest.mark.asyncio
+async def test_del_key_invalidation_callback():
+    manager = AuthKeyManager()
+    auth_key, _, auth_key_id, _ = auth_key_tests[0]
+    callback = Callback()
+    removed_callback = Callback()
+
+    assert isinstance(manager, InvalidatingAuthKeyManagerProtocol)
+
+    manager.add_invalidation_callback(callback)
+    manager.add_invalidation_callback(removed_callback)
+    manager.remove_invalidation_callback(removed_callback)
+
+    await manager.set_key(auth_key)
+    await manager.del_key(AuthKey(auth_key))
+
+    assert callback.calls == [auth_key_id]
+    assert removed_callback.calls == []
+
+
+@pytest.mark.asyncio
+async def test_del_key_not_found_invalidation_callback():
+    manager = AuthKeyManager()
+    callback = Callback()
+    manager.add_invalidation_callback(callback)
+
+    with pytest.raises(AuthKeyDoesNotExist):
+        await manager.del_key(auth_key_tests[0][2])
+
+    assert callback.calls == []
+
+
+def test_invalidation_callback_weak_reference():
+    manager = AuthKeyManager()
+    manager.add_invalidation_callback(Callback())
+
+    assert len(manager._invalidation_callbacks) == 0
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from mtpylon.crypto import (
+    AuthKey,
+    AuthKeyManager,
+    AuthKeyDoesNotExist,
+    AuthKeyPin,
+    CachedAuthKeyManager,
+)
+from mtpylon.crypto.auth_key_manager import (
+    InvalidatingAuthKeyManagerProtocol,
+)
+
+from tests.test_crypto.test_auth_key_manager import auth_key_tests
+
+auth_key_value, _, auth_key_id, _ = auth_key_tests[0]
+
+
+class SlowAuthKeyManager(AuthKeyManager):
+    """
+    Fake auth key manager of separate service with request latency
+    """
+
+    def __init__(self, latency: float = 0.01):
+        super().__init__()
+        self.latency = latency
+        self.requests = 0
+
+    async def get_key(self, value: int) -> AuthKey:
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        return await super().get_key(value)
+
+
+async def create_manager(**kwargs):
+    backend = SlowAuthKeyManager()
+    await backend.set_key(auth_key_value)
+
+    return backend, CachedAuthKeyManager(backend, **kwargs)
+
+
+def test_wrong_max_size():
+    with pytest.raises(ValueError):
+        CachedAuthKeyManager(AuthKeyManager(), max_size=0)
+
+
+@pytest.mark.asyncio
+async def test_get_key_cached():
+    backend, manager = await create_manager()
+
+    for _ in range(3):
+        auth_key = await manager.get_key(auth_key_id)
+        assert auth_key == AuthKey(auth_key_value)
+
+    assert await manager.has_key(auth_key_id)
+    assert backend.requests == 1
+    assert manager.metrics.misses == 1
+    assert manager.metrics.hits == 3
+    assert manager.metrics.hit_rate == 0.75
+
+
+@pytest.mark.asyncio
+async def test_get_key_negative_cached():
+    backend, manager = await create_manager()
+
+    for _ in range(3):
+        with pytest.raises(AuthKeyDoesNotExist):
+            await manager.get_key(123)
+
+    assert not await manager.has_key(123)
+    assert backend.requests == 1
+    assert manager.metrics.negative_hits == 3
+
+
+@pytest.mark.asyncio
+async def test_get_key_coalesced():
+    backend, manager = await create_manager()
+
+    auth_keys = await asyncio.gather(*[
+        manager.get_key(auth_key_id)
+        for _ in range(10)
+    ])
+
+    assert all(auth_key == AuthKey(auth_key_value) for auth_key in auth_keys)
+    assert backend.requests == 1
+    assert manager.metrics.misses == 1
+    assert manager.metrics.coalesced == 9
+
+
+@pytest.mark.asyncio
+async def test_get_key_coalesced_not_found():
+    backend, manager = await create_manager()
+
+    results = await asyncio.gather(
+        *[manager.get_key(123) for _ in range(5)],
+        return_exceptions=True
+    )
+
+    assert all(isinstance(result, AuthKeyDoesNotExist) for result in results)
+    assert backend.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_get_key_cancelled_lookup():
+    backend, manager = await create_manager()
+
+    cancelled = asyncio.create_task(manager.get_key(auth_key_id))
+    waiting = asyncio.create_task(manager.get_key(auth_key_id))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+
+    assert await waiting == AuthKey(auth_key_value)
+    assert backend.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_get_key_expired():
+    backend, manager = await create_manager(ttl=10, negative_ttl=1)
+
+    with patch(
+        'mtpylon.crypto.cached_auth_key_manager.monotonic',
+        return_value=100.0
+    ):
+        await manager.get_key(auth_key_id)
+        with pytest.raises(AuthKeyDoesNotExist):
+            await manager.get_key(123)
+
+    with patch(
+        'mtpylon.crypto.cached_auth_key_manager.monotonic',
+        return_value=105.0
+    ):
+        await manager.get_key(auth_key_id)
+        with pytest.raises(AuthKeyDoesNotExist):
+            await manager.get_key(123)
+
+    assert backend.requests == 3
+
+    with patch(
+        'mtpylon.crypto.cached_auth_key_manager.monotonic',
+        return_value=111.0
+    ):
+        await manager.get_key(auth_key_id)
+
+    assert backend.requests == 4
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction():
+    backend, manager = await create_manager(max_size=2)
+
+    await manager.get_key(auth_key_id)
+    for value in (1, 2):
+        with pytest.raises(AuthKeyDoesNotExist):
+            await manager.get_key(value)
+
+    assert len(manager) == 2
+
+    await manager.get_key(auth_key_id)
+
+    assert backend.requests == 4
+
+
+@pytest.mark.asyncio
+async def test_set_key_replaces_negative_entry():
+    backend = SlowAuthKeyManager()
+    manager = CachedAuthKeyManager(backend)
+
+    with pytest.raises(AuthKeyDoesNotExist):
+        await manager.get_key(auth_key_id)
+
+    await manager.set_key(auth_key_value)
+
+    assert await manager.get_key(auth_key_id) == AuthKey(auth_key_value)
+    assert await backend.has_key(auth_key_id)
+    assert backend.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_del_key():
+    backend, manager = await create_manager()
+    pin = AuthKeyPin(await manager.get_key(auth_key_id))
+    assert isinstance(manager, InvalidatingAuthKeyManagerProtocol)
+    manager.add_invalidation_callback(pin)
+
+    await manager.del_key(AuthKey(auth_key_value))
+
+    assert pin.auth_key is None
+    assert not await backend.has_key(auth_key_id)
+
+    with pytest.raises(AuthKeyDoesNotExist):
+        await manager.get_key(auth_key_id)
+
+
+class StaleAuthKeyManager(SlowAuthKeyManager):
+    """
+    Fake auth key manager that reads key before request latency
+    """
+
+    async def get_key(self, value: int) -> AuthKey:
+        auth_key = await AuthKeyManager.get_key(self, value)
+        await asyncio.sleep(self.latency)
+        return auth_key
+
+
+@pytest.mark.asyncio
+async def test_del_key_during_lookup():
+    backend = StaleAuthKeyManager()
+    await backend.set_key(auth_key_value)
+    manager = CachedAuthKeyManager(backend)
+
+    lookup = asyncio.create_task(manager.get_key(auth_key_id))
+    await asyncio.sleep(backend.latency / 2)
+
+    await manager.del_key(auth_key_id)
+
+    assert await lookup == AuthKey(auth_key_value)
+
+    with pytest.raises(AuthKeyDoesNotExist):
+        await manager.get_key(auth_key_id)
+
+
+@pytest.mark.asyncio
+async def test_del_key_not_found():
+    backend, manager = await create_manager()
+
+    with pytest.raises(AuthKeyDoesNotExist):
+        await manager.del_key(123)
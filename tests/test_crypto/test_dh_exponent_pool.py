@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+from mtpylon.crypto import DhExponentPool, HandshakeExecutor
+
+g = 3
+dh_prime = 23
+
+
+class OffloadedHandshakeExecutor(HandshakeExecutor):
+    """
+    Runs math inline but reports it runs outside of event loop, so pool is
+    filled in background
+    """
+
+    @property
+    def offloaded(self) -> bool:
+        return True
+
+
+def create_pool(**params) -> DhExponentPool:
+    return DhExponentPool(
+        handshake_executor=OffloadedHandshakeExecutor(),
+        **params
+    )
+
+
+async def wait_filled(pool: DhExponentPool):
+    while pool._tasks:
+        await asyncio.sleep(0)
+
+
+@pytest.mark.parametrize('low_watermark, high_watermark, max_pools', [
+    pytest.param(-1, 4, 1, id='negative low watermark'),
+    pytest.param(5, 4, 1, id='low watermark above high'),
+    pytest.param(1, 4, 0, id='no pools'),
+])
+def test_wrong_params(low_watermark, high_watermark, max_pools):
+    with pytest.raises(ValueError):
+        DhExponentPool(
+            low_watermark=low_watermark,
+            high_watermark=high_watermark,
+            max_pools=max_pools
+        )
+
+
+@pytest.mark.asyncio
+async def test_pop_exhausted_pool():
+    pool = create_pool(low_watermark=2, high_watermark=4)
+
+    for _ in range(2):
+        a, g_a = await pool.pop(g, dh_prime)
+        assert g_a == pow(g, a, dh_prime)
+
+    assert pool.metrics.exhausted == 2
+    assert pool.metrics.hits == 0
+
+    await wait_filled(pool)
+
+    assert pool.size(g, dh_prime) == 4
+    assert pool.metrics.generated == 4
+
+
+@pytest.mark.asyncio
+async def test_pop_from_pool():
+    pool = DhExponentPool(low_watermark=2, high_watermark=4)
+    await pool.fill(g, dh_prime)
+
+    a, g_a = await pool.pop(g, dh_prime)
+
+    assert g_a == pow(g, a, dh_prime)
+    assert pool.metrics.hits == 1
+    assert pool.metrics.exhausted == 0
+    assert pool.size(g, dh_prime) == 3
+    assert not pool._tasks
+
+
+@pytest.mark.asyncio
+async def test_no_pool_for_prime_seen_once():
+    pool = create_pool(low_watermark=2, high_watermark=4)
+
+    for prime in (23, 29, 31, 37):
+        await pool.pop(g, prime)
+
+    assert not pool._tasks
+    assert not pool._pools
+    assert pool.metrics.generated == 0
+
+
+@pytest.mark.asyncio
+async def test_no_fill_with_inline_executor():
+    pool = DhExponentPool(low_watermark=2, high_watermark=4)
+
+    for _ in range(3):
+        await pool.pop(g, dh_prime)
+
+    assert not pool._tasks
+    assert pool.size(g, dh_prime) == 0
+    assert pool.metrics.generated == 0
+
+
+@pytest.mark.asyncio
+async def test_refill_below_low_watermark():
+    pool = create_pool(low_watermark=2, high_watermark=4)
+    await pool.fill(g, dh_prime)
+
+    for _ in range(3):
+        await pool.pop(g, dh_prime)
+
+    assert pool._tasks
+
+    await wait_filled(pool)
+
+    assert pool.size(g, dh_prime) == 4
+
+
+@pytest.mark.asyncio
+async def test_pairs_not_reused():
+    pool = DhExponentPool(low_watermark=2, high_watermark=4)
+
+    exponents = [(await pool.pop(g, dh_prime))[0] for _ in range(20)]
+
+    assert len(set(exponents)) == len(exponents)
+
+
+@pytest.mark.asyncio
+async def test_drop_least_recently_used_pool():
+    pool = DhExponentPool(low_watermark=0, high_watermark=2, max_pools=2)
+
+    await pool.fill(g, 23)
+    await pool.fill(g, 29)
+    await pool.pop(g, 23)
+    await pool.fill(g, 31)
+
+    assert pool.size(g, 23) == 1
+    assert pool.size(g, 29) == 0
+    assert pool.size(g, 31) == 2
+
+
+@pytest.mark.asyncio
+async def test_shutdown():
+    pool = create_pool(low_watermark=2, high_watermark=4)
+    await pool.pop(g, dh_prime)
+    await pool.pop(g, dh_prime)
+    assert pool._tasks
+
+    pool.shutdown()
+    await asyncio.sleep(0)
+
+    assert not pool._tasks
+    assert pool.size(g, dh_prime) == 0
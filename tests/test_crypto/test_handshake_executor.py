@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from mtpylon.crypto import HandshakeExecutor, ProcessHandshakeExecutor
+from mtpylon.crypto.rsa import decrypt
+
+from .test_rsa import private_key, encrypted_data, original_data
+
+
+@pytest.fixture
+def handshake_executor():
+    handshake_executor = ProcessHandshakeExecutor(max_workers=1)
+    handshake_executor.start()
+
+    yield handshake_executor
+
+    handshake_executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_inline():
+    handshake_executor = HandshakeExecutor()
+
+    assert await handshake_executor.run(pow, 3, 5, 7) == pow(3, 5, 7)
+
+
+@pytest.mark.asyncio
+async def test_run_in_process(handshake_executor):
+    assert await handshake_executor.run(pow, 3, 5, 7) == pow(3, 5, 7)
+    assert (
+        await handshake_executor.run(decrypt, encrypted_data, private_key) ==
+        original_data
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_in_process_raises(handshake_executor):
+    with pytest.raises(ValueError):
+        await handshake_executor.run(pow, 3, -1, 9)
+
+
+@pytest.mark.asyncio
+async def test_run_not_started():
+    handshake_executor = ProcessHandshakeExecutor(max_workers=1)
+
+    assert await handshake_executor.run(pow, 3, 5, 7) == pow(3, 5, 7)
+
+
+def test_offloaded():
+    handshake_executor = ProcessHandshakeExecutor(max_workers=1)
+
+    assert not HandshakeExecutor().offloaded
+    assert not handshake_executor.offloaded
+
+    handshake_executor.start()
+    assert handshake_executor.offloaded
+
+    handshake_executor.shutdown()
+    assert not handshake_executor.offloaded
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import os
+from unittest.mock import patch
+
+import pytest
+
+from mtpylon.crypto import AuthKey, AuthKeyDoesNotExist, AuthKeyPin
+from mtpylon.crypto.auth_key_manager import (
+    InvalidatingAuthKeyManagerProtocol,
+)
+from mtpylon.crypto.persistent_auth_key_manager import (
+    PersistentAuthKeyManager,
+    AuthKeyIndex,
+    LOG_FILE,
+    INDEX_FILE,
+    RECORD,
+    MIN_CAPACITY,
+    get_capacity,
+)
+
+from tests.test_crypto.test_auth_key_manager import auth_key_tests
+
+
+def test_get_capacity():
+    assert get_capacity(0) == MIN_CAPACITY
+    assert get_capacity(MIN_CAPACITY // 2) == MIN_CAPACITY
+    assert get_capacity(MIN_CAPACITY // 2 + 1) == MIN_CAPACITY * 2
+
+
+def test_wrong_sync_batch(tmp_path):
+    with pytest.raises(ValueError):
+        PersistentAuthKeyManager(str(tmp_path), sync_batch=0)
+
+
+@pytest.mark.asyncio
+async def test_set_get_del_key(tmp_path):
+    manager = PersistentAuthKeyManager(str(tmp_path))
+
+    for auth_key, auth_hash, auth_key_id, auth_aux_hash in auth_key_tests:
+        await manager.set_key(auth_key)
+
+    assert len(manager) == len(auth_key_tests)
+
+    for auth_key, auth_hash, auth_key_id, auth_aux_hash in auth_key_tests:
+        assert await manager.has_key(auth_key_id)
+        assert await manager.has_key(AuthKey(auth_key))
+        assert (await manager.get_key(auth_key_id)).value == auth_key
+
+    auth_key_id = auth_key_tests[0][2]
+    await manager.del_key(auth_key_id)
+
+    assert not await manager.has_key(auth_key_id)
+    with pytest.raises(AuthKeyDoesNotExist):
+        await manager.get_key(auth_key_id)
+    with pytest.raises(AuthKeyDoesNotExist):
+        await manager.del_key(auth_key_id)
+
+    assert len(manager) == len(auth_key_tests) - 1
+    assert manager.dead_records == 2
+
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_get_key_after_restart(tmp_path):
+    manager = PersistentAuthKeyManager(str(tmp_path))
+
+    for auth_key, *_ in auth_key_tests:
+        await manager.set_key(auth_key)
+    await manager.del_key(auth_key_tests[0][2])
+    await manager.close()
+
+    with patch(
+        'mtpylon.crypto.persistent_auth_key_manager.replay_log'
+    ) as replay_log:
+        manager = PersistentAuthKeyManager(str(tmp_path))
+
+    replay_log.assert_not_called()
+    assert len(manager) == len(auth_key_tests) - 1
+    assert not await manager.has_key(auth_key_tests[0][2])
+
+    for auth_key, auth_hash, auth_key_id, auth_aux_hash in auth_key_tests[1:]:
+        auth_key_data = await manager.get_key(auth_key_id)
+        assert auth_key_data.value == auth_key
+        assert auth_key_data.hash == auth_hash
+        assert auth_key_data.aux_hash == auth_aux_hash
+
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_rebuild_index_after_crash(tmp_path):
+    manager = PersistentAuthKeyManager(str(tmp_path))
+
+    for auth_key, *_ in auth_key_tests:
+        await manager.set_key(auth_key)
+    await manager.del_key(auth_key_tests[0][2])
+
+    # process stops without close, partial record is written
+    with open(os.path.join(tmp_path, LOG_FILE), 'ab') as f:
+        f.write(b'\x01' * 10)
+
+    restarted = PersistentAuthKeyManager(str(tmp_path))
+
+    assert len(restarted) == len(auth_key_tests) - 1
+    assert not await restarted.has_key(auth_key_tests[0][2])
+    for auth_key, _, auth_key_id, _ in auth_key_tests[1:]:
+        assert (await restarted.get_key(auth_key_id)).value == auth_key
+
+    assert os.path.getsize(os.path.join(tmp_path, LOG_FILE)) == \
+        RECORD.size * (len(auth_key_tests) + 1)
+
+    await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_rebuild_wrong_index(tmp_path):
+    manager = PersistentAuthKeyManager(str(tmp_path))
+    await manager.set_key(auth_key_tests[0][0])
+    await manager.close()
+
+    with open(os.path.join(tmp_path, INDEX_FILE), 'wb') as f:
+        f.write(b'wrong index')
+
+    manager = PersistentAuthKeyManager(str(tmp_path))
+
+    assert await manager.has_key(auth_key_tests[0][2])
+
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_grow_index(tmp_path):
+    manager = PersistentAuthKeyManager(str(tmp_path), hot_keys=1)
+    auth_keys = [AuthKey(i) for i in range(1, MIN_CAPACITY + 1)]
+
+    await asyncio.gather(*[
+        manager.set_key(auth_key)
+        for auth_key in auth_keys
+    ])
+    await manager.close()
+
+    manager = PersistentAuthKeyManager(str(tmp_path))
+
+    assert len(manager) == len(auth_keys)
+    for auth_key in auth_keys:
+        assert await manager.get_key(auth_key.id) == auth_key
+
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_grow_index_before_crash(tmp_path):
+    manager = PersistentAuthKeyManager(str(tmp_path), hot_keys=1)
+    auth_keys = [AuthKey(i) for i in range(1, MIN_CAPACITY // 2 + 2)]
+
+    for auth_key in auth_keys:
+        await manager.set_key(auth_key)
+
+    assert manager._index.capacity == MIN_CAPACITY * 2
+
+    # grown index on disk doesn't keep the last key, so it shouldn't be
+    # clean
+    index = AuthKeyIndex(os.path.join(tmp_path, INDEX_FILE))
+    assert not index.clean
+    index.close()
+
+    # process stops without close
+    restarted = PersistentAuthKeyManager(str(tmp_path))
+
+    assert len(restarted) == len(auth_keys)
+    assert await restarted.get_key(auth_keys[-1].id) == auth_keys[-1]
+
+    await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_get_key_of_truncated_log(tmp_path):
+    manager = PersistentAuthKeyManager(str(tmp_path), hot_keys=1)
+
+    for auth_key, *_ in auth_key_tests:
+        await manager.set_key(auth_key)
+
+    os.truncate(
+        os.path.join(tmp_path, LOG_FILE),
+        RECORD.size + 10
+    )
+
+    # the last key is hot, the second one is read from log
+    with pytest.raises(ValueError):
+        await manager.get_key(auth_key_tests[1][2])
+
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_keep_recently_used_hot_key(tmp_path):
+    manager = PersistentAuthKeyManager(str(tmp_path), hot_keys=2)
+    hot_key = AuthKey(auth_key_tests[0][0])
+    await manager.set_key(hot_key)
+
+    for auth_key, *_ in auth_key_tests[1:]:
+        assert await manager.get_key(hot_key.id) is hot_key
+        await manager.set_key(auth_key)
+
+    assert await manager.get_key(hot_key.id) is hot_key
+
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_compact(tmp_path):
+    manager = PersistentAuthKeyManager(str(tmp_path))
+
+    for auth_key, *_ in auth_key_tests:
+        await manager.set_key(auth_key)
+        await manager.set_key(auth_key)
+    await manager.del_key(auth_key_tests[0][2])
+
+    assert manager.dead_records == 5
+
+    await manager.compact()
+
+    assert manager.dead_records == 0
+    assert os.path.getsize(os.path.join(tmp_path, LOG_FILE)) == \
+        RECORD.size * (len(auth_key_tests) - 1)
+
+    auth_key, _, auth_key_id, _ = auth_key_tests[0]
+    await manager.set_key(auth_key)
+    await manager.close()
+
+    manager = PersistentAuthKeyManager(str(tmp_path))
+
+    assert len(manager) == len(auth_key_tests)
+    for auth_key, _, auth_key_id, _ in auth_key_tests:
+        assert (await manager.get_key(auth_key_id)).value == auth_key
+
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_batched_fsync(tmp_path):
+    manager = PersistentAuthKeyManager(
+        str(tmp_path),
+        sync_delay=10,
+        sync_batch=len(auth_key_tests)
+    )
+
+    with patch(
+        'mtpylon.crypto.persistent_auth_key_manager.os.fsync'
+    ) as fsync:
+        await asyncio.gather(*[
+            manager.set_key(auth_key)
+            for auth_key, *_ in auth_key_tests
+        ])
+
+    fsync.assert_called_once()
+
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_del_key_invalidation_callback(tmp_path):
+    manager = PersistentAuthKeyManager(str(tmp_path))
+    auth_key = AuthKey(auth_key_tests[0][0])
+    await manager.set_key(auth_key)
+
+    pin = AuthKeyPin(auth_key)
+    assert isinstance(manager, InvalidatingAuthKeyManagerProtocol)
+    manager.add_invalidation_callback(pin)
+
+    await manager.del_key(auth_key)
+
+    assert pin.auth_key is None
+
+    await manager.close()
+
+
+def test_index_items(tmp_path):
+    path = str(tmp_path / INDEX_FILE)
+    entries = [(i, i * RECORD.size) for i in range(10)]
+
+    index = AuthKeyIndex.create(path, entries, 10 * RECORD.size)
+    index.delete(3)
+    index.set(3, 20 * RECORD.size)
+    index.set(20, 21 * RECORD.size)
+
+    assert len(index) == 11
+    assert index.used == 11
+    assert index.get(3) == 20 * RECORD.size
+    assert sorted(index.items()) == sorted(
+        entries[:3] + [(3, 20 * RECORD.size)] + entries[4:] +
+        [(20, 21 * RECORD.size)]
+    )
+
+    index.close()
@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+from random import randrange
+
+import pytest
 import rsa  # type: ignore
 from mtpylon.crypto.rsa import encrypt, decrypt
 
@@ -43,3 +46,19 @@ def test_encrypt_rsa():
 
 def test_decrypt_rsa():
     assert decrypt(encrypted_data, private_key) == original_data
+
+
+@pytest.mark.parametrize('key', [
+    pytest.param(private_key, id='512 bit key'),
+    pytest.param(rsa.newkeys(1024)[1], id='1024 bit key'),
+])
+def test_decrypt_rsa_equal_to_full_exponent(key):
+    values = [0, 1, key.p, key.q, key.n - 1] + [
+        randrange(key.n) for _ in range(20)
+    ]
+
+    for value in values:
+        encrypted = value.to_bytes(key.n.bit_length() // 8, 'big')
+        expected = pow(value, key.d, key.n)
+
+        assert int.from_bytes(decrypt(encrypted, key), 'big') == expected
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from mtpylon.dh_prime_generators.safe_prime import (
+    generate,
+    is_safe_prime,
+    search_safe_prime,
+    load_primes,
+    store_primes,
+)
+from mtpylon.dh_prime_generators.single_prime import DH_PRIME
+
+BITS = 64
+
+
+@pytest.mark.parametrize('value, bits, expected', [
+    pytest.param(DH_PRIME, 2048, True, id='dh prime'),
+    pytest.param(DH_PRIME + 2, 2048, False, id='composite'),
+    pytest.param(2 ** 61 - 1, 61, False, id='prime but not safe prime'),
+    pytest.param(DH_PRIME, 1024, False, id='wrong size'),
+])
+def test_is_safe_prime(value, bits, expected):
+    assert is_safe_prime(value, bits) == expected
+
+
+def test_search_safe_prime():
+    prime = None
+
+    while prime is None:
+        prime = search_safe_prime(BITS, window=1024)
+
+    assert is_safe_prime(prime, BITS)
+
+
+def test_store_primes(tmp_path):
+    path = str(tmp_path / 'primes.txt')
+
+    assert load_primes(path) == []
+
+    store_primes(path, [23, 47])
+
+    assert load_primes(path) == [23, 47]
+
+
+def test_load_primes_skips_wrong_lines(tmp_path):
+    path = tmp_path / 'primes.txt'
+    path.write_text('23\nwrong\n47\n')
+
+    assert load_primes(str(path)) == [23, 47]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_asend(tmp_path):
+    path = str(tmp_path / 'primes.txt')
+    generator = generate(cache_path=path, pool_size=2, workers=1, bits=BITS)
+
+    primes = await asyncio.gather(*[generator.asend(None) for _ in range(8)])
+    await generator._task
+
+    assert all(is_safe_prime(prime, BITS) for prime in primes)
+    assert load_primes(path) == generator.primes
+    assert len(generator.primes) == 2
+
+    await generator.aclose()
+
+
+@pytest.mark.asyncio
+async def test_warm_restart(tmp_path):
+    path = tmp_path / 'primes.txt'
+    path.write_text(f'{DH_PRIME}\n{DH_PRIME + 2}\n')
+
+    generator = generate(cache_path=str(path), pool_size=1, workers=1)
+
+    assert await generator.asend(None) == DH_PRIME
+    assert await generator.__anext__() == DH_PRIME
+    assert load_primes(str(path)) == [DH_PRIME]
+
+    await generator.aclose()
+
+
+@pytest.mark.asyncio
+async def test_failed_fill(tmp_path):
+    generator = generate(cache_path=str(tmp_path / 'primes.txt'), bits=BITS)
+    generator.fill = AsyncMock(side_effect=OSError('broken executor'))
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            *[generator.asend(None) for _ in range(3)],
+            return_exceptions=True
+        ),
+        timeout=1
+    )
+
+    assert all(isinstance(result, OSError) for result in results)
+
+    with pytest.raises(OSError):
+        await generator.asend(None)
+
+    await generator.aclose()
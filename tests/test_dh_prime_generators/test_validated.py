@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from mtpylon.crypto import HandshakeExecutor, ProcessHandshakeExecutor
+from mtpylon.dh_prime_generators.single_prime import DH_PRIME
+from mtpylon.dh_prime_generators.validated import (
+    ValidatedDhPrimeGenerator,
+    is_valid_dh_prime,
+    is_valid_g,
+)
+
+
+async def generate_primes(*primes):
+    for prime in primes:
+        yield prime
+
+
+async def concurrent_generate(prime):
+    while True:
+        await asyncio.sleep(0)
+        yield prime
+
+
+class OffloadedHandshakeExecutor(HandshakeExecutor):
+    """
+    Runs math inline, so patched functions are called, but reports it runs
+    outside of event loop
+    """
+
+    @property
+    def offloaded(self) -> bool:
+        return True
+
+
+@pytest.mark.parametrize('prime, g, expected', [
+    pytest.param(DH_PRIME, 3, True, id='dh prime with g=3'),
+    pytest.param(DH_PRIME, 4, True, id='dh prime with g=4'),
+    pytest.param(DH_PRIME, 8, False, id='unsupported g'),
+    pytest.param(DH_PRIME + 2, 4, False, id='not safe prime'),
+])
+def test_is_valid_dh_prime(prime, g, expected):
+    assert is_valid_dh_prime(prime, g) == expected
+
+
+@pytest.mark.parametrize('prime, g, expected', [
+    pytest.param(23, 2, True, id='g=2'),
+    pytest.param(17, 2, False, id='wrong g=2'),
+    pytest.param(11, 3, True, id='g=3'),
+    pytest.param(13, 3, False, id='wrong g=3'),
+    pytest.param(11, 5, True, id='g=5'),
+    pytest.param(43, 6, True, id='g=6'),
+    pytest.param(17, 7, True, id='g=7'),
+])
+def test_is_valid_g(prime, g, expected):
+    assert is_valid_g(prime, g) == expected
+
+
+@pytest.mark.asyncio
+async def test_verify_prime_once():
+    generator = ValidatedDhPrimeGenerator(
+        generate_primes(DH_PRIME, DH_PRIME),
+        handshake_executor=OffloadedHandshakeExecutor()
+    )
+
+    with patch(
+        'mtpylon.dh_prime_generators.validated.is_valid_dh_prime',
+        return_value=True
+    ) as is_valid:
+        assert await generator.asend(None) == DH_PRIME
+        assert await generator.asend(None) == DH_PRIME
+
+    is_valid.assert_called_once_with(DH_PRIME, 3)
+
+
+@pytest.mark.asyncio
+async def test_skip_invalid_prime():
+    generator = ValidatedDhPrimeGenerator(
+        generate_primes(DH_PRIME + 2, DH_PRIME)
+    )
+
+    assert await generator.asend(None) == DH_PRIME
+    assert generator._executor is not None
+
+    await generator.aclose()
+
+    assert generator._executor is None
+
+
+@pytest.mark.asyncio
+async def test_invalid_primes():
+    generator = ValidatedDhPrimeGenerator(
+        generate_primes(23, 47, 59),
+        max_attempts=3
+    )
+
+    with pytest.raises(ValueError):
+        await generator.asend(None)
+
+    await generator.aclose()
+
+
+@pytest.mark.asyncio
+async def test_verify_with_handshake_executor():
+    handshake_executor = ProcessHandshakeExecutor(max_workers=1)
+    handshake_executor.start()
+
+    generator = ValidatedDhPrimeGenerator(
+        generate_primes(DH_PRIME + 2, DH_PRIME),
+        handshake_executor=handshake_executor
+    )
+
+    assert await generator.asend(None) == DH_PRIME
+    assert generator._executor is None
+
+    await generator.aclose()
+    handshake_executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_asend():
+    generator = ValidatedDhPrimeGenerator(
+        concurrent_generate(DH_PRIME),
+        handshake_executor=OffloadedHandshakeExecutor()
+    )
+
+    with patch(
+        'mtpylon.dh_prime_generators.validated.is_valid_dh_prime',
+        return_value=True
+    ) as is_valid:
+        primes = await asyncio.gather(*[
+            generator.asend(None)
+            for _ in range(10)
+        ])
+
+    assert primes == [DH_PRIME] * 10
+    is_valid.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cancel_one_of_waiting_handshakes():
+    generator = ValidatedDhPrimeGenerator(
+        concurrent_generate(DH_PRIME),
+        handshake_executor=OffloadedHandshakeExecutor()
+    )
+    verified = asyncio.Event()
+
+    async def verify(*args):
+        await verified.wait()
+        return True
+
+    with patch.object(generator, '_verify', side_effect=verify) as is_valid:
+        handshakes = [
+            asyncio.create_task(generator.is_valid(DH_PRIME))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        handshakes[0].cancel()
+        handshakes[1].cancel()
+        await asyncio.sleep(0)
+        verified.set()
+
+        assert await handshakes[2]
+
+    assert handshakes[0].cancelled()
+    assert handshakes[1].cancelled()
+    assert not generator._pending
+    assert await generator.is_valid(DH_PRIME)
+    is_valid.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_aclose():
+    generator = ValidatedDhPrimeGenerator(concurrent_generate(DH_PRIME))
+
+    await generator.aclose()
+
+    with pytest.raises(StopAsyncIteration):
+        await generator.generator.asend(None)
@@ -60,6 +60,43 @@ async def test_unpack_unencyprted_message_correct():
         assert income_message_var.get() == message
 
 
+@pytest.mark.asyncio
+async def test_handle_transport_message():
+    obfuscator = MagicMock()
+    transport_wrapper = MagicMock()
+    message_sender = MagicMock(
+        send_unencrypted_message=AsyncMock()
+    )
+    request = MagicMock()
+
+    message = UnencryptedMessage(
+        message_id=long(0x51e57ac42770964a),
+        message_data=CallableFunc(
+            func=req_pq,
+            params={'nonce': int128(234)},
+        )
+    )
+
+    unpack_message = AsyncMock(return_value=message)
+
+    with patch(
+        'mtpylon.message_handler.message_handler.unpack_message',
+        unpack_message
+    ):
+        handler = MessageHandler(
+            schema=schema,
+            obfuscator=obfuscator,
+            transport_wrapper=transport_wrapper,
+            message_sender=message_sender
+        )
+
+        await handler.handle_transport_message(request, b'wrapped message')
+
+        assert not obfuscator.decrypt.called
+        transport_wrapper.unwrap.assert_called_with(b'wrapped message')
+        message_sender.send_unencrypted_message.assert_awaited()
+
+
 @pytest.mark.asyncio
 async def test_unpack_encrypted_message_correct():
     obfuscator = MagicMock()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+import threading
+from dataclasses import dataclass
+from typing import Any, List
+
+import pytest
+
+from mtpylon.messages import CodecExecutor
+from mtpylon.messages.codec_executor import estimate_size
+from mtpylon.serialization.lazy import LazyBytes
+
+
+@dataclass
+class Item:
+    data: Any
+    number: int
+
+
+@dataclass
+class Container:
+    items: List[Item]
+    name: str
+
+
+def get_thread_name(*args) -> str:
+    return threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_decode_inline():
+    codec_executor = CodecExecutor(inline_threshold=16)
+
+    thread_name = await codec_executor.decode(10, get_thread_name)
+
+    assert thread_name == threading.current_thread().name
+    assert codec_executor.metrics.inline == 1
+    assert codec_executor.metrics.offloaded == 0
+
+
+@pytest.mark.asyncio
+async def test_decode_offloaded():
+    codec_executor = CodecExecutor(inline_threshold=16)
+
+    thread_name = await codec_executor.decode(16, get_thread_name)
+
+    assert thread_name.startswith('mtpylon-codec')
+    assert codec_executor.metrics.inline == 0
+    assert codec_executor.metrics.offloaded == 1
+
+    codec_executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_decode_passes_args():
+    codec_executor = CodecExecutor(inline_threshold=16)
+
+    assert await codec_executor.decode(1, max, 1, 3, 2) == 3
+    assert await codec_executor.decode(100, max, 1, 3, 2) == 3
+
+    codec_executor.shutdown()
+
+
+def test_estimate_size():
+    data = Container(items=[Item(data=b'x' * 10, number=1)], name='abc')
+
+    # container, vector, item, bytes with length, number, name with length
+    assert estimate_size(data, 1024) == 4 + 4 + 4 + 14 + 8 + 7
+
+
+def test_estimate_size_vector_by_first_item():
+    data = Container(
+        items=[Item(data=b'', number=i) for i in range(1000)],
+        name='',
+    )
+
+    assert estimate_size(data, 1024 * 1024) == 4 + 4 + 1000 * 16 + 4
+
+
+def test_estimate_size_stops_at_limit():
+    data = Item(data=b'x' * 100, number=Container(items=[], name=''))
+
+    # second field isn't walked as estimate has reached limit
+    assert estimate_size(data, 64) == 4 + 104
+
+
+def test_estimate_size_lazy_value():
+    data = Item(data=LazyBytes(memoryview(b'x' * 100)), number=1)
+
+    assert estimate_size(data, 1024) == 4 + 104 + 8
+
+
+@pytest.mark.asyncio
+async def test_encode_small_inline():
+    codec_executor = CodecExecutor(inline_threshold=32)
+
+    data = Item(data=b'x', number=1)
+    assert await codec_executor.encode(data, bytes, 4) == bytes(4)
+
+    assert codec_executor.metrics.inline == 1
+    assert codec_executor.metrics.offloaded == 0
+
+
+@pytest.mark.asyncio
+async def test_encode_large_after_small_offloaded():
+    codec_executor = CodecExecutor(inline_threshold=32)
+
+    await codec_executor.encode(Item(data=b'x', number=1), bytes, 4)
+    assert codec_executor.metrics.inline == 1
+
+    await codec_executor.encode(Item(data=b'x' * 64, number=1), bytes, 4)
+    assert codec_executor.metrics.offloaded == 1
+
+    codec_executor.shutdown()
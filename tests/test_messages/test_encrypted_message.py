@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+from unittest.mock import patch
+
 import pytest
 from tgcrypto import ige256_decrypt  # type: ignore
 
@@ -6,10 +8,11 @@ from mtpylon.types import long
 from mtpylon.crypto import (
     AuthKey,
     AuthKeyManager,
+    CachedAuthKeyManager,
     generate_key_iv
 )
 from mtpylon.exceptions import DumpError
-from mtpylon.contextvars import auth_key_var
+from mtpylon.contextvars import auth_key_var, auth_key_pin_var
 from mtpylon.exceptions import (
     AuthKeyNotFound,
     AuthKeyChangedException,
@@ -19,13 +22,21 @@ from mtpylon.messages.encrypted_message import (
     load_data,
     dump_data,
     pack_message,
-    load_message
+    load_message,
+    write_message,
 )
 from mtpylon.messages import EncryptedMessage
 from mtpylon.serialization import CallableFunc
 from mtpylon.serialization.int128 import load as load_int128
 from mtpylon.utils import get_function_name
 
+from mtpylon.service_schema import service_schema
+from mtpylon.service_schema.constructors import (
+    MessageContainer,
+    Message,
+    MsgsAck,
+)
+
 from tests.echoschema import schema, Reply
 
 auth_key_data = 19173138450442901591212846731489158386637947003706705793697466005840359118325984130331040988945126053253996441948760332982664467588522441280332705742850565768210808401324268532424996018690635427668017180714026266980907736921933287244346526265760362799421836958089132713806536144155052702458589251084836839798895173633060038337086228492970997360899822298102887831495037141025890442863060204588167094562664112338589266018632963871940922732022252873979144345421549843044971414444544589457542139689588733663359139549339618779617218500603713731236381263744006515913607287705083142719869116507454233793160540351518647758028  # noqa
@@ -66,11 +77,54 @@ def test_load_success():
     assert isinstance(value, Reply)
 
 
+def test_dump_load_service_data():
+    common_schema = schema | service_schema
+    container = MessageContainer(
+        messages=[
+            Message(
+                msg_id=long(4),
+                seqno=1,
+                body=Reply(content='hello world', rand_id=44),
+            ),
+            Message(
+                msg_id=long(8),
+                seqno=2,
+                body=MsgsAck(msg_ids=[long(4)]),
+            ),
+        ]
+    )
+
+    dumped = dump_data(common_schema, container)
+    loaded = load_data(common_schema, dumped)
+
+    assert isinstance(loaded, MessageContainer)
+    assert [message.body for message in loaded.messages] == [
+        Reply(content='hello world', rand_id=44),
+        MsgsAck(msg_ids=[long(4)]),
+    ]
+
+
 def test_load_data_error():
     with pytest.raises(ValueError):
         load_data(schema, b'fakedata')
 
 
+def test_write_message():
+    message = EncryptedMessage(
+        salt=server_salt,
+        session_id=session_id,
+        message_id=long(0x51e57ac42770964a),
+        seq_no=1,
+        message_data=Reply(content='hello world', rand_id=44),
+    )
+
+    buffer = write_message(schema, message)
+
+    assert buffer[24:28] == b'\x01\x00\x00\x00'
+    assert buffer[28:32] == b'\x14\x00\x00\x00'
+    assert buffer[32:] == b'>\x00j\r,\x00\x00\x00\x0bhello world'
+
+
 @pytest.mark.asyncio
 async def test_unpack_message():
     auth_key_manager = AuthKeyManager()
@@ -125,6 +179,99 @@ async def test_unpack_message_ohter_auth_key():
         )
 
 
+@pytest.mark.asyncio
+async def test_unpack_message_pinned_auth_key():
+    auth_key_manager = AuthKeyManager()
+    await auth_key_manager.set_key(auth_key_data)
+
+    with patch.object(
+        auth_key_manager,
+        'get_key',
+        wraps=auth_key_manager.get_key
+    ) as get_key:
+        for _ in range(3):
+            message = await unpack_message(
+                auth_key_manager,
+                schema,
+                encrypted_message_bytes
+            )
+            assert message.session_id == session_id
+
+    assert get_key.call_count == 1
+    assert auth_key_pin_var.get().auth_key == AuthKey(auth_key_data)
+
+
+@pytest.mark.asyncio
+async def test_unpack_message_pinned_auth_key_deleted():
+    auth_key_manager = AuthKeyManager()
+    await auth_key_manager.set_key(auth_key_data)
+
+    await unpack_message(
+        auth_key_manager,
+        schema,
+        encrypted_message_bytes
+    )
+
+    await auth_key_manager.del_key(auth_key_id)
+
+    assert auth_key_pin_var.get().auth_key is None
+
+    with pytest.raises(AuthKeyNotFound):
+        await unpack_message(
+            auth_key_manager,
+            schema,
+            encrypted_message_bytes
+        )
+
+
+@pytest.mark.asyncio
+async def test_unpack_message_pinned_auth_key_expired():
+    backend = AuthKeyManager()
+    auth_key_manager = CachedAuthKeyManager(backend, ttl=0)
+    await backend.set_key(auth_key_data)
+
+    await unpack_message(
+        auth_key_manager,
+        schema,
+        encrypted_message_bytes
+    )
+
+    assert auth_key_pin_var.get().ttl == 0
+
+    await backend.del_key(auth_key_id)
+
+    with pytest.raises(AuthKeyNotFound):
+        await unpack_message(
+            auth_key_manager,
+            schema,
+            encrypted_message_bytes
+        )
+
+
+@pytest.mark.asyncio
+async def test_unpack_message_manager_without_invalidation():
+    class Manager:
+
+        def __init__(self):
+            self.calls = 0
+
+        async def get_key(self, value):
+            self.calls += 1
+            return AuthKey(auth_key_data)
+
+    auth_key_manager = Manager()
+
+    for _ in range(2):
+        await unpack_message(
+            auth_key_manager,  # type: ignore
+            schema,
+            encrypted_message_bytes
+        )
+
+    assert auth_key_manager.calls == 2
+    assert auth_key_pin_var.get(None) is None
+
+
 @pytest.mark.asyncio
 async def test_pack_message():
     auth_key = AuthKey(auth_key_data)
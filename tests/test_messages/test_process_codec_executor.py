@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+from mtpylon import long
+from mtpylon.messages import ProcessCodecExecutor, EncryptedMessage
+from mtpylon.messages.encrypted_message import (
+    load_data,
+    dump_data,
+    write_message,
+)
+from mtpylon.messages import process_codec_executor
+from mtpylon.messages.process_codec_executor import init_worker
+from mtpylon.serialization.codegen import load_schema
+from mtpylon.service_schema import get_common_schema
+
+from tests.echoschema import schema, Reply
+
+common_schema = get_common_schema(schema)
+
+reply = Reply(content='hello world', rand_id=44)
+reply_bytes = b'>\x00j\r,\x00\x00\x00\x0bhello world'
+
+
+@pytest.fixture
+def codec_executor():
+    codec_executor = ProcessCodecExecutor(
+        inline_threshold=4,
+        process_threshold=16,
+        process_workers=1
+    )
+    codec_executor.start(common_schema)
+
+    yield codec_executor
+
+    codec_executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_decode_in_process(codec_executor):
+    value = await codec_executor.decode(
+        len(reply_bytes),
+        load_data,
+        common_schema,
+        memoryview(reply_bytes),
+    )
+
+    assert value == reply
+    assert codec_executor.metrics.processed == 1
+
+
+@pytest.mark.asyncio
+async def test_decode_small_in_thread(codec_executor):
+    value = await codec_executor.decode(
+        8,
+        load_data,
+        common_schema,
+        reply_bytes,
+    )
+
+    assert value == reply
+    assert codec_executor.metrics.offloaded == 1
+    assert codec_executor.metrics.processed == 0
+
+
+@pytest.mark.asyncio
+async def test_decode_other_schema_in_thread(codec_executor):
+    value = await codec_executor.decode(
+        len(reply_bytes),
+        load_data,
+        schema,
+        reply_bytes,
+    )
+
+    assert value == reply
+    assert codec_executor.metrics.offloaded == 1
+    assert codec_executor.metrics.processed == 0
+
+
+@pytest.mark.asyncio
+async def test_encode_in_process(codec_executor):
+    message = EncryptedMessage(
+        salt=long(1),
+        session_id=long(2),
+        message_id=long(3),
+        seq_no=0,
+        message_data=reply,
+    )
+
+    encoded = await codec_executor.encode(
+        reply,
+        write_message,
+        common_schema,
+        message
+    )
+
+    assert encoded[32:] == dump_data(common_schema, reply)
+    assert codec_executor.metrics.offloaded == 0
+    assert codec_executor.metrics.processed == 1
+
+
+@pytest.mark.asyncio
+async def test_not_started_executor_uses_threads():
+    codec_executor = ProcessCodecExecutor(
+        inline_threshold=4,
+        process_threshold=16,
+    )
+
+    value = await codec_executor.decode(
+        len(reply_bytes),
+        load_data,
+        common_schema,
+        reply_bytes,
+    )
+
+    assert value == reply
+    assert codec_executor.metrics.offloaded == 1
+
+    codec_executor.shutdown()
+
+
+def test_init_worker_with_cache_dir(tmp_path):
+    load_schema(
+        common_schema.constructors,
+        common_schema.functions,
+        str(tmp_path)
+    )
+
+    init_worker(
+        common_schema.constructors,
+        common_schema.functions,
+        str(tmp_path)
+    )
+
+    codecs = process_codec_executor._worker_schema.codecs
+
+    assert codecs is not None
+    assert os.path.dirname(codecs.__file__) == str(tmp_path)
+
+
+@pytest.mark.asyncio
+async def test_decode_in_process_with_generated_codecs(tmp_path):
+    generated_schema = load_schema(
+        common_schema.constructors,
+        common_schema.functions,
+        str(tmp_path)
+    )
+    codec_executor = ProcessCodecExecutor(
+        inline_threshold=4,
+        process_threshold=16,
+        process_workers=1
+    )
+    codec_executor.start(generated_schema)
+
+    value = await codec_executor.decode(
+        len(reply_bytes),
+        load_data,
+        generated_schema,
+        reply_bytes,
+    )
+
+    assert value == reply
+    assert codec_executor.metrics.processed == 1
+
+    codec_executor.shutdown()
@@ -271,3 +271,54 @@ def test_duplicate_method(one_schema):
 
     with pytest.raises(ValueError):
         one_schema.update(simple_schema)
+
+
+def test_schema_from_structure():
+    with patch('mtpylon.schema.is_valid_constructor') as is_valid_constructor:
+        new_schema = Schema.from_structure(
+            schema.constructors,
+            schema.functions,
+            schema.get_schema_structure()
+        )
+
+    is_valid_constructor.assert_not_called()
+    assert new_schema.get_schema_structure() == schema.get_schema_structure()
+    assert Bool in new_schema
+    assert new_schema[Task] == schema[Task]
+    assert new_schema[login] == schema[login]
+    assert new_schema.codecs is None
+
+
+def test_update_drops_codecs(one_schema, another_schema):
+    one_schema.codecs = MagicMock()
+    one_schema.update(another_schema)
+
+    assert one_schema.codecs is None
+
+
+def test_update_describes_only_new_schema(one_schema, another_schema):
+    structure = one_schema.get_schema_structure()
+
+    with patch.object(
+        Schema,
+        '_describe_constructor'
+    ) as describe_constructor, patch.object(
+        Schema,
+        '_describe_function'
+    ) as describe_function:
+        one_schema.update(another_schema)
+
+    describe_constructor.assert_not_called()
+    describe_function.assert_not_called()
+
+    new_structure = one_schema.get_schema_structure()
+    assert new_structure.constructors == (
+        structure.constructors +
+        another_schema.get_schema_structure().constructors
+    )
+    assert new_structure.methods == (
+        structure.methods +
+        another_schema.get_schema_structure().methods
+    )
+    assert one_schema[Reply] == another_schema[Reply]
+    assert one_schema[another_schema[echo].id] == another_schema[echo]
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import pytest
 
-from mtpylon.serialization.bytes import load, dump
+from mtpylon.serialization.bytes import load, dump, dump_to
 
 
 def test_dump_short_string():
@@ -79,3 +79,38 @@ def test_load_long_string_257():
 def test_load_value_error():
     with pytest.raises(ValueError):
         load(b'')
+
+
+def test_load_by_offset():
+    dumped = b'\x00\x00\x00\x00' + b'\x05hello\x00\x00' + b'\x01a\x00\x00'
+
+    loaded = load(memoryview(dumped), 4)
+
+    assert loaded.value == b'hello'
+    assert isinstance(loaded.value, bytes)
+    assert loaded.offset == 12
+
+    loaded = load(memoryview(dumped), loaded.offset)
+
+    assert loaded.value == b'a'
+    assert loaded.offset == 16
+
+
+def test_load_by_offset_value_error():
+    with pytest.raises(ValueError):
+        load(b'\x05hello\x00\x00', 8)
+
+
+def test_dump_to():
+    buffer = bytearray(b'head')
+    dump_to(buffer, b'hello')
+
+    assert buffer == b'head' + b'\x05hello\x00\x00'
+
+
+def test_dump_to_long_bytes():
+    value = b'\x01' * 254
+    buffer = bytearray()
+    dump_to(buffer, value)
+
+    assert buffer == dump(value)
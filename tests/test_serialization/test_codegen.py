@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+import os
+from dataclasses import make_dataclass, field
+from unittest.mock import patch
+
+import pytest
+
+from mtpylon.exceptions import DumpError
+from mtpylon.serialization import dump, dump_to, load, CallableFunc
+from mtpylon.serialization.codegen import (
+    get_schema_hash,
+    get_codecs_path,
+    load_schema,
+)
+
+from ..simpleschema import (
+    schema,
+    BoolTrue,
+    BoolFalse,
+    Task,
+    TaskList,
+    AuthorizedUser,
+    EntityComment,
+    login,
+    get_task_list,
+)
+
+values = [
+    pytest.param(BoolTrue(), id='combinator without params'),
+    pytest.param(
+        Task(id=12, content='task', completed=BoolFalse(), tags=None),
+        id='optional param not set'
+    ),
+    pytest.param(
+        Task(id=12, content='task', completed=BoolTrue(), tags=['a', 'b']),
+        id='optional param set'
+    ),
+    pytest.param(
+        AuthorizedUser(
+            id=1,
+            username='user',
+            password='pass',
+            avatar_url='http://avatar'
+        ),
+        id='optional string'
+    ),
+    pytest.param(
+        TaskList(tasks=[
+            Task(id=i, content=f'{i}', completed=BoolTrue(), tags=None)
+            for i in range(3)
+        ]),
+        id='vector of combinators'
+    ),
+    pytest.param(
+        EntityComment(entity=BoolTrue(), comment='comment'),
+        id='object param'
+    ),
+    pytest.param(
+        CallableFunc(login, {'username': 'user', 'password': 'pass'}),
+        id='function'
+    ),
+    pytest.param(
+        CallableFunc(get_task_list, {}),
+        id='function without params'
+    ),
+]
+
+
+@pytest.fixture
+def generated_schema(tmp_path):
+    return load_schema(schema.constructors, schema.functions, str(tmp_path))
+
+
+def test_schema_hash():
+    assert (
+        get_schema_hash(schema.constructors, schema.functions) ==
+        get_schema_hash(list(schema.constructors), list(schema.functions))
+    )
+    assert (
+        get_schema_hash(schema.constructors, schema.functions) !=
+        get_schema_hash(schema.constructors, schema.functions[1:])
+    )
+
+
+def test_schema_hash_changed_with_field_type():
+    meta = type('Meta', (), {'name': 'item', 'order': ('value', )})
+    int_item = make_dataclass('Item', [('value', int)], namespace={
+        'Meta': meta
+    })
+    str_item = make_dataclass('Item', [('value', str)], namespace={
+        'Meta': meta
+    })
+
+    assert get_schema_hash([int_item], []) != get_schema_hash([str_item], [])
+
+
+def test_schema_hash_with_object_in_metadata():
+    class Marker:
+        pass
+
+    def build_item():
+        return make_dataclass(
+            'Item',
+            [('value', int, field(metadata={'marker': Marker()}))],
+            namespace={
+                'Meta': type('Meta', (), {'name': 'item'})
+            }
+        )
+
+    assert get_schema_hash([build_item()], []) == \
+        get_schema_hash([build_item()], [])
+
+
+def test_load_schema_writes_codecs(tmp_path):
+    generated_schema = load_schema(
+        schema.constructors,
+        schema.functions,
+        str(tmp_path)
+    )
+    path = get_codecs_path(
+        str(tmp_path),
+        get_schema_hash(schema.constructors, schema.functions)
+    )
+
+    assert os.path.exists(path)
+    assert generated_schema.codecs is not None
+    assert generated_schema.codecs.__file__ == path
+    assert (
+        generated_schema.get_schema_structure() ==
+        schema.get_schema_structure()
+    )
+
+
+def test_load_schema_from_cache(tmp_path):
+    load_schema(schema.constructors, schema.functions, str(tmp_path))
+
+    with patch('mtpylon.schema.is_valid_constructor') as is_valid_constructor:
+        generated_schema = load_schema(
+            schema.constructors,
+            schema.functions,
+            str(tmp_path)
+        )
+
+    is_valid_constructor.assert_not_called()
+    assert generated_schema.codecs is not None
+    assert (
+        generated_schema.get_schema_structure() ==
+        schema.get_schema_structure()
+    )
+    assert Task in generated_schema
+    assert generated_schema[login] == schema[login]
+
+
+def test_load_schema_with_wrong_hash(tmp_path):
+    path = get_codecs_path(
+        str(tmp_path),
+        get_schema_hash(schema.constructors, schema.functions)
+    )
+    with open(path, 'w') as f:
+        f.write("SCHEMA_HASH = 'wrong'\n")
+
+    generated_schema = load_schema(
+        schema.constructors,
+        schema.functions,
+        str(tmp_path)
+    )
+
+    assert generated_schema.codecs.SCHEMA_HASH != 'wrong'
+    assert (
+        generated_schema.get_schema_structure() ==
+        schema.get_schema_structure()
+    )
+
+
+@pytest.mark.parametrize('value', values)
+def test_generated_codecs(generated_schema, value):
+    dumped = dump(value, schema=schema)
+
+    assert dump(value, schema=generated_schema) == dumped
+    assert load(dumped, schema=generated_schema).value == value
+
+
+def test_generated_load_not_enough_bytes(generated_schema):
+    dumped = dump(
+        Task(id=12, content='task', completed=BoolTrue(), tags=None),
+        schema=schema
+    )
+
+    with pytest.raises(ValueError):
+        load(dumped[:6], schema=generated_schema)
+
+
+def test_generated_dump_error_truncates_buffer(generated_schema):
+    buffer = bytearray(b'head')
+
+    with pytest.raises(DumpError, match='Can`t dump value int'):
+        dump_to(
+            buffer,
+            Task(id='12', content='task', completed=BoolTrue(), tags=None),
+            schema=generated_schema
+        )
+
+    assert buffer == b'head'
@@ -1,12 +1,19 @@
 # -*- coding: utf-8 -*-
 from mtpylon import double
-from mtpylon.serialization.double import load, dump
+from mtpylon.serialization.double import load, dump, dump_to
 
 
 def test_dump():
     assert dump(double(1.23)) == b'\xaeG\xe1z\x14\xae\xf3?'
 
 
+def test_dump_to():
+    buffer = bytearray(b'head')
+    dump_to(buffer, double(1.23))
+
+    assert buffer == b'head\xaeG\xe1z\x14\xae\xf3?'
+
+
 def test_load():
     loaded = load(b'\xaeG\xe1z\x14\xae\xf3?')
 
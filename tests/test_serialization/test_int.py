@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
+from struct import error as StructError
+
 import pytest
-from mtpylon.serialization.int import load, dump
+from mtpylon.serialization.int import load, dump, dump_to
 
 
 def test_dump_success():
@@ -11,6 +13,18 @@ def test_dump_negative_success():
     assert dump(-23) == b'\xe9\xff\xff\xff'
 
 
+def test_dump_to():
+    buffer = bytearray(b'head')
+    dump_to(buffer, -23)
+
+    assert buffer == b'head\xe9\xff\xff\xff'
+
+
+def test_dump_to_overflow():
+    with pytest.raises(StructError):
+        dump_to(bytearray(), 2 ** 31)
+
+
 def test_load_success():
     loaded = load(b'\x13\x01\x00\x00')
 
@@ -28,3 +42,15 @@ def test_load_negative_success():
 def test_load_error():
     with pytest.raises(ValueError):
         load(b'\x13\x00\x00')
+
+
+def test_load_by_offset():
+    loaded = load(memoryview(b'\x00\x00\x13\x01\x00\x00'), 2)
+
+    assert loaded.value == 275
+    assert loaded.offset == 6
+
+
+def test_load_by_offset_error():
+    with pytest.raises(ValueError):
+        load(b'\x00\x00\x13\x01\x00', 2)
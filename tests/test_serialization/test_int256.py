@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 import pytest
-from mtpylon.serialization.int256 import load, dump
+from mtpylon.serialization.int256 import load, dump, dump_to
 
 number = 0x3E0549828CCA27E966B301A48FECE2FC3E0549828CCA27E966B301A48FECE2FC
 
@@ -15,6 +15,18 @@ def test_dump_success():
     assert dump(number) == dumped
 
 
+def test_dump_to():
+    buffer = bytearray(b'head')
+    dump_to(buffer, number)
+
+    assert buffer == b'head' + dumped
+
+
+def test_dump_to_negative():
+    with pytest.raises(OverflowError):
+        dump_to(bytearray(), -1)
+
+
 def test_load_success():
     loaded = load(dumped)
 
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+import pickle
+
+from mtpylon.serialization.lazy import (
+    LazyBytes,
+    LazyString,
+    load_bytes,
+    load_string,
+)
+from mtpylon.serialization.bytes import (
+    dump as dump_bytes,
+    dump_to as dump_bytes_to,
+)
+from mtpylon.serialization.string import (
+    dump as dump_string,
+    dump_to as dump_string_to,
+)
+
+
+def test_load_bytes():
+    dumped = b'head' + dump_bytes(b'hello')
+
+    loaded = load_bytes(dumped, offset=4)
+
+    assert isinstance(loaded.value, LazyBytes)
+    assert loaded.value == b'hello'
+    assert loaded.offset == len(dumped)
+
+
+def test_load_bytes_not_copied():
+    input = bytearray(dump_bytes(b'hello'))
+
+    loaded = load_bytes(input)
+
+    assert loaded.value.view.obj is input
+
+
+def test_lazy_bytes_value_cached():
+    lazy = LazyBytes(memoryview(b'hello'))
+
+    assert lazy.value == b'hello'
+    assert lazy.value is lazy.value
+    assert bytes(lazy) == b'hello'
+    assert len(lazy) == 5
+
+
+def test_load_string():
+    dumped = dump_string('привет')
+
+    loaded = load_string(dumped)
+
+    assert isinstance(loaded.value, LazyString)
+    assert loaded.value == 'привет'
+    assert str(loaded.value) == 'привет'
+    assert loaded.offset == len(dumped)
+
+
+def test_lazy_values_hashable():
+    assert hash(LazyBytes(memoryview(b'hello'))) == hash(b'hello')
+    assert hash(LazyString(memoryview(b'hello'))) == hash('hello')
+
+
+def test_lazy_values_pickled_as_values():
+    lazy_bytes = pickle.loads(pickle.dumps(LazyBytes(memoryview(b'hello'))))
+    lazy_string = pickle.loads(pickle.dumps(LazyString(memoryview(b'hi'))))
+
+    assert lazy_bytes == b'hello'
+    assert isinstance(lazy_bytes, bytes)
+    assert lazy_string == 'hi'
+    assert isinstance(lazy_string, str)
+
+
+def test_dump_lazy_bytes_to():
+    value = b'a' * 300
+    buffer = bytearray()
+
+    dump_bytes_to(buffer, LazyBytes(memoryview(value)))
+    dump_bytes_to(buffer, value)
+
+    assert buffer == dump_bytes(value) * 2
+
+
+def test_dump_lazy_string_to():
+    lazy = LazyString(memoryview('привет'.encode()))
+    buffer = bytearray()
+
+    dump_string_to(buffer, lazy)
+    dump_string_to(buffer, 'привет')
+
+    assert buffer == dump_string('привет') * 2
+    assert lazy._value is None
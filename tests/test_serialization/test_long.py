@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 import pytest
-from mtpylon.serialization.long import load, dump
+from mtpylon.serialization.long import load, dump, dump_to
 
 
 def test_dump_success():
@@ -11,6 +11,13 @@ def test_dump_negative_success():
     assert dump(-23) == b'\xe9\xff\xff\xff\xff\xff\xff\xff'
 
 
+def test_dump_to():
+    buffer = bytearray(b'head')
+    dump_to(buffer, -23)
+
+    assert buffer == b'head\xe9\xff\xff\xff\xff\xff\xff\xff'
+
+
 def test_load_success():
     loaded = load(b'\x13\x01\x00\x00\x00\x00\x00\x00')
 
@@ -28,3 +35,15 @@ def test_load_negative_success():
 def test_load_error():
     with pytest.raises(ValueError):
         load(b'\x13\x00\x00')
+
+
+def test_load_by_offset():
+    loaded = load(memoryview(b'\xff' + b'\x13\x01' + b'\x00' * 6), 1)
+
+    assert loaded.value == 275
+    assert loaded.offset == 9
+
+
+def test_load_by_offset_error():
+    with pytest.raises(ValueError):
+        load(b'\xff' + b'\x13\x01' + b'\x00' * 5, 1)
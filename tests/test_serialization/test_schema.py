@@ -1,15 +1,30 @@
 # -*- coding: utf-8 -*-
-from typing import no_type_check
+import gc
+import weakref
+from dataclasses import dataclass, field, make_dataclass
+from typing import List, Optional, no_type_check
+from unittest.mock import patch
 
 import pytest
 
-from mtpylon.serialization import dump, load
-from mtpylon.serialization.schema import CallableFunc, _load
+from mtpylon import Schema, long
+from mtpylon.serialization import dump, dump_to, load
+from mtpylon.serialization.schema import (
+    CallableFunc,
+    SchemaLoader,
+    SchemaDumper,
+    _load,
+    get_loader,
+    get_dumper,
+)
 from mtpylon.exceptions import DumpError
 from mtpylon.serialization.loaded import LoadedValue
+from mtpylon.serialization.lazy import LazyBytes, LazyString
+from mtpylon.service_schema.constructors import MsgsAck
 
 from ..simpleschema import (
     schema,
+    Bool,
     BoolTrue,
     BoolFalse,
     Task,
@@ -517,3 +532,261 @@ def test_load_bare_task():
     )
 
     assert loaded.value == task
+
+
+def test_get_loader_cached():
+    assert get_loader(schema) is get_loader(schema)
+    assert get_loader(schema) is get_loader(schema, custom_loaders={})
+
+
+def test_get_loader_custom_loaders():
+    def bool_true_loader(
+        input: bytes,
+        bare: bool = False
+    ) -> LoadedValue[BoolTrue]:  # pragma: nocover
+        return LoadedValue(BoolTrue(), offset=4)
+
+    custom_loaders = {BoolTrue: bool_true_loader}
+
+    assert get_loader(schema, custom_loaders) is not get_loader(schema)
+    assert get_loader(schema, custom_loaders) is get_loader(
+        schema,
+        {BoolTrue: bool_true_loader}
+    )
+
+
+def test_get_dumper_cached():
+    assert get_dumper(schema) is get_dumper(schema)
+    assert get_dumper(schema) is get_dumper(schema, custom_dumpers={})
+
+
+def test_release_schema_with_loader_and_dumper():
+    tmp_schema = Schema(constructors=[Task, Bool], functions=[])
+    get_loader(tmp_schema)
+    get_dumper(tmp_schema)
+    schema_ref = weakref.ref(tmp_schema)
+
+    del tmp_schema
+    gc.collect()
+
+    assert schema_ref() is None
+
+
+def test_drop_loader_and_dumper_on_update():
+    tmp_schema = Schema(constructors=[Task, Bool], functions=[])
+    loader = get_loader(tmp_schema)
+    dumper = get_dumper(tmp_schema)
+
+    tmp_schema.update(Schema(constructors=[MsgsAck], functions=[]))
+
+    assert get_loader(tmp_schema) is not loader
+    assert get_dumper(tmp_schema) is not dumper
+
+
+def test_load_plan_compiled_once():
+    tmp_schema = Schema(constructors=[Task, Bool], functions=[])
+    input = (
+        b'\x63\xa5\x01\xb8' +  # task combinator number
+        b'\x00\x00\x00\x00' +  # flags
+        b'\x0c\x00\x00\x00' +  # id number - int
+        b'\x0edump by schema\x00' +  # content - str
+        b'\xb5\x75\x72\x99'  # completed - Bool
+    )
+
+    with patch.object(
+        SchemaLoader,
+        '_compile_params',
+        autospec=True,
+        side_effect=SchemaLoader._compile_params
+    ) as compile_params:
+        first = load(input, schema=tmp_schema)
+        second = load(input, schema=tmp_schema)
+
+    assert first.value == second.value
+    assert compile_params.call_count == 2  # task and boolTrue
+
+
+def test_dump_plan_compiled_once():
+    tmp_schema = Schema(constructors=[Task, Bool], functions=[])
+    task = Task(
+        id=12,
+        content='dump by schema',
+        completed=BoolTrue(),
+        tags=['schema'],
+    )
+
+    with patch.object(
+        SchemaDumper,
+        '_compile_plan',
+        autospec=True,
+        side_effect=SchemaDumper._compile_plan
+    ) as compile_plan:
+        first = dump(task, schema=tmp_schema)
+        second = dump(task, schema=tmp_schema)
+
+    assert first == second
+    assert compile_plan.call_count == 2  # task and boolTrue
+
+
+def test_load_by_offset():
+    input = memoryview(
+        b'\x00\x00\x00\x00' +  # skipped value
+        b'\x63\xa5\x01\xb8' +  # task combinator number
+        b'\x02\x00\x00\x00' +  # flags
+        b'\x0c\x00\x00\x00' +  # id number - int
+        b'\x0edump by schema\x00' +  # content - str
+        b'\xb5\x75\x72\x99'  # completed - Bool
+        b'\x15\xc4\xb5\x1c' +  # vector id
+        b'\x01\x00\x00\x00' +  # vector size
+        b'\x06schema\x00'  # tag 'schema'
+    )
+
+    loaded = load(input, schema=schema, offset=4)
+
+    assert loaded.value == Task(
+        id=12,
+        content='dump by schema',
+        completed=BoolTrue(),
+        tags=['schema']
+    )
+    assert loaded.offset == len(input)
+
+
+def test_custom_loader_by_offset():
+    dumped = b'\x00\x00\x00\x00' + b'\xb5\x75\x72\x99' + b'custom'
+
+    def bool_true_loader(
+        input: bytes,
+        offset: int = 0,
+        bare: bool = False
+    ) -> LoadedValue[BoolTrue]:
+        assert input[offset + 4:offset + 10] == b'custom'
+        return LoadedValue(BoolTrue(), offset=offset + 10)
+
+    loaded = load(
+        memoryview(dumped),
+        schema=schema,
+        custom_loaders={BoolTrue: bool_true_loader},
+        offset=4
+    )
+
+    assert loaded.value == BoolTrue()
+    assert loaded.offset == 14
+
+
+def test_dump_to_buffer():
+    task = Task(
+        id=12,
+        content='dump by schema',
+        completed=BoolTrue(),
+        tags=['schema']
+    )
+    buffer = bytearray(b'head')
+
+    dump_to(buffer, task, schema=schema)
+
+    assert buffer == b'head' + dump(task, schema=schema)
+
+
+@no_type_check
+def test_dump_to_wrong_object_params_truncates_buffer():
+    task = Task(id=12, content=12312, completed=BoolFalse(), tags=None)
+    buffer = bytearray(b'head')
+
+    with pytest.raises(DumpError):
+        dump_to(buffer, task, schema=schema)
+
+    assert buffer == b'head'
+
+
+def test_basic_vector_selected_by_schema():
+    value = MsgsAck(msg_ids=[long(i) for i in range(100)])
+
+    with patch(
+        'mtpylon.serialization.schema.load_vector',
+        side_effect=AssertionError
+    ), patch(
+        'mtpylon.serialization.schema.dump_vector_to',
+        side_effect=AssertionError
+    ):
+        msgs_ack_schema = Schema(constructors=[MsgsAck], functions=[])
+        dumped = dump(value, schema=msgs_ack_schema)
+        loaded = load(dumped, schema=msgs_ack_schema)
+
+    assert loaded.value == value
+    assert dumped[8:12] == b'\x64\x00\x00\x00'  # size of vector
+
+
+@dataclass
+class FileChunk:
+    name: str = field(metadata={'lazy': True})
+    data: bytes = field(metadata={'lazy': True})
+    comment: Optional[str] = field(metadata={'flag': 0, 'lazy': True})
+
+    class Meta:
+        name = 'fileChunk'
+        order = ('name', 'data', 'comment')
+
+
+def test_lazy_fields():
+    chunk_schema = Schema(constructors=[FileChunk], functions=[])
+    chunk = FileChunk(name='file.txt', data=b'\x01' * 1024, comment='hi')
+    dumped = dump(chunk, schema=chunk_schema)
+
+    loaded = load(memoryview(dumped), schema=chunk_schema).value
+
+    assert isinstance(loaded.name, LazyString)
+    assert isinstance(loaded.data, LazyBytes)
+    assert isinstance(loaded.comment, LazyString)
+    assert loaded == chunk
+    assert dump(loaded, schema=chunk_schema) == dumped
+
+
+@dataclass
+class StoredFile:
+    name: str
+    data: bytes
+    tags: List[str]
+
+    class Meta:
+        name = 'storedFile'
+        order = ('name', 'data', 'tags')
+
+
+def test_forward_lazy_fields_into_plain_fields():
+    forward_schema = Schema(constructors=[FileChunk, StoredFile], functions=[])
+    chunk = FileChunk(name='файл.txt', data=b'\x01' * 1024, comment='hi')
+    loaded = load(
+        memoryview(dump(chunk, schema=forward_schema)),
+        schema=forward_schema
+    ).value
+
+    stored = StoredFile(
+        name=loaded.name,
+        data=loaded.data,
+        tags=[loaded.comment]
+    )
+    dumped = dump(stored, schema=forward_schema)
+
+    assert dumped == dump(
+        StoredFile(name='файл.txt', data=b'\x01' * 1024, tags=['hi']),
+        schema=forward_schema
+    )
+    assert loaded.name._value is None
+
+
+def test_lazy_fields_not_changed_combinator_number():
+    plain_chunk = make_dataclass(
+        'FileChunk',
+        [
+            ('name', str),
+            ('data', bytes),
+            ('comment', Optional[str], field(metadata={'flag': 0})),
+        ],
+        namespace={'Meta': FileChunk.Meta}
+    )
+
+    chunk_schema = Schema(constructors=[FileChunk], functions=[])
+    plain_schema = Schema(constructors=[plain_chunk], functions=[])
+
+    assert chunk_schema[FileChunk].id == plain_schema[plain_chunk].id
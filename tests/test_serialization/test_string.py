@@ -54,3 +54,12 @@ def test_load_long_string():
 
     assert loaded.value == value
     assert loaded.offset == 512
+
+
+def test_load_by_offset():
+    dumped = b'\x00\x00\x00\x00' + b'\x05hello\x00\x00'
+
+    loaded = load(memoryview(dumped), 4)
+
+    assert loaded.value == 'hello'
+    assert loaded.offset == 12
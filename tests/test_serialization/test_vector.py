@@ -1,11 +1,24 @@
 # -*- coding: utf-8 -*-
 import pytest
 
-from mtpylon.serialization.vector import load, dump
+from mtpylon.serialization.vector import (
+    load,
+    dump,
+    dump_to,
+    load_packed,
+    load_wide,
+    dump_packed_to,
+    dump_wide_to,
+)
 from mtpylon.serialization.int import load as load_int, dump as dump_int
+from mtpylon.serialization.long import dump as dump_long
+from mtpylon.serialization.double import dump as dump_double
+from mtpylon.serialization.int128 import dump as dump_int128
+from mtpylon.serialization.int256 import dump as dump_int256
 from mtpylon.serialization.string import (
     load as load_string,
-    dump as dump_string
+    dump as dump_string,
+    dump_to as dump_string_to,
 )
 
 
@@ -129,3 +142,97 @@ def test_load_bare_vector():
 
     assert loaded.value == value
     assert loaded.offset == 32
+
+
+def test_load_by_offset():
+    dumped = (
+        b'\x00\x00\x00\x00' +  # skipped value
+        b'\x15\xc4\xb5\x1c' +  # vector id
+        b'\x02\x00\x00\x00' +  # size of vector
+        b'\x05hello\x00\x00' +
+        b'\x05world\x00\x00'
+    )
+
+    loaded = load(load_string, memoryview(dumped), offset=4)
+
+    assert loaded.value == ['hello', 'world']
+    assert loaded.offset == len(dumped)
+
+
+def test_dump_to():
+    buffer = bytearray(b'head')
+
+    dump_to(buffer, dump_string_to, ['hello', 'world'])
+
+    assert buffer == b'head' + dump(dump_string, ['hello', 'world'])
+
+
+def test_dump_to_bare():
+    buffer = bytearray()
+
+    dump_to(buffer, dump_string_to, ['hello'], bare=True)
+
+    assert buffer == dump(dump_string, ['hello'], bare=True)
+
+
+@pytest.mark.parametrize(
+    'item_format,dump_item,value',
+    [
+        pytest.param('i', dump_int, [2, -3, 4], id='int'),
+        pytest.param('q', dump_long, [2, -(2 ** 63), 2 ** 63 - 1], id='long'),
+        pytest.param('d', dump_double, [1.5, -0.25], id='double'),
+        pytest.param('q', dump_long, [], id='empty'),
+    ]
+)
+def test_load_dump_packed(item_format, dump_item, value):
+    dumped = dump(dump_item, value)
+
+    loaded = load_packed(item_format, b'head' + dumped, offset=4)
+
+    assert loaded.value == value
+    assert loaded.offset == len(dumped) + 4
+
+    buffer = bytearray()
+    dump_packed_to(buffer, item_format, value)
+
+    assert buffer == dumped
+
+
+@pytest.mark.parametrize(
+    'item_size,dump_item,value',
+    [
+        pytest.param(16, dump_int128, [1, 2 ** 128 - 1], id='int128'),
+        pytest.param(32, dump_int256, [2 ** 200, 0], id='int256'),
+    ]
+)
+def test_load_dump_wide(item_size, dump_item, value):
+    dumped = dump(dump_item, value, bare=True)
+
+    loaded = load_wide(item_size, dumped, bare=True)
+
+    assert loaded.value == value
+    assert loaded.offset == len(dumped)
+
+    buffer = bytearray()
+    dump_wide_to(buffer, item_size, value, bare=True)
+
+    assert buffer == dumped
+
+
+def test_load_packed_not_enough_bytes():
+    dumped = dump(dump_int, [1, 2, 3])
+
+    with pytest.raises(ValueError):
+        load_packed('i', dumped[:-1])
+
+
+def test_load_wide_not_enough_bytes():
+    dumped = dump(dump_int128, [1, 2])
+
+    with pytest.raises(ValueError):
+        load_wide(16, dumped[:-1])
+
+
+def test_load_packed_wrong_vector_id():
+    with pytest.raises(ValueError):
+        load_packed('i', b'\x00\x00\x00\x00\x00\x00\x00\x00')
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+from mtpylon import Schema
+from mtpylon.serialization.schema import get_loader, get_dumper
+from mtpylon.service_schema import (
+    service_schema,
+    get_common_schema,
+    prepare_common_schema,
+)
+from mtpylon.service_schema.constructors import MsgsAck
+from mtpylon.service_schema.serialization.service_schema import (
+    custom_loaders,
+    custom_dumpers,
+)
+
+from tests.simpleschema import schema, Task
+from tests.echoschema import schema as echo_schema, Reply
+
+
+def test_get_common_schema():
+    common_schema = get_common_schema(schema)
+
+    assert Task in common_schema
+    assert MsgsAck in common_schema
+    assert common_schema is not schema
+    assert common_schema is not service_schema
+
+
+def test_get_common_schema_cached():
+    assert get_common_schema(schema) is get_common_schema(schema)
+
+
+def test_get_common_schema_updated():
+    customer_schema = Schema(
+        constructors=schema.constructors,
+        functions=schema.functions
+    )
+    common_schema = get_common_schema(customer_schema)
+
+    customer_schema |= echo_schema
+
+    updated_common_schema = get_common_schema(customer_schema)
+
+    assert updated_common_schema is not common_schema
+    assert Reply not in common_schema
+    assert Reply in updated_common_schema
+    assert MsgsAck in updated_common_schema
+    assert updated_common_schema is get_common_schema(customer_schema)
+
+
+def test_prepare_common_schema():
+    common_schema = prepare_common_schema(schema)
+
+    assert common_schema is get_common_schema(schema)
+
+    loader = get_loader(common_schema, custom_loaders)
+    dumper = get_dumper(common_schema, custom_dumpers)
+
+    assert common_schema[Task].id in loader._boxed_plans
+    assert common_schema[MsgsAck].id in loader._boxed_plans
+    assert Task in dumper._plans
+    assert MsgsAck in dumper._plans
+
+
+def test_prepare_common_schema_with_cache_dir(tmp_path):
+    customer_schema = Schema(
+        constructors=schema.constructors,
+        functions=schema.functions
+    )
+
+    common_schema = prepare_common_schema(
+        customer_schema,
+        cache_dir=str(tmp_path)
+    )
+
+    assert common_schema is get_common_schema(customer_schema)
+    assert common_schema.codecs is not None
+    assert Task in common_schema
+    assert MsgsAck in common_schema
+
+    loader = get_loader(common_schema, custom_loaders)
+    plan = loader._boxed_plans[common_schema[Task].id]
+
+    assert plan.__module__ == common_schema.codecs.__name__
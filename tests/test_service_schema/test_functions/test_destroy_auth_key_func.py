@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+from unittest.mock import MagicMock
+
+import pytest
+
+from mtpylon.constants import AUTH_KEY_MANAGER_RESOURCE_NAME
+from mtpylon.contextvars import auth_key_var
+from mtpylon.crypto import AuthKey, AuthKeyManager, AuthKeyPin
+from mtpylon.service_schema.constructors import (
+    DestroyAuthKeyOk,
+    DestroyAuthKeyNone,
+)
+from mtpylon.service_schema.functions import destroy_auth_key
+
+auth_key_value = 0x4fa4120d3646e1cadc7e21fcc9c46111ff8467665908a56b18bd38bee60ee1cccc2eff69dda5e638be2b06e813e6d9832142a054d22f405d9d416f79168140d373b048f55924b836ec5be2ab92e29624edf67bd5d763f8a15c3aed587e7ac70f8fe0d78de45c4b9ea5b81a1e0a098eb064dc9609fa37ca33f703b48461aed343aabc1498dd4d1cbbf3ca4c56cc8c7dc315e251e28312ed258c74326729118251f9153f7ac9d52bd47fdf7072963f6330f06bb72e2cc744af91df3302800e80c23c25a402b97bfc5292589b1c688bd1fde0e9997d9996a32ebd39ba258137b123fa762fd07548c44fd1b9321778f6ec3464ae39402c0445bd02fa8223b30cdfc8  # noqa
+
+
+@pytest.mark.asyncio
+async def test_destroy_auth_key():
+    manager = AuthKeyManager()
+    await manager.set_key(auth_key_value)
+
+    auth_key = AuthKey(auth_key_value)
+    auth_key_var.set(auth_key)
+    pin = AuthKeyPin(auth_key)
+    manager.add_invalidation_callback(pin)
+
+    request = MagicMock()
+    request.app = {
+        AUTH_KEY_MANAGER_RESOURCE_NAME: manager
+    }
+
+    result = await destroy_auth_key(request)
+
+    assert isinstance(result, DestroyAuthKeyOk)
+    assert not await manager.has_key(auth_key)
+    assert pin.auth_key is None
+
+
+@pytest.mark.asyncio
+async def test_destroy_auth_key_not_found():
+    auth_key_var.set(AuthKey(auth_key_value))
+
+    request = MagicMock()
+    request.app = {
+        AUTH_KEY_MANAGER_RESOURCE_NAME: AuthKeyManager()
+    }
+
+    result = await destroy_auth_key(request)
+
+    assert isinstance(result, DestroyAuthKeyNone)
+
+
+@pytest.mark.asyncio
+async def test_destroy_auth_key_not_set():
+    request = MagicMock()
+    request.app = {}
+
+    result = await destroy_auth_key(request)
+
+    assert isinstance(result, DestroyAuthKeyNone)
@@ -10,12 +10,14 @@ import pytest
 
 from mtpylon import int128, long, int256
 from mtpylon.crypto.rsa_manager import RsaManagerProtocol
+from mtpylon.crypto import ProcessHandshakeExecutor, DhExponentPool
 from mtpylon.contextvars import (
     server_nonce_var,
     new_nonce_var,
     p_var,
     q_var,
     pq_var,
+    a_var,
 )
 from mtpylon.dh_prime_generators.single_prime import (
     generate as generate_dh,
@@ -36,7 +38,9 @@ from mtpylon.utils import dump_integer_big_endian
 from mtpylon.crypto.rsa import encrypt as rsa_encrypt
 from mtpylon.constants import (
     RSA_MANAGER_RESOURCE_NAME,
-    DH_PRIME_GENERATOR_RESOURCE_NAME
+    DH_PRIME_GENERATOR_RESOURCE_NAME,
+    HANDSHAKE_EXECUTOR_RESOURCE_NAME,
+    DH_EXPONENT_POOL_RESOURCE_NAME,
 )
 
 from tests.simple_manager import manager
@@ -262,6 +266,113 @@ async def test_req_DH_params_ok(aiohttp_request):
     assert new_nonce_value == new_nonce_var.get()
 
 
+@pytest.mark.asyncio
+async def test_req_DH_params_in_process_executor(aiohttp_request):
+    handshake_executor = ProcessHandshakeExecutor(max_workers=1)
+    handshake_executor.start()
+    aiohttp_request.app[HANDSHAKE_EXECUTOR_RESOURCE_NAME] = handshake_executor
+
+    fingerprint = manager.fingerprint_list[0]
+    new_nonce_value = int256(getrandbits(256))
+
+    p_bytes = dump_integer_big_endian(p_value)
+    q_bytes = dump_integer_big_endian(q_value)
+
+    p_q_inner_data = PQInnerData(
+        pq=dump_integer_big_endian(pq_value),
+        p=p_bytes,
+        q=q_bytes,
+        nonce=nonce_value,
+        server_nonce=server_nonce_value,
+        new_nonce=new_nonce_value
+    )
+    encrypted_data = encrypt_client_data(
+        manager,
+        dump(p_q_inner_data),
+        fingerprint
+    )
+
+    try:
+        result = await req_DH_params(
+            aiohttp_request,
+            nonce_value,
+            server_nonce_value,
+            p_bytes,
+            q_bytes,
+            fingerprint,
+            encrypted_data
+        )
+    finally:
+        handshake_executor.shutdown()
+
+    assert isinstance(result, ServerDHParamsOk)
+
+    key_iv_pair = generate_tmp_key_iv(result.server_nonce, new_nonce_value)
+    unencrypted_data = ige256_decrypt(
+        result.encrypted_answer,
+        key_iv_pair.key,
+        key_iv_pair.iv
+    )
+    value = load(unencrypted_data[20:]).value
+
+    assert int.from_bytes(value.g_a, 'big') == pow(
+        value.g,
+        a_var.get(),
+        DH_PRIME
+    )
+
+
+@pytest.mark.asyncio
+async def test_req_DH_params_from_exponent_pool(aiohttp_request):
+    dh_exponent_pool = DhExponentPool(low_watermark=0, high_watermark=1)
+    await dh_exponent_pool.fill(3, DH_PRIME)
+    aiohttp_request.app[DH_EXPONENT_POOL_RESOURCE_NAME] = dh_exponent_pool
+
+    fingerprint = manager.fingerprint_list[0]
+    new_nonce_value = int256(getrandbits(256))
+
+    p_bytes = dump_integer_big_endian(p_value)
+    q_bytes = dump_integer_big_endian(q_value)
+
+    p_q_inner_data = PQInnerData(
+        pq=dump_integer_big_endian(pq_value),
+        p=p_bytes,
+        q=q_bytes,
+        nonce=nonce_value,
+        server_nonce=server_nonce_value,
+        new_nonce=new_nonce_value
+    )
+    encrypted_data = encrypt_client_data(
+        manager,
+        dump(p_q_inner_data),
+        fingerprint
+    )
+
+    result = await req_DH_params(
+        aiohttp_request,
+        nonce_value,
+        server_nonce_value,
+        p_bytes,
+        q_bytes,
+        fingerprint,
+        encrypted_data
+    )
+
+    assert isinstance(result, ServerDHParamsOk)
+    assert dh_exponent_pool.metrics.hits == 1
+    assert dh_exponent_pool.size(3, DH_PRIME) == 0
+
+    key_iv_pair = generate_tmp_key_iv(result.server_nonce, new_nonce_value)
+    unencrypted_data = ige256_decrypt(
+        result.encrypted_answer,
+        key_iv_pair.key,
+        key_iv_pair.iv
+    )
+    value = load(unencrypted_data[20:]).value
+
+    assert int.from_bytes(value.g_a, 'big') == pow(3, a_var.get(), DH_PRIME)
+
+
 @pytest.mark.asyncio
 async def test_req_DH_wront_encrypted_hash(aiohttp_request):
     fingerprint = manager.fingerprint_list[0]
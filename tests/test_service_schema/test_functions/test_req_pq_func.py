@@ -12,7 +12,11 @@ from mtpylon.contextvars import (
     pq_var,
 )
 from mtpylon.service_schema.functions import req_pq
-from mtpylon.constants import RSA_MANAGER_RESOURCE_NAME
+from mtpylon.service_schema import PqPool
+from mtpylon.constants import (
+    RSA_MANAGER_RESOURCE_NAME,
+    PQ_POOL_RESOURCE_NAME,
+)
 
 from tests.simple_manager import manager
 
@@ -62,3 +66,26 @@ async def test_req_pq():
         assert len(result.server_public_key_fingerprints) == 1
         fingerprint = result.server_public_key_fingerprints[0]
         assert fingerprint in manager.fingerprint_list
+
+
+@pytest.mark.asyncio
+async def test_req_pq_from_pool():
+    pq_pool = PqPool(low_watermark=0, high_watermark=1)
+    await pq_pool.fill()
+    p_value, q_value = pq_pool._pairs[0]
+
+    request = MagicMock()
+    request.app = {
+        RSA_MANAGER_RESOURCE_NAME: manager,
+        PQ_POOL_RESOURCE_NAME: pq_pool,
+    }
+
+    nonce_value = int128(88224628713810667588887952107997447839)
+
+    result = await req_pq(request, nonce_value)
+
+    assert int.from_bytes(result.pq, 'big') == p_value * q_value
+    assert p_var.get() == p_value
+    assert q_var.get() == q_value
+    assert pq_pool.metrics.hits == 1
+    assert len(pq_pool) == 0
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+from mtpylon.crypto import HandshakeExecutor
+from mtpylon.service_schema import PqPool
+
+
+class OffloadedHandshakeExecutor(HandshakeExecutor):
+    """
+    Runs math inline but reports it runs outside of event loop, so pool is
+    filled in background
+    """
+
+    @property
+    def offloaded(self) -> bool:
+        return True
+
+
+def create_pool(**params) -> PqPool:
+    return PqPool(handshake_executor=OffloadedHandshakeExecutor(), **params)
+
+
+async def wait_filled(pool: PqPool):
+    while pool._task is not None:
+        await asyncio.sleep(0)
+
+
+def test_wrong_watermarks():
+    with pytest.raises(ValueError):
+        PqPool(low_watermark=5, high_watermark=4)
+
+
+@pytest.mark.asyncio
+async def test_pop_empty_pool():
+    pool = create_pool(low_watermark=2, high_watermark=4)
+
+    p, q = pool.pop()
+
+    assert p < q
+    assert pool.metrics.misses == 1
+    assert pool.metrics.hits == 0
+
+    await wait_filled(pool)
+
+    assert len(pool) == 4
+    assert pool.metrics.generated == 4
+
+
+@pytest.mark.asyncio
+async def test_pop_from_pool():
+    pool = create_pool(low_watermark=2, high_watermark=4)
+    await pool.fill()
+
+    pool.pop()
+
+    assert pool.metrics.hits == 1
+    assert pool.metrics.misses == 0
+    assert len(pool) == 3
+    assert pool._task is None
+
+    pool.pop()
+    pool.pop()
+
+    assert pool._task is not None
+
+    await wait_filled(pool)
+
+    assert len(pool) == 4
+
+
+@pytest.mark.asyncio
+async def test_no_fill_with_inline_executor():
+    pool = PqPool(low_watermark=2, high_watermark=4)
+
+    for _ in range(3):
+        p, q = pool.pop()
+        assert p < q
+
+    assert pool._task is None
+    assert len(pool) == 0
+    assert pool.metrics.misses == 3
+    assert pool.metrics.generated == 0
+
+
+@pytest.mark.asyncio
+async def test_fill_with_inline_executor():
+    pool = PqPool(low_watermark=2, high_watermark=4)
+    await pool.fill()
+
+    pool.pop()
+
+    assert pool.metrics.hits == 1
+    assert len(pool) == 3
+
+
+@pytest.mark.asyncio
+async def test_pairs_not_reused():
+    pool = create_pool(low_watermark=4, high_watermark=4)
+    await pool.fill()
+
+    pairs = [pool.pop() for _ in range(4)]
+
+    assert len(set(pairs)) == 4
+
+
+@pytest.mark.asyncio
+async def test_shutdown():
+    pool = create_pool(low_watermark=2, high_watermark=4)
+    pool.pop()
+
+    pool.shutdown()
+    await asyncio.sleep(0)
+
+    assert pool._task is None
+    assert len(pool) == 0
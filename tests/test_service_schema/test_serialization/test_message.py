@@ -2,7 +2,11 @@
 from mtpylon import long
 from mtpylon.serialization import LoadedValue
 from mtpylon.service_schema.constructors import Message
-from mtpylon.service_schema.serialization.message import load, dump
+from mtpylon.service_schema.serialization.message import (
+    load,
+    dump,
+    dump_to,
+)
 
 message = Message(
     msg_id=long(32),
@@ -39,6 +43,18 @@ def test_dump_bare_message():
     ) == bare_dumped_message
 
 
+def test_dump_message_to_buffer():
+    buffer = bytearray(b'head')
+
+    dump_to(
+        buffer,
+        message,
+        dump_object=lambda buffer, x, bare: buffer.extend(x),
+    )
+
+    assert buffer == b'head' + dumped_message
+
+
 def test_load_message():
     loaded = load(
         dumped_message + b'prefix that should be skipped',
@@ -58,3 +74,17 @@ def test_load_bare_message():
 
     assert loaded.value == message
     assert loaded.offset == len(bare_dumped_message)
+
+
+def test_load_message_by_offset():
+    loaded = load(
+        memoryview(b'prefix' + dumped_message),
+        load_object=lambda x, bare: LoadedValue(
+            value=bytes(x),
+            offset=len(x)
+        ),
+        offset=6
+    )
+
+    assert loaded.offset == 6 + len(dumped_message)
+    assert loaded.value == message
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mtpylon.transports.ctr_backends import (
+    ctr_backends,
+    get_ctr_backend,
+    default_ctr_backend,
+    process_into,
+    PyaesCtrCipher,
+    TgcryptoCtrCipher,
+)
+from mtpylon.transports.obfuscation import Obfuscator
+
+available_backends = [
+    pytest.param(backend, id=name)
+    for name, backend in ctr_backends.items()
+    if backend is not None
+]
+
+key = bytes(range(32))
+iv = bytes(range(100, 116))
+
+
+@pytest.mark.parametrize('backend', available_backends)
+@pytest.mark.parametrize('chunk_sizes', [
+    pytest.param([64], id='one block'),
+    pytest.param([1, 15, 16, 17, 0, 100, 3], id='split blocks'),
+])
+def test_ctr_backend_equal_to_pyaes(backend, chunk_sizes):
+    cipher = backend(key, iv)
+    pyaes_cipher = PyaesCtrCipher(key, iv)
+
+    for size in chunk_sizes:
+        data = os.urandom(size)
+        assert cipher.process(data) == pyaes_cipher.process(data)
+
+
+@pytest.mark.parametrize('backend', available_backends)
+def test_ctr_backend_process_into(backend):
+    data = os.urandom(100)
+    buffer = bytearray(b'head' + data + b'tail')
+    cipher = backend(key, iv)
+    pyaes_cipher = PyaesCtrCipher(key, iv)
+
+    cipher.process_into(memoryview(buffer)[4:20])
+    cipher.process_into(memoryview(buffer)[20:20])
+    cipher.process_into(memoryview(buffer)[20:104])
+
+    assert buffer == b'head' + pyaes_cipher.process(data) + b'tail'
+    assert cipher.process(data) == pyaes_cipher.process(data)
+
+
+class ProcessOnlyCtrCipher:
+    """
+    Custom backend that implements only `process` method
+    """
+
+    def __init__(self, key: bytes, iv: bytes):
+        self._cipher = PyaesCtrCipher(key, iv)
+
+    def process(self, data: bytes) -> bytes:
+        return self._cipher.process(data)
+
+
+@pytest.mark.parametrize('backend', available_backends + [
+    pytest.param(ProcessOnlyCtrCipher, id='process only'),
+])
+def test_process_into(backend):
+    data = os.urandom(100)
+    buffer = bytearray(data)
+    cipher = backend(key, iv)
+
+    process_into(cipher, memoryview(buffer)[:30])
+    process_into(cipher, memoryview(buffer)[30:])
+
+    assert buffer == PyaesCtrCipher(key, iv).process(data)
+
+
+def test_obfuscator_decrypt_into_process_only_backend():
+    data = os.urandom(100)
+    buffer = bytearray(data)
+    obfuscator = Obfuscator(
+        client_key=key,
+        client_iv=iv,
+        server_key=key,
+        server_iv=iv,
+        ctr_backend=ProcessOnlyCtrCipher,
+    )
+
+    obfuscator.decrypt_into(memoryview(buffer))
+
+    assert buffer == PyaesCtrCipher(key, iv).process(data)
+
+
+@pytest.mark.skipif(
+    ctr_backends['cryptography'] is None,
+    reason='cryptography is not installed'
+)
+def test_cryptography_process_into_small_buffer():
+    data = os.urandom(20)
+    buffer = bytearray(data)
+    cipher = get_ctr_backend('cryptography')(key, iv)
+    context = MagicMock(wraps=cipher._context)  # type: ignore
+    context.update_into.side_effect = ValueError
+    cipher._context = context  # type: ignore
+
+    cipher.process_into(memoryview(buffer))
+
+    assert buffer == PyaesCtrCipher(key, iv).process(data)
+
+
+@pytest.mark.parametrize('backend', available_backends)
+def test_ctr_backend_decrypts(backend):
+    data = os.urandom(1024)
+
+    assert backend(key, iv).process(backend(key, iv).process(data)) == data
+
+
+@pytest.mark.parametrize('backend', available_backends)
+def test_ctr_backend_counter_overflow(backend):
+    data = os.urandom(48)
+    overflow_iv = b'\xff' * 16
+
+    assert (
+        backend(key, overflow_iv).process(data) ==
+        PyaesCtrCipher(key, overflow_iv).process(data)
+    )
+
+
+def test_default_ctr_backend():
+    assert default_ctr_backend is TgcryptoCtrCipher
+    assert get_ctr_backend() is TgcryptoCtrCipher
+
+
+def test_get_ctr_backend_by_name():
+    assert get_ctr_backend('pyaes') is PyaesCtrCipher
+
+
+def test_get_unknown_ctr_backend():
+    with pytest.raises(ValueError):
+        get_ctr_backend('des')
+
+
+def test_get_not_installed_ctr_backend():
+    with patch.dict(ctr_backends, {'cryptography': None}):
+        with pytest.raises(ValueError):
+            get_ctr_backend('cryptography')
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from mtpylon.transports.intermediate import wrap, unwrap
+from mtpylon.transports.intermediate import wrap, unwrap, packet_size
 
 
 original_message = b'\x47\xac\x9f\xf1\xf1\x7d\xd4\xc0\xcd\xde\xdf\x86\xad\x73'
@@ -16,3 +16,10 @@ def test_unwrap():
     returned_message = unwrap(wrapped_message)
 
     assert returned_message == original_message
+
+
+def test_packet_size():
+    buffer = memoryview(wrapped_message + b'next packet')
+
+    assert packet_size(buffer) == len(wrapped_message)
+    assert packet_size(buffer[:3]) is None
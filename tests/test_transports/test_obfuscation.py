@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
+import pytest
+
 from mtpylon.transports.obfuscation import parse_header
+from mtpylon.transports.ctr_backends import ctr_backends
 
 from ..helpers import hexstr_to_bytes
 
@@ -70,7 +73,29 @@ def test_decrypt_client_message():
     assert obfuscator.decrypt(client_encrypted_msg) == client_original_msg
 
 
+def test_decrypt_client_message_into_buffer():
+    transport_tag, obfuscator = parse_header(header)
+    buffer = bytearray(client_encrypted_msg)
+
+    obfuscator.decrypt_into(memoryview(buffer))
+
+    assert buffer == client_original_msg
+
+
 def test_encrypt_server_message():
     transport_tag, obfuscator = parse_header(header)
 
     assert obfuscator.encrypt(server_original_message) == server_encrypted_msg
+
+
+@pytest.mark.parametrize('ctr_backend', [
+    pytest.param(backend, id=name)
+    for name, backend in ctr_backends.items()
+    if backend is not None
+])
+def test_obfuscation_ctr_backend(ctr_backend):
+    transport_tag, obfuscator = parse_header(header, ctr_backend=ctr_backend)
+
+    assert transport_tag == 0xeeeeeeee
+    assert obfuscator.decrypt(client_encrypted_msg) == client_original_msg
+    assert obfuscator.encrypt(server_original_message) == server_encrypted_msg
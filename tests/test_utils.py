@@ -24,6 +24,7 @@ from mtpylon.utils import (
     get_fields_map,
 )
 from mtpylon import long, int128
+from mtpylon.request import MtprotoRequest
 
 
 @dataclass
@@ -584,6 +585,13 @@ async def invalid_kwargs(
     return BoolFalse()
 
 
+async def ping_mtproto_request(
+    request: MtprotoRequest,
+    a: int
+) -> Bool:  # pragma: nocover
+    return BoolTrue()
+
+
 async def func_no_request(task: Task) -> Bool:  # pragma: nocover
     return BoolTrue()
 
@@ -737,6 +745,9 @@ class TestIsValidFunction:
     def test_valid_list_params(self):
         is_valid_function(has_tasks, [Task, Bool])
 
+    def test_valid_with_mtproto_request(self):
+        is_valid_function(ping_mtproto_request, [Bool])
+
     def test_not_async_function(self):
         with pytest.raises(InvalidFunction):
             is_valid_function(not_async_func, [Bool])